@@ -3,13 +3,170 @@ import threading
 import logging
 import json
 import datetime
-from typing import Dict, Any, Optional, Union
+from typing import Callable, Dict, Any, Optional, Tuple, Union
+from cycles.order_record import to_plain
+from helpers.metrics import count_http_request
+
+
+class WriteBehindBuffer:
+    """ Coalesces record updates and writes them behind the caller.
+
+    Updates are keyed by (collection, record id) and later field values
+    overwrite earlier ones, so a record that changes on every tick costs
+    one request per flush window. Flushes go through PocketBase's
+    ``/api/batch`` endpoint and fall back to one PATCH per record when the
+    server does not support or allow batch requests.
+    """
+
+    def __init__(self, client, flush_interval=2.0, max_pending=50, max_batch_size=50):
+        self.client = client
+        self.flush_interval = float(flush_interval)
+        self.max_pending = int(max_pending)
+        self.max_batch_size = int(max_batch_size)
+        self.batch_supported = True
+        self._pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._callbacks: Dict[Tuple[str, str], Callable] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def queue(self, collection: str, record_id: str, data: Dict[str, Any], on_failure: Optional[Callable] = None):
+        """Merge fields into the pending update for a record.
+
+        Args:
+            collection: PocketBase collection name
+            record_id: Record ID to update
+            data: Fields to write; they override any pending values
+            on_failure: Called as ``on_failure(record_id, data)`` if the write fails
+        """
+        key = (collection, record_id)
+        with self._lock:
+            self._pending.setdefault(key, {}).update(data)
+            if on_failure is not None:
+                self._callbacks[key] = on_failure
+            pending_count = len(self._pending)
+        self._ensure_started()
+        if pending_count >= self.max_pending:
+            self._wakeup.set()
+
+    def discard(self, collection: str, record_id: str) -> Dict[str, Any]:
+        """Remove and return the pending fields for a record."""
+        key = (collection, record_id)
+        with self._lock:
+            self._callbacks.pop(key, None)
+            return self._pending.pop(key, {})
+
+    def write_through(self, collection: str, record_id: str, data: Dict[str, Any], send: Callable):
+        """Write a record immediately, folding in any pending fields first.
+
+        Holding the flush lock guarantees a stale buffered write can never
+        land after this one.
+        """
+        with self._flush_lock:
+            merged = self.discard(collection, record_id)
+            merged.update(data)
+            return send(merged)
+
+    def pending_count(self) -> int:
+        """Number of records waiting to be written."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write every pending record now.
+
+        Returns:
+            int: Number of records written successfully
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                callbacks, self._callbacks = self._callbacks, {}
+            if not pending:
+                return 0
+
+            items = list(pending.items())
+            written = 0
+            failed = []
+            for start in range(0, len(items), self.max_batch_size):
+                chunk = items[start:start + self.max_batch_size]
+                if self.batch_supported and len(chunk) > 1 and self._send_batch(chunk):
+                    written += len(chunk)
+                    continue
+                for key, data in chunk:
+                    if self._send_one(key, data):
+                        written += 1
+                    else:
+                        failed.append((key, data))
+
+        for (collection, record_id), data in failed:
+            callback = callbacks.get((collection, record_id))
+            if callback is None:
+                continue
+            try:
+                callback(record_id, data)
+            except Exception as e:
+                logging.error(f"Write-behind failure handler for {collection}/{record_id} raised: {e}")
+        return written
+
+    def _send_batch(self, chunk) -> bool:
+        """Send a chunk of updates as one PocketBase batch request."""
+        requests = [
+            {
+                "method": "PATCH",
+                "url": f"/api/collections/{collection}/records/{record_id}",
+                "body": data,
+            }
+            for (collection, record_id), data in chunk
+        ]
+        try:
+            self.client.send("/api/batch", {"method": "POST", "body": {"requests": requests}})
+            return True
+        except Exception as e:
+            if getattr(e, "status", None) in (403, 404):
+                # Batch API missing (PocketBase < 0.23) or disabled in the server settings
+                self.batch_supported = False
+                logging.info(f"PocketBase batch API unavailable, writing records individually: {e}")
+            else:
+                logging.warning(f"Batch update of {len(chunk)} records failed, retrying individually: {e}")
+            return False
+
+    def _send_one(self, key, data) -> bool:
+        """Send a single record update."""
+        collection, record_id = key
+        try:
+            self.client.collection(collection).update(record_id, data)
+            return True
+        except Exception as e:
+            logging.error(f"Failed to write buffered update for {collection}/{record_id}: {e}")
+            return False
+
+    def _ensure_started(self):
+        """Start the background flusher on first use."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="WriteBehindBuffer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Flush on the configured interval, or early once max_pending records are waiting."""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error(f"Error flushing buffered updates: {e}")
 
 
 class API:
     """ The base class for all the API handlers"""
 
-    def __init__(self, base_url, token=None):
+    def __init__(self, base_url, token=None, write_flush_interval=2.0, max_pending_writes=50):
         self.base_url = base_url
         self.token = token
         self.authenticated = False
@@ -18,6 +175,30 @@ class API:
         self.is_active = False
         self.user_id = None
         self.client = PocketBase(self.base_url)
+        self._count_requests(self.client)
+        self.write_buffer = WriteBehindBuffer(
+            self.client, flush_interval=write_flush_interval, max_pending=max_pending_writes)
+
+    @staticmethod
+    def _count_requests(client):
+        """Count every request the PocketBase SDK sends for the metrics endpoint."""
+        send = getattr(client, "send", None)
+        if not callable(send):
+            return
+
+        def counted_send(*args, **kwargs):
+            count_http_request("sync")
+            return send(*args, **kwargs)
+
+        client.send = counted_send
+
+    def flush_pending_updates(self) -> int:
+        """Write all buffered record updates now."""
+        try:
+            return self.write_buffer.flush()
+        except Exception as e:
+            logging.error(f"Failed to flush pending updates: {e}")
+            return 0
 
     def login(self, username, password):
         """Authenticate with the API using the provided username and password."""
@@ -426,7 +607,7 @@ class API:
     def ensure_json_serializable(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Ensure all fields in the data dictionary are JSON serializable."""
         serialized_data = {}
-        for key, value in data.items():
+        for key, value in to_plain(data).items():
             if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
                 serialized_data[key] = value.isoformat() if value else None
             elif isinstance(value, (list, dict)):
@@ -552,7 +733,7 @@ class API:
         """Update an Advanced Cycles Trader cycle by its ID."""
         try:
             # No need to map fields anymore since we're using the correct names directly
-            return self.client.collection("advanced_cycles_trader_cycles").update(cycle_id, data)
+            return self.client.collection("advanced_cycles_trader_cycles").update(cycle_id, to_plain(data))
         except Exception as e:
             logging.error(f"Failed to update ACT cycle by ID: {e}")
             return None
@@ -705,13 +886,24 @@ class API:
             return None
 
     def update_MG_cycle_by_id(self, cycle_id: str, data: Dict[str, Any]) -> Optional[Any]:
-        """Update a MoveGuard cycle by its ID."""
+        """Update a MoveGuard cycle by its ID, superseding any buffered update."""
         try:
-            return self.client.collection("moveguard_cycles").update(cycle_id, data)
+            return self.write_buffer.write_through(
+                "moveguard_cycles", cycle_id, data,
+                lambda merged: self.client.collection("moveguard_cycles").update(cycle_id, merged))
         except Exception as e:
             logging.error(f"Failed to update MoveGuard cycle by ID: {e}")
             return None
 
+    def queue_MG_cycle_update(self, cycle_id: str, data: Dict[str, Any], on_failure: Optional[Callable] = None) -> bool:
+        """Buffer a MoveGuard cycle update; it is coalesced and written on the next flush."""
+        try:
+            self.write_buffer.queue("moveguard_cycles", cycle_id, data, on_failure=on_failure)
+            return True
+        except Exception as e:
+            logging.error(f"Failed to queue MoveGuard cycle update: {e}")
+            return False
+
     def get_MG_cycle_by_id(self, cycle_id: str):
         """Get a MoveGuard cycle by its ID."""
         try:
@@ -744,11 +936,24 @@ class API:
             logging.error(f"An error occurred while fetching MoveGuard cycles by bot ID: {e}")
             return []
 
+    def get_MG_cycles_updated_since(self, bot_id: str, since: str):
+        """Get the MoveGuard cycles of a bot (open or closed) updated at or after a PocketBase timestamp.
+
+        Returns None on error so callers can tell a failed query from "nothing changed".
+        """
+        try:
+            return self.client.collection("moveguard_cycles").get_full_list(200, {"filter": f"bot = '{bot_id}' && updated >= '{since}'"})
+        except Exception as e:
+            logging.error(f"An error occurred while fetching updated MoveGuard cycles by bot ID: {e}")
+            return None
+
     def close_MG_cycle(self, cycle_id: str):
         """Close a MoveGuard cycle by its ID."""
         try:
             data = {"is_closed": True}
-            return self.client.collection("moveguard_cycles").update(cycle_id, data)
+            return self.write_buffer.write_through(
+                "moveguard_cycles", cycle_id, data,
+                lambda merged: self.client.collection("moveguard_cycles").update(cycle_id, merged))
         except Exception as e:
             logging.error(f"Failed to close MoveGuard cycle: {e}")
             return None
@@ -0,0 +1,387 @@
+import asyncio
+import json
+import logging
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+
+from cycles.order_record import to_plain
+from helpers.metrics import count_http_request
+
+
+def _to_snake_case(name: str) -> str:
+    """Convert PocketBase system field names (collectionId) to attribute names (collection_id)."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class Record:
+    """ Attribute-access view of a PocketBase record, shaped like the SDK's Record model """
+
+    def __init__(self, data: Dict[str, Any]):
+        for key, value in data.items():
+            setattr(self, _to_snake_case(key), value)
+
+    def __repr__(self):
+        return f"Record({getattr(self, 'id', None)})"
+
+
+class AsyncAPI:
+    """ Async PocketBase client on a shared keep-alive connection pool.
+
+    Mirrors the method surface of ``API`` for the calls made from the
+    account and cycle-sync loops. Every request has a timeout and goes
+    through a semaphore, so concurrent bots share a bounded number of
+    in-flight requests instead of queuing behind a blocking SDK call.
+
+    The underlying ``httpx.AsyncClient`` is bound to the event loop it is
+    first used on; create one instance per loop.
+    """
+
+    def __init__(self, base_url, token=None, token_getter: Optional[Callable[[], Optional[str]]] = None,
+                 max_connections=10, max_concurrency=8, timeout=10.0):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.token_getter = token_getter
+        self.user_id = None
+        self.max_concurrency = int(max_concurrency)
+        self.timeout = float(timeout)
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    @classmethod
+    def from_api(cls, api, **kwargs):
+        """Create an async client that follows the auth token of a logged-in ``API``."""
+        async_api = cls(api.base_url, token_getter=lambda: api.token, **kwargs)
+        async_api.user_id = api.user_id
+        return async_api
+
+    async def close(self):
+        """Close the connection pool."""
+        await self.http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # ==================== TRANSPORT ====================
+
+    def _headers(self) -> Dict[str, str]:
+        token = self.token_getter() if self.token_getter else self.token
+        return {"Authorization": token} if token else {}
+
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                       json: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one request through the pool, bounded by the concurrency limit."""
+        count_http_request("async")
+        async with self._semaphore:
+            response = await self.http.request(method, path, params=params, json=json, headers=self._headers())
+        response.raise_for_status()
+        if response.status_code == 204 or not response.content:
+            return None
+        return response.json()
+
+    async def _get_full_list(self, collection: str, batch: int = 200, filter: Optional[str] = None) -> List[Record]:
+        """Fetch every record of a collection matching the filter, page by page."""
+        records = []
+        page = 1
+        while True:
+            params = {"page": page, "perPage": batch, "skipTotal": 1}
+            if filter:
+                params["filter"] = filter
+            result = await self._request("GET", f"/api/collections/{collection}/records", params=params)
+            items = result.get("items", []) if result else []
+            records.extend(Record(item) for item in items)
+            if len(items) < batch:
+                return records
+            page += 1
+
+    async def _create(self, collection: str, data: Dict[str, Any]) -> Record:
+        return Record(await self._request("POST", f"/api/collections/{collection}/records", json=to_plain(data)))
+
+    async def _update(self, collection: str, record_id: str, data: Dict[str, Any]) -> Record:
+        return Record(await self._request("PATCH", f"/api/collections/{collection}/records/{record_id}", json=to_plain(data)))
+
+    async def _delete(self, collection: str, record_id: str) -> bool:
+        await self._request("DELETE", f"/api/collections/{collection}/records/{record_id}")
+        return True
+
+    # ==================== REALTIME ====================
+
+    async def subscribe_realtime(self, collection: str, filter: Optional[str] = None) -> AsyncIterator[Tuple[str, Optional[Record]]]:
+        """Stream record changes of a collection over PocketBase's realtime SSE endpoint.
+
+        Yields ``("connect", None)`` once the subscription is registered, then
+        ``(action, record)`` for every create/update/delete matching the
+        filter. The generator ends when the server closes the stream; callers
+        reconnect and use the connect marker to run a catch-up query.
+        """
+        topic = collection
+        if filter:
+            topic += "?options=" + quote(json.dumps({"query": {"filter": filter}}))
+
+        stream_timeout = httpx.Timeout(self.timeout, read=None)
+        async with self.http.stream("GET", "/api/realtime", headers=self._headers(), timeout=stream_timeout) as response:
+            response.raise_for_status()
+            event_name, data_lines = None, []
+            async for line in response.aiter_lines():
+                if line:
+                    if line.startswith(":"):
+                        continue
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event_name = value
+                    elif field == "data":
+                        data_lines.append(value)
+                    continue
+
+                # A blank line dispatches the buffered event
+                if not data_lines:
+                    event_name = None
+                    continue
+                payload = json.loads("\n".join(data_lines))
+                name, event_name, data_lines = event_name, None, []
+
+                if name == "PB_CONNECT":
+                    await self._request("POST", "/api/realtime",
+                                        json={"clientId": payload["clientId"], "subscriptions": [topic]})
+                    yield "connect", None
+                elif name == topic:
+                    yield payload.get("action"), Record(payload.get("record", {}))
+
+    # ==================== AUTH ====================
+
+    async def login(self, username, password):
+        """Authenticate with the API using the provided username and password."""
+        try:
+            result = await self._request("POST", "/api/collections/users/auth-with-password",
+                                         json={"identity": username, "password": password})
+            self.token = result["token"]
+            self.token_getter = None
+            self.user_id = result["record"]["id"]
+            return result
+        except Exception as e:
+            logging.error(f"Failed to login: {e}")
+            return None
+
+    async def Refresh_token(self):
+        """Refresh the token."""
+        try:
+            result = await self._request("POST", "/api/collections/users/auth-refresh")
+            self.token = result["token"]
+            self.token_getter = None
+            return result
+        except Exception as e:
+            logging.error(f"Failed to refresh token: {e}")
+            return None
+
+    # ==================== ACCOUNTS & BOTS ====================
+
+    async def get_accounts_by_metatrader_id(self, account_id):
+        """Get an account by its MetaTrader ID."""
+        try:
+            return await self._get_full_list("accounts", 200, f"user = '{self.user_id}' && meta_trader_id = '{account_id}'")
+        except Exception as e:
+            logging.error(f"Failed to get account by MetaTrader ID: {e}")
+            return None
+
+    async def update_account(self, account_id, data):
+        """Update an account."""
+        try:
+            return await self._update("accounts", account_id, data)
+        except Exception as e:
+            logging.error(f"Failed to update account: {e}")
+            return None
+
+    async def update_account_symbols(self, account_id, data):
+        """Update an account."""
+        try:
+            return await self._update("accounts", account_id, data)
+        except Exception as e:
+            logging.error(f"Failed to update account symbols: {e}")
+            return None
+
+    async def get_account_bots(self, account_id):
+        """Get all bots for the current user."""
+        try:
+            return await self._get_full_list("bots", 200, f"account = '{account_id}'")
+        except Exception as e:
+            logging.error(f"Failed to get account bots: {e}")
+            return []
+
+    async def get_account_bots_by_id(self, bot_id):
+        """Get a bot by its ID."""
+        try:
+            return await self._get_full_list("bots", 200, f"id = '{bot_id}'")
+        except Exception as e:
+            logging.error(f"Failed to get bot by ID: {e}")
+            return None
+
+    async def send_log(self, data):
+        """Create a log."""
+        try:
+            return await self._create("terminal_logs", data)
+        except Exception as e:
+            logging.error(f"Failed to create log: {e}")
+            return None
+
+    # ==================== EVENTS ====================
+
+    async def get_all_events(self):
+        """Get all events."""
+        try:
+            return await self._get_full_list("events", 200)
+        except Exception as e:
+            logging.error(f"An error occurred while fetching events: {e}")
+            return None
+
+    async def get_events_by_account(self, account_id: str):
+        """Get all pending events of an account."""
+        try:
+            return await self._get_full_list("events", 200, f"account = '{account_id}'")
+        except Exception as e:
+            logging.error(f"An error occurred while fetching events for account {account_id}: {e}")
+            return None
+
+    async def get_events_by_bot(self, bot_id: str):
+        """Get events specific to a bot."""
+        try:
+            return await self._get_full_list("events", 200, f"bot = '{bot_id}'")
+        except Exception as e:
+            logging.error(f"An error occurred while fetching events for bot {bot_id}: {e}")
+            return None
+
+    async def get_events_by_account_and_bot(self, account_id: str, bot_id: str):
+        """Get events specific to an account and bot combination."""
+        try:
+            return await self._get_full_list("events", 200, f"account = '{account_id}' && bot = '{bot_id}'")
+        except Exception as e:
+            logging.error(f"An error occurred while fetching events for account {account_id} and bot {bot_id}: {e}")
+            return None
+
+    async def delete_event(self, event_id):
+        """Delete an event from the event collection."""
+        try:
+            return await self._delete("events", event_id)
+        except Exception as e:
+            logging.error(f"Failed to delete event: {e}")
+            return None
+
+    # ==================== SYMBOLS ====================
+
+    async def get_symbols_by_account(self, account):
+        """Get the symbols of an account."""
+        try:
+            return await self._get_full_list("symbols", 200, f"account = '{account}'")
+        except Exception as e:
+            logging.error(f"Failed to get symbol: {e}")
+            return None
+
+    async def get_symbol_by_name(self, symbol_name, account_id):
+        """Get a symbol by its name and account."""
+        try:
+            return await self._get_full_list("symbols", 200, f"name = '{symbol_name}' && account = '{account_id}'")
+        except Exception as e:
+            logging.error(f"Failed to get symbol by name: {e}")
+            return None
+
+    async def create_symbol(self, data):
+        """Create a symbol."""
+        try:
+            return await self._create("symbols", data)
+        except Exception as e:
+            logging.error(f"Failed to create symbol: {e}")
+            return None
+
+    async def update_symbol(self, symbol_id, data):
+        """Update a symbol."""
+        try:
+            return await self._update("symbols", symbol_id, data)
+        except Exception as e:
+            logging.error(f"Failed to update symbol: {e}")
+            return None
+
+    # ==================== CYCLES ====================
+
+    async def get_all_AH_active_cycles_by_account(self, account_id):
+        """Get all active AH cycles by account."""
+        try:
+            return await self._get_full_list("adaptive_hedge_cycles", 200, f"account = '{account_id}' && is_closed = False")
+        except Exception as e:
+            logging.error(f"An error occurred while fetching AH cycles by account: {e}")
+            return []
+
+    async def update_AH_cycle_by_id(self, cycle_id, data):
+        """Update an AH cycle by its ID."""
+        try:
+            return await self._update("adaptive_hedge_cycles", cycle_id, data)
+        except Exception as e:
+            logging.error(f"Failed to update AH cycle by ID: {e}")
+            return None
+
+    async def get_all_CT_active_cycles_by_account(self, account_id):
+        """Get all active CT cycles by account."""
+        try:
+            return await self._get_full_list("cycles_trader_cycles", 200, f"account = '{account_id}' && is_closed = False")
+        except Exception as e:
+            logging.error(f"An error occurred while fetching CT cycles by account: {e}")
+            return []
+
+    async def update_CT_cycle_by_id(self, cycle_id, data):
+        """Update a CT cycle by its ID."""
+        try:
+            return await self._update("cycles_trader_cycles", cycle_id, data)
+        except Exception as e:
+            logging.error(f"Failed to update CT cycle by ID: {e}")
+            return None
+
+    async def get_all_ACT_active_cycles_by_account(self, account_id):
+        """Get all active ACT cycles by account."""
+        try:
+            return await self._get_full_list("advanced_cycles_trader_cycles", 200, f"account = '{account_id}' && is_closed = false")
+        except Exception as e:
+            logging.error(f"An error occurred while fetching ACT cycles by account: {e}")
+            return []
+
+    async def update_ACT_cycle_by_id(self, cycle_id, data):
+        """Update an ACT cycle by its ID."""
+        try:
+            return await self._update("advanced_cycles_trader_cycles", cycle_id, data)
+        except Exception as e:
+            logging.error(f"Failed to update ACT cycle by ID: {e}")
+            return None
+
+    async def create_MG_cycle(self, data: Dict[str, Any]) -> Optional[Any]:
+        """Create a MoveGuard cycle."""
+        try:
+            return await self._create("moveguard_cycles", data)
+        except Exception as e:
+            logging.error(f"❌ Failed to create MoveGuard cycle: {str(e)}")
+            return None
+
+    async def update_MG_cycle_by_id(self, cycle_id: str, data: Dict[str, Any]) -> Optional[Any]:
+        """Update a MoveGuard cycle by its ID."""
+        try:
+            return await self._update("moveguard_cycles", cycle_id, data)
+        except Exception as e:
+            logging.error(f"Failed to update MoveGuard cycle by ID: {e}")
+            return None
+
+    async def get_all_MG_active_cycles_by_account(self, account_id: str):
+        """Get all active MoveGuard cycles by account."""
+        try:
+            return await self._get_full_list("moveguard_cycles", 200, f"account = '{account_id}' && is_closed = False")
+        except Exception as e:
+            logging.error(f"An error occurred while fetching MoveGuard cycles by account: {e}")
+            return []
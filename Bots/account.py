@@ -1,11 +1,17 @@
 import threading
 import time
 from Bots.bot import Bot
+from Bots.symbol_price_publisher import SymbolPricePublisher
 from DB.db_engine import engine
 from DB.ah_strategy.repositories.ah_repo import AHRepo
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 import asyncio
+from collections import OrderedDict
+import httpx
 from Views.globals.app_logger import app_logger as logger
+from MetaTrader.TickStream import get_tick_stream
+from Api.AsyncAPIHandler import AsyncAPI
+from helpers.metrics import timed, set_bot_label
 
 
 class Account:
@@ -30,6 +36,7 @@ class Account:
         self.config = None
         self.symbols = None
         self.client = client
+        self.async_client = None  # Pooled async client for the background loops, bound to their event loop
         self.meta_trader = meta_trader
         self.mt5_accounts_info = None
         self.bots = []
@@ -37,8 +44,12 @@ class Account:
         self.symbol_price = None
         self.ah_repo = AHRepo(engine=engine)
         self.ct_repo = CTRepo(engine=engine)
-        self.processed_events = set()  # Track processed events to prevent duplicates
-        self.bot_processed_events = {}  # Track processed events per bot
+        self.processed_events = OrderedDict()  # Bounded window of processed event ids to prevent duplicates
+        self.processed_events_limit = 1000
+        self.event_reconnect_delay = 5  # Seconds to wait before reconnecting the realtime stream
+        self.idle_wakeup_interval = 5  # Refresh at least every N seconds when no tick arrives
+        self.price_publish_min_points = 1  # Only publish a symbol price when the bid moved this many points
+        self.price_publish_interval = 1  # Publish each symbol price at most once per N seconds
 
     async def on_init(self):
         """ Initialize the account """
@@ -69,13 +80,36 @@ class Account:
                 return True
         return False
 
+    def bot_symbols(self):
+        """ Symbols traded by the account's bots """
+        return {bot.symbol_name for bot in self.bots if getattr(bot, "symbol_name", None)}
+
+    def subscribe_ticks(self):
+        """ Subscribe to the tick stream for the bots' symbols (at most one wake-up per second) """
+        try:
+            return get_tick_stream(self.meta_trader).subscribe(self.bot_symbols(), min_interval=1)
+        except Exception as e:
+            logger.error(f"Failed to subscribe to tick stream: {e}")
+            return None
+
+    async def wait_for_ticks(self, subscription):
+        """ Wait for a price change on the bots' symbols, picking up added bots """
+        if subscription is None:
+            await asyncio.sleep(1)
+            return None
+        for symbol in self.bot_symbols() - subscription.symbols:
+            subscription.add_symbol(symbol)
+        return await subscription.wait(self.idle_wakeup_interval)
+
     async def update_account(self):
         ''' Update the account '''
+        subscription = self.subscribe_ticks()
         while True:
             try:
-                self.mt5_accounts_info = self.meta_trader.get_account_info()
+                with timed("account", "account_info"):
+                    self.mt5_accounts_info = self.meta_trader.get_account_info()
                 if self.balance == self.mt5_accounts_info["balance"] and self.equity == self.mt5_accounts_info["equity"] and self.margin == self.mt5_accounts_info["margin"] and self.total_pnl == self.mt5_accounts_info["profit"]:
-                    await asyncio.sleep(1)
+                    await self.wait_for_ticks(subscription)
                     continue
 
                 self.balance = self.mt5_accounts_info["balance"]
@@ -90,8 +124,9 @@ class Account:
                     "total_pnl": round(self.total_pnl, 2)
                 }
                 account_id = self.id
-                self.client.update_account(account_id, data)
-                await asyncio.sleep(1)
+                with timed("account", "update_account"):
+                    await self.async_client.update_account(account_id, data)
+                await self.wait_for_ticks(subscription)
             except Exception as e:
                 logger.error(f"Unexpected error in update_account: {e}")
                 await asyncio.sleep(1)
@@ -99,6 +134,9 @@ class Account:
     async def run_in_background(self):
         """ Run the account in the background """
         try:
+            self.async_client = AsyncAPI.from_api(self.client)
+            # Background tasks copy this context, so their metrics carry the account label
+            set_bot_label(f"account-{self.id}")
             tasks = [
                 asyncio.create_task(self.update_account()),
                 asyncio.create_task(self.subscribe()),
@@ -181,13 +219,10 @@ class Account:
             return
         
         # Check if we've already processed this event
-        if event.id in self.processed_events:
+        if not self.mark_event_seen(event.id):
             logger.info(f"Event {event.id} already processed, skipping")
             return
         
-        # Mark event as being processed
-        self.processed_events.add(event.id)
-        
         content = event.content
         message = content["message"]
         try:
@@ -229,11 +264,6 @@ class Account:
                 for bot in self.bots:
                     if bot.id == bot_id:
                         self.bots.remove(bot)
-                        # Clean up bot-specific processed events
-                        if bot_id in self.bot_processed_events:
-                            del self.bot_processed_events[bot_id]
-                            logger.info(f"🧹 Cleaned up processed events for deleted bot {bot_id}")
-                        
                         self.client.delete_event(event.id)
                         data = {
                             "title":    bot.name,
@@ -254,87 +284,17 @@ class Account:
             logger.error(f"Failed to handle event: {e}")
 
     async def subscribe(self):
-        """ Subscribe to the events """
-        event_cleanup_counter = 0
+        """ Subscribe to the account's events over a realtime connection """
         while True:
             try:
-                # Get events for each bot individually to prevent race conditions
-                bot_events_processed = 0
-                
-                for bot in self.bots:
-                    try:
-                        # Get events specific to this bot
-                        bot_events = self.client.get_events_by_account_and_bot(self.id, bot.id)
-                        if bot_events and len(bot_events) > 0:
-                            logger.info(f"📨 Processing {len(bot_events)} events for bot {bot.id}")
-                            
-                            # Process events for this bot
-                            for event in bot_events:
-                                try:
-                                    # Check if this bot has already processed this event
-                                    if bot.id not in self.bot_processed_events:
-                                        self.bot_processed_events[bot.id] = set()
-                                    
-                                    if event.id in self.bot_processed_events[bot.id]:
-                                        logger.info(f"⏭️ Bot {bot.id} already processed event {event.id}, skipping")
-                                        continue
-                                    
-                                    # Delete event immediately to prevent other bots from seeing it
-                                    self.client.delete_event(event.id)
-                                    logger.info(f"🗑️ Deleted event {event.id} for bot {bot.id}")
-                                    
-                                    # Mark event as processed for this bot
-                                    self.bot_processed_events[bot.id].add(event.id)
-                                    
-                                    # Process the event
-                                    await self.handle_events(event)
-                                    bot_events_processed += 1
-                                    
-                                except Exception as e:
-                                    logger.error(f"❌ Error processing event {event.id} for bot {bot.id}: {e}")
-                                    # Remove from processed events so it can be retried
-                                    if bot.id in self.bot_processed_events and event.id in self.bot_processed_events[bot.id]:
-                                        self.bot_processed_events[bot.id].remove(event.id)
-                                    
-                    except Exception as e:
-                        logger.error(f"❌ Error processing events for bot {bot.id}: {e}")
-                
-                # Also check for account-level events (create_bot, update_bot, delete_bot)
-                account_events = self.client.get_all_events()
-                if account_events and len(account_events) > 0:
-                    account_tasks = []
-                    for event in account_events:
-                        if event.account == self.id and not hasattr(event, 'bot'):
-                            # This is an account-level event (no specific bot)
-                            account_tasks.append(asyncio.create_task(
-                                self.handle_events(event)))
-                    
-                    if len(account_tasks) > 0:
-                        await asyncio.gather(*account_tasks)
-                        logger.info(f"📨 Processed {len(account_tasks)} account-level events")
-                
-                if bot_events_processed > 0:
-                    logger.info(f"✅ Processed {bot_events_processed} bot-specific events")
-                
-                # Clean up processed events every 100 iterations to prevent memory leaks
-                event_cleanup_counter += 1
-                if event_cleanup_counter >= 100:
-                    # Keep only the last 1000 processed event IDs for account-level events
-                    if len(self.processed_events) > 1000:
-                        events_list = list(self.processed_events)
-                        self.processed_events = set(events_list[-1000:])
-                        logger.info(f"Cleaned up account processed events cache, kept {len(self.processed_events)} entries")
-                    
-                    # Clean up bot-specific processed events
-                    for bot_id, bot_events in self.bot_processed_events.items():
-                        if len(bot_events) > 1000:
-                            events_list = list(bot_events)
-                            self.bot_processed_events[bot_id] = set(events_list[-1000:])
-                            logger.info(f"Cleaned up bot {bot_id} processed events cache, kept {len(self.bot_processed_events[bot_id])} entries")
-                    
-                    event_cleanup_counter = 0
-                    
-            except (ConnectionError, TimeoutError) as e:
+                async for action, event in self.async_client.subscribe_realtime("events", f"account = '{self.id}'"):
+                    if action == "connect":
+                        # (Re)connected - pick up anything created while we were not listening
+                        await self.catch_up_events()
+                    elif action == "create":
+                        await self.process_event(event)
+                logger.info("Realtime event stream closed by the server, reconnecting")
+            except (ConnectionError, TimeoutError, httpx.HTTPError) as e:
                 logger.error(
                     f"Failed to subscribe to events due to connection issue: {e}")
             except RuntimeError as e:
@@ -343,7 +303,38 @@ class Account:
             except Exception as e:
                 logger.error(
                     f"Failed to subscribe to events due to an unexpected error: {e}")
-            await asyncio.sleep(1)
+            await asyncio.sleep(self.event_reconnect_delay)
+
+    async def catch_up_events(self):
+        """ Process events that were created while the realtime connection was down """
+        events = await self.async_client.get_events_by_account(self.id)
+        if events:
+            logger.info(f"📨 Catching up on {len(events)} pending events")
+            for event in events:
+                await self.process_event(event)
+
+    def mark_event_seen(self, event_id):
+        """ Record an event in the bounded dedupe window, returning False if it was already seen """
+        if event_id in self.processed_events:
+            return False
+        self.processed_events[event_id] = True
+        while len(self.processed_events) > self.processed_events_limit:
+            self.processed_events.popitem(last=False)
+        return True
+
+    async def process_event(self, event):
+        """ Process an event received from the realtime stream or the catch-up query """
+        try:
+            if getattr(event, "account", None) != self.id:
+                return
+            if getattr(event, "bot", None) and event.id not in self.processed_events:
+                # Delete bot events immediately so a catch-up query does not pick them up again;
+                # account-level events (create_bot, update_bot, delete_bot) are deleted once handled
+                await self.async_client.delete_event(event.id)
+                logger.info(f"🗑️ Deleted event {event.id} for bot {event.bot}")
+            await self.handle_events(event)
+        except Exception as e:
+            logger.error(f"❌ Error processing event {getattr(event, 'id', None)}: {e}")
 
     async def update_symbols(self):
         """ Update the symbols """
@@ -382,30 +373,28 @@ class Account:
             bot.run()
 
     async def update_symbols_price(self):
+        """ Publish the bid of every traded symbol, once per symbol across bots """
+        subscription = self.subscribe_ticks()
+        publisher = SymbolPricePublisher(
+            self.async_client, self.id, self.meta_trader,
+            min_move_points=self.price_publish_min_points,
+            min_interval=self.price_publish_interval)
         while True:
             try:
-                for bot in self.bots:
-                    # Update the symbol price
-                    bid_price = self.meta_trader.get_bid(bot.symbol_name)
-                    
-                    # Only update if we got a valid price
-                    if bid_price is not None:
-                        # Find the symbol record by name first
-                        symbol_records = self.client.get_symbol_by_name(bot.symbol_name, self.id)
-                        
-                        if symbol_records and len(symbol_records) > 0:
-                            symbol_record = symbol_records[0]
-                            symbol_data = {
-                                "price": bid_price,
-                            }
-                            # Update using the actual symbol ID from the database
-                            self.client.update_symbol(symbol_record.id, symbol_data)
+                with timed("account", "publish_symbol_prices"):
+                    prices = {}
+                    for symbol in self.bot_symbols():
+                        tick = subscription.latest(symbol) if subscription is not None else None
+                        bid_price = tick.bid if tick is not None else self.meta_trader.get_bid(symbol)
+
+                        # Only update if we got a valid price
+                        if bid_price is not None:
+                            prices[symbol] = bid_price
                         else:
-                            logger.debug(f"Symbol '{bot.symbol_name}' not found in database for account {self.id}")
-                    else:
-                        logger.debug(f"Skipping price update for {bot.symbol_name} - no valid bid price available")
-                        
-                await asyncio.sleep(1)
+                            logger.debug(f"Skipping price update for {symbol} - no valid bid price available")
+
+                    await publisher.publish_many(prices)
+                await self.wait_for_ticks(subscription)
             except Exception as e:
                 logger.error(f"Failed to update symbol price: {e}")
                 await asyncio.sleep(1)
@@ -1,11 +1,8 @@
 import threading
 import time
 import logging
-from Strategy.AdaptiveHedging import AdaptiveHedging
-from Strategy.CycleTrader import CycleTrader
-from Strategy.AdvancedCyclesTrader_Organized import AdvancedCyclesTrader
-from Strategy.StockTrader import StockTrader
-from Strategy.MoveGuard import MoveGuard
+from Strategy.registry import get_strategy_class
+from helpers import startup_profile
 import asyncio
 
 
@@ -56,14 +53,17 @@ class Bot:
         """ Initialize the strategy """
         try:
             if self.strategy_name == "Tony AH Recovery":
+                AdaptiveHedging = get_strategy_class(self.strategy_name)
                 self.strategy = AdaptiveHedging(
                     self.meta_trader, self.configs, self.client, self.symbol_name, self)
                 self.strategy.initialize(self.configs, self.settings)
             elif self.strategy_name == "Cycles Trader":
+                CycleTrader = get_strategy_class(self.strategy_name)
                 self.strategy = CycleTrader(
                     self.meta_trader, self.configs, self.client, self.symbol_name, self)
                 self.strategy.initialize(self.configs, self.settings)
             elif self.strategy_name == "Advanced Cycles Trader":
+                AdvancedCyclesTrader = get_strategy_class(self.strategy_name)
                 self.strategy = AdvancedCyclesTrader(
                     self.meta_trader, self.configs, self.client, self.symbol_name, self)
                 # Check if initialize method is async and handle appropriately
@@ -84,6 +84,7 @@ class Bot:
                 except Exception as init_error:
                     print(f"Failed to initialize Advanced Cycles Trader: {init_error}")
             elif self.strategy_name == "MoveGuard":
+                MoveGuard = get_strategy_class(self.strategy_name)
                 self.strategy = MoveGuard(
                     self.meta_trader, self.configs, self.client, self.symbol_name, self)
                 # Check if initialize method is async and handle appropriately
@@ -104,6 +105,7 @@ class Bot:
                 except Exception as init_error:
                     print(f"Failed to initialize MoveGuard: {init_error}")
             elif self.strategy_name == "Stock Trader":
+                StockTrader = get_strategy_class(self.strategy_name)
                 self.strategy = StockTrader(
                     self.meta_trader, self.configs, self.client)
                 self.strategy.initialize(self.configs, self.settings)
@@ -214,6 +216,7 @@ class Bot:
         if self.strategy is not None:
             # Run the strategy
             logging.info(f"Running strategy for bot {self.id}")
+            startup_profile.mark(f"bot {self.id} strategy started")
             await self.strategy.run_in_thread()
         else:
             logging.error(
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from Views.globals.app_logger import app_logger as logger
+
+
+class SymbolPricePublisher:
+    """ Publishes symbol prices to PocketBase once per symbol, not once per bot
+
+    Symbol record ids are resolved once and cached. A price is only written
+    when the bid moved by at least ``min_move_points`` points since the last
+    published value, and at most once every ``min_interval`` seconds per
+    symbol. A move that is held back by the rate limit is published on a
+    later call once the interval has passed. If the point size of a symbol
+    is unknown, any change of the bid is published.
+    """
+
+    def __init__(self, client, account_id, meta_trader, min_move_points=1, min_interval=1.0,
+                 missing_retry_interval=60.0):
+        """
+        Args:
+            client: Async API client used for symbol lookups and updates
+            account_id: Account the symbol records belong to
+            meta_trader: MetaTrader connection used to look up symbol points
+            min_move_points (float): Minimum bid move, in points, worth publishing
+            min_interval (float): Minimum seconds between two writes of the same symbol
+            missing_retry_interval (float): Seconds before looking up a symbol record that was not found again
+        """
+        self.client = client
+        self.account_id = account_id
+        self.meta_trader = meta_trader
+        self.min_move_points = float(min_move_points)
+        self.min_interval = float(min_interval)
+        self.missing_retry_interval = float(missing_retry_interval)
+        self.record_ids = {}
+        self.points = {}
+        self.last_published = {}
+        self.last_publish_time = {}
+        self._missing_since = {}
+
+    async def resolve_record_id(self, symbol):
+        """ Get the PocketBase record id of a symbol, looking it up only once """
+        if symbol in self.record_ids:
+            return self.record_ids[symbol]
+        missing_since = self._missing_since.get(symbol)
+        if missing_since is not None and time.monotonic() - missing_since < self.missing_retry_interval:
+            return None
+
+        symbol_records = await self.client.get_symbol_by_name(symbol, self.account_id)
+        if symbol_records and len(symbol_records) > 0:
+            self.record_ids[symbol] = symbol_records[0].id
+            self._missing_since.pop(symbol, None)
+            return self.record_ids[symbol]
+
+        logger.debug(f"Symbol '{symbol}' not found in database for account {self.account_id}")
+        self._missing_since[symbol] = time.monotonic()
+        return None
+
+    def get_point(self, symbol):
+        """ Get the point size of a symbol, cached after the first lookup """
+        point = self.points.get(symbol)
+        if point is None:
+            symbol_info = self.meta_trader.get_symbol_info(symbol)
+            point = getattr(symbol_info, "point", 0.0) or 0.0
+            if point:
+                self.points[symbol] = point
+        return point
+
+    def should_publish(self, symbol, bid, now=None):
+        """ Check the move threshold and the per-symbol rate limit """
+        now = now if now is not None else time.monotonic()
+        if now - self.last_publish_time.get(symbol, float("-inf")) < self.min_interval:
+            return False
+        last_bid = self.last_published.get(symbol)
+        if last_bid is None:
+            return True
+        point = self.get_point(symbol)
+        if not point:
+            # Unknown point size, no threshold to apply - only publish an actual change
+            return bid != last_bid
+        # Rounded, so a move of exactly min_move_points is not lost to float error
+        return round(abs(bid - last_bid) / point, 6) >= self.min_move_points
+
+    async def publish(self, symbol, bid):
+        """ Publish one symbol price if it is due
+
+        Returns:
+            bool: True if a write was sent
+        """
+        try:
+            if bid is None or not self.should_publish(symbol, bid):
+                return False
+            record_id = await self.resolve_record_id(symbol)
+            if record_id is None:
+                return False
+
+            result = await self.client.update_symbol(record_id, {"price": bid})
+            if result is None:
+                # The record may have been deleted - look it up again next time
+                self.record_ids.pop(symbol, None)
+                return False
+
+            self.last_published[symbol] = bid
+            self.last_publish_time[symbol] = time.monotonic()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to publish price for {symbol}: {e}")
+            return False
+
+    async def publish_many(self, prices):
+        """ Publish the latest bid of several symbols concurrently
+
+        Args:
+            prices (dict): Symbol name -> bid price
+
+        Returns:
+            int: Number of writes sent
+        """
+        results = await asyncio.gather(*(self.publish(symbol, bid) for symbol, bid in prices.items()))
+        return sum(1 for published in results if published)
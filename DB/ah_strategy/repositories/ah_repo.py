@@ -4,6 +4,7 @@ from DB.ah_strategy.models.ah_cycles import AHCycle
 from DB.ah_strategy.models.ah_cycles_orders import AhCyclesOrders
 from datetime import datetime
 from sqlalchemy import and_
+from DB.bulk import upsert_rows, get_rows_by_key
 
 
 class AHRepo:
@@ -198,6 +199,37 @@ class AHRepo:
             print(f"Failed to update AH order: {e}")
             return None
 
+    def get_orders_by_tickets(self, tickets) -> dict[int, AhCyclesOrders]:
+        """Get the orders with the given tickets in one query, as {ticket: order}"""
+        with Session(self.engine) as session:
+            return get_rows_by_key(session, AhCyclesOrders, "ticket", tickets)
+
+    def upsert_orders(self, orders_data) -> list[AhCyclesOrders] | None:
+        """
+        Insert or update orders keyed by ticket in a single transaction.
+
+        :param orders_data: Iterable of order dicts, each with a ticket.
+        :return: The written orders, or None if the transaction failed.
+        """
+        try:
+            return upsert_rows(self.engine, AhCyclesOrders, "ticket", orders_data)
+        except SQLAlchemyError as e:
+            print(f"Failed to upsert AH orders: {e}")
+            return None
+
+    def upsert_cycles(self, cycles_data) -> list[AHCycle] | None:
+        """
+        Insert or update cycles keyed by id in a single transaction.
+
+        :param cycles_data: Iterable of cycle dicts, each with an id.
+        :return: The written cycles, or None if the transaction failed.
+        """
+        try:
+            return upsert_rows(self.engine, AHCycle, "id", cycles_data)
+        except SQLAlchemyError as e:
+            print(f"Failed to upsert AH cycles: {e}")
+            return None
+
     def get_recently_closed_cycles(self, account_id, timestamp):
         """
         Get cycles that were recently closed after the specified timestamp.
@@ -0,0 +1,43 @@
+from sqlmodel import Session, select, col
+
+# Stay well under SQLite's bound-parameter limit for IN (...) lookups
+LOOKUP_CHUNK = 500
+
+
+def get_rows_by_key(session, model, key, values) -> dict:
+    """Load the rows whose `key` column is in `values`, as {value: row}"""
+    column = getattr(model, key)
+    values = list(dict.fromkeys(values))
+    rows = {}
+    for start in range(0, len(values), LOOKUP_CHUNK):
+        chunk = values[start:start + LOOKUP_CHUNK]
+        for row in session.exec(select(model).where(col(column).in_(chunk))).all():
+            rows[getattr(row, key)] = row
+    return rows
+
+
+def upsert_rows(engine, model, key, rows_data) -> list:
+    """Insert or update rows keyed by a unique column, all in one transaction
+
+    :param engine: The database engine.
+    :param model: The SQLModel table class.
+    :param key: Name of the unique column identifying a row (e.g. 'id' or 'ticket').
+    :param rows_data: Iterable of dicts holding the key and the fields to write.
+    :return: The written rows, in input order (later duplicates of a key win).
+    """
+    rows_data = [data for data in rows_data if data.get(key) is not None]
+    if not rows_data:
+        return []
+    with Session(engine, expire_on_commit=False) as session:
+        rows = get_rows_by_key(session, model, key, (data[key] for data in rows_data))
+        for data in rows_data:
+            row = rows.get(data[key])
+            if row is None:
+                row = model(**data)
+                rows[data[key]] = row
+            else:
+                for field, value in data.items():
+                    setattr(row, field, value)
+            session.add(row)
+        session.commit()
+        return [rows[data[key]] for data in rows_data]
@@ -5,6 +5,7 @@ from DB.ct_strategy.models.ct_cycles_orders import CtCyclesOrders
 from DB.ct_strategy.models.ct_config import CTConfig
 from datetime import datetime
 from sqlalchemy import and_
+from DB.bulk import upsert_rows, get_rows_by_key
 
 
 class CTRepo:
@@ -240,6 +241,37 @@ class CTRepo:
                 return config
             return None
 
+    def get_orders_by_tickets(self, tickets) -> dict[int, CtCyclesOrders]:
+        """Get the orders with the given tickets in one query, as {ticket: order}"""
+        with Session(self.engine) as session:
+            return get_rows_by_key(session, CtCyclesOrders, "ticket", tickets)
+
+    def upsert_orders(self, orders_data) -> list[CtCyclesOrders] | None:
+        """
+        Insert or update orders keyed by ticket in a single transaction.
+
+        :param orders_data: Iterable of order dicts, each with a ticket.
+        :return: The written orders, or None if the transaction failed.
+        """
+        try:
+            return upsert_rows(self.engine, CtCyclesOrders, "ticket", orders_data)
+        except SQLAlchemyError as e:
+            print(f"Failed to upsert CT orders: {e}")
+            return None
+
+    def upsert_cycles(self, cycles_data) -> list[CTCycle] | None:
+        """
+        Insert or update cycles keyed by id in a single transaction.
+
+        :param cycles_data: Iterable of cycle dicts, each with an id.
+        :return: The written cycles, or None if the transaction failed.
+        """
+        try:
+            return upsert_rows(self.engine, CTCycle, "id", cycles_data)
+        except SQLAlchemyError as e:
+            print(f"Failed to upsert CT cycles: {e}")
+            return None
+
     def get_recently_closed_cycles(self, account_id, timestamp):
         """
         Get cycles that were recently closed after the specified timestamp.
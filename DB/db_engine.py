@@ -6,6 +6,7 @@ from DB.ct_strategy.models.ct_cycles import CTCycle
 from DB.mt5_login.models.mt5_login import Mt5Login
 from DB.remote_login.models.remote_login import RemoteLogin
 from sqlmodel import SQLModel, create_engine
+from sqlalchemy import event
 from typing import TYPE_CHECKING
 import os
 import logging
@@ -58,6 +59,28 @@ sqlite_url = f"sqlite:///{db_path}"
 # Create the engine
 engine = create_engine(sqlite_url, echo=False)
 
+# Pragmas applied to every new SQLite connection:
+# WAL lets readers run while a sync writes, synchronous=NORMAL only fsyncs at
+# WAL checkpoints (safe in WAL mode), and a 16 MB page cache keeps the order
+# and cycle tables in memory between syncs.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 # Create the db tables
 
 
@@ -2,8 +2,15 @@
 # from aiomql import MetaTrader as MT5
 from Views.globals.app_state import store
 from Views.globals.app_logger import app_logger as logger
-import MetaTrader5 as Mt5
+from MetaTrader.MarketSnapshot import MarketSnapshot
+from MetaTrader.TicketIndex import TicketIndex
+from MetaTrader.PnLEngine import PnLBook
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module, get_mt5_gateway, PRIORITY_MODIFY
+from helpers.metrics import count_mt5_call
+from MetaTrader.SymbolManager import symbol_spec_cache
 # Mt5=MT5()
+Mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
 
 
 class MetaTrader:
@@ -68,9 +75,7 @@ class MetaTrader:
 
     def get_points(self, symbol):
         """ Get the point value of a symbol """
-        Mt5.symbol_select(symbol, True)
-
-        return Mt5.symbol_info(symbol).point
+        return self.get_symbol_spec(symbol).point
 
     def get_symbol_spread(self, symbol):
         """ Get the spread of a symbol """
@@ -80,9 +85,15 @@ class MetaTrader:
 
     def get_pips(self, symbol):
         """ Get the pips of a symbol """
-        Mt5.symbol_select(symbol, True)
+        return self.get_symbol_spec(symbol).pip
 
-        return Mt5.symbol_info(symbol).point * 10
+    def get_symbol_spec(self, symbol):
+        """ Get the cached contract spec of a symbol (point, digits, pip, volume limits, stops level) """
+        return symbol_spec_cache.get(symbol)
+
+    def invalidate_symbol_spec(self, symbol=None):
+        """ Reload the spec of a symbol (or all symbols) on next use """
+        symbol_spec_cache.invalidate(symbol)
 
     def get_ask(self, symbol):
         """ Get the ask price of a symbol """
@@ -119,6 +130,18 @@ class MetaTrader:
         Mt5.symbol_select(symbol, True)
         return Mt5.symbol_info(symbol)
 
+    def get_market_snapshot(self, symbol):
+        """ Get bid, ask, point and tick time of a symbol in a single terminal round trip """
+        try:
+            Mt5.symbol_select(symbol, True)
+            snapshot = MarketSnapshot.from_symbol_info(symbol, Mt5.symbol_info(symbol))
+            if snapshot is None:
+                logger.warning(f"No market data for {symbol} - symbol may not exist or be available")
+            return snapshot
+        except Exception as e:
+            logger.error(f"Error getting market snapshot for {symbol}: {e}")
+            return None
+
     def symbol_info_tick(self, symbol):
         """ Get the current tick information for a symbol """
         Mt5.symbol_select(symbol, True)
@@ -324,6 +347,22 @@ class MetaTrader:
     def get_all_positions(self):
         """ Get all positions """
         return Mt5.positions_get()
+
+    def get_deals_between(self, date_from, date_to):
+        """ Get the history deals executed in a time range
+
+        Args:
+            date_from (int): Range start, seconds since epoch (server time)
+            date_to (int): Range end, seconds since epoch (server time)
+
+        Returns:
+            tuple: Deals in the range, or None on error
+        """
+        try:
+            return Mt5.history_deals_get(int(date_from), int(date_to))
+        except Exception as e:
+            logger.error(f"Error getting deals between {date_from} and {date_to}: {e}")
+            return None
     # get order by ticket
 
     def get_order_by_ticket(self, ticket):
@@ -334,6 +373,39 @@ class MetaTrader:
     def get_all_orders(self):
         """ Get all order open orders """
         return Mt5.orders_get()
+
+    def get_ticket_index(self, magic=None):
+        """ Get an index of all open positions and pending orders keyed by ticket
+
+        Args:
+            magic (int, optional): Only index records with this magic number
+
+        Returns:
+            TicketIndex: Built from one positions_get() and one orders_get() call, or None on error
+        """
+        try:
+            return TicketIndex(Mt5.positions_get(), Mt5.orders_get(), magic=magic)
+        except Exception as e:
+            logger.error(f"Error building ticket index: {e}")
+            return None
+
+    def get_pnl_book(self, symbol, ticket_cycles=None, price=None, pip=0.0):
+        """ Get the P&L of every open position of a symbol in one vectorized pass
+
+        Args:
+            symbol (str): Symbol whose positions are loaded
+            ticket_cycles (dict, optional): Ticket -> cycle id used for the per-cycle totals
+            price (float, optional): Current price used for the pips figures
+            pip (float): Pip size of the symbol
+
+        Returns:
+            PnLBook: Built from one positions_get(symbol=...) call, or None on error
+        """
+        try:
+            return PnLBook(Mt5.positions_get(symbol=symbol), ticket_cycles, price=price, pip=pip)
+        except Exception as e:
+            logger.error(f"Error building P&L book for {symbol}: {e}")
+            return None
     # buy stop
 
     def buy_stop(self, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment=None):
@@ -928,6 +1000,83 @@ class MetaTrader:
             logger.error(f"Error in modify_position_sl_tp: {e}")
             return None
 
+    def modify_positions_sl_tp(self, modifications, symbol=None):
+        """Modify SL/TP of many open positions in one batch.
+
+        Positions are read with a single ``positions_get`` call and serve as the
+        SL view: tickets whose SL/TP already match are skipped. Prices are
+        rounded to the symbol's digits (one ``symbol_info`` per symbol), and all
+        ``order_send`` requests are queued on the MT5 gateway together instead
+        of waiting for each round trip.
+
+        Args:
+            modifications: Iterable of (ticket, sl, tp); sl/tp 0 removes the level, None keeps the current one
+            symbol: Symbol of the positions, narrows the positions lookup when given
+
+        Returns:
+            dict: ticket -> {'status': 'modified' | 'unchanged' | 'not_found' | 'failed',
+                             'sl', 'tp', 'retcode', 'comment'}
+        """
+        results = {}
+        try:
+            positions = Mt5.positions_get(symbol=symbol) if symbol else Mt5.positions_get()
+            view = {int(p.ticket): p for p in positions or ()}
+            digits = {}
+            requests = []
+            for ticket, sl, tp in modifications:
+                ticket = int(ticket)
+                position = view.get(ticket)
+                if position is None:
+                    results[ticket] = {'status': 'not_found', 'sl': sl, 'tp': tp, 'retcode': None, 'comment': None}
+                    continue
+                if position.symbol not in digits:
+                    info = Mt5.symbol_info(position.symbol)
+                    digits[position.symbol] = (info.digits, info.point) if info is not None else (5, 0.00001)
+                symbol_digits, point = digits[position.symbol]
+                new_sl = round(float(sl), symbol_digits) if sl is not None and sl > 0 else (0.0 if sl is not None else position.sl)
+                new_tp = round(float(tp), symbol_digits) if tp is not None and tp > 0 else (0.0 if tp is not None else position.tp)
+                if abs(position.sl - new_sl) < point / 2 and abs(position.tp - new_tp) < point / 2:
+                    results[ticket] = {'status': 'unchanged', 'sl': new_sl, 'tp': new_tp, 'retcode': None, 'comment': None}
+                    continue
+                requests.append((ticket, {
+                    "action": Mt5.TRADE_ACTION_SLTP,
+                    "symbol": position.symbol,
+                    "position": ticket,
+                    "sl": new_sl,
+                    "tp": new_tp,
+                }))
+
+            for (ticket, request), result in zip(requests, self._send_pipelined([r for _, r in requests])):
+                retcode = getattr(result, 'retcode', None)
+                if retcode in (Mt5.TRADE_RETCODE_DONE, Mt5.TRADE_RETCODE_NO_CHANGES):
+                    status = 'modified' if retcode == Mt5.TRADE_RETCODE_DONE else 'unchanged'
+                else:
+                    status = 'failed'
+                    logger.error(f"order_send failed, retcode={retcode}, request: {request}")
+                results[ticket] = {'status': status, 'sl': request['sl'], 'tp': request['tp'],
+                                   'retcode': retcode, 'comment': getattr(result, 'comment', None)}
+        except Exception as e:
+            logger.error(f"Error in modify_positions_sl_tp: {e}")
+        return results
+
+    def _send_pipelined(self, requests):
+        """Send order requests back to back on the MT5 gateway, returning results in request order"""
+        gateway = get_mt5_gateway()
+        if not gateway.enabled or gateway.in_gateway_thread() or len(requests) < 2:
+            return [Mt5.order_send(request) for request in requests]
+        futures = []
+        for request in requests:
+            count_mt5_call("order_send")
+            futures.append(gateway.submit(PRIORITY_MODIFY, MetaTrader5.order_send, request))
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"order_send raised: {e}")
+                results.append(None)
+        return results
+
     # check if order is pending
     def check_order_is_pending(self, ticket):
         """
@@ -0,0 +1,166 @@
+""" Single worker thread that owns every MetaTrader 5 terminal call. """
+import asyncio
+import itertools
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from Views.globals.app_logger import app_logger as logger
+from helpers.metrics import registry, CountedModule, MT5_GATEWAY_SECONDS, MT5_GATEWAY_QUEUE_DEPTH
+
+# Lower runs first: trading beats SL/TP modification beats status/profit polling
+PRIORITY_TRADE = 0
+PRIORITY_MODIFY = 1
+PRIORITY_QUERY = 2
+
+# MT5 TRADE_ACTION_* values of order_send requests that only change SL/TP or a pending price
+MODIFY_ACTIONS = (6, 7)  # TRADE_ACTION_SLTP, TRADE_ACTION_MODIFY
+TRADE_CALLS = frozenset(('order_send', 'order_check', 'initialize', 'login', 'shutdown'))
+
+_STOP = object()
+
+
+class MT5Gateway:
+    """Runs MT5 calls one at a time on a dedicated thread, most urgent first.
+
+    The ``MetaTrader5`` package is process-global and not thread-safe. The
+    strategy threads, the order/cycle managers and the account tasks submit
+    their calls here instead of calling the terminal concurrently. Requests
+    are ordered by priority and then by arrival, so an order placement never
+    waits behind a burst of position polling.
+    """
+
+    def __init__(self, name="mt5-gateway"):
+        self.name = name
+        self.enabled = os.environ.get("MT5_GATEWAY_ENABLED", "1") != "0"
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.calls_completed = 0
+
+    def start(self):
+        """Start the worker thread if it is not running"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """Finish the queued calls and stop the worker thread"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put((PRIORITY_QUERY + 1, next(self._sequence), _STOP))
+        thread.join(timeout)
+        self._thread = None
+
+    def in_gateway_thread(self):
+        """Check whether the caller is the worker thread itself"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def queue_depth(self):
+        """Number of calls waiting for the worker thread"""
+        return self._queue.qsize()
+
+    def submit(self, priority, func, /, *args, **kwargs):
+        """Queue a call and return a ``concurrent.futures.Future`` for its result"""
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        future = Future()
+        self._queue.put((priority, next(self._sequence), (future, func, args, kwargs, time.perf_counter())))
+        if registry.enabled:
+            MT5_GATEWAY_QUEUE_DEPTH.set(self._queue.qsize())
+        return future
+
+    def call(self, priority, func, /, *args, **kwargs):
+        """Run a call on the worker thread and wait for its result"""
+        if not self.enabled or self.in_gateway_thread():
+            return func(*args, **kwargs)
+        return self.submit(priority, func, *args, **kwargs).result()
+
+    async def call_async(self, priority, func, /, *args, **kwargs):
+        """Run a call on the worker thread without blocking the event loop"""
+        if not self.enabled or self.in_gateway_thread():
+            return func(*args, **kwargs)
+        return await asyncio.wrap_future(self.submit(priority, func, *args, **kwargs))
+
+    def wrap(self, module):
+        """Route every function of a module (e.g. ``MetaTrader5``) through the gateway"""
+        return GatewayModule(module, self)
+
+    def _run(self):
+        while True:
+            _, _, request = self._queue.get()
+            if request is _STOP:
+                break
+            future, func, args, kwargs, queued_at = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.perf_counter()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finished = time.perf_counter()
+            self.calls_completed += 1
+            if registry.enabled:
+                call_name = getattr(func, '__name__', 'call')
+                MT5_GATEWAY_SECONDS.observe(started - queued_at, call_name, "queue")
+                MT5_GATEWAY_SECONDS.observe(finished - started, call_name, "run")
+                MT5_GATEWAY_QUEUE_DEPTH.set(self._queue.qsize())
+
+
+class GatewayModule:
+    """Module stand-in whose functions run on the gateway thread; constants and types pass through"""
+
+    def __init__(self, module, gateway):
+        object.__setattr__(self, '_module', module)
+        object.__setattr__(self, '_gateway', gateway)
+
+    def __getattr__(self, name):
+        value = getattr(self._module, name)
+        if callable(value) and not isinstance(value, type):
+            value = self._route(name, value)
+        object.__setattr__(self, name, value)
+        return value
+
+    def _route(self, name, func):
+        gateway = self._gateway
+
+        if name == 'order_send':
+            def routed(*args, **kwargs):
+                request = args[0] if args else kwargs.get('request')
+                action = request.get('action') if isinstance(request, dict) else None
+                priority = PRIORITY_MODIFY if action in MODIFY_ACTIONS else PRIORITY_TRADE
+                return gateway.call(priority, func, *args, **kwargs)
+        else:
+            priority = PRIORITY_TRADE if name in TRADE_CALLS else PRIORITY_QUERY
+
+            def routed(*args, **kwargs):
+                return gateway.call(priority, func, *args, **kwargs)
+
+        routed.__name__ = name
+        routed.__doc__ = getattr(func, '__doc__', None)
+        return routed
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_mt5_gateway():
+    """Get the process-wide MT5 gateway"""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = MT5Gateway()
+            logger.info("MT5 gateway created" + ("" if _gateway.enabled else " (disabled, calling MT5 directly)"))
+        return _gateway
+
+
+def routed_module(module):
+    """Wrap the ``MetaTrader5`` module so calls are counted per bot and run on the gateway thread"""
+    return CountedModule(get_mt5_gateway().wrap(module))
@@ -0,0 +1,71 @@
+""" Tick-scoped market snapshot shared by the strategy hot loops. """
+import datetime
+import time
+
+
+class MarketSnapshot:
+    """Read-only view of a symbol's market state captured once per loop iteration.
+
+    Strategies fetch one snapshot per tick and pass it to grid, take-profit,
+    trailing-SL and profit code instead of re-querying MetaTrader for every
+    cycle and every order.
+    """
+
+    __slots__ = ('symbol', 'bid', 'ask', 'mid', 'spread', 'point', 'tick_time', 'captured_at')
+
+    def __init__(self, symbol, bid, ask, point=0.0, tick_time=None, captured_at=None):
+        self.symbol = symbol
+        self.bid = float(bid)
+        self.ask = float(ask)
+        self.mid = (self.bid + self.ask) / 2
+        self.spread = self.ask - self.bid
+        self.point = float(point or 0.0)
+        self.tick_time = tick_time
+        self.captured_at = captured_at if captured_at is not None else time.monotonic()
+
+    @classmethod
+    def from_symbol_info(cls, symbol, symbol_info):
+        """Build a snapshot from an MT5 ``SymbolInfo`` record, or None if prices are missing."""
+        if symbol_info is None:
+            return None
+        bid = getattr(symbol_info, 'bid', None)
+        ask = getattr(symbol_info, 'ask', None)
+        if not bid or not ask:
+            return None
+        return cls(
+            symbol,
+            bid,
+            ask,
+            point=getattr(symbol_info, 'point', 0.0),
+            tick_time=getattr(symbol_info, 'time', None),
+        )
+
+    @property
+    def pip(self):
+        """Pip size for the symbol (10 points), 0.0 when the point is unknown"""
+        return self.point * 10
+
+    def age(self, now=None):
+        """Seconds elapsed since the snapshot was captured"""
+        return (now if now is not None else time.monotonic()) - self.captured_at
+
+    def is_fresh(self, max_age):
+        """Check whether the snapshot is still usable for the current tick"""
+        return self.age() <= max_age
+
+    def to_market_data(self):
+        """Return the market data dict shape used by the strategy loops"""
+        return {
+            'price': self.mid,
+            'bid': self.bid,
+            'ask': self.ask,
+            'last': self.mid,
+            'spread': self.spread,
+            'point': self.point,
+            'tick_time': self.tick_time,
+            'time': datetime.datetime.now(),
+            'snapshot': self,
+        }
+
+    def __repr__(self):
+        return f"MarketSnapshot({self.symbol}, bid={self.bid}, ask={self.ask}, point={self.point})"
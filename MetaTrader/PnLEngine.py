@@ -0,0 +1,112 @@
+""" Vectorized P&L over the open MT5 positions of a symbol. """
+import time
+import numpy as np
+
+POSITION_TYPE_BUY = 0
+
+
+class PnLBook:
+    """Per-order, per-cycle and account P&L computed in one vectorized pass.
+
+    Built from a single ``positions_get(symbol=...)`` result so profit sync
+    and take-profit checks read positions from memory instead of issuing one
+    terminal call per order.
+    """
+
+    __slots__ = ('tickets', 'profit', 'profit_pips', 'swap', 'commission', 'price',
+                 'cycle_ids', 'cycle_profit', 'cycle_profit_pips', 'total_profit',
+                 'total_profit_pips', 'captured_at', '_rows', '_cycle_rows', '_ticket_cycles')
+
+    def __init__(self, positions, ticket_cycles=None, price=None, pip=0.0, captured_at=None):
+        """
+        Args:
+            positions: MT5 position records (ticket, type, volume, price_open, profit, swap, commission)
+            ticket_cycles (dict): Ticket -> cycle id for the positions that belong to cycles
+            price (float): Current price used for the pips figures
+            pip (float): Pip size of the symbol
+            captured_at (float): Monotonic time the positions were fetched
+        """
+        positions = list(positions or ())
+        ticket_cycles = ticket_cycles or {}
+        self._ticket_cycles = ticket_cycles
+        count = len(positions)
+
+        self.tickets = np.fromiter((int(p.ticket) for p in positions), dtype=np.int64, count=count)
+        direction = np.fromiter((1.0 if getattr(p, 'type', POSITION_TYPE_BUY) == POSITION_TYPE_BUY else -1.0
+                                 for p in positions), dtype=np.float64, count=count)
+        price_open = np.fromiter((float(getattr(p, 'price_open', 0.0) or 0.0) for p in positions),
+                                 dtype=np.float64, count=count)
+        self.profit = np.fromiter((float(getattr(p, 'profit', 0.0) or 0.0) for p in positions),
+                                  dtype=np.float64, count=count)
+        self.swap = np.fromiter((float(getattr(p, 'swap', 0.0) or 0.0) for p in positions),
+                                dtype=np.float64, count=count)
+        self.commission = np.fromiter((float(getattr(p, 'commission', 0.0) or 0.0) for p in positions),
+                                      dtype=np.float64, count=count)
+
+        self.price = price
+        if price and pip:
+            self.profit_pips = direction * (float(price) - price_open) / float(pip)
+        else:
+            self.profit_pips = np.zeros(count, dtype=np.float64)
+
+        # Group positions by cycle: index -1 marks positions outside every known cycle
+        self.cycle_ids = list(dict.fromkeys(str(c) for c in ticket_cycles.values()))
+        self._cycle_rows = {cycle_id: i for i, cycle_id in enumerate(self.cycle_ids)}
+        slots = np.fromiter((self._cycle_rows.get(str(ticket_cycles.get(int(t), '')), -1) for t in self.tickets),
+                            dtype=np.int64, count=count)
+        owned = slots >= 0
+        cycles = len(self.cycle_ids)
+        self.cycle_profit = np.bincount(slots[owned], weights=self.profit[owned], minlength=cycles)
+        self.cycle_profit_pips = np.bincount(slots[owned], weights=self.profit_pips[owned], minlength=cycles)
+
+        self.total_profit = float(self.profit.sum())
+        self.total_profit_pips = float(self.profit_pips.sum())
+        self._rows = {int(t): i for i, t in enumerate(self.tickets)}
+        self.captured_at = captured_at if captured_at is not None else time.monotonic()
+
+    def has(self, ticket):
+        """Check if the ticket is one of the open positions"""
+        return int(ticket) in self._rows
+
+    def order(self, ticket):
+        """Get the P&L of one position, or None if the ticket is not open
+
+        Returns:
+            dict: profit, profit_pips, swap, commission and close_price (current price)
+        """
+        row = self._rows.get(int(ticket))
+        if row is None:
+            return None
+        return {
+            'profit': float(self.profit[row]),
+            'profit_pips': float(self.profit_pips[row]),
+            'swap': float(self.swap[row]),
+            'commission': float(self.commission[row]),
+            'close_price': self.price,
+        }
+
+    def cycle_of(self, ticket):
+        """Get the cycle id a ticket was grouped under, or None"""
+        cycle_id = self._ticket_cycles.get(int(ticket))
+        return str(cycle_id) if cycle_id is not None else None
+
+    def cycle(self, cycle_id):
+        """Get the open profit of a cycle as (dollars, pips), (0.0, 0.0) if it has no open positions"""
+        i = self._cycle_rows.get(str(cycle_id))
+        if i is None:
+            return 0.0, 0.0
+        return float(self.cycle_profit[i]), float(self.cycle_profit_pips[i])
+
+    def age(self, now=None):
+        """Seconds elapsed since the positions were fetched"""
+        return (now if now is not None else time.monotonic()) - self.captured_at
+
+    def is_fresh(self, max_age):
+        """Check whether the book is still usable for the current tick"""
+        return self.age() <= max_age
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __repr__(self):
+        return f"PnLBook(positions={len(self)}, cycles={len(self.cycle_ids)}, total_profit={self.total_profit:.2f})"
@@ -0,0 +1,733 @@
+""" Simulated MetaTrader backend that replays historical ticks faster than real time. """
+import asyncio
+import csv
+import datetime
+import heapq
+import time
+from collections import deque, namedtuple
+import numpy as np
+from Views.globals.app_logger import app_logger as logger
+from MetaTrader.MarketSnapshot import MarketSnapshot
+from MetaTrader.TicketIndex import TicketIndex
+from MetaTrader.PnLEngine import PnLBook
+from MetaTrader.SymbolSpec import SymbolSpec
+
+# MetaTrader5 constants used by the strategies (same values as the MetaTrader5 package)
+ORDER_TYPE_BUY = 0
+ORDER_TYPE_SELL = 1
+ORDER_TYPE_BUY_LIMIT = 2
+ORDER_TYPE_SELL_LIMIT = 3
+ORDER_TYPE_BUY_STOP = 4
+ORDER_TYPE_SELL_STOP = 5
+TRADE_ACTION_DEAL = 1
+TRADE_ACTION_PENDING = 5
+TRADE_ACTION_SLTP = 6
+TRADE_ACTION_MODIFY = 7
+TRADE_ACTION_REMOVE = 8
+TRADE_RETCODE_DONE = 10009
+TRADE_RETCODE_INVALID = 10013
+TRADE_RETCODE_INVALID_PRICE = 10015
+TRADE_RETCODE_NO_CHANGES = 10025
+TRADE_RETCODE_POSITION_CLOSED = 10036
+DEAL_ENTRY_IN = 0
+DEAL_ENTRY_OUT = 1
+DEAL_REASON_EXPERT = 3
+DEAL_REASON_SL = 4
+DEAL_REASON_TP = 5
+
+TIMEFRAME_SECONDS = {
+    "M1": 60, "M5": 300, "M15": 900, "M30": 1800, "H1": 3600,
+    "H4": 14400, "D1": 86400, "W1": 604800, "MN1": 2592000,
+}
+
+Tick = namedtuple('Tick', 'symbol time time_msc bid ask last volume')
+SymbolInfo = namedtuple('SymbolInfo', 'name bid ask point digits spread time trade_contract_size '
+                                      'volume_min volume_max volume_step trade_stops_level visible')
+TradePosition = namedtuple('TradePosition', 'ticket time time_update type magic identifier volume '
+                                            'price_open sl tp price_current swap profit commission symbol comment')
+TradeOrder = namedtuple('TradeOrder', 'ticket time_setup type magic volume_initial volume_current '
+                                      'price_open sl tp price_current symbol comment')
+TradeDeal = namedtuple('TradeDeal', 'ticket order time type entry magic position_id reason volume '
+                                    'price commission swap profit symbol comment')
+OrderSendResult = namedtuple('OrderSendResult', 'retcode deal order volume price bid ask comment request')
+AccountInfo = namedtuple('AccountInfo', 'login balance equity profit margin margin_free currency leverage server')
+
+CANDLE_DTYPE = np.dtype([('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'),
+                         ('close', '<f8'), ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8')])
+
+
+def _parse_tick_time(value):
+    """Tick time in milliseconds from epoch seconds, epoch milliseconds or an ISO timestamp"""
+    try:
+        number = float(value)
+        return int(number if number > 1e11 else number * 1000)
+    except ValueError:
+        moment = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=datetime.timezone.utc)
+        return int(moment.timestamp() * 1000)
+
+
+def load_tick_csv(path, symbol=None):
+    """Stream ticks from a CSV file
+
+    The file needs ``bid`` and ``ask`` columns and a ``time_msc`` or ``time``
+    column (epoch seconds, epoch milliseconds or ISO). A ``symbol`` column is
+    optional when the symbol argument is given.
+
+    Yields:
+        Tick: One record per row, in file order
+    """
+    with open(path, newline='') as handle:
+        for row in csv.DictReader(handle):
+            time_msc = _parse_tick_time(row.get('time_msc') or row['time'])
+            yield Tick(
+                symbol or row['symbol'],
+                time_msc // 1000,
+                time_msc,
+                float(row['bid']),
+                float(row['ask']),
+                float(row.get('last') or 0.0),
+                float(row.get('volume') or 0.0),
+            )
+
+
+def merge_ticks(*streams):
+    """Merge several time-ordered tick streams (e.g. one file per symbol) into one"""
+    return heapq.merge(*streams, key=lambda tick: tick.time_msc)
+
+
+class VirtualClock:
+    """Replay time, advanced by the tick stream instead of the wall clock"""
+
+    def __init__(self, time_msc=0):
+        self.time_msc = int(time_msc)
+
+    def advance(self, time_msc):
+        """Move the clock forward to a tick's time (never backwards)"""
+        self.time_msc = max(self.time_msc, int(time_msc))
+
+    def time(self):
+        """Current replay time in epoch seconds"""
+        return self.time_msc / 1000.0
+
+    def now(self):
+        """Current replay time as a UTC datetime"""
+        return datetime.datetime.fromtimestamp(self.time(), tz=datetime.timezone.utc)
+
+
+class SimulatedMetaTrader:
+    """Drop-in replacement for ``MetaTrader`` driven by historical ticks.
+
+    Exposes the same method surface as ``MetaTrader/MT5.MetaTrader`` (prices,
+    market/pending orders, SL/TP modification, positions, candles, ...) on top
+    of an in-memory matching engine. Each ``step()`` applies the next tick:
+    pending orders trigger, SL/TP levels are hit, floating profit and candles
+    are updated and the virtual clock advances.
+    """
+
+    def __init__(self, ticks, symbols=None, balance=10000.0, currency="USD", leverage=100,
+                 login=0, server="Simulator", history_size=5000):
+        """
+        Args:
+            ticks: Time-ordered iterable of Tick records (see load_tick_csv / merge_ticks)
+            symbols (dict): Symbol -> spec overrides (point, digits, contract_size, volume_min, ...)
+            balance (float): Starting account balance
+            currency (str): Account currency (profits are not converted)
+            leverage (int): Account leverage reported by get_account_info
+            login (int): Account number reported by get_account_info
+            server (str): Server name reported by get_account_info
+            history_size (int): Candles kept per symbol and timeframe
+        """
+        self.username = login
+        self.account_id = login
+        self.server = server
+        self.authorized = True
+        self.currency = currency
+        self.leverage = leverage
+        self.balance = float(balance)
+        self.clock = VirtualClock()
+        self.symbol_specs = dict(symbols or {})
+        self.history_size = history_size
+
+        self._ticks = iter(ticks)
+        self._quotes = {}
+        self._positions = {}
+        self._orders = {}
+        self._deals = []
+        self._closed_tickets = set()
+        self._candles = {}
+        self._next_ticket = 1000000
+        self.ticks_processed = 0
+
+    # ==================== REPLAY ====================
+
+    def step(self):
+        """Apply the next tick to the simulated market
+
+        Returns:
+            Tick: The tick applied, or None when the tick stream is exhausted
+        """
+        tick = next(self._ticks, None)
+        if tick is None:
+            return None
+        self.clock.advance(tick.time_msc)
+        self._quotes[tick.symbol] = tick
+        self._update_candles(tick)
+        self._match(tick)
+        self.ticks_processed += 1
+        return tick
+
+    def replay(self, on_tick=None, max_ticks=None):
+        """Replay ticks as fast as possible, calling on_tick(simulator, tick) after each one
+
+        Returns:
+            dict: Ticks replayed, wall and CPU seconds, and CPU microseconds per tick spent in on_tick
+        """
+        return self._finish_replay(*self._replay_sync(on_tick, max_ticks))
+
+    async def replay_async(self, on_tick=None, max_ticks=None):
+        """Like replay() for coroutine callbacks such as a strategy's per-tick processing"""
+        started_wall, started_cpu, callback_cpu, count = time.perf_counter(), time.process_time(), 0.0, 0
+        while max_ticks is None or count < max_ticks:
+            tick = self.step()
+            if tick is None:
+                break
+            count += 1
+            if on_tick is not None:
+                before = time.process_time()
+                await on_tick(self, tick)
+                callback_cpu += time.process_time() - before
+        return self._finish_replay(count, started_wall, started_cpu, callback_cpu)
+
+    def _replay_sync(self, on_tick, max_ticks):
+        started_wall, started_cpu, callback_cpu, count = time.perf_counter(), time.process_time(), 0.0, 0
+        while max_ticks is None or count < max_ticks:
+            tick = self.step()
+            if tick is None:
+                break
+            count += 1
+            if on_tick is not None:
+                before = time.process_time()
+                result = on_tick(self, tick)
+                if asyncio.iscoroutine(result):
+                    result.close()
+                    raise TypeError("replay() got a coroutine callback - use replay_async()")
+                callback_cpu += time.process_time() - before
+        return count, started_wall, started_cpu, callback_cpu
+
+    def _finish_replay(self, count, started_wall, started_cpu, callback_cpu):
+        stats = {
+            'ticks': count,
+            'wall_seconds': time.perf_counter() - started_wall,
+            'cpu_seconds': time.process_time() - started_cpu,
+            'callback_cpu_us_per_tick': (callback_cpu / count * 1e6) if count else 0.0,
+            'replay_time': self.clock.now().isoformat() if self.clock.time_msc else None,
+        }
+        logger.info(f"Replayed {count} ticks in {stats['wall_seconds']:.2f}s "
+                    f"({stats['callback_cpu_us_per_tick']:.1f} us CPU per tick in callback)")
+        return stats
+
+    # ==================== MATCHING ENGINE ====================
+
+    def _new_ticket(self):
+        self._next_ticket += 1
+        return self._next_ticket
+
+    def _spec(self, symbol):
+        """Symbol contract spec with defaults derived from the symbol name"""
+        spec = self.symbol_specs.get(symbol)
+        if spec is None or 'point' not in spec:
+            name = symbol.upper()
+            if 'JPY' in name:
+                point, digits = 0.001, 3
+            elif any(metal in name for metal in ('XAU', 'XAG', 'BTC', 'ETH')) or name.startswith('US'):
+                point, digits = 0.01, 2
+            else:
+                point, digits = 0.00001, 5
+            spec = {'point': point, 'digits': digits, 'contract_size': 100000.0,
+                    'volume_min': 0.01, 'volume_max': 100.0, 'volume_step': 0.01, **(spec or {})}
+            self.symbol_specs[symbol] = spec
+        return spec
+
+    def _profit(self, position_type, symbol, volume, price_open, price_close):
+        direction = 1.0 if position_type == ORDER_TYPE_BUY else -1.0
+        return round(direction * (price_close - price_open) * volume * self._spec(symbol)['contract_size'], 2)
+
+    def _match(self, tick):
+        """Trigger pending orders, then SL/TP, then refresh floating profit for the tick's symbol"""
+        for order in [o for o in self._orders.values() if o.symbol == tick.symbol]:
+            if self._pending_triggered(order, tick):
+                del self._orders[order.ticket]
+                price = tick.ask if order.type in (ORDER_TYPE_BUY_LIMIT, ORDER_TYPE_BUY_STOP) else tick.bid
+                side = ORDER_TYPE_BUY if order.type in (ORDER_TYPE_BUY_LIMIT, ORDER_TYPE_BUY_STOP) else ORDER_TYPE_SELL
+                self._open_position(order.ticket, side, order.symbol, order.volume_current, price,
+                                    order.sl, order.tp, order.magic, order.comment)
+
+        for position in [p for p in self._positions.values() if p.symbol == tick.symbol]:
+            if position.type == ORDER_TYPE_BUY:
+                close_price = tick.bid
+                hit_sl = position.sl > 0 and close_price <= position.sl
+                hit_tp = position.tp > 0 and close_price >= position.tp
+            else:
+                close_price = tick.ask
+                hit_sl = position.sl > 0 and close_price >= position.sl
+                hit_tp = position.tp > 0 and close_price <= position.tp
+            if hit_sl or hit_tp:
+                self._close(position, close_price, DEAL_REASON_SL if hit_sl else DEAL_REASON_TP)
+            else:
+                self._positions[position.ticket] = position._replace(
+                    price_current=close_price,
+                    profit=self._profit(position.type, position.symbol, position.volume, position.price_open, close_price),
+                )
+
+    @staticmethod
+    def _pending_triggered(order, tick):
+        if order.type == ORDER_TYPE_BUY_STOP:
+            return tick.ask >= order.price_open
+        if order.type == ORDER_TYPE_BUY_LIMIT:
+            return tick.ask <= order.price_open
+        if order.type == ORDER_TYPE_SELL_STOP:
+            return tick.bid <= order.price_open
+        if order.type == ORDER_TYPE_SELL_LIMIT:
+            return tick.bid >= order.price_open
+        return False
+
+    def _open_position(self, ticket, side, symbol, volume, price, sl, tp, magic, comment):
+        now = self.clock.time_msc // 1000
+        position = TradePosition(ticket, now, now, side, magic, ticket, float(volume), float(price),
+                                 float(sl or 0.0), float(tp or 0.0), float(price), 0.0, 0.0, 0.0, symbol, comment or "")
+        self._positions[ticket] = position
+        self._record_deal(ticket, side, DEAL_ENTRY_IN, position, price, 0.0, DEAL_REASON_EXPERT)
+        return position
+
+    def _close(self, position, price, reason=DEAL_REASON_EXPERT):
+        profit = self._profit(position.type, position.symbol, position.volume, position.price_open, price)
+        del self._positions[position.ticket]
+        self._closed_tickets.add(position.ticket)
+        self.balance += profit
+        closing_side = ORDER_TYPE_SELL if position.type == ORDER_TYPE_BUY else ORDER_TYPE_BUY
+        return self._record_deal(self._new_ticket(), closing_side, DEAL_ENTRY_OUT, position, price, profit, reason)
+
+    def _record_deal(self, order_ticket, side, entry, position, price, profit, reason):
+        deal = TradeDeal(self._new_ticket(), order_ticket, self.clock.time_msc // 1000, side, entry, position.magic,
+                         position.ticket, reason, position.volume, float(price), 0.0, 0.0, profit,
+                         position.symbol, position.comment)
+        self._deals.append(deal)
+        return deal
+
+    def _result(self, retcode, request, order=0, deal=0, volume=0.0, price=0.0, comment=""):
+        quote = self._quotes.get(request.get('symbol'))
+        return OrderSendResult(retcode, deal, order, volume, price, quote.bid if quote else 0.0,
+                               quote.ask if quote else 0.0, comment, request)
+
+    def order_send(self, request):
+        """Execute an MT5-style trade request against the simulated market
+
+        Returns:
+            OrderSendResult: retcode TRADE_RETCODE_DONE on success, or None for a malformed request
+        """
+        if not isinstance(request, dict):
+            logger.error("order_send requires a dictionary parameter")
+            return None
+        action = request.get('action')
+        symbol = request.get('symbol')
+        quote = self._quotes.get(symbol) if symbol else None
+
+        if action == TRADE_ACTION_DEAL:
+            if quote is None:
+                return self._result(TRADE_RETCODE_INVALID_PRICE, request, comment="No prices")
+            side = request.get('type')
+            price = quote.ask if side == ORDER_TYPE_BUY else quote.bid
+            position_ticket = request.get('position')
+            if position_ticket:
+                position = self._positions.get(int(position_ticket))
+                if position is None:
+                    return self._result(TRADE_RETCODE_POSITION_CLOSED, request, comment="Position not found")
+                deal = self._close(position, price)
+                return self._result(TRADE_RETCODE_DONE, request, order=deal.order, deal=deal.ticket,
+                                    volume=position.volume, price=price)
+            ticket = self._new_ticket()
+            self._open_position(ticket, side, symbol, request.get('volume', 0.0), price, request.get('sl'),
+                                request.get('tp'), request.get('magic', 0), request.get('comment'))
+            return self._result(TRADE_RETCODE_DONE, request, order=ticket, deal=ticket,
+                                volume=request.get('volume', 0.0), price=price)
+
+        if action == TRADE_ACTION_PENDING:
+            ticket = self._new_ticket()
+            volume = float(request.get('volume', 0.0))
+            price = float(request.get('price', 0.0))
+            self._orders[ticket] = TradeOrder(ticket, self.clock.time_msc // 1000, request.get('type'),
+                                              request.get('magic', 0), volume, volume, price,
+                                              float(request.get('sl') or 0.0), float(request.get('tp') or 0.0),
+                                              quote.bid if quote else price, symbol, request.get('comment') or "")
+            return self._result(TRADE_RETCODE_DONE, request, order=ticket, volume=volume, price=price)
+
+        if action == TRADE_ACTION_SLTP:
+            position = self._positions.get(int(request.get('position', 0)))
+            if position is None:
+                return self._result(TRADE_RETCODE_POSITION_CLOSED, request, comment="Position not found")
+            self._positions[position.ticket] = position._replace(
+                sl=float(request.get('sl') or 0.0), tp=float(request.get('tp') or 0.0))
+            return self._result(TRADE_RETCODE_DONE, request, order=position.ticket)
+
+        if action in (TRADE_ACTION_REMOVE, TRADE_ACTION_MODIFY):
+            order = self._orders.get(int(request.get('order', 0)))
+            if order is None:
+                return self._result(TRADE_RETCODE_INVALID, request, comment="Order not found")
+            if action == TRADE_ACTION_REMOVE:
+                del self._orders[order.ticket]
+                self._closed_tickets.add(order.ticket)
+            else:
+                self._orders[order.ticket] = order._replace(
+                    price_open=float(request.get('price', order.price_open)),
+                    sl=float(request.get('sl', order.sl) or 0.0), tp=float(request.get('tp', order.tp) or 0.0))
+            return self._result(TRADE_RETCODE_DONE, request, order=order.ticket)
+
+        return self._result(TRADE_RETCODE_INVALID, request, comment="Unsupported action")
+
+    # ==================== CANDLES ====================
+
+    def _update_candles(self, tick):
+        spread = int(round((tick.ask - tick.bid) / self._spec(tick.symbol)['point']))
+        for timeframe, seconds in TIMEFRAME_SECONDS.items():
+            bars = self._candles.setdefault((tick.symbol, timeframe), deque(maxlen=self.history_size))
+            start = tick.time - tick.time % seconds
+            if bars and bars[-1][0] == start:
+                bar = bars[-1]
+                bar[2] = max(bar[2], tick.bid)
+                bar[3] = min(bar[3], tick.bid)
+                bar[4] = tick.bid
+                bar[5] += 1
+            else:
+                bars.append([start, tick.bid, tick.bid, tick.bid, tick.bid, 1, spread, 0])
+
+    def get_candles(self, symbol, timeframe, count=10):
+        """Get the latest candles built from the replayed ticks, oldest first (like copy_rates_from_pos)"""
+        bars = self._candles.get((symbol, timeframe if timeframe in TIMEFRAME_SECONDS else "H1"))
+        if not bars:
+            return None
+        selected = list(bars)[-count:]
+        return np.array([tuple(bar) for bar in selected], dtype=CANDLE_DTYPE)
+
+    def get_last_candle(self, symbol, timeframe):
+        """Get the last completed candle for a symbol and timeframe"""
+        candles = self.get_candles(symbol, timeframe, 2)
+        if candles is not None and len(candles) >= 2:
+            return candles[0]
+        return None
+
+    def check_candle_direction(self, symbol, timeframe):
+        """Check if the last completed candle closed up or down"""
+        last_candle = self.get_last_candle(symbol, timeframe)
+        if last_candle is not None:
+            if last_candle["close"] > last_candle["open"]:
+                return "UP"
+            elif last_candle["close"] < last_candle["open"]:
+                return "DOWN"
+        return None
+
+    # ==================== CONNECTION AND ACCOUNT ====================
+
+    def initialize(self, path=""):
+        """Nothing to launch - the simulator is always connected"""
+        return True
+
+    def connect(self):
+        """Nothing to log in to - the simulator is always authorized"""
+        return True
+
+    def get_account_info(self):
+        """Get simulated account information"""
+        floating = sum(p.profit for p in self._positions.values())
+        equity = self.balance + floating
+        return AccountInfo(self.username, round(self.balance, 2), round(equity, 2), round(floating, 2), 0.0,
+                           round(equity, 2), self.currency, self.leverage, self.server)._asdict()
+
+    # ==================== SYMBOLS AND PRICES ====================
+
+    def get_symbol_info(self, symbol):
+        """Get the symbol information, or None before the symbol's first tick"""
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            return None
+        spec = self._spec(symbol)
+        return SymbolInfo(symbol, quote.bid, quote.ask, spec['point'], spec['digits'],
+                          int(round((quote.ask - quote.bid) / spec['point'])), quote.time,
+                          spec['contract_size'], spec['volume_min'], spec['volume_max'], spec['volume_step'], 0, True)
+
+    def get_points(self, symbol):
+        """ Get the point value of a symbol """
+        return self._spec(symbol)['point']
+
+    def get_pips(self, symbol):
+        """ Get the pips of a symbol """
+        return self._spec(symbol)['point'] * 10
+
+    def get_symbol_spec(self, symbol):
+        """ Get the contract spec of a symbol """
+        spec = self._spec(symbol)
+        return SymbolSpec(symbol, spec['point'], spec['digits'], spec['point'] * 10, spec['point'], 0.0,
+                          spec['volume_min'], spec['volume_step'], spec['volume_max'], 0, time.monotonic())
+
+    def invalidate_symbol_spec(self, symbol=None):
+        """ Specs are configured in memory, nothing to reload """
+
+    def get_symbol_spread(self, symbol):
+        """ Get the spread of a symbol in points """
+        symbol_info = self.get_symbol_info(symbol)
+        return symbol_info.spread if symbol_info else None
+
+    def get_ask(self, symbol):
+        """ Get the ask price of a symbol """
+        quote = self._quotes.get(symbol)
+        return quote.ask if quote else None
+
+    def get_bid(self, symbol):
+        """ Get the bid price of a symbol """
+        quote = self._quotes.get(symbol)
+        return quote.bid if quote else None
+
+    def symbol_info_tick(self, symbol):
+        """ Get the current tick of a symbol """
+        return self._quotes.get(symbol)
+
+    def get_market_snapshot(self, symbol):
+        """ Get bid, ask, point and tick time of a symbol """
+        return MarketSnapshot.from_symbol_info(symbol, self.get_symbol_info(symbol))
+
+    def get_symbols_from_watch(self):
+        """ Get the symbols seen in the tick stream so far """
+        return tuple(self.get_symbol_info(symbol) for symbol in self._quotes)
+
+    # ==================== MARKET ORDERS ====================
+
+    def _sltp_prices(self, sltp_type, side, sl, tp, reference_sl, reference_tp, point):
+        """Convert POINTS/PIPS distances to prices the way MetaTrader.buy/sell/... do"""
+        unit = point if sltp_type == "POINTS" else point * 10 if sltp_type == "PIPS" else None
+        if unit is None:
+            return sl, tp
+        direction = 1 if side == ORDER_TYPE_BUY else -1
+        if sl > 0:
+            sl = reference_sl - direction * unit * sl
+        if tp > 0:
+            tp = reference_tp + direction * unit * tp
+        return sl, tp
+
+    def _market(self, side, symbol, volume, magic, sl, tp, sltp_type, slippage, comment):
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            logger.error(f"Symbol {symbol} not found or not available")
+            return []
+        if comment and len(comment) > 30:
+            comment = comment[:30]
+        if side == ORDER_TYPE_BUY:
+            sl, tp = self._sltp_prices(sltp_type, side, sl, tp, quote.bid, quote.ask, self._spec(symbol)['point'])
+        else:
+            sl, tp = self._sltp_prices(sltp_type, side, sl, tp, quote.ask, quote.bid, self._spec(symbol)['point'])
+        request = {"action": TRADE_ACTION_DEAL, "symbol": symbol, "volume": float(volume), "type": side,
+                   "magic": magic, "comment": comment, "deviation": slippage}
+        if tp > 0:
+            request["tp"] = tp
+        if sl > 0:
+            request["sl"] = sl
+        result = self.order_send(request)
+        if result is None or result.retcode != TRADE_RETCODE_DONE:
+            logger.error(f"order_send failed, retcode={getattr(result, 'retcode', None)}, request: {request}")
+            return []
+        return self.get_position_by_ticket(result.order)
+
+    def buy(self, symbol, volume, magic, sl, tp, sltp_type, slippage, comment=None):
+        """ Buy a symbol at the current ask """
+        return self._market(ORDER_TYPE_BUY, symbol, volume, magic, sl, tp, sltp_type, slippage, comment)
+
+    def sell(self, symbol, volume, magic, sl, tp, sltp_type, slippage, comment=None):
+        """ Sell a symbol at the current bid """
+        return self._market(ORDER_TYPE_SELL, symbol, volume, magic, sl, tp, sltp_type, slippage, comment)
+
+    def place_buy_order(self, symbol, volume, price=None, stop_loss=0.0, take_profit=0.0, comment=None):
+        """ Place a buy order and return the {'order': {...}} shape MultiCycleManager expects """
+        return self._place_market_order(self.buy, symbol, volume, stop_loss, take_profit, comment)
+
+    def place_sell_order(self, symbol, volume, price=None, stop_loss=0.0, take_profit=0.0, comment=None):
+        """ Place a sell order and return the {'order': {...}} shape MultiCycleManager expects """
+        return self._place_market_order(self.sell, symbol, volume, stop_loss, take_profit, comment)
+
+    def _place_market_order(self, send, symbol, volume, stop_loss, take_profit, comment):
+        result = send(symbol=symbol, volume=volume, magic=getattr(self, 'magic_number', 123456), sl=stop_loss,
+                      tp=take_profit, sltp_type="PRICE", slippage=10, comment=comment)
+        if not result:
+            return None
+        return {'order': {'ticket': result[0].ticket, 'volume': result[0].volume, 'price_open': result[0].price_open}}
+
+    # ==================== PENDING ORDERS ====================
+
+    def _pending(self, order_type, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment):
+        if symbol not in self._quotes:
+            logger.error(f"Symbol {symbol} not found or not available")
+            return []
+        if comment and len(comment) > 30:
+            comment = comment[:30]
+        side = ORDER_TYPE_BUY if order_type in (ORDER_TYPE_BUY_STOP, ORDER_TYPE_BUY_LIMIT) else ORDER_TYPE_SELL
+        sl, tp = self._sltp_prices(sltp_type, side, sl, tp, price, price, self._spec(symbol)['point'])
+        request = {"action": TRADE_ACTION_PENDING, "symbol": symbol, "volume": float(volume), "type": order_type,
+                   "price": float(price), "magic": magic, "comment": comment, "deviation": slippage}
+        if tp > 0:
+            request["tp"] = tp
+        if sl > 0:
+            request["sl"] = sl
+        result = self.order_send(request)
+        if result is None or result.retcode != TRADE_RETCODE_DONE:
+            logger.error(f"order_send failed, retcode={getattr(result, 'retcode', None)}, request: {request}")
+            return []
+        return self.get_order_by_ticket(result.order)
+
+    def buy_stop(self, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment=None):
+        """ Place a buy stop order """
+        return self._pending(ORDER_TYPE_BUY_STOP, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment)
+
+    def sell_stop(self, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment=None):
+        """ Place a sell stop order """
+        return self._pending(ORDER_TYPE_SELL_STOP, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment)
+
+    def buy_limit(self, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment=None):
+        """ Place a buy limit order """
+        return self._pending(ORDER_TYPE_BUY_LIMIT, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment)
+
+    def sell_limit(self, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment=None):
+        """ Place a sell limit order """
+        return self._pending(ORDER_TYPE_SELL_LIMIT, symbol, price, volume, magic, sl, tp, sltp_type, slippage, comment)
+
+    def place_pending_buy_order(self, symbol, target_price, current_price, volume, sl=0, tp=0, comment=None, force_buy_stop=False):
+        """Place pending BUY order - BUY_STOP above the price (or when forced), BUY_LIMIT below"""
+        send = self.buy_stop if force_buy_stop or target_price > current_price else self.buy_limit
+        return send(symbol=symbol, price=target_price, volume=volume, magic=getattr(self, 'magic_number', 123456),
+                    sl=sl, tp=tp, sltp_type="PRICE", slippage=10, comment=comment)
+
+    def place_pending_sell_order(self, symbol, target_price, current_price, volume, sl=0, tp=0, comment=None, force_sell_stop=False):
+        """Place pending SELL order - SELL_STOP below the price (or when forced), SELL_LIMIT above"""
+        send = self.sell_stop if force_sell_stop or target_price < current_price else self.sell_limit
+        return send(symbol=symbol, price=target_price, volume=volume, magic=getattr(self, 'magic_number', 123456),
+                    sl=sl, tp=tp, sltp_type="PRICE", slippage=10, comment=comment)
+
+    # ==================== CLOSING AND MODIFYING ====================
+
+    def close_position(self, order, deviation=10):
+        """ Close an open position (dict, position record or object with a ticket) """
+        if hasattr(order, 'get'):
+            ticket = order.get('ticket') or order.get('order_id')
+        else:
+            ticket = getattr(order, 'ticket', None)
+        position = self._positions.get(int(ticket)) if ticket else None
+        if position is None:
+            logger.error(f"close_position: position {ticket} not found")
+            return None
+        closing_side = ORDER_TYPE_SELL if position.type == ORDER_TYPE_BUY else ORDER_TYPE_BUY
+        return self.order_send({"action": TRADE_ACTION_DEAL, "symbol": position.symbol, "volume": position.volume,
+                                "type": closing_side, "position": position.ticket, "deviation": deviation,
+                                "magic": position.magic, "comment": "python script close"})
+
+    def close_order(self, order, deviation=10):
+        """ Remove a pending order (dict, order record or ticket number) """
+        if isinstance(order, (int, str)):
+            ticket = int(order)
+        elif hasattr(order, 'get'):
+            ticket = order.get('ticket') or order.get('order_id')
+        else:
+            ticket = getattr(order, 'ticket', None)
+        pending = self._orders.get(int(ticket)) if ticket else None
+        if pending is None:
+            logger.error(f"Order/position {ticket} not found")
+            return None
+        return self.order_send({"action": TRADE_ACTION_REMOVE, "order": pending.ticket, "symbol": pending.symbol})
+
+    def cancel_pending_order(self, order_id, symbol):
+        """Cancel a pending order"""
+        result = self.order_send({"action": TRADE_ACTION_REMOVE, "order": order_id, "symbol": symbol})
+        if result is None or result.retcode != TRADE_RETCODE_DONE:
+            logger.error(f"Failed to cancel order {order_id}, retcode={getattr(result, 'retcode', None)}")
+            return None
+        return result
+
+    def modify_position_sl_tp(self, ticket: int, sl: float = 0.0, tp: float = 0.0):
+        """Modify SL/TP of an existing open position by ticket"""
+        if int(ticket) not in self._positions:
+            logger.error(f"modify_position_sl_tp: position {ticket} not found")
+            return None
+        return self.order_send({"action": TRADE_ACTION_SLTP, "position": int(ticket),
+                                "sl": float(sl) if sl and sl > 0 else 0.0, "tp": float(tp) if tp and tp > 0 else 0.0})
+
+    def modify_positions_sl_tp(self, modifications, symbol=None):
+        """Modify SL/TP of many open positions, skipping the ones already at the target
+
+        Returns:
+            dict: ticket -> {'status': 'modified' | 'unchanged' | 'not_found' | 'failed', 'sl', 'tp', 'retcode', 'comment'}
+        """
+        results = {}
+        for ticket, sl, tp in modifications:
+            ticket = int(ticket)
+            position = self._positions.get(ticket)
+            if position is None:
+                results[ticket] = {'status': 'not_found', 'sl': sl, 'tp': tp, 'retcode': None, 'comment': None}
+                continue
+            spec = self._spec(position.symbol)
+            new_sl = round(float(sl), spec['digits']) if sl is not None and sl > 0 else (0.0 if sl is not None else position.sl)
+            new_tp = round(float(tp), spec['digits']) if tp is not None and tp > 0 else (0.0 if tp is not None else position.tp)
+            if abs(position.sl - new_sl) < spec['point'] / 2 and abs(position.tp - new_tp) < spec['point'] / 2:
+                results[ticket] = {'status': 'unchanged', 'sl': new_sl, 'tp': new_tp, 'retcode': None, 'comment': None}
+                continue
+            result = self.order_send({"action": TRADE_ACTION_SLTP, "symbol": position.symbol, "position": ticket,
+                                      "sl": new_sl, "tp": new_tp})
+            retcode = getattr(result, 'retcode', None)
+            results[ticket] = {'status': 'modified' if retcode == TRADE_RETCODE_DONE else 'failed', 'sl': new_sl,
+                               'tp': new_tp, 'retcode': retcode, 'comment': getattr(result, 'comment', None)}
+        return results
+
+    # ==================== POSITIONS, ORDERS AND HISTORY ====================
+
+    def get_position_by_ticket(self, ticket):
+        """ Get a position by its ticket """
+        position = self._positions.get(int(ticket))
+        return (position,) if position else ()
+
+    def get_all_positions(self):
+        """ Get all positions """
+        return tuple(self._positions.values())
+
+    def get_order_by_ticket(self, ticket):
+        """ Get a pending order by its ticket """
+        order = self._orders.get(int(ticket))
+        return (order,) if order else ()
+
+    def get_all_orders(self):
+        """ Get all open pending orders """
+        return tuple(self._orders.values())
+
+    def get_ticket_index(self, magic=None):
+        """ Get an index of all open positions and pending orders keyed by ticket """
+        return TicketIndex(self.get_all_positions(), self.get_all_orders(), magic=magic)
+
+    def get_pnl_book(self, symbol, ticket_cycles=None, price=None, pip=0.0):
+        """ Get the P&L of every open position of a symbol in one vectorized pass """
+        positions = [p for p in self._positions.values() if p.symbol == symbol]
+        return PnLBook(positions, ticket_cycles, price=price, pip=pip)
+
+    def history_deals_get(self, position=None, ticket=None):
+        """ Get simulated deals, optionally for one position or one deal ticket """
+        return tuple(d for d in self._deals
+                     if (position is None or d.position_id == position) and (ticket is None or d.ticket == ticket))
+
+    def get_deals_between(self, date_from, date_to):
+        """ Get simulated deals executed in a time range """
+        return tuple(d for d in self._deals if date_from <= d.time <= date_to)
+
+    def check_order_is_pending(self, ticket):
+        """ Check if a ticket is a pending order """
+        return int(ticket) in self._orders
+
+    def check_order_is_closed(self, ticket):
+        """ Check if an order was closed or cancelled """
+        ticket = int(ticket)
+        if ticket in self._positions or ticket in self._orders:
+            return False
+        return ticket in self._closed_tickets
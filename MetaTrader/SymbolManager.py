@@ -1,8 +1,81 @@
-import MetaTrader5 as mt5
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module
 import logging
+import threading
+import time
+from MetaTrader.SymbolSpec import spec_from_symbol_info
+
+mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
 
 logger = logging.getLogger(__name__)
 
+def _load_spec_from_mt5(symbol):
+    mt5.symbol_select(symbol, True)
+    info = mt5.symbol_info(symbol)
+    return spec_from_symbol_info(symbol, info) if info is not None and info.point > 0 else None
+
+
+class SymbolSpecCache:
+    """Static contract specs per symbol, loaded once and shared by every component.
+
+    Point, digits, pip, tick size/value, volume limits and stops level rarely
+    change, so they are read from the terminal once and reloaded only after
+    ``max_age`` seconds or when a strategy switches symbols (``invalidate``).
+    """
+
+    def __init__(self, loader=None, max_age=900.0):
+        self._loader = loader or _load_spec_from_mt5
+        self.max_age = float(max_age)
+        self._specs = {}
+        self._lock = threading.Lock()
+
+    def get(self, symbol):
+        """Get the spec of a symbol, loading it if missing or stale
+
+        Returns:
+            SymbolSpec: The spec, the stale one if a reload fails, or None if the symbol cannot be loaded
+        """
+        spec = self._specs.get(symbol)
+        if spec is not None and time.monotonic() - spec.loaded_at < self.max_age:
+            return spec
+        return self.refresh(symbol)
+
+    def refresh(self, symbol):
+        """Reload the spec of a symbol from the terminal"""
+        try:
+            spec = self._loader(symbol)
+        except Exception as e:
+            logger.error(f"Error loading symbol spec for {symbol}: {e}")
+            spec = None
+        with self._lock:
+            if spec is None:
+                return self._specs.get(symbol)
+            self._specs[symbol] = spec
+        return spec
+
+    def invalidate(self, symbol=None):
+        """Drop the cached spec of a symbol, or of every symbol"""
+        with self._lock:
+            if symbol is None:
+                self._specs.clear()
+            else:
+                self._specs.pop(symbol, None)
+
+    def pip(self, symbol, default=None):
+        """Pip size of a symbol (10 points)"""
+        spec = self.get(symbol)
+        return spec.pip if spec is not None else default
+
+    def point(self, symbol, default=None):
+        """Point size of a symbol"""
+        spec = self.get(symbol)
+        return spec.point if spec is not None else default
+
+
+# Process-wide cache shared by MetaTrader and the strategy components
+symbol_spec_cache = SymbolSpecCache()
+
+
 class SymbolManager:
     """ Symbol manager class to manage the symbols """
     def __init__(self):
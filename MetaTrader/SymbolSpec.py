@@ -0,0 +1,24 @@
+""" Static contract spec of a trading symbol. """
+import time
+from collections import namedtuple
+
+SymbolSpec = namedtuple('SymbolSpec', 'symbol point digits pip tick_size tick_value '
+                                      'volume_min volume_step volume_max stops_level loaded_at')
+
+
+def spec_from_symbol_info(symbol, info, loaded_at=None):
+    """Build a SymbolSpec from an MT5 symbol_info record (pip = 10 points, as everywhere else)"""
+    point = float(info.point)
+    return SymbolSpec(
+        symbol=symbol,
+        point=point,
+        digits=int(info.digits),
+        pip=point * 10,
+        tick_size=float(getattr(info, 'trade_tick_size', 0.0) or point),
+        tick_value=float(getattr(info, 'trade_tick_value', 0.0) or 0.0),
+        volume_min=float(getattr(info, 'volume_min', 0.01) or 0.01),
+        volume_step=float(getattr(info, 'volume_step', 0.01) or 0.01),
+        volume_max=float(getattr(info, 'volume_max', 100.0) or 100.0),
+        stops_level=int(getattr(info, 'trade_stops_level', 0) or 0),
+        loaded_at=loaded_at if loaded_at is not None else time.monotonic(),
+    )
@@ -0,0 +1,209 @@
+""" Shared MT5 tick stream that wakes strategies on real price changes. """
+import asyncio
+import threading
+import time
+from Views.globals.app_logger import app_logger as logger
+
+
+class TickSubscription:
+    """A subscriber's view of the tick stream, bound to the subscriber's event loop.
+
+    Ticks are delivered through a bounded asyncio queue where the newest tick
+    replaces an unconsumed one, so a slow strategy always wakes on the latest
+    price instead of working through a backlog.
+    """
+
+    def __init__(self, stream, symbols, loop, min_interval=0.0, maxsize=1):
+        self.stream = stream
+        self.symbols = set(symbols)
+        self.loop = loop
+        self.min_interval = float(min_interval)
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.ticks = {}
+        self._changed_symbols = set()
+        self._last_wake = 0.0
+
+    def add_symbol(self, symbol):
+        """Start receiving ticks for another symbol"""
+        self.symbols.add(symbol)
+
+    def remove_symbol(self, symbol):
+        """Stop receiving ticks for a symbol"""
+        self.symbols.discard(symbol)
+        self.ticks.pop(symbol, None)
+
+    def publish(self, symbol, tick):
+        """Hand a tick to the subscriber's loop (called from the poller thread)"""
+        try:
+            self.loop.call_soon_threadsafe(self._offer, symbol, tick)
+        except RuntimeError:
+            # Subscriber loop is closed - drop the subscription
+            self.stream.unsubscribe(self)
+
+    def _offer(self, symbol, tick):
+        """Store the tick and replace any unconsumed one in the queue"""
+        self.ticks[symbol] = tick
+        self._changed_symbols.add(symbol)
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(tick)
+
+    async def next_tick(self, timeout=None):
+        """Wait for the next tick, returning None if the timeout expires first"""
+        try:
+            if timeout is None:
+                return await self.queue.get()
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def wait(self, timeout):
+        """Sleep until a price changes or the timeout expires
+
+        Wake-ups are spaced at least min_interval apart so a fast market
+        cannot spin the caller's loop.
+
+        Returns:
+            set: Symbols whose price changed since the previous wait (empty on timeout)
+        """
+        if self.min_interval > 0:
+            remaining = self.min_interval - (time.monotonic() - self._last_wake)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        if not self._changed_symbols:
+            await self.next_tick(timeout)
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self._last_wake = time.monotonic()
+        changed, self._changed_symbols = self._changed_symbols, set()
+        return changed
+
+    def latest(self, symbol):
+        """Get the most recent tick delivered for a symbol, or None"""
+        return self.ticks.get(symbol)
+
+    def close(self):
+        """Unsubscribe from the stream"""
+        self.stream.unsubscribe(self)
+
+
+class TickStream:
+    """Polls ``symbol_info_tick`` for the union of subscribed symbols in one place.
+
+    A single background thread dedupes ticks by ``time_msc`` and fans out
+    only real price changes to every subscriber of the symbol.
+    """
+
+    def __init__(self, meta_trader, poll_interval=0.05):
+        self.meta_trader = meta_trader
+        self.poll_interval = float(poll_interval)
+        self._subscriptions = []
+        self._last_ticks = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+    def subscribe(self, symbols, loop=None, min_interval=0.0):
+        """Subscribe the current event loop to one or more symbols
+
+        Args:
+            symbols (str | iterable): Symbol name or names to receive ticks for
+            loop: Event loop to deliver ticks on (defaults to the running loop)
+            min_interval (float): Minimum seconds between wake-ups of the subscriber
+
+        Returns:
+            TickSubscription: The new subscription
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        loop = loop or asyncio.get_running_loop()
+        subscription = TickSubscription(self, symbols, loop, min_interval=min_interval)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        self.start()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Remove a subscription, stopping the poller when nobody is listening"""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            idle = not self._subscriptions
+        if idle:
+            self.stop()
+
+    def symbols(self):
+        """Union of all subscribed symbols"""
+        with self._lock:
+            return set().union(*(s.symbols for s in self._subscriptions)) if self._subscriptions else set()
+
+    def start(self):
+        """Start the poller thread if it is not already running"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="TickStream", daemon=True)
+        self._thread.start()
+        logger.info("Tick stream started")
+
+    def stop(self):
+        """Stop the poller thread"""
+        self._running = False
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=1)
+        self._thread = None
+
+    def _run(self):
+        """Poll loop executed on the background thread"""
+        while self._running and self._thread is threading.current_thread():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Error polling ticks: {e}")
+            time.sleep(self.poll_interval)
+
+    def poll_once(self):
+        """Poll every subscribed symbol once and publish new ticks
+
+        Returns:
+            int: Number of symbols whose price changed
+        """
+        published = 0
+        for symbol in self.symbols():
+            tick = self.meta_trader.symbol_info_tick(symbol)
+            if tick is None or not self._is_new_tick(symbol, tick):
+                continue
+            with self._lock:
+                subscribers = [s for s in self._subscriptions if symbol in s.symbols]
+            for subscription in subscribers:
+                subscription.publish(symbol, tick)
+            published += 1
+        return published
+
+    def _is_new_tick(self, symbol, tick):
+        """Dedupe by time_msc and ignore updates that did not move bid or ask"""
+        last = self._last_ticks.get(symbol)
+        self._last_ticks[symbol] = tick
+        if last is None:
+            return True
+        if getattr(tick, 'time_msc', None) == getattr(last, 'time_msc', None):
+            return False
+        return tick.bid != last.bid or tick.ask != last.ask
+
+
+_tick_streams = {}
+_tick_streams_lock = threading.Lock()
+
+
+def get_tick_stream(meta_trader):
+    """Get the process-wide tick stream for a MetaTrader connection"""
+    with _tick_streams_lock:
+        stream = _tick_streams.get(id(meta_trader))
+        if stream is None:
+            stream = TickStream(meta_trader)
+            _tick_streams[id(meta_trader)] = stream
+        return stream
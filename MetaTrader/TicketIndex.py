@@ -0,0 +1,75 @@
+""" Per-tick index of open positions and pending orders keyed by ticket. """
+import time
+
+
+class TicketIndex:
+    """O(1) ticket lookups over one ``positions_get()`` and one ``orders_get()`` call.
+
+    Built once per monitoring tick so order tracking code can answer
+    "does this ticket still exist in MT5?" without one terminal round trip
+    per order.
+    """
+
+    __slots__ = ('positions', 'orders', 'magic', 'captured_at')
+
+    def __init__(self, positions=None, orders=None, magic=None, captured_at=None):
+        self.magic = magic
+        self.positions = self._index(positions, magic)
+        self.orders = self._index(orders, magic)
+        self.captured_at = captured_at if captured_at is not None else time.monotonic()
+
+    @staticmethod
+    def _index(records, magic):
+        """Key MT5 position/order records by ticket, optionally keeping one magic number"""
+        index = {}
+        for record in records or ():
+            if magic is not None and getattr(record, 'magic', None) != magic:
+                continue
+            ticket = getattr(record, 'ticket', None)
+            if ticket is not None:
+                index[int(ticket)] = record
+        return index
+
+    def has_position(self, ticket):
+        """Check if the ticket is an open position"""
+        return int(ticket) in self.positions
+
+    def has_order(self, ticket):
+        """Check if the ticket is a pending order"""
+        return int(ticket) in self.orders
+
+    def exists(self, ticket):
+        """Check if the ticket is an open position or a pending order"""
+        ticket = int(ticket)
+        return ticket in self.positions or ticket in self.orders
+
+    def get_position(self, ticket):
+        """Get the open position record for a ticket, or None"""
+        return self.positions.get(int(ticket))
+
+    def get_order(self, ticket):
+        """Get the pending order record for a ticket, or None"""
+        return self.orders.get(int(ticket))
+
+    def order_status(self, ticket):
+        """Classify a pending order ticket as 'pending', 'filled' or 'cancelled'"""
+        ticket = int(ticket)
+        if ticket in self.orders:
+            return 'pending'
+        if ticket in self.positions:
+            return 'filled'
+        return 'cancelled'
+
+    def age(self, now=None):
+        """Seconds elapsed since the index was built"""
+        return (now if now is not None else time.monotonic()) - self.captured_at
+
+    def is_fresh(self, max_age):
+        """Check whether the index is still usable for the current tick"""
+        return self.age() <= max_age
+
+    def __len__(self):
+        return len(self.positions) + len(self.orders)
+
+    def __repr__(self):
+        return f"TicketIndex(positions={len(self.positions)}, orders={len(self.orders)}, magic={self.magic})"
@@ -0,0 +1,92 @@
+""" Change tracking for the incremental MT5 -> local DB order reconciliation. """
+
+# MT5 deal entry type for deals that open a position; every other entry
+# (OUT, INOUT, OUT_BY) reduces or closes the position it belongs to
+DEAL_ENTRY_IN = 0
+
+
+def position_signature(position):
+    """The position fields the local DB mirrors, rounded the way the order record stores them"""
+    return (round(position.profit, 2), round(position.swap, 2), round(position.volume, 2),
+            position.sl, position.tp, position.time_update)
+
+
+class PositionTracker:
+    """Remembers the last seen signature of every open position.
+
+    ``diff()`` returns only the positions that appeared or changed since the
+    previous call, and the tickets that disappeared, so the caller touches
+    the database for changed tickets only.
+    """
+
+    def __init__(self):
+        self.signatures = {}
+
+    def reset(self, positions):
+        """Take the positions as the new baseline (after a full reconciliation)"""
+        self.signatures = {int(p.ticket): position_signature(p) for p in positions or ()}
+
+    def diff(self, positions):
+        """Compare the open positions with the previous pass
+
+        Returns:
+            tuple: (new or changed positions, tickets no longer open)
+        """
+        previous = self.signatures
+        current = {}
+        changed = []
+        for position in positions or ():
+            ticket = int(position.ticket)
+            signature = position_signature(position)
+            current[ticket] = signature
+            if previous.get(ticket) != signature:
+                changed.append(position)
+        self.signatures = current
+        return changed, set(previous) - set(current)
+
+
+class DealCursor:
+    """High-water mark over the MT5 deal history.
+
+    MT5 deal times are in server time, which can be hours away from the
+    local clock, so every query window reaches ``lookahead`` seconds past
+    the local time and re-reads ``overlap`` seconds before the mark. Deals
+    seen in that overlap are remembered by ticket and not returned twice.
+    """
+
+    def __init__(self, lookahead=86400, overlap=60):
+        self.lookahead = lookahead
+        self.overlap = overlap
+        self.high_water = None
+        self.seen = set()
+
+    def window(self, now):
+        """Time range of the next deal query"""
+        if self.high_water is None:
+            return int(now) - self.lookahead, int(now) + self.lookahead
+        return self.high_water - self.overlap, int(now) + self.lookahead
+
+    def reset(self, deals, now):
+        """Take the deals of a full reconciliation's window as already applied"""
+        self.high_water = int(now) - self.lookahead
+        self.seen = set()
+        self.advance(deals)
+
+    def advance(self, deals):
+        """Move the mark past the queried deals
+
+        Returns:
+            list: Deals not returned before, in query order
+        """
+        new_deals = [deal for deal in deals or () if deal.ticket not in self.seen]
+        times = [int(deal.time) for deal in deals or ()]
+        if times:
+            self.high_water = max(max(times), self.high_water or 0)
+        floor = (self.high_water or 0) - self.overlap
+        self.seen = {deal.ticket for deal in deals or () if int(deal.time) >= floor}
+        return new_deals
+
+    @staticmethod
+    def closed_positions(deals):
+        """Position tickets reduced or closed by the deals"""
+        return {int(deal.position_id) for deal in deals if deal.entry != DEAL_ENTRY_IN and deal.position_id}
@@ -139,6 +139,12 @@ class order:
         # If we get here, all retries failed
         return False
 
+    def update_from_position(self, position_data):
+        """Update order information from an MT5 position that was already fetched"""
+        self.is_pending = False
+        self.is_closed = False
+        self._update_order_details(position_data, is_pending=False)
+
     def _update_order_details(self, order_data, is_pending):
         """Helper method to update order details"""
         self.comment = order_data.comment
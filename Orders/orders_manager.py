@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from Orders.order import order
+from Orders.change_tracker import PositionTracker, DealCursor
 import time
 import threading
 from DB.db_engine import engine
@@ -8,6 +9,7 @@ from DB.ah_strategy.repositories.ah_repo import AHRepo
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 
 from Views.globals.app_logger import app_logger as logger
+from helpers.metrics import timed
 
 
 class orders_manager:
@@ -18,6 +20,7 @@ class orders_manager:
         self.suspious_ah_orders = []
         self.suspious_ct_orders = []
         self.all_mt5_orders = []
+        self.mt5_positions = None
         self.all_ah_orders = []
         self.all_ct_orders = []
         self.false_closed_orders = []
@@ -26,12 +29,21 @@ class orders_manager:
         self.mt5_lock = threading.Lock()
         # Add a delay between MT5 and database operations to prevent race conditions
         self.sync_delay = 0.5  # 500ms delay
+        # Incremental reconciliation: only changed positions and new deals are applied
+        # every pass, the full DB <-> MT5 comparison runs on a slow schedule
+        self.full_sync_interval = 60  # seconds between full reconciliations
+        self.position_tracker = PositionTracker()
+        self.deal_cursor = DealCursor()
+        self.needs_full_sync = True
+        self.last_full_sync = 0.0
+        self.synced_account = None
 
     async def get_all_mt5_orders(self):
         try:
             # Use the lock when accessing MT5 API
             with self.mt5_lock:
                 positions = self.mt5.get_all_positions()
+                self.mt5_positions = positions
                 self.all_mt5_orders = []
                 for position in positions:
                     self.all_mt5_orders.append(position.ticket)
@@ -41,78 +53,89 @@ class orders_manager:
 
     async def update_ah_orders_in_db(self):
         try:
-            # Create a fixed list of tasks before starting execution
-            tasks = []
             # First handle active MT5 orders
-            for pos in self.all_mt5_orders:
-                tasks.append(self.update_single_ah_order(pos))
-
-            # Process all active orders first
-            if tasks:
-                await asyncio.gather(*tasks)
+            await self.update_open_orders_in_db(self.ah_repo)
 
             # Wait for a short delay to ensure MT5 status is fully propagated
             await asyncio.sleep(self.sync_delay)
 
             # Then handle suspicious orders that might be closed
-            suspicious_tasks = []
-            for db_order in self.suspious_ah_orders:
-                suspicious_tasks.append(
-                    self.update_single_suspicious_ah_order(db_order))
-
-            if suspicious_tasks:
-                await asyncio.gather(*suspicious_tasks)
+            await self.update_suspicious_orders_in_db(self.ah_repo, self.suspious_ah_orders)
 
         except Exception as e:
             self.logger.error(f"Error in update_ah_orders_in_db: {e}")
 
-    async def update_single_ah_order(self, pos):
+    async def update_open_orders_in_db(self, repo):
+        """Refresh the DB orders of every open MT5 ticket and write them in one transaction"""
         try:
-            # Get order data from database
-            db_order = self.ah_repo.get_order_by_ticket(pos)
-            if db_order:
-                # Create a local lock scope for this specific order
-                with self.mt5_lock:
-                    order_obj = order(db_order, db_order.is_pending,
-                                      self.mt5, self.ah_repo, "db", db_order.cycle_id)
-                    # Only update order status, then wait before checking for cycles
-                    updated = order_obj.update_from_mt5()
-
-                # If order status was updated successfully, we can update the database
-                if updated:
-                    order_obj.update_order()
-
-                # Check for false closed cycles with a small delay
-                await asyncio.sleep(self.sync_delay / 2)
-                order_obj.check_false_closed_cycles()
+            # One query for all DB orders of the open MT5 tickets
+            db_orders = repo.get_orders_by_tickets(self.all_mt5_orders)
+
+            refreshed = []
+            for db_order in db_orders.values():
+                try:
+                    # Create a local lock scope for this specific order
+                    with self.mt5_lock:
+                        order_obj = order(db_order, db_order.is_pending,
+                                          self.mt5, repo, "db", db_order.cycle_id)
+                        # Only update order status, then wait before checking for cycles
+                        updated = order_obj.update_from_mt5()
+                    refreshed.append((order_obj, updated))
+                except Exception as e:
+                    self.logger.error(f"Error refreshing order {db_order.ticket} from MT5: {e}")
+
+            # Write every order whose status was updated successfully in a single commit
+            updated_orders = [order_obj.to_dict() for order_obj, updated in refreshed if updated]
+            if updated_orders:
+                repo.upsert_orders(updated_orders)
+
+            # Check for false closed cycles with a small delay
+            await asyncio.sleep(self.sync_delay / 2)
+            for order_obj, _ in refreshed:
+                try:
+                    order_obj.check_false_closed_cycles()
+                except Exception as e:
+                    self.logger.error(f"Error checking false closed cycles for order {order_obj.ticket}: {e}")
         except Exception as e:
-            self.logger.error(f"Error in update_single_ah_order: {e}")
+            self.logger.error(f"Error in update_open_orders_in_db: {e}")
 
-    async def update_single_suspicious_ah_order(self, db_order):
+    async def update_suspicious_orders_in_db(self, repo, suspicious_orders):
+        """Mark DB orders missing from MT5 as closed once MT5 confirms it, in one transaction"""
         try:
-            # Use the lock when checking closed status in MT5
-            is_closed = self.mt5.check_order_is_closed(db_order.ticket)
+            closed_orders = []
+            for db_order in suspicious_orders:
+                try:
+                    # Only perform the update if definitely closed in MT5
+                    if not self.mt5.check_order_is_closed(db_order.ticket):
+                        continue
 
-            # Only perform the update if definitely closed in MT5
-            if is_closed:
-                # Log this discrepancy for analysis
-                self.logger.info(
-                    f"Order {db_order.ticket} confirmed closed in MT5 but still open in DB")
+                    # Log this discrepancy for analysis
+                    self.logger.info(
+                        f"Order {db_order.ticket} confirmed closed in MT5 but still open in DB")
 
-                order_obj = order(db_order, db_order.is_pending,
-                                  self.mt5, self.ah_repo, "db", db_order.cycle_id)
-                order_obj.is_closed = is_closed
-
-                # Additional verification with retry
-                # Double-check once more before committing the change
-                if self.mt5.check_order_is_closed(db_order.ticket):
-                    order_obj.update_order()
-                    # After updating, verify cycle status
-                    await asyncio.sleep(self.sync_delay / 2)
+                    order_obj = order(db_order, db_order.is_pending,
+                                      self.mt5, repo, "db", db_order.cycle_id)
+                    order_obj.is_closed = True
+
+                    # Double-check once more before committing the change
+                    if self.mt5.check_order_is_closed(db_order.ticket):
+                        closed_orders.append(order_obj)
+                except Exception as e:
+                    self.logger.error(f"Error checking suspicious order {db_order.ticket}: {e}")
+
+            if not closed_orders:
+                return
+            repo.upsert_orders([order_obj.to_dict() for order_obj in closed_orders])
+
+            # After updating, verify cycle status
+            await asyncio.sleep(self.sync_delay / 2)
+            for order_obj in closed_orders:
+                try:
                     order_obj.check_false_closed_cycles()
+                except Exception as e:
+                    self.logger.error(f"Error checking false closed cycles for order {order_obj.ticket}: {e}")
         except Exception as e:
-            self.logger.error(
-                f"Error in update_single_suspicious_ah_order: {e}")
+            self.logger.error(f"Error in update_suspicious_orders_in_db: {e}")
 
     async def get_all_ah_orders_in_db(self):
         try:
@@ -141,78 +164,17 @@ class orders_manager:
 
     async def update_ct_orders_in_db(self):
         try:
-            # Create a fixed list of tasks before starting execution
-            tasks = []
             # First handle active MT5 orders
-            for pos in self.all_mt5_orders:
-                tasks.append(self.update_single_ct_order(pos))
-
-            # Process all active orders first
-            if tasks:
-                await asyncio.gather(*tasks)
+            await self.update_open_orders_in_db(self.ct_repo)
 
             # Wait for a short delay to ensure MT5 status is fully propagated
             await asyncio.sleep(self.sync_delay)
 
             # Then handle suspicious orders that might be closed
-            suspicious_tasks = []
-            for db_order in self.suspious_ct_orders:
-                suspicious_tasks.append(
-                    self.update_single_suspicious_ct_order(db_order))
-
-            if suspicious_tasks:
-                await asyncio.gather(*suspicious_tasks)
+            await self.update_suspicious_orders_in_db(self.ct_repo, self.suspious_ct_orders)
         except Exception as e:
             self.logger.error(f"Error in update_ct_orders_in_db: {e}")
 
-    async def update_single_ct_order(self, pos):
-        try:
-            # Get order data from database
-            db_order = self.ct_repo.get_order_by_ticket(pos)
-            if db_order:
-                # Create a local lock scope for this specific order
-                with self.mt5_lock:
-                    order_obj = order(db_order, db_order.is_pending,
-                                      self.mt5, self.ct_repo, "db", db_order.cycle_id)
-                    # Only update order status, then wait before checking for cycles
-                    updated = order_obj.update_from_mt5()
-
-                # If order status was updated successfully, we can update the database
-                if updated:
-                    order_obj.update_order()
-
-                # Check for false closed cycles with a small delay
-                await asyncio.sleep(self.sync_delay / 2)
-                order_obj.check_false_closed_cycles()
-        except Exception as e:
-            self.logger.error(f"Error in update_single_ct_order: {e}")
-
-    async def update_single_suspicious_ct_order(self, db_order):
-        try:
-            # Use the lock when checking closed status in MT5
-            is_closed = self.mt5.check_order_is_closed(db_order.ticket)
-
-            # Only perform the update if definitely closed in MT5
-            if is_closed:
-                # Log this discrepancy for analysis
-                self.logger.info(
-                    f"Order {db_order.ticket} confirmed closed in MT5 but still open in DB")
-
-                order_obj = order(db_order, db_order.is_pending,
-                                  self.mt5, self.ct_repo, "db", db_order.cycle_id)
-                order_obj.is_closed = is_closed
-
-                # Additional verification with retry
-                # Double-check once more before committing the change
-                if self.mt5.check_order_is_closed(db_order.ticket):
-                    order_obj.update_order()
-                    # After updating, verify cycle status
-                    await asyncio.sleep(self.sync_delay / 2)
-                    order_obj.check_false_closed_cycles()
-        except Exception as e:
-            self.logger.error(
-                f"Error in update_single_suspicious_ct_order: {e}")
-
     async def get_all_ct_orders_in_db(self):
         try:
             orders = self.ct_repo.get_open_orders_only()
@@ -230,43 +192,165 @@ class orders_manager:
         except Exception as e:
             self.logger.error(f"Error in get_suspicious_ct_orders_in_db: {e}")
 
+    async def reconcile_full(self):
+        """Compare every open DB order with MT5 and reset the incremental baseline"""
+        # Read the deal window before the positions, so a deal landing in between is picked up next pass
+        with self.mt5_lock:
+            deals = self.mt5.get_deals_between(*self.deal_cursor.window(time.time()))
+
+        # Get orders from MT5 first
+        with timed("orders_manager", "get_mt5_orders"):
+            await self.get_all_mt5_orders()
+        if self.mt5_positions is None or deals is None:
+            self.logger.warning("MT5 positions or deals unavailable, postponing the full order sync")
+            self.needs_full_sync = True
+            return
+        self.logger.debug(
+            f"Found {len(self.all_mt5_orders)} orders in MT5")
+
+        # Brief delay to ensure MT5 data is stable
+        await asyncio.sleep(self.sync_delay / 2)
+
+        # Get orders from database
+        with timed("orders_manager", "load_db_orders"):
+            await self.get_all_ah_orders_in_db()
+            await self.get_suspicious_ah_orders_in_db()
+        self.logger.debug(
+            f"Found {len(self.all_ah_orders)} AH orders in DB, {len(self.suspious_ah_orders)} suspicious")
+
+        # Get CT orders
+        with timed("orders_manager", "load_db_orders"):
+            await self.get_all_ct_orders_in_db()
+            await self.get_suspicious_ct_orders_in_db()
+        self.logger.debug(
+            f"Found {len(self.all_ct_orders)} CT orders in DB, {len(self.suspious_ct_orders)} suspicious")
+
+        # Update orders with a delay between strategies
+        with timed("orders_manager", "update_ah_orders"):
+            await self.update_ah_orders_in_db()
+        await asyncio.sleep(self.sync_delay)
+        with timed("orders_manager", "update_ct_orders"):
+            await self.update_ct_orders_in_db()
+
+        # Everything up to here is applied, later passes only look at what changes from now on
+        self.position_tracker.reset(self.mt5_positions)
+        self.deal_cursor.reset(deals, time.time())
+        self.synced_account = self.mt5.account_id
+        self.needs_full_sync = False
+        self.last_full_sync = time.monotonic()
+
+    async def reconcile_incremental(self):
+        """Apply only the positions and deals that changed since the last pass"""
+        with self.mt5_lock:
+            positions = self.mt5.get_all_positions()
+            deals = self.mt5.get_deals_between(*self.deal_cursor.window(time.time()))
+        if positions is None or deals is None:
+            # A failed MT5 read usually means a lost connection, resync everything once it is back
+            self.logger.warning("MT5 positions or deals unavailable, scheduling a full order sync")
+            self.needs_full_sync = True
+            return
+
+        self.mt5_positions = positions
+        self.all_mt5_orders = [position.ticket for position in positions]
+        known_tickets = set(self.position_tracker.signatures)
+        changed, gone = self.position_tracker.diff(positions)
+        new_deals = self.deal_cursor.advance(deals)
+
+        # Positions that vanished or were closed by a new deal (partial closes show up as a volume change)
+        closed = (gone | DealCursor.closed_positions(new_deals)) - set(self.position_tracker.signatures)
+        if not changed and not closed:
+            return
+        self.logger.debug(
+            f"Applying {len(changed)} changed positions and {len(closed)} closed tickets")
+
+        for repo in (self.ah_repo, self.ct_repo):
+            applied = True
+            if changed:
+                applied = await self.apply_position_changes(repo, changed, known_tickets)
+            if closed:
+                applied = await self.apply_closed_tickets(repo, closed) and applied
+            if not applied:
+                # The baseline already moved past these changes, let a full pass write them
+                self.needs_full_sync = True
+
+    async def apply_position_changes(self, repo, positions, known_tickets=()):
+        """Write new or changed MT5 positions to their DB orders in one transaction
+
+        Returns:
+            bool: False if the DB write failed
+        """
+        try:
+            db_orders = repo.get_orders_by_tickets([position.ticket for position in positions])
+            refreshed = []
+            for position in positions:
+                db_order = db_orders.get(int(position.ticket))
+                if db_order is None or db_order.account != self.mt5.account_id:
+                    continue
+                order_obj = order(db_order, db_order.is_pending,
+                                  self.mt5, repo, "db", db_order.cycle_id)
+                # Only orders that are new here or were closed in the DB can have a falsely closed cycle
+                check_cycle = order_obj.is_closed or int(position.ticket) not in known_tickets
+                order_obj.update_from_position(position)
+                refreshed.append((order_obj, check_cycle))
+
+            if not refreshed:
+                return True
+            if repo.upsert_orders([order_obj.to_dict() for order_obj, _ in refreshed]) is None:
+                return False
+
+            for order_obj, check_cycle in refreshed:
+                if not check_cycle:
+                    continue
+                try:
+                    order_obj.check_false_closed_cycles()
+                except Exception as e:
+                    self.logger.error(f"Error checking false closed cycles for order {order_obj.ticket}: {e}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error in apply_position_changes: {e}")
+            return False
+
+    async def apply_closed_tickets(self, repo, tickets):
+        """Mark the DB orders of closed MT5 tickets as closed once MT5 confirms it
+
+        Returns:
+            bool: False if the DB lookup failed
+        """
+        try:
+            db_orders = repo.get_orders_by_tickets(tickets)
+            open_orders = [db_order for db_order in db_orders.values()
+                           if not db_order.is_closed and db_order.account == self.mt5.account_id]
+            if open_orders:
+                await self.update_suspicious_orders_in_db(repo, open_orders)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error in apply_closed_tickets: {e}")
+            return False
+
     async def run_orders_manager(self):
         while True:
             try:
                 # Add more detailed logging to help diagnose issues
                 self.logger.debug("Starting order sync cycle")
 
-                # Get orders from MT5 first
-                await self.get_all_mt5_orders()
-                self.logger.debug(
-                    f"Found {len(self.all_mt5_orders)} orders in MT5")
-
-                # Brief delay to ensure MT5 data is stable
-                await asyncio.sleep(self.sync_delay / 2)
-
-                # Get orders from database
-                await self.get_all_ah_orders_in_db()
-                await self.get_suspicious_ah_orders_in_db()
-                self.logger.debug(
-                    f"Found {len(self.all_ah_orders)} AH orders in DB, {len(self.suspious_ah_orders)} suspicious")
-
-                # Get CT orders
-                await self.get_all_ct_orders_in_db()
-                await self.get_suspicious_ct_orders_in_db()
-                self.logger.debug(
-                    f"Found {len(self.all_ct_orders)} CT orders in DB, {len(self.suspious_ct_orders)} suspicious")
+                # A new login means a different set of tickets, start from a full comparison
+                if self.synced_account != self.mt5.account_id:
+                    self.needs_full_sync = True
 
-                # Update orders with a delay between strategies
-                await self.update_ah_orders_in_db()
-                await asyncio.sleep(self.sync_delay)
-                await self.update_ct_orders_in_db()
+                if self.needs_full_sync or time.monotonic() - self.last_full_sync >= self.full_sync_interval:
+                    with timed("orders_manager", "full_reconcile"):
+                        await self.reconcile_full()
+                else:
+                    with timed("orders_manager", "incremental_reconcile"):
+                        await self.reconcile_incremental()
 
-                # Longer delay between full sync cycles to prevent overloading
+                # Delay between sync cycles to prevent overloading
                 await asyncio.sleep(1)
 
                 self.logger.debug("Completed order sync cycle")
             except Exception as e:
                 self.logger.error(f"Error in run_orders_manager: {e}")
+                self.needs_full_sync = True
                 # Add a longer delay after error to prevent rapid retry loops
                 await asyncio.sleep(5)
 
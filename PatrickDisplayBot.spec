@@ -6,7 +6,21 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    # Imported by name from Strategy/registry.py and Strategy/components/__init__.py
+    hiddenimports=[
+        'Strategy.AdaptiveHedging',
+        'Strategy.CycleTrader',
+        'Strategy.AdvancedCyclesTrader_Organized',
+        'Strategy.MoveGuard',
+        'Strategy.StockTrader',
+        'Strategy.components.direction_controller',
+        'Strategy.components.zone_detection_engine',
+        'Strategy.components.enhanced_zone_detection',
+        'Strategy.components.advanced_order_manager',
+        'Strategy.components.enhanced_order_manager',
+        'Strategy.components.multi_cycle_manager',
+        'Strategy.components.reversal_detector',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
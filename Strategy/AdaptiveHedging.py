@@ -1,6 +1,7 @@
 from Strategy.strategy import Strategy
 from Orders.order import order
 from cycles.AH_cycle import cycle
+from cycles.cycle_registry import CycleRegistry
 import threading
 from DB.db_engine import engine
 from DB.ah_strategy.repositories.ah_repo import AHRepo
@@ -18,6 +19,9 @@ class AdaptiveHedging(Strategy):
         self.orders = {}
         self.symbol = symbol
         self.bot = bot
+        # Cycle objects kept across ticks, rebuilt only when their DB row changes elsewhere
+        self.cycle_registry = CycleRegistry(
+            lambda cycle_data: cycle(cycle_data, self.meta_trader, self, "db"))
         self.disable_new_cycle_recovery = False
         self.enable_recovery = False
         self.lot_sizes = [0.01, 0.02, 0.03, 0.04,
@@ -358,8 +362,7 @@ class AdaptiveHedging(Strategy):
                 active_cycles = await self.get_all_active_cycles()
                 tasks = []
 
-                for cycle_data in active_cycles:
-                    cycle_obj = cycle(cycle_data, self.meta_trader, self, "db")
+                for cycle_obj in self.cycle_registry.refresh(active_cycles):
                     if self.stop is False:
                         tasks.append(cycle_obj.manage_cycle_orders())
                     tasks.append(cycle_obj.update_cycle(self.client))
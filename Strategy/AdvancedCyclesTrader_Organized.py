@@ -12,6 +12,7 @@ from Strategy.strategy import Strategy
 import threading
 from Orders.order import order
 from cycles.ACT_cycle_Organized import AdvancedCycle
+from cycles.order_record import OrderRecord, orders_from_dicts, json_default
 from DB.db_engine import engine
 from Strategy.components import AdvancedOrderManager, DirectionController
 from Strategy.components.multi_cycle_manager import MultiCycleManager
@@ -19,14 +20,18 @@ from Strategy.components.enhanced_zone_detection import EnhancedZoneDetection
 from Strategy.components.enhanced_order_manager import EnhancedOrderManager
 from Strategy.components.reversal_detector import ReversalDetector
 from helpers.mt5_order_utils import MT5OrderUtils
+from MetaTrader.TickStream import get_tick_stream
+from helpers.metrics import timed, set_bot_label
 import asyncio
 import datetime
 import time
-from Views.globals.app_logger import app_logger as logger
+from Views.globals.app_logger import get_logger
 from typing import Dict, List, Optional, Any
 import json
 import traceback
 
+logger = get_logger("act")
+
 
 class AdvancedCyclesTrader(Strategy):
     """
@@ -106,6 +111,9 @@ class AdvancedCyclesTrader(Strategy):
         self.zone_range_pips = int(config.get("zone_range_pips", 50))
         self.auto_place_cycles=bool(config.get("auto_place_cycles", True))
         self.one_direction_per_candle=bool(config.get("one_direction_per_candle", True))
+        self.tick_stream_enabled = bool(config.get("tick_stream_enabled", True))
+        self.tick_min_interval = float(config.get("tick_min_interval", 0.1))
+        self.idle_wakeup_interval = float(config.get("idle_wakeup_interval", 5.0))
         
         # Update magic number in PocketBase if it has changed
         self._update_magic_number_if_needed(config)
@@ -167,6 +175,7 @@ class AdvancedCyclesTrader(Strategy):
         self.strategy_active = False
         self.trading_active = False
         self.monitoring_thread = None
+        self.tick_subscription = None
         
         # Market data
         self.current_market_price = None
@@ -270,7 +279,7 @@ class AdvancedCyclesTrader(Strategy):
                                     try:
                                         import json
                                         active_orders = json.loads(cycle.active_orders) if cycle.active_orders else []
-                                        all_orders.extend(active_orders)
+                                        all_orders.extend(orders_from_dicts(active_orders))
                                     except Exception as e:
                                         logger.warning(f"Could not parse active_orders for cycle {cycle.cycle_id}: {e}")
                                 elif isinstance(cycle.active_orders, list):
@@ -284,7 +293,7 @@ class AdvancedCyclesTrader(Strategy):
                                     try:
                                         import json
                                         completed_orders = json.loads(cycle.completed_orders) if cycle.completed_orders else []
-                                        all_orders.extend(completed_orders)
+                                        all_orders.extend(orders_from_dicts(completed_orders))
                                     except Exception as e:
                                         logger.warning(f"Could not parse completed_orders for cycle {cycle.cycle_id}: {e}")
                                 elif isinstance(cycle.completed_orders, list):
@@ -295,7 +304,7 @@ class AdvancedCyclesTrader(Strategy):
                             # Find initial order with type safety
                             for order in all_orders:
                                 try:
-                                    if isinstance(order, dict) and order.get('kind', 'initial') == 'initial':
+                                    if isinstance(order, OrderRecord) and getattr(order, 'kind', 'initial') == 'initial':
                                         initial_order = order
                                         break
                                     elif isinstance(order, str):
@@ -508,8 +517,8 @@ class AdvancedCyclesTrader(Strategy):
                 'initial_order_data': initial_order_data,
                 'price_level': self._safe_float_value(getattr(pb_cycle, 'price_level', 0.0)),
                 # Orders data
-                'active_orders': active_orders,
-                'completed_orders': completed_orders,
+                'active_orders': orders_from_dicts(active_orders),
+                'completed_orders': orders_from_dicts(completed_orders),
                 'reversal_history': getattr(pb_cycle, 'reversal_history', []),
                 
                 # Cycle type
@@ -776,7 +785,7 @@ class AdvancedCyclesTrader(Strategy):
                 return None
             if isinstance(data, str):
                 return data
-            return json.dumps(data)
+            return json.dumps(data, default=json_default)
         except (TypeError, ValueError) as e:
             logger.error(f"Error serializing data: {e}")
             return None
@@ -1813,31 +1822,52 @@ class AdvancedCyclesTrader(Strategy):
     async def _monitoring_loop(self):
         """Main monitoring loop"""
         logger.info("Strategy monitoring loop started")
+        set_bot_label(getattr(self.bot, 'id', None))
+        
+        if self.tick_stream_enabled:
+            try:
+                self.tick_subscription = get_tick_stream(self.meta_trader).subscribe(
+                    self.symbol, min_interval=self.tick_min_interval
+                )
+            except Exception as e:
+                logger.error(f"Error subscribing to tick stream, falling back to polling: {e}")
+                self.tick_subscription = None
         
         while self.strategy_active:
             try:
                 # Clean up closed cycles periodically
-                self._cleanup_closed_cycles()
+                with timed("act", "cleanup_closed_cycles"):
+                    self._cleanup_closed_cycles()
                 
                 # Update only active cycles
-                self._update_active_cycles_sync()
+                with timed("act", "update_active_cycles"):
+                    self._update_active_cycles_sync()
                 
                 # Get market data
-                market_data = self._get_market_data()
+                with timed("act", "market_data"):
+                    market_data = self._get_market_data()
                 
                 if market_data:
                     # Process strategy logic
-                    await self._process_strategy_logic(market_data)
+                    with timed("act", "process_strategy_logic"):
+                        await self._process_strategy_logic(market_data)
                     
                     # Monitor order management
                     # self._monitor_order_management(market_data)
                 
-                # Sleep before next iteration
-                time.sleep(1)
+                # Sleep until the price moves or the idle interval expires
+                if self.tick_subscription is not None:
+                    await self.tick_subscription.wait(self.idle_wakeup_interval)
+                else:
+                    await asyncio.sleep(1)
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(5)  # Wait longer on error
+                await asyncio.sleep(5)  # Wait longer on error
+        
+        if self.tick_subscription is not None:
+            self.tick_subscription.close()
+            self.tick_subscription = None
         
         logger.info("Strategy monitoring loop stopped")
 
@@ -1885,27 +1915,29 @@ class AdvancedCyclesTrader(Strategy):
             active_cycles = self._get_only_active_cycles()
             
             # Check for take profit conditions first
-            for cycle in active_cycles.copy():
-                if self._check_cycle_take_profit(cycle, current_price):
-                    try:
-                        logger.info(f"Take profit hit for cycle {cycle.cycle_id}, closing cycle")
-                        await self._close_single_cycle(cycle.cycle_id,"system")
-                        continue
-                    except Exception as e:
-                        logger.error(f"Error handling take profit for cycle {cycle.cycle_id}: {e}")
-                        continue
+            with timed("act", "check_take_profit_conditions"):
+                for cycle in active_cycles.copy():
+                    if self._check_cycle_take_profit(cycle, current_price):
+                        try:
+                            logger.info(f"Take profit hit for cycle {cycle.cycle_id}, closing cycle")
+                            await self._close_single_cycle(cycle.cycle_id,"system")
+                            continue
+                        except Exception as e:
+                            logger.error(f"Error handling take profit for cycle {cycle.cycle_id}: {e}")
+                            continue
             
             # Check for initial order stop losses
-            for cycle in active_cycles.copy():
-                if self._check_initial_order_stop_loss(cycle, current_price):
-                    try:
-                        # Always handle stop loss synchronously to avoid MetaTrader attribute issues
-                        logger.warning(f"Stop loss detected for cycle {cycle.cycle_id}, handling synchronously")
-                        self._close_initial_order_stop_loss_sync(cycle, current_price)
-                        continue
-                    except Exception as e:
-                        logger.error(f"Error handling stop loss for cycle {cycle.cycle_id}: {e}")
-                        continue
+            with timed("act", "check_initial_stop_loss"):
+                for cycle in active_cycles.copy():
+                    if self._check_initial_order_stop_loss(cycle, current_price):
+                        try:
+                            # Always handle stop loss synchronously to avoid MetaTrader attribute issues
+                            logger.warning(f"Stop loss detected for cycle {cycle.cycle_id}, handling synchronously")
+                            self._close_initial_order_stop_loss_sync(cycle, current_price)
+                            continue
+                        except Exception as e:
+                            logger.error(f"Error handling stop loss for cycle {cycle.cycle_id}: {e}")
+                            continue
             
             # Update active cycles list after potential closures
             active_cycles = self._get_only_active_cycles()
@@ -1920,8 +1952,10 @@ class AdvancedCyclesTrader(Strategy):
             cycles_for_breach_reversal = self._filter_cycles_for_breach_reversal_checks(active_cycles)
             
             # Continue with other strategy logic using filtered cycles
-            self._check_reversal_conditions_for_cycles(current_price, market_data, cycles_for_breach_reversal)
-            self._check_zone_breaches(current_price, market_data, cycles_for_breach_reversal)
+            with timed("act", "check_reversal_conditions"):
+                self._check_reversal_conditions_for_cycles(current_price, market_data, cycles_for_breach_reversal)
+            with timed("act", "check_zone_breaches"):
+                self._check_zone_breaches(current_price, market_data, cycles_for_breach_reversal)
             # self._manage_continuous_orders_for_cycles(current_price, market_data, active_cycles)
             
         except Exception as e:
@@ -2527,10 +2561,10 @@ class AdvancedCyclesTrader(Strategy):
     def _get_pip_value(self) -> float:
         """Get pip value for the current symbol"""
         try:
-            # Get symbol point from MetaTrader and multiply by 100
-            symbol_info = self.meta_trader.get_symbol_info(self.symbol)
-            if symbol_info and hasattr(symbol_info, 'point'):
-                return symbol_info.point * 10
+            # Cached symbol spec: point * 10
+            pip_value = self.meta_trader.get_pips(self.symbol)
+            if pip_value:
+                return pip_value
             
         except Exception as e:
             logger.error(f"Error getting pip value: {e}")
@@ -2,10 +2,12 @@ from Strategy.strategy import Strategy
 import threading
 from Orders.order import order
 from cycles.CT_cycle import cycle
+from cycles.cycle_registry import CycleRegistry
 from DB.db_engine import engine
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 import asyncio
 from Views.globals.app_logger import app_logger as logger
+from MetaTrader.TickStream import get_tick_stream
 
 
 class CycleTrader(Strategy):
@@ -19,6 +21,9 @@ class CycleTrader(Strategy):
         self.orders = {}
         self.symbol = symbol
         self.bot = bot
+        # Cycle objects kept across ticks, rebuilt only when their DB row changes elsewhere
+        self.cycle_registry = CycleRegistry(
+            lambda cycle_data: cycle(cycle_data, self.meta_trader, self, "db"))
         self.enable_recovery = False
         self.lot_sizes = [0.01, 0.02, 0.03, 0.04,
                           0.05, 0.06, 0.07, 0.08, 0.09, 0.10]
@@ -47,6 +52,8 @@ class CycleTrader(Strategy):
         self.hedge_sl = 100
         self.prevent_opposing_trades = True
         self.last_candle_time = None
+        self.tick_subscription = None
+        self.idle_wakeup_interval = 5
         self.init_settings()
 
     def initialize(self, config, settings):
@@ -579,9 +586,17 @@ class CycleTrader(Strategy):
         Returns:
         None
         """
+        try:
+            self.tick_subscription = get_tick_stream(self.meta_trader).subscribe(
+                self.symbol, min_interval=1)
+        except Exception as e:
+            self.logger.error(f"Error subscribing to tick stream: {e}")
+            self.tick_subscription = None
+
         while True:
             try:
                 active_cycles = await self.get_all_active_cycles()
+                cycle_objs = self.cycle_registry.refresh(active_cycles)
                 New_cycles_Restrition = False
 
                 # Only calculate restrictions if autotrade_pips_restriction is not 0
@@ -592,17 +607,14 @@ class CycleTrader(Strategy):
                     up_price = bid+(self.autotrade_pips_restriction/2)*pips
                     down_price = bid-(self.autotrade_pips_restriction/2)*pips
 
-                    for cycle_data in active_cycles:
-                        cycle_obj = cycle(
-                            cycle_data, self.meta_trader, self, "db")
+                    for cycle_obj in cycle_objs:
                         if len(cycle_obj.orders) <= 2 and len(cycle_obj.closed) == 0 and len(cycle_obj.hedge) == 0:
                             if cycle_obj.open_price > 0:
                                 if cycle_obj.open_price > down_price and cycle_obj.open_price < up_price:
                                     New_cycles_Restrition = True
 
                 tasks = []
-                for cycle_data in active_cycles:
-                    cycle_obj = cycle(cycle_data, self.meta_trader, self, "db")
+                for cycle_obj in cycle_objs:
                     if not self.stop:
                         tasks.append(cycle_obj.manage_cycle_orders(
                             self.zone_forward, self.zone_forward2))
@@ -629,8 +641,11 @@ class CycleTrader(Strategy):
                 import traceback
                 self.logger.error(traceback.format_exc())
 
-            # Always sleep at the end to prevent CPU overload
-            await asyncio.sleep(1)
+            # Wait for the next price change (at most 1 wake-up per second) to prevent CPU overload
+            if self.tick_subscription is not None:
+                await self.tick_subscription.wait(self.idle_wakeup_interval)
+            else:
+                await asyncio.sleep(1)
 
     async def check_candle_trading(self):
         """Check for candle close events and execute trades
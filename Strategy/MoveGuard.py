@@ -24,14 +24,22 @@ from Strategy.components.enhanced_zone_detection import EnhancedZoneDetection
 from Strategy.components.enhanced_order_manager import EnhancedOrderManager
 from Strategy.components.reversal_detector import ReversalDetector
 from helpers.mt5_order_utils import MT5OrderUtils
+from MetaTrader.TickStream import get_tick_stream
+from cycles.order_store import OrderStore
+from cycles.grid_ladder import GridLadder
+from cycles.cycle_snapshot import CycleSnapshotStore, default_snapshot_path, dump_cycle, load_cycle, pocketbase_time
+from cycles.order_record import OrderRecord, orders_from_dicts, json_default
+from helpers.metrics import timed, set_bot_label
 import asyncio
 import datetime
 import time
-from Views.globals.app_logger import app_logger as logger
+from Views.globals.app_logger import get_logger
 from typing import Dict, List, Optional, Any
 import json
 import traceback
 
+logger = get_logger("moveguard")
+
 
 class MoveGuard(Strategy):
     """
@@ -187,7 +195,7 @@ class MoveGuard(Strategy):
         self.market_hours_enabled = bool(cfg.get("market_hours_enabled", True))
         
         # Advanced optimization systems
-        self.batch_update_queue = []  # Queue for batch database updates
+        self.batch_update_queue = {}  # Queue for batch database updates, keyed by cycle_id
         self.batch_update_interval = float(cfg.get("batch_update_interval", 10.0))  # Process batch updates every N seconds
         self.last_batch_update_time = 0
         self.order_cleanup_interval_seconds = float(cfg.get("order_cleanup_interval_seconds", 45.0))
@@ -197,6 +205,19 @@ class MoveGuard(Strategy):
         self.cycle_process_interval = float(cfg.get("cycle_process_interval", 2.0))  # Process each cycle every N seconds
         self.database_update_interval = float(cfg.get("database_update_interval", 5.0))  # Database update throttling interval
         self.optimization_enabled = bool(cfg.get("optimization_enabled", True))  # Enable/disable optimizations
+        self.market_snapshot_max_age = float(cfg.get("market_snapshot_max_age", 1.0))  # Reuse the tick snapshot for N seconds
+        self.ticket_index_max_age = float(cfg.get("ticket_index_max_age", 1.0))  # Reuse the MT5 ticket index for N seconds
+        self.pnl_book_max_age = float(cfg.get("pnl_book_max_age", 1.0))  # Reuse the vectorized position P&L for N seconds
+        self.tick_stream_enabled = bool(cfg.get("tick_stream_enabled", True))  # Wake the loop on price changes instead of fixed polling
+        self.tick_min_interval = float(cfg.get("tick_min_interval", 0.1))  # Minimum seconds between tick wake-ups
+        self.idle_wakeup_interval = float(cfg.get("idle_wakeup_interval", 5.0))  # Run the loop at least every N seconds in a quiet market
+        self.order_tracking_interval = float(cfg.get("order_tracking_interval", 5.0))  # Track order status every N seconds
+        self.warm_start_enabled = bool(cfg.get("warm_start_enabled", True))  # Resume from the local cycle snapshot on restart
+        self.snapshot_interval = float(cfg.get("snapshot_interval", 30.0))  # Write the local cycle snapshot every N seconds
+        self.snapshot_max_age = float(cfg.get("snapshot_max_age", 86400.0))  # Do a full PocketBase sync if the snapshot is older
+        self.snapshot_clock_skew = float(cfg.get("snapshot_clock_skew", 120.0))  # Re-read cycles updated up to N seconds before the snapshot
+        self.cycle_snapshot = CycleSnapshotStore(cfg.get("snapshot_path") or default_snapshot_path("moveguard", self.bot.id))
+        self.warm_started_cycle_ids = set()
 
     def _initialize_advanced_components(self):
         """Initialize advanced components for MoveGuard"""
@@ -238,6 +259,21 @@ class MoveGuard(Strategy):
         self.grid_direction = None
         self.last_grid_price = 0.0
         
+        # Tick-scoped market snapshot shared by grid, TP, trailing-SL and profit code
+        self.market_snapshot = None
+        
+        # Tick-scoped index of MT5 position/order tickets used by order tracking
+        self.ticket_index = None
+        
+        # Tick-scoped P&L of the symbol's open positions, shared by profit sync and TP checks
+        self.pnl_book = None
+        
+        # Ladder mapping the price of a loaded order back to its grid level
+        self.level_ladder = GridLadder()
+        
+        # Subscription to the shared MT5 tick stream that wakes the monitoring loop
+        self.tick_subscription = None
+        
         # Zone state tracking
         self.active_zones = {}
         self.zone_movement_history = []
@@ -269,8 +305,9 @@ class MoveGuard(Strategy):
         try:
             logger.info("🚀 Initializing MoveGuard Strategy...")
             
-            # Sync with PocketBase
-            self._sync_cycles_with_pocketbase()
+            # Resume from the local snapshot when possible, otherwise load every cycle from PocketBase
+            if not self._warm_start_from_snapshot():
+                self._sync_cycles_with_pocketbase()
             
             # Initialize zone boundaries for existing cycles
             self._initialize_zone_boundaries_for_existing_cycles()
@@ -309,54 +346,132 @@ class MoveGuard(Strategy):
             
             # Process each cycle
             for pb_cycle in cycles_data:
-                try:
-                    # Convert PocketBase cycle to local format
-                    local_cycle_data = self._convert_pb_cycle_to_local_format(pb_cycle)
+                self._add_cycle_from_pocketbase(pb_cycle)
                     
-                    if local_cycle_data:
-                        # Check if cycle already exists locally
-                        existing_cycle = None
-                        for cycle in self.multi_cycle_manager.get_all_active_cycles():
-                            if cycle.cycle_id == local_cycle_data.get('cycle_id'):
-                                existing_cycle = cycle
-                                break
+        except Exception as e:
+            logger.error(f"❌ Error syncing MoveGuard cycles with PocketBase: {str(e)}")
+            logger.error(traceback.format_exc())
+
+    def _add_cycle_from_pocketbase(self, pb_cycle):
+        """Convert a PocketBase cycle record and add it to the cycle manager unless it is already loaded"""
+        try:
+            # Convert PocketBase cycle to local format
+            local_cycle_data = self._convert_pb_cycle_to_local_format(pb_cycle)
+            
+            if local_cycle_data:
+                # Check if cycle already exists locally
+                existing_cycle = None
+                for cycle in self.multi_cycle_manager.get_all_active_cycles():
+                    if cycle.cycle_id == local_cycle_data.get('cycle_id'):
+                        existing_cycle = cycle
+                        break
+                
+                if not existing_cycle:
+                    # Create new cycle
+                    try:
+                        cycle = MoveGuardCycle(local_cycle_data, self.meta_trader, self.bot)
                         
-                        if not existing_cycle:
-                            # Create new cycle
-                            try:
-                                cycle = MoveGuardCycle(local_cycle_data, self.meta_trader, self.bot)
-                                
-                                # Sync zone data and bounds after creating cycle
-                                self._sync_cycle_zone_data_from_database(cycle, pb_cycle)
-                                
-                                # CRITICAL: Initialize pending orders from PocketBase data
-                                if not hasattr(cycle, 'pending_orders'):
-                                    cycle.pending_orders = []
-                                    cycle.pending_order_levels = set()
-                                
-                                # Restore pending orders from cycle data
-                                pending_orders = local_cycle_data.get('pending_orders', [])
-                                pending_levels = local_cycle_data.get('pending_order_levels', set())
-                                if pending_orders:
-                                    cycle.pending_orders = pending_orders
-                                    cycle.pending_order_levels = pending_levels
-                                    logger.info(f"✅ Restored {len(pending_orders)} pending orders for cycle {cycle.cycle_id}")
-                                
-                                self.multi_cycle_manager.add_cycle(cycle)
-                                logger.info(f"✅ MoveGuard cycle {cycle.cycle_id} synced from PocketBase")
-                            except Exception as e:
-                                logger.error(f"❌ Error creating cycle from PocketBase data: {str(e)}")
-                                continue
-                        else:
-                            logger.debug(f"MoveGuard cycle {local_cycle_data.get('cycle_id')} already exists locally")
-                            
-                except Exception as e:
-                    logger.error(f"❌ Error processing PocketBase cycle: {str(e)}")
-                    continue
+                        # Sync zone data and bounds after creating cycle
+                        self._sync_cycle_zone_data_from_database(cycle, pb_cycle)
+                        
+                        # CRITICAL: Initialize pending orders from PocketBase data
+                        if not hasattr(cycle, 'pending_orders'):
+                            cycle.pending_orders = []
+                            cycle.pending_order_levels = set()
+                        
+                        # Restore pending orders from cycle data
+                        pending_orders = local_cycle_data.get('pending_orders', [])
+                        pending_levels = local_cycle_data.get('pending_order_levels', set())
+                        if pending_orders:
+                            cycle.pending_orders = pending_orders
+                            cycle.pending_order_levels = pending_levels
+                            logger.info(f"✅ Restored {len(pending_orders)} pending orders for cycle {cycle.cycle_id}")
+                        
+                        self.multi_cycle_manager.add_cycle(cycle)
+                        logger.info(f"✅ MoveGuard cycle {cycle.cycle_id} synced from PocketBase")
+                    except Exception as e:
+                        logger.error(f"❌ Error creating cycle from PocketBase data: {str(e)}")
+                else:
+                    logger.debug(f"MoveGuard cycle {local_cycle_data.get('cycle_id')} already exists locally")
                     
         except Exception as e:
-            logger.error(f"❌ Error syncing MoveGuard cycles with PocketBase: {str(e)}")
+            logger.error(f"❌ Error processing PocketBase cycle: {str(e)}")
+
+    # ==================== WARM START SNAPSHOT ====================
+
+    def _warm_start_from_snapshot(self) -> bool:
+        """Restore cycles from the local snapshot and re-read only the ones changed in PocketBase since
+
+        Returns:
+            bool: True if the cycles were restored, False if a full PocketBase sync is needed
+        """
+        try:
+            if not self.warm_start_enabled:
+                return False
+            
+            saved_at, states = self.cycle_snapshot.load(self.snapshot_max_age)
+            if saved_at is None:
+                logger.info("🧊 No usable MoveGuard cycle snapshot, doing a full PocketBase sync")
+                return False
+            
+            # Anything written to PocketBase around or after the snapshot (UI edits, closes) wins over it
+            since = pocketbase_time(saved_at - self.snapshot_clock_skew)
+            changed = self.client.get_MG_cycles_updated_since(self.bot.id, since)
+            if changed is None:
+                return False
+            changed_by_id = {getattr(pb_cycle, 'id', None): pb_cycle for pb_cycle in changed}
+            
+            cycles = [load_cycle(MoveGuardCycle, state, self.meta_trader, self.bot)
+                      for cycle_id, state in states.items() if cycle_id not in changed_by_id]
+            for cycle in cycles:
+                self.multi_cycle_manager.add_cycle(cycle)
+                self.warm_started_cycle_ids.add(cycle.cycle_id)
+            
+            refreshed = 0
+            for pb_cycle in changed:
+                if not getattr(pb_cycle, 'is_closed', False):
+                    self._add_cycle_from_pocketbase(pb_cycle)
+                    refreshed += 1
+            
+            logger.info(f"🔥 MoveGuard warm start: {len(cycles)} cycles restored from snapshot, "
+                        f"{refreshed} re-read from PocketBase, {len(changed) - refreshed} closed since")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error restoring MoveGuard cycle snapshot, doing a full PocketBase sync: {str(e)}")
             logger.error(traceback.format_exc())
+            for cycle in self.multi_cycle_manager.get_all_active_cycles():
+                self.multi_cycle_manager.remove_cycle(cycle.cycle_id)
+            self.warm_started_cycle_ids.clear()
+            return False
+
+    def _dump_cycle_snapshot(self) -> dict:
+        """Pickle every active cycle's state (run on the thread that mutates the cycles)"""
+        states = {}
+        for cycle in self.multi_cycle_manager.get_all_active_cycles():
+            if getattr(cycle, 'is_closed', False) or not getattr(cycle, 'cycle_id', None):
+                continue
+            try:
+                states[cycle.cycle_id] = dump_cycle(cycle)
+            except Exception as e:
+                logger.warning(f"⚠️ Cycle {cycle.cycle_id} left out of the snapshot: {str(e)}")
+        return states
+
+    def _write_cycle_snapshot(self):
+        """Write the local warm-start snapshot of the active cycles"""
+        try:
+            if self.warm_start_enabled:
+                self.cycle_snapshot.save(self._dump_cycle_snapshot())
+        except Exception as e:
+            logger.error(f"❌ Error writing MoveGuard cycle snapshot: {str(e)}")
+
+    async def _write_cycle_snapshot_async(self):
+        """Pickle the cycles in the monitoring loop, write the file off the loop"""
+        try:
+            if self.warm_start_enabled:
+                await asyncio.to_thread(self.cycle_snapshot.save, self._dump_cycle_snapshot())
+        except Exception as e:
+            logger.error(f"❌ Error writing MoveGuard cycle snapshot: {str(e)}")
 
     def _convert_pb_cycle_to_local_format(self, pb_cycle) -> dict:
         """Convert PocketBase cycle data to local format for MoveGuard"""
@@ -446,6 +561,10 @@ class MoveGuard(Strategy):
             else:
                 cycle_data['completed_orders'] = completed_orders_data if completed_orders_data else []
 
+            # Keep loaded orders as compact records
+            for key in ('orders', 'active_orders', 'completed_orders', 'pending_orders'):
+                cycle_data[key] = orders_from_dicts(cycle_data[key])
+
             # Enrich orders with grid_level/is_grid/is_initial if missing
             try:
                 pip_value = self._get_pip_value()
@@ -495,8 +614,7 @@ class MoveGuard(Strategy):
                                     # Level 1 starts exactly at grid_start_price
                                     price_diff = grid_start_price - float(price)
                                     pips_diff = price_diff / pip_value
-                                    level = int(pips_diff / float(self.grid_interval_pips)) + 1
-                                    level = max(1, level)
+                                    level = self._grid_level_at_price('SELL', grid_start_price, self.grid_interval_pips, pip_value, price)
                             else:  # SELL
                                 # For SELL: Level 1 starts above upper_boundary + initial_offset
                                 grid_start_price = upper_boundary + (entry_interval_pips * pip_value)
@@ -512,8 +630,7 @@ class MoveGuard(Strategy):
                                     # Level 1 starts exactly at grid_start_price
                                     price_diff = float(price) - grid_start_price
                                     pips_diff = price_diff / pip_value
-                                    level = int(pips_diff / float(self.grid_interval_pips)) + 1
-                                    level = max(1, level)
+                                    level = self._grid_level_at_price('BUY', grid_start_price, self.grid_interval_pips, pip_value, price)
                             
                             o['grid_level'] = level
                             logger.debug(f"📊 Computed grid_level={level} for order {o.get('order_id')} (price={price}, entry={entry}, pips_diff={pips_diff:.1f}, entry_interval={entry_interval_pips})")
@@ -904,10 +1021,7 @@ class MoveGuard(Strategy):
                                     new_grid_level = 0
                                 else:
                                     # Price is below grid_start_price - calculate grid level
-                                    price_diff = grid_start_price - float(price)
-                                    pips_diff = price_diff / pip_value
-                                    new_grid_level = int(pips_diff / float(grid_interval_pips)) + 1
-                                    new_grid_level = max(1, new_grid_level)
+                                    new_grid_level = self._grid_level_at_price('SELL', grid_start_price, grid_interval_pips, pip_value, price)
                             else:  # SELL
                                 # For SELL: Level 1 starts above upper_boundary + initial_offset
                                 grid_start_price = upper_boundary + (entry_interval_pips * pip_value)
@@ -920,10 +1034,7 @@ class MoveGuard(Strategy):
                                     new_grid_level = 0
                                 else:
                                     # Price is above grid_start_price - calculate grid level
-                                    price_diff = float(price) - grid_start_price
-                                    pips_diff = price_diff / pip_value
-                                    new_grid_level = int(pips_diff / float(grid_interval_pips)) + 1
-                                    new_grid_level = max(1, new_grid_level)
+                                    new_grid_level = self._grid_level_at_price('BUY', grid_start_price, grid_interval_pips, pip_value, price)
                             
                             # Update grid level if it changed
                             old_grid_level = order.get('grid_level')
@@ -1638,6 +1749,14 @@ class MoveGuard(Strategy):
             if hasattr(self, 'monitoring_thread') and self.monitoring_thread.is_alive():
                 self.monitoring_thread.join(timeout=5)
             
+            # Write out queued and buffered cycle updates
+            self._process_batch_updates(force=True)
+            if hasattr(self.client, 'flush_pending_updates'):
+                self.client.flush_pending_updates()
+            
+            # Snapshot after the flush so the next start sees PocketBase at least as new as the snapshot
+            self._write_cycle_snapshot()
+            
             logger.info("✅ MoveGuard Strategy stopped successfully")
             
         except Exception as e:
@@ -1648,30 +1767,50 @@ class MoveGuard(Strategy):
         try:
             logger.info("🔄 MoveGuard monitoring loop started")
             
-            order_tracking_counter = 0
+            set_bot_label(getattr(self.bot, 'id', None))
+            self._subscribe_tick_stream()
+            last_order_tracking_time = time.monotonic()
+            last_snapshot_time = time.monotonic()
             
             while self.is_running:
                 try:
-                    # Get market data
-                    market_data = self._get_market_data()
+                    # Capture one market snapshot for this tick; all cycles share it
+                    with timed("moveguard", "market_data"):
+                        market_data = self._get_market_data()
                     if not market_data:
                         await asyncio.sleep(1)
                         continue
                     
+                    # Index all MT5 tickets once for this tick's order existence checks
+                    with timed("moveguard", "ticket_index"):
+                        self._refresh_ticket_index()
+                    
+                    # Load every open position's P&L once for this tick's profit and TP checks
+                    with timed("moveguard", "pnl_book"):
+                        self._refresh_pnl_book()
+                    
                     # Process strategy logic
-                    await self._process_strategy_logic(market_data)
+                    with timed("moveguard", "process_strategy_logic"):
+                        await self._process_strategy_logic(market_data)
                     
                     # Update active cycles
-                    self._update_active_cycles_sync()
+                    with timed("moveguard", "update_active_cycles"):
+                        self._update_active_cycles_sync()
                     
-                    # Track order status every 5 seconds
-                    order_tracking_counter += 1
-                    if order_tracking_counter >= 5:
-                        self._track_and_update_order_status()
-                        order_tracking_counter = 0
+                    # Track order status on a wall-clock interval (tick wake-ups are irregular)
+                    if time.monotonic() - last_order_tracking_time >= self.order_tracking_interval:
+                        with timed("moveguard", "track_order_status"):
+                            self._track_and_update_order_status()
+                        last_order_tracking_time = time.monotonic()
                     
-                    # Sleep for monitoring interval
-                    await asyncio.sleep(1)
+                    # Refresh the warm-start snapshot
+                    if time.monotonic() - last_snapshot_time >= self.snapshot_interval:
+                        with timed("moveguard", "cycle_snapshot"):
+                            await self._write_cycle_snapshot_async()
+                        last_snapshot_time = time.monotonic()
+                    
+                    # Sleep until the price moves or the idle interval expires
+                    await self._wait_for_next_tick()
                     
                 except Exception as e:
                     logger.error(f"❌ Error in MoveGuard monitoring loop: {str(e)}")
@@ -1679,16 +1818,48 @@ class MoveGuard(Strategy):
                     
         except Exception as e:
             logger.error(f"❌ Fatal error in MoveGuard monitoring loop: {str(e)}")
+        finally:
+            self._unsubscribe_tick_stream()
+
+    def _subscribe_tick_stream(self):
+        """Subscribe the monitoring loop to the shared MT5 tick stream"""
+        try:
+            if not self.tick_stream_enabled or self.tick_subscription is not None:
+                return
+            self.tick_subscription = get_tick_stream(self.meta_trader).subscribe(
+                self.symbol, min_interval=self.tick_min_interval
+            )
+            logger.info(f"📡 MoveGuard subscribed to tick stream for {self.symbol}")
+        except Exception as e:
+            logger.error(f"❌ Error subscribing to tick stream, falling back to polling: {str(e)}")
+            self.tick_subscription = None
+
+    def _unsubscribe_tick_stream(self):
+        """Release the tick stream subscription"""
+        try:
+            if self.tick_subscription is not None:
+                self.tick_subscription.close()
+        except Exception as e:
+            logger.error(f"❌ Error unsubscribing from tick stream: {str(e)}")
+        finally:
+            self.tick_subscription = None
+
+    async def _wait_for_next_tick(self):
+        """Wait for the next price change, or poll every second without a subscription"""
+        if self.tick_subscription is None:
+            await asyncio.sleep(1)
+            return
+        await self.tick_subscription.wait(self.idle_wakeup_interval)
 
     def _update_active_cycles_sync(self):
         """Update active cycles for MoveGuard"""
         try:
             active_cycles = self.multi_cycle_manager.get_all_active_cycles()
+            current_price = self._get_current_price()
             
             for cycle in active_cycles:
                 try:
                     # Update cycle statistics
-                    current_price = self._get_current_price()
                     if current_price:
                         cycle.total_profit_pips = self._calculate_cycle_total_profit_pips(cycle, current_price)
                     
@@ -1733,9 +1904,10 @@ class MoveGuard(Strategy):
             
             # CRITICAL: Monitor all active orders status across all cycles
             # This ensures we catch any orders that were closed in MT5
-            for cycle in active_cycles:
-                if cycle.status == 'active':
-                    self._monitor_active_orders_status(cycle)
+            with timed("moveguard", "monitor_active_orders_status"):
+                for cycle in active_cycles:
+                    if cycle.status == 'active':
+                        self._monitor_active_orders_status(cycle)
             
             # Filter cycles that need processing (smart filtering)
             cycles_to_process = []
@@ -1753,19 +1925,21 @@ class MoveGuard(Strategy):
             
             # Update filtered cycles with current profit data from MetaTrader
             # This now automatically syncs to PocketBase immediately when profits change
-            self._update_cycles_profit_from_mt5(cycles_to_process)
-            
-            # Process batch updates if needed
-            self._process_batch_updates()
+            with timed("moveguard", "update_cycles_profit_from_mt5"):
+                self._update_cycles_profit_from_mt5(cycles_to_process)
             
-            # Note: Database sync is now handled inside _update_cycle_orders_profit_from_mt5
-            # But we still update cycles that might have other changes (non-profit updates)
-            for cycle in cycles_to_process:
-                try:
-                    # Only update if not already synced by profit update (throttled)
-                    self._update_cycle_in_database(cycle)
-                except Exception as e:
-                    logger.error(f"❌ Error updating cycle {cycle.cycle_id} in database after profit update: {str(e)}")
+            with timed("moveguard", "pocketbase_sync"):
+                # Process batch updates if needed
+                self._process_batch_updates()
+                
+                # Note: Database sync is now handled inside _update_cycle_orders_profit_from_mt5
+                # But we still update cycles that might have other changes (non-profit updates)
+                for cycle in cycles_to_process:
+                    try:
+                        # Only update if not already synced by profit update (throttled)
+                        self._update_cycle_in_database(cycle)
+                    except Exception as e:
+                        logger.error(f"❌ Error updating cycle {cycle.cycle_id} in database after profit update: {str(e)}")
             
             # Log total active profit for monitoring
             total_profit = self.get_total_active_profit_from_mt5()
@@ -1782,7 +1956,8 @@ class MoveGuard(Strategy):
                 # self._check_and_cleanup_closed_orders(cycle)
             
             # Process grid logic
-            self._process_grid_logic(current_price, market_data, active_cycles)
+            with timed("moveguard", "process_grid_logic"):
+                self._process_grid_logic(current_price, market_data, active_cycles)
             
             # Process zone logic
             # self._process_zone_logic(current_price, market_data, active_cycles)
@@ -1791,10 +1966,12 @@ class MoveGuard(Strategy):
             # self._process_recovery_logic(current_price, market_data)
             
             # Check take profit conditions
-            self._check_take_profit_conditions(current_price, active_cycles)
+            with timed("moveguard", "check_take_profit_conditions"):
+                self._check_take_profit_conditions(current_price, active_cycles)
             
             # Check for interval-based cycle creation
-            await self._check_cycle_intervals(current_price)
+            with timed("moveguard", "check_cycle_intervals"):
+                await self._check_cycle_intervals(current_price)
             
             # Clean up active cycle levels for closed cycles
             self._cleanup_cycle_levels()
@@ -2133,7 +2310,7 @@ class MoveGuard(Strategy):
                     cycle.direction = order_direction
                     logger.info(f"🔄 Updated cycle {cycle.cycle_id} direction to {order_direction}")
                     
-                    order_info = {
+                    order_info = OrderRecord({
                         'order_id': order_id,
                         'ticket': order_id,
                         'direction': order_direction,
@@ -2151,7 +2328,7 @@ class MoveGuard(Strategy):
                         'sl': sl_price,
                         'is_active': False
                     
-                    }
+                    })
                     
                     # Add to pending orders tracking
                     if not hasattr(cycle, 'pending_orders'):
@@ -2343,37 +2520,124 @@ class MoveGuard(Strategy):
 
     # ==================== UTILITY METHODS ====================
 
+    def _refresh_market_snapshot(self):
+        """Fetch a new market snapshot from MetaTrader (one round trip per tick)"""
+        try:
+            snapshot = self.meta_trader.get_market_snapshot(self.symbol)
+            if snapshot is not None:
+                self.market_snapshot = snapshot
+            return snapshot
+        except Exception as e:
+            logger.error(f"❌ Failed to refresh market snapshot: {str(e)}")
+            return None
+
+    def _get_market_snapshot(self):
+        """Get the current tick snapshot, refreshing it only when it is stale"""
+        snapshot = self.market_snapshot
+        if snapshot is not None and snapshot.symbol == self.symbol and snapshot.is_fresh(self.market_snapshot_max_age):
+            return snapshot
+        return self._refresh_market_snapshot()
+
     def _get_market_data(self) -> Optional[dict]:
-        """Get market data for MoveGuard"""
+        """Get market data for MoveGuard (captures the snapshot for this tick)"""
         try:
-            bid = self.meta_trader.get_bid(self.symbol)
-            ask = self.meta_trader.get_ask(self.symbol)
-            if bid and ask:
-                price = (bid + ask) / 2
-                return {
-                    'price': price,
-                    'bid': bid,
-                    'ask': ask,
-                    'last': price,
-                    'time': datetime.datetime.now()
-                }
+            snapshot = self._refresh_market_snapshot()
+            if snapshot is not None:
+                return snapshot.to_market_data()
             return None
         except Exception as e:
             logger.error(f"❌ Failed to get market data: {str(e)}")
             return None
 
     def _get_current_price(self) -> Optional[float]:
-        """Get current price for MoveGuard"""
+        """Get current price for MoveGuard from the tick snapshot"""
         try:
-            bid = self.meta_trader.get_bid(self.symbol)
-            ask = self.meta_trader.get_ask(self.symbol)
-            if bid and ask:
-                return (bid + ask) / 2
+            snapshot = self._get_market_snapshot()
+            if snapshot is not None:
+                return snapshot.mid
             return None
         except Exception as e:
             logger.error(f"❌ Failed to get current price: {str(e)}")
             return None
 
+    def _get_bid(self) -> Optional[float]:
+        """Get bid price for MoveGuard from the tick snapshot"""
+        snapshot = self._get_market_snapshot()
+        return snapshot.bid if snapshot is not None else None
+
+    def _get_ask(self) -> Optional[float]:
+        """Get ask price for MoveGuard from the tick snapshot"""
+        snapshot = self._get_market_snapshot()
+        return snapshot.ask if snapshot is not None else None
+
+    def _refresh_ticket_index(self):
+        """Index all MT5 positions and pending orders by ticket (two round trips per tick)"""
+        try:
+            ticket_index = self.meta_trader.get_ticket_index()
+            self.ticket_index = ticket_index
+            return ticket_index
+        except Exception as e:
+            logger.error(f"❌ Failed to refresh ticket index: {str(e)}")
+            self.ticket_index = None
+            return None
+
+    def _get_ticket_index(self):
+        """Get the current tick's ticket index, rebuilding it only when it is stale"""
+        ticket_index = self.ticket_index
+        if ticket_index is not None and ticket_index.is_fresh(self.ticket_index_max_age):
+            return ticket_index
+        return self._refresh_ticket_index()
+
+    def _refresh_pnl_book(self):
+        """Compute per-order, per-cycle and total P&L from one positions_get(symbol) call"""
+        try:
+            ticket_cycles = {}
+            for cycle in self.multi_cycle_manager.get_all_active_cycles():
+                for order in self._order_store(cycle).active():
+                    order_id = getattr(order, 'ticket', None)
+                    if order_id:
+                        ticket_cycles[int(order_id)] = cycle.cycle_id
+            snapshot = self._get_market_snapshot()
+            price = snapshot.mid if snapshot is not None else None
+            self.pnl_book = self.meta_trader.get_pnl_book(self.symbol, ticket_cycles, price=price, pip=self._get_pip_value())
+            return self.pnl_book
+        except Exception as e:
+            logger.error(f"❌ Failed to refresh P&L book: {str(e)}")
+            self.pnl_book = None
+            return None
+
+    def _get_pnl_book(self):
+        """Get the current tick's P&L book, rebuilding it only when it is stale"""
+        pnl_book = self.pnl_book
+        if pnl_book is not None and pnl_book.is_fresh(self.pnl_book_max_age):
+            return pnl_book
+        return self._refresh_pnl_book()
+
+    def _get_mt5_position(self, order_id, fallback: bool = True):
+        """Get the MT5 position for a ticket from the index
+        
+        Tickets missing from the index may have been opened after it was built,
+        so unless fallback is disabled they are looked up directly in MT5.
+        """
+        ticket_index = self._get_ticket_index()
+        if ticket_index is not None:
+            position = ticket_index.get_position(order_id)
+            if position is not None or not fallback:
+                return position
+        positions = self.meta_trader.get_position_by_ticket(int(order_id))
+        if positions:
+            return positions[0] if isinstance(positions, (tuple, list)) else positions
+        return None
+
+    def _pending_order_exists_in_mt5(self, order_id, fallback: bool = True) -> bool:
+        """Check if a ticket is a pending order in MT5 using the ticket index"""
+        ticket_index = self._get_ticket_index()
+        if ticket_index is not None:
+            if ticket_index.has_order(order_id) or not fallback:
+                return ticket_index.has_order(order_id)
+        orders = self.meta_trader.get_order_by_ticket(int(order_id))
+        return bool(orders)
+
     def _is_market_open(self) -> bool:
         """Check if market is currently open"""
         try:
@@ -2483,8 +2747,8 @@ class MoveGuard(Strategy):
             if new_trailing_sl <= 0:
                 return False
             # Only update active positions, skip pending orders
-            active_orders = [o for o in cycle.orders if o.get('status') == 'active']
-            pending_orders = [o for o in cycle.orders if o.get('status') == 'pending']
+            active_orders = self._order_store(cycle).active()
+            pending_orders = self._order_store(cycle).pending()
             
             if not active_orders:
                 logger.debug(f"No active orders to update SL for cycle {cycle.cycle_id} (pending orders: {len(pending_orders)})")
@@ -2516,82 +2780,31 @@ class MoveGuard(Strategy):
             closed_orders = 0
             if(len(grid_orders_to_update) == 1):
                 return False;
+            
+            # Modify every grid position's SL in one batch; positions already at the target are skipped
+            orders_by_ticket = {}
             for order in grid_orders_to_update:
                 order_id = order.get('ticket') or order.get('order_id')
                 if not order_id:
                     logger.warning(f"⚠️ Order missing ticket/order_id: {order}")
                     continue
-                
-                try:
-                    # # Check if position still exists in MT5
-                    # position = self.meta_trader.get_position_by_ticket(int(order_id))
-                    # if not position or len(position) == 0:
-                    #     logger.debug(f"🔍 Position {order_id} not found in MT5 - order was closed, updating status")
-                    #     # CRITICAL: Preserve profit before marking as closed
-                    #     self._preserve_order_profit_before_closure(order)
-                    #     order['status'] = 'closed'
-                    #     order['closed_reason'] = 'position_not_found'
-                    #     order['closed_at'] = datetime.datetime.now().isoformat()
-                    #     closed_orders += 1
-                        
-                        # # CRITICAL: If a grid order (level >= 1) was closed, immediately close all other active grid orders
-                        # # This ensures all grid orders close together
-                        # grid_level = order.get('grid_level', 0)
-                        # if isinstance(grid_level, (int, float)) and int(grid_level) >= 1:
-                        #     logger.info(f"🚨 Grid order {order_id} (level {grid_level}) was closed during SL update - closing all other active grid orders to keep them synchronized")
-                        #     remaining_active_orders = [o for o in active_orders 
-                        #                               if o.get('grid_level', 0) >= 1
-                        #                               and (o.get('ticket') or o.get('order_id')) != order_id
-                        #                               and o.get('status') == 'active']
-                            
-                        #     for remaining_order in remaining_active_orders:
-                        #         remaining_order_id = remaining_order.get('ticket') or remaining_order.get('order_id')
-                        #         try:
-                        #             # Close the remaining grid order immediately
-                        #             close_result = self._close_order(remaining_order)
-                        #             if close_result:
-                        #                 logger.info(f"✅ Closed remaining grid order {remaining_order_id} (level {remaining_order.get('grid_level')}) to keep synchronized")
-                        #                 # CRITICAL: Preserve profit before marking as closed
-                        #                 self._preserve_order_profit_before_closure(remaining_order)
-                        #                 remaining_order['status'] = 'closed'
-                        #                 remaining_order['closed_reason'] = 'synchronized_close'
-                        #                 remaining_order['closed_at'] = datetime.datetime.now().isoformat()
-                        #                 closed_orders += 1
-                        #             else:
-                        #                 logger.warning(f"⚠️ Failed to close remaining grid order {remaining_order_id}")
-                        #         except Exception as close_error:
-                        #             logger.error(f"❌ Error closing remaining grid order {remaining_order_id}: {close_error}")
-                        
-                        # continue
-                    
-                    # Modify the position's stop loss in MT5
-                    logger.debug(f"🔧 Attempting to modify SL for order {order_id} from {order.get('stop_loss', 'unknown')} to {new_trailing_sl:.5f}")
-                    result = self.meta_trader.modify_position_sl_tp(
-                        ticket=int(order_id),
-                        sl=new_trailing_sl,
-                        tp=0.0
-                    )
-                    
-                    if result:
-                        updated_count += 1
-                        logger.info(f"✅ Successfully updated SL for order {order_id} to {new_trailing_sl:.5f}")
-                        # Update order record with new SL
-                        order['stop_loss'] = new_trailing_sl
-                    else:
-                        failed_count += 1
-                        logger.warning(f"⚠️ Failed to update SL for order {order_id} - modify_position_sl_tp returned False")
-                        # Try to get more details about why it failed
-                        try:
-                            position_info = self.meta_trader.get_position_by_ticket(int(order_id))
-                            if position_info:
-                                logger.warning(f"🔍 Position {order_id} exists but SL modification failed. Current SL: {getattr(position_info, 'sl', 'unknown')}")
-                        except Exception as e:
-                            logger.warning(f"🔍 Could not get position info for {order_id}: {e}")
-                        
-                except Exception as e:
+                orders_by_ticket[int(order_id)] = order
+            
+            results = self.meta_trader.modify_positions_sl_tp(
+                [(ticket, new_trailing_sl, 0.0) for ticket in orders_by_ticket], symbol=self.symbol
+            )
+            for ticket, order in orders_by_ticket.items():
+                result = results.get(ticket) or {'status': 'failed', 'retcode': None}
+                if result['status'] in ('modified', 'unchanged'):
+                    updated_count += 1
+                    # Update order record with new SL
+                    order['stop_loss'] = new_trailing_sl
+                elif result['status'] == 'not_found':
                     failed_count += 1
-                    logger.debug(f"⚠️ Error updating SL for order {order_id}: {e}")
-                    continue
+                    logger.debug("🔍 Position %s not found in MT5 while updating trailing SL", ticket)
+                else:
+                    failed_count += 1
+                    logger.warning("⚠️ Failed to update SL for order %s (retcode=%s)", ticket, result.get('retcode'))
             
             # If we found closed orders, update the cycle data and sync to database
             if closed_orders > 0:
@@ -2621,15 +2834,16 @@ class MoveGuard(Strategy):
     def _get_pip_value(self) -> float:
         """Get pip value for MoveGuard with enhanced validation"""
         try:
-            # Get symbol point value from MetaTrader
-            symbol_info = self.meta_trader.get_symbol_info(self.symbol)
-            if symbol_info and hasattr(symbol_info, 'point'):
-                pip_value = float(symbol_info.point) * 10
-                if pip_value > 0:
-                    logger.debug(f"✅ Got pip value from MT5: {pip_value}")
-                    return pip_value
-                else:
-                    logger.warning(f"⚠️ Invalid pip value from MT5: {pip_value}")
+            # Reuse the point captured in this tick's snapshot when available
+            snapshot = self.market_snapshot
+            if snapshot is not None and snapshot.symbol == self.symbol and snapshot.pip > 0:
+                return snapshot.pip
+            
+            # Otherwise use the cached symbol spec (loaded from MT5 once per symbol)
+            pip_value = float(self.meta_trader.get_pips(self.symbol) or 0)
+            if pip_value > 0:
+                return pip_value
+            logger.warning(f"⚠️ Invalid pip value from MT5: {pip_value}")
             
             # Fallback based on symbol type
             if 'BTC' in self.symbol.upper():
@@ -2661,24 +2875,14 @@ class MoveGuard(Strategy):
         """Add cycle to batch update queue"""
         try:
             cycle_id = getattr(cycle, 'cycle_id', 'unknown')
-            # Check if cycle is already in queue
-            for item in self.batch_update_queue:
-                if item.get('cycle_id') == cycle_id:
-                    # Update existing entry
-                    item['cycle'] = cycle
-                    item['use_snapshot'] = use_snapshot
-                    item['snapshot'] = snapshot
-                    item['timestamp'] = datetime.datetime.now().timestamp()
-                    return
-            
-            # Add new entry to queue
-            self.batch_update_queue.append({
+            # Add or replace the entry for this cycle (latest state wins)
+            self.batch_update_queue[cycle_id] = {
                 'cycle_id': cycle_id,
                 'cycle': cycle,
                 'use_snapshot': use_snapshot,
                 'snapshot': snapshot,
                 'timestamp': datetime.datetime.now().timestamp()
-            })
+            }
             
         except Exception as e:
             logger.error(f"❌ Error adding cycle to batch queue: {str(e)}")
@@ -2701,24 +2905,10 @@ class MoveGuard(Strategy):
             successful_updates = 0
             failed_updates = 0
             
-            for item in self.batch_update_queue:
+            for item in self.batch_update_queue.values():
                 try:
-                    cycle = item['cycle']
-                    use_snapshot = item['use_snapshot']
-                    snapshot = item['snapshot']
-                    
-                    # Update cycle statistics before database update
-                    self._update_cycle_statistics_with_profit(cycle)
-                    
-                    cycle_data = self._prepare_cycle_data_for_database(cycle, use_snapshot, snapshot)
-                    
-                    if self._validate_cycle_data_before_update(cycle_data):
-                        success = self.client.update_MG_cycle_by_id(cycle.cycle_id, cycle_data)
-                        if success:
-                            successful_updates += 1
-                            cycle._last_db_update_time = current_time
-                        else:
-                            failed_updates += 1
+                    if self._queue_cycle_update(item['cycle'], item['use_snapshot'], item['snapshot']):
+                        successful_updates += 1
                     else:
                         failed_updates += 1
                         
@@ -2735,6 +2925,46 @@ class MoveGuard(Strategy):
         except Exception as e:
             logger.error(f"❌ Error processing batch updates: {str(e)}")
 
+    def _queue_cycle_update(self, cycle, use_snapshot: bool = False, snapshot: dict = None):
+        """Hand a cycle update to the API write-behind buffer
+        
+        Repeated updates of the same cycle within a flush window are coalesced
+        into a single PocketBase request. If the buffered write fails, the
+        cycle goes through the regular update-or-create path.
+        """
+        try:
+            if not hasattr(self.client, 'queue_MG_cycle_update'):
+                return self._update_cycle_in_database(cycle, use_snapshot, snapshot, force_update=True)
+            
+            # Update cycle statistics before database update
+            self._update_cycle_statistics_with_profit(cycle)
+            
+            cycle_data = self._prepare_cycle_data_for_database(cycle, use_snapshot, snapshot)
+            
+            if not self._validate_cycle_data_before_update(cycle_data):
+                logger.error(f"❌ Invalid cycle data for MoveGuard cycle {cycle.cycle_id}")
+                return False
+            
+            changed_data, fingerprints = self._diff_cycle_data(cycle, cycle_data)
+            if not changed_data:
+                logger.debug(f"⏭️ No field changes for cycle {cycle.cycle_id}, skipping queued update")
+                return True
+            
+            def on_failure(cycle_id, data):
+                # The buffered diff was lost - resend the full record
+                cycle._persisted_fingerprints = {}
+                self._update_cycle_in_database(cycle, force_update=True)
+            
+            queued = self.client.queue_MG_cycle_update(cycle.cycle_id, changed_data, on_failure=on_failure)
+            if queued:
+                cycle._persisted_fingerprints = fingerprints
+                cycle._last_db_update_time = datetime.datetime.now().timestamp()
+            return queued
+            
+        except Exception as e:
+            logger.error(f"❌ Error queueing update for cycle {getattr(cycle, 'cycle_id', 'unknown')}: {str(e)}")
+            return False
+
     # ==================== DATABASE OPERATIONS ====================
 
     def _update_cycle_in_database(self, cycle, use_snapshot: bool = False, snapshot: dict = None, force_update: bool = False):
@@ -2762,13 +2992,21 @@ class MoveGuard(Strategy):
                 logger.error(f"❌ Invalid cycle data for MoveGuard cycle {cycle.cycle_id}")
                 return False
             
+            # Only send fields whose content changed since the last successful write
+            changed_data, fingerprints = self._diff_cycle_data(cycle, cycle_data)
+            if not changed_data:
+                logger.debug(f"⏭️ No field changes for MoveGuard cycle {cycle.cycle_id}, skipping database update")
+                cycle._last_db_update_time = datetime.datetime.now().timestamp()
+                return True
+            
             # First, try to update the cycle
             try:
-                success = self.client.update_MG_cycle_by_id(cycle.cycle_id, cycle_data)
+                success = self.client.update_MG_cycle_by_id(cycle.cycle_id, changed_data)
                 
                 if success:
-                    logger.debug(f"✅ MoveGuard cycle {cycle.cycle_id} updated in database")
+                    logger.debug(f"✅ MoveGuard cycle {cycle.cycle_id} updated in database ({len(changed_data)}/{len(cycle_data)} fields)")
                     # Update the last database update timestamp
+                    cycle._persisted_fingerprints = fingerprints
                     cycle._last_db_update_time = datetime.datetime.now().timestamp()
                     return True
                 else:
@@ -2793,6 +3031,7 @@ class MoveGuard(Strategy):
                 
                 if result and hasattr(result, 'id'):
                     logger.info(f"✅ MoveGuard cycle {cycle.cycle_id} created in database with ID: {result.id}")
+                    cycle._persisted_fingerprints = fingerprints
                     return True
                 else:
                     logger.error(f"❌ Failed to create MoveGuard cycle {cycle.cycle_id} in database - No result returned")
@@ -2969,11 +3208,36 @@ class MoveGuard(Strategy):
             logger.error(f"❌ Error validating MoveGuard cycle data: {str(e)}")
             return False
 
+    def _diff_cycle_data(self, cycle, cycle_data: dict):
+        """Compare prepared cycle data with what was last persisted for the cycle
+        
+        Each top-level field is fingerprinted; nested structures are already
+        JSON strings by this point, so their hash covers the full content.
+        
+        Returns:
+            tuple: (changed fields to send, fingerprints to store once the write succeeds)
+        """
+        persisted = getattr(cycle, '_persisted_fingerprints', None) or {}
+        fingerprints = {}
+        changed_data = {}
+        for field, value in cycle_data.items():
+            try:
+                fingerprint = hash((type(value).__name__, value))
+            except TypeError:
+                fingerprint = hash((type(value).__name__, repr(value)))
+            fingerprints[field] = fingerprint
+            if persisted.get(field) != fingerprint:
+                changed_data[field] = value
+        # 'id' only identifies the record, it never needs to be written on its own
+        if set(changed_data) == {'id'}:
+            changed_data = {}
+        return changed_data, fingerprints
+
     def _serialize_data(self, data):
         """Serialize data for MoveGuard database storage"""
         try:
             if isinstance(data, (dict, list)):
-                return json.dumps(data)
+                return json.dumps(data, default=json_default)
             return str(data)
         except Exception as e:
             logger.error(f"❌ Error serializing data for MoveGuard: {str(e)}")
@@ -3106,30 +3370,15 @@ class MoveGuard(Strategy):
     def _calculate_grid_level(self, cycle, current_price: float) -> int:
         """Calculate grid level for MoveGuard based on price movement and existing orders"""
         try:
-            # Get zone boundaries and grid parameters
-            zone_data = cycle.zone_data
-            upper_boundary = zone_data.get('upper_boundary', 0.0)
-            lower_boundary = zone_data.get('lower_boundary', 0.0)
-            
-            pip_value = self._get_pip_value()
-            grid_interval_pips = getattr(cycle, 'grid_interval_pips', self.grid_interval_pips)
-            entry_interval_pips = getattr(cycle, 'entry_interval_pips', self.entry_interval_pips)
-            
-            # Get active orders for this cycle
-            active_orders = [o for o in cycle.orders if o.get('status') == 'active']
-            active_grid_orders = [o for o in active_orders if o.get('is_grid', False)]
+            # Get active grid orders for this cycle
+            active_grid_orders = [o for o in self._order_store(cycle).active() if o.get('is_grid', False)]
             
             if not active_grid_orders:
                 logger.debug(f"📊 No active grid orders found for cycle {cycle.cycle_id}, starting at level 1")
                 return 1
             
             # Find the highest grid level among active grid orders
-            max_grid_level = -1
-            for order in active_grid_orders:
-                grid_level = order.get('grid_level', 0)
-                if grid_level > max_grid_level:
-                    max_grid_level = grid_level
-            
+            max_grid_level = max(o.get('grid_level', 0) for o in active_grid_orders)
             next_level = max_grid_level + 1
             logger.debug(f"📊 Grid level calculation for cycle {cycle.cycle_id}: max_level={max_grid_level}, next_level={next_level}")
             return next_level
@@ -3144,7 +3393,7 @@ class MoveGuard(Strategy):
             logger.info(f"🔄 Resetting grid levels for cycle {cycle.cycle_id} due to trailing SL hit")
             
             # Get all active orders for this cycle
-            active_orders = [o for o in cycle.orders if o.get('status') == 'active']
+            active_orders = self._order_store(cycle).active()
             
             # Reset grid levels starting from 0
             new_level = 0
@@ -3312,7 +3561,7 @@ class MoveGuard(Strategy):
                 logger.info(f"📈 Updated cycle {cycle.cycle_id} direction to BUY")
                 
                 # Add order to cycle
-                order_info = {
+                order_info = OrderRecord({
                     'order_id': order_result['order'].get('ticket'),
                     'ticket': order_result['order'].get('ticket'),
                     'direction': 'BUY',
@@ -3327,7 +3576,7 @@ class MoveGuard(Strategy):
                     'profit': 0.0,
                     'profit_pips': 0.0,
                     'last_profit_update': datetime.datetime.now().isoformat()
-                }
+                })
                 
                 # Add order to cycle
                 if hasattr(cycle, 'orders'):
@@ -3492,7 +3741,7 @@ class MoveGuard(Strategy):
                 logger.info(f"📉 Updated cycle {cycle.cycle_id} direction to SELL")
                 
                 # Add order to cycle
-                order_info = {
+                order_info = OrderRecord({
                     'order_id': order_result['order'].get('ticket'),
                     'ticket': order_result['order'].get('ticket'),
                     'direction': 'SELL',
@@ -3507,7 +3756,7 @@ class MoveGuard(Strategy):
                     'profit': 0.0,
                     'profit_pips': 0.0,
                     'last_profit_update': datetime.datetime.now().isoformat()
-                }
+                })
                 
                 # Add order to cycle
                 if hasattr(cycle, 'orders'):
@@ -3582,18 +3831,43 @@ class MoveGuard(Strategy):
             logger.error(f"❌ Error placing MoveGuard grid SELL order: {str(e)}")
             return False
 
+    def _order_store(self, cycle) -> OrderStore:
+        """Get the cycle's indexed order store, converting a plain orders list on first use"""
+        orders = getattr(cycle, 'orders', None)
+        if not isinstance(orders, OrderStore):
+            orders = OrderStore(orders or [])
+            cycle.orders = orders
+        return orders
+
+    def _grid_ladder(self, cycle) -> GridLadder:
+        """Get the cycle's grid ladder with its level occupancy synced to the cycle's orders"""
+        ladder = getattr(cycle, 'grid_ladder', None)
+        if ladder is None:
+            ladder = GridLadder()
+            cycle.grid_ladder = ladder
+        ladder.sync(self._order_store(cycle), getattr(cycle, 'pending_order_levels', ()))
+        return ladder
+
+    def _grid_level_at_price(self, ladder_direction, grid_start_price, grid_interval_pips, pip_value, price) -> int:
+        """Grid level (1 or more) a price has reached on a ladder starting at grid_start_price
+        
+        ladder_direction is the side the levels run to: 'BUY' upward, 'SELL' downward.
+        The level prices are only rebuilt when the geometry changes, so mapping all
+        orders of a cycle is one bisect per order.
+        """
+        self.level_ladder.configure(ladder_direction, grid_start_price, float(grid_interval_pips), pip_value)
+        return max(1, self.level_ladder.level_at(float(price)))
+
+    def _set_order_status(self, cycle, order, status):
+        """Set an order's status, keeping the cycle's order store index in sync"""
+        if cycle is None:
+            order['status'] = status
+            return order
+        return self._order_store(cycle).set_status(order, status)
+
     def _level_already_exists(self, cycle, target_level: int) -> bool:
         """Check if a grid level already exists in pending or active orders"""
-        # Check pending orders
-        if target_level in cycle.pending_order_levels:
-            return True
-        
-        # Check active orders
-        for order in cycle.orders:
-            if order.get('status') == 'active' and order.get('grid_level') == target_level:
-                return True
-        
-        return False
+        return self._grid_ladder(cycle).is_occupied(target_level)
 
     def _calculate_pending_orders_needed(self, cycle) -> int:
         """Calculate how many pending orders are needed to maintain 1 pending order"""
@@ -3607,23 +3881,11 @@ class MoveGuard(Strategy):
         If active orders are 1, 2, 3, next level should be 4.
         If no active orders, starts from 1.
         """
-        # Find highest active order level (NOT pending orders)
-        max_active_level = 0
-        active_levels = []
+        # Highest active order level (NOT pending orders, they'll be replaced) comes from the ladder
+        ladder = self._grid_ladder(cycle)
+        result = ladder.next_level()
         
-        # Only check active orders (pending orders are ignored as they'll be replaced)
-        for order in cycle.orders:
-            if order.get('status') == 'active':
-                grid_level = order.get('grid_level', 0)
-                if grid_level > 0:  # Only count valid grid levels (> 0)
-                    max_active_level = max(max_active_level, grid_level)
-                    active_levels.append(grid_level)
-        
-        # Return next level after highest active order, ensuring we start from grid level 1
-        next_level = max_active_level + 1
-        result = max(next_level, 1)
-        
-        logger.debug(f"🔍 _get_next_grid_level: active_levels={sorted(active_levels)}, max_active={max_active_level}, next_level={result}")
+        logger.debug("🔍 _get_next_grid_level: max_active=%s, next_level=%s", ladder.max_active_level, result)
         return result
     
     def _check_grid_level_gaps(self, cycle) -> bool:
@@ -3633,26 +3895,12 @@ class MoveGuard(Strategy):
         Returns False if levels are sequential (1, 2, 3) or no active orders
         """
         try:
-            # Get all active order grid levels
-            active_levels = []
-            for order in cycle.orders:
-                if order.get('status') == 'active':
-                    grid_level = order.get('grid_level', 0)
-                    if grid_level > 0:  # Only count valid grid levels
-                        active_levels.append(grid_level)
-            
-            # If no active orders or only 1, no gaps possible
-            if len(active_levels) <= 1:
-                return False
-            
-            # Sort levels
-            active_levels.sort()
-            
-            # Check for gaps: levels should be consecutive (1, 2, 3...)
-            for i in range(len(active_levels) - 1):
-                if active_levels[i + 1] != active_levels[i] + 1:
-                    logger.warning(f"⚠️ Gap detected in grid levels: {active_levels} - missing levels between {active_levels[i]} and {active_levels[i + 1]}")
-                    return True
+            # The ladder keeps the active level count and span, so no scan is needed
+            ladder = self._grid_ladder(cycle)
+            if ladder.has_gaps():
+                logger.warning(f"⚠️ Gap detected in grid levels: {ladder.active_orders} active orders on "
+                               f"{ladder.active_levels} levels between {ladder.min_active_level} and {ladder.max_active_level}")
+                return True
             
             return False
             
@@ -3670,17 +3918,17 @@ class MoveGuard(Strategy):
         """
         try:
             # Get active orders
-            active_orders = [o for o in cycle.orders if o.get('status') == 'active']
-            active_grid_orders = [o for o in active_orders if o.get('grid_level', 0) >= 1]
+            active_orders = self._order_store(cycle).active()
+            active_grid_orders = [o for o in active_orders if getattr(o, 'grid_level', 0) >= 1]
             
             # Get pending grid orders (level >= 1)
-            pending_grid_orders = [o for o in getattr(cycle, 'pending_orders', []) if o.get('grid_level', 0) >= 1]
+            pending_grid_orders = [o for o in getattr(cycle, 'pending_orders', []) if getattr(o, 'grid_level', 0) >= 1]
             
             if not pending_grid_orders:
                 # No pending grid orders - validation passes
                 return True
             
-            pending_levels = sorted([o.get('grid_level', 0) for o in pending_grid_orders])
+            pending_levels = sorted([getattr(o, 'grid_level', 0) for o in pending_grid_orders])
             
             if len(active_grid_orders) == 0:
                 # No active grid orders - pending must start from grid level 1, max 1 pending
@@ -3700,7 +3948,7 @@ class MoveGuard(Strategy):
                 return True
             else:
                 # Active grid orders exist - pending must continue sequentially
-                active_levels = sorted([o.get('grid_level', 0) for o in active_grid_orders])
+                active_levels = sorted([getattr(o, 'grid_level', 0) for o in active_grid_orders])
                 max_active_level = max(active_levels) if active_levels else 0
                 
                 # Check if pending levels are sequential starting from max_active_level + 1
@@ -3801,8 +4049,8 @@ class MoveGuard(Strategy):
             
             # CRITICAL FIX: Check if grid orders have just closed - if so, maintain cycle direction and don't switch
             # Get active orders to check grid order status
-            active_orders_check = [o for o in getattr(cycle, 'orders', []) if o.get('status') == 'active']
-            active_grid_orders_check = [o for o in active_orders_check if o.get('grid_level', 0) >= 1]
+            active_orders_check = [o for o in getattr(cycle, 'orders', []) if getattr(o, 'status', None) == 'active']
+            active_grid_orders_check = [o for o in active_orders_check if getattr(o, 'grid_level', 0) >= 1]
             has_active_grid_orders = len(active_grid_orders_check) > 0
             
             # CRITICAL: If no active grid orders exist (grid orders just closed), maintain cycle direction
@@ -3845,10 +4093,10 @@ class MoveGuard(Strategy):
             
             # Check if there's an active initial order (grid 0) of the same direction
             # Don't place pending orders if initial order is still active
-            active_orders = [o for o in getattr(cycle, 'orders', []) if o.get('status') == 'active']
+            active_orders = [o for o in getattr(cycle, 'orders', []) if getattr(o, 'status', None) == 'active']
             active_initial_order = None
             for order in active_orders:
-                if order.get('grid_level', 0) == 0 and order.get('direction') == order_direction:
+                if getattr(order, 'grid_level', 0) == 0 and getattr(order, 'direction', None) == order_direction:
                     active_initial_order = order
                     break
             
@@ -3857,6 +4105,7 @@ class MoveGuard(Strategy):
                 return True  # Return True to indicate we successfully handled the request (by skipping)
             
             # Determine next grid level to place after ensuring initial order conflict is handled
+            ladder = self._grid_ladder(cycle)
             start_level = self._get_next_grid_level(cycle)
 
             # When about to place grid level 1, ensure no higher-level pending orders remain
@@ -3903,9 +4152,10 @@ class MoveGuard(Strategy):
                     
                     # Note: Level will be added to pending_order_levels inside _place_pending_grid_order
                     
-                    # Calculate target price for this level
+                    # Target price for this level from the cycle's precomputed ladder
                     # For BUY orders: grid level 1 should be at grid_start_price, level 2 should be grid_start_price + grid_interval_pips
-                    target_price = grid_start_price + (grid_interval_pips * (target_level - 1) * pip_value)
+                    ladder.configure(order_direction, grid_start_price, grid_interval_pips, pip_value)
+                    target_price = ladder.price(target_level)
                     
                     # Debug logging to identify price calculation issues
                     logger.info(f"🔍 BUY Grid Level {target_level} Price Calculation:")
@@ -3931,15 +4181,17 @@ class MoveGuard(Strategy):
                             if not success and retry_count < max_retries:
                                 # Get fresh ask price for retry
                                 ask = self.meta_trader.get_ask(self.symbol)
-                                target_price = ask + (grid_interval_pips * (target_level - 1) * pip_value)
                                 grid_start_price = ask
+                                ladder.configure(order_direction, grid_start_price, grid_interval_pips, pip_value)
+                                target_price = ladder.price(target_level)
                                 logger.warning(f"⚠️ BUY level {target_level} failed, retrying with ask price {ask:.5f}, new target {target_price:.5f}")
                                 success = self._place_pending_grid_order(cycle, target_level, target_price, order_direction, ask)
                         else:
                             # Target price is not above current price, use ask price
                             ask = self.meta_trader.get_ask(self.symbol)
-                            target_price = ask + (grid_interval_pips * (target_level - 1) * pip_value)
-                            grid_start_price = ask 
+                            grid_start_price = ask
+                            ladder.configure(order_direction, grid_start_price, grid_interval_pips, pip_value)
+                            target_price = ladder.price(target_level)
                             logger.info(f"🔄 BUY level {target_level} price too low, using ask price {ask:.5f}, target {target_price:.5f} (attempt {retry_count}/{max_retries})")
                             success = self._place_pending_grid_order(cycle, target_level, target_price, order_direction, ask)
                     
@@ -3981,9 +4233,10 @@ class MoveGuard(Strategy):
                     
                     # Note: Level will be added to pending_order_levels inside _place_pending_grid_order
                     
-                    # Calculate target price for this level
+                    # Target price for this level from the cycle's precomputed ladder
                     # For SELL orders: grid level 1 should be at grid_start_price, level 2 should be grid_start_price - grid_interval_pips
-                    target_price = grid_start_price - (grid_interval_pips * (target_level - 1) * pip_value)
+                    ladder.configure(order_direction, grid_start_price, grid_interval_pips, pip_value)
+                    target_price = ladder.price(target_level)
                     
                     # Debug logging to identify price calculation issues
                     logger.info(f"🔍 SELL Grid Level {target_level} Price Calculation:")
@@ -4009,16 +4262,18 @@ class MoveGuard(Strategy):
                             if not success and retry_count < max_retries:
                                 # Get fresh bid price for retry
                                 bid = self.meta_trader.get_bid(self.symbol)
-                                target_price = bid - (grid_interval_pips * (target_level - 1) * pip_value)
-                                grid_start_price = bid 
+                                grid_start_price = bid
+                                ladder.configure(order_direction, grid_start_price, grid_interval_pips, pip_value)
+                                target_price = ladder.price(target_level)
                                 logger.warning(f"⚠️ SELL level {target_level} failed, retrying with bid price {bid:.5f}, new target {target_price:.5f}")
                                 success = self._place_pending_grid_order(cycle, target_level, target_price, order_direction, bid)
 
                         else:
                             # Target price is not below current price, use bid price
                             bid = self.meta_trader.get_bid(self.symbol)
-                            target_price = bid - (grid_interval_pips * (target_level - 1) * pip_value)
-                            grid_start_price = bid 
+                            grid_start_price = bid
+                            ladder.configure(order_direction, grid_start_price, grid_interval_pips, pip_value)
+                            target_price = ladder.price(target_level)
                             logger.info(f"🔄 SELL level {target_level} price too high, using bid price {bid:.5f}, target {target_price:.5f} (attempt {retry_count}/{max_retries})")
                             success = self._place_pending_grid_order(cycle, target_level, target_price, order_direction, bid)
                     
@@ -4167,7 +4422,7 @@ class MoveGuard(Strategy):
                 
                 if order_id:
                     # Store pending order info
-                    pending_order = {
+                    pending_order = OrderRecord({
                         'order_id': order_id,
                         'is_active': False,
                         'is_initial': False,
@@ -4188,7 +4443,7 @@ class MoveGuard(Strategy):
                         'comment': f"Grid_{grid_level}_{direction}",
                         'status': 'pending',
                      
-                    }
+                    })
                     
                     cycle.pending_orders.append(pending_order)
                     # Note: grid_level already added to pending_order_levels at the start of this function
@@ -4268,17 +4523,16 @@ class MoveGuard(Strategy):
                         logger.warning(f"⚠️ Failed to cancel SELL pending order {order_id} - checking if it was activated as market order")
                         
                         # Search for the order as a market position
-                        position = self.meta_trader.get_position_by_ticket(int(order_id))
-                        if position and len(position) > 0:
+                        position = self._get_mt5_position(order_id)
+                        if position is not None:
                             logger.info(f"🔍 Found SELL pending order {order_id} as activated market position - will close it")
                             
                             # Update the pending order to active status in cycle.orders
-                            for order in cycle.orders:
-                                if order.get('order_id') == order_id:
-                                    order['status'] = 'active'
-                                    order['activated_at'] = datetime.datetime.now().isoformat()
-                                    logger.info(f"🔄 Updated SELL order {order_id} status from 'pending' to 'active' (activated)")
-                                    break
+                            order = self._order_store(cycle).get(order_id)
+                            if order is not None:
+                                self._set_order_status(cycle, order, 'active')
+                                order['activated_at'] = datetime.datetime.now().isoformat()
+                                logger.info(f"🔄 Updated SELL order {order_id} status from 'pending' to 'active' (activated)")
                             
                             # Remove from pending tracking while keeping it in orders as active
                             self._cleanup_cycle_order_references(
@@ -4349,17 +4603,16 @@ class MoveGuard(Strategy):
                         logger.warning(f"⚠️ Failed to cancel BUY pending order {order_id} - checking if it was activated as market order")
                         
                         # Search for the order as a market position
-                        position = self.meta_trader.get_position_by_ticket(int(order_id))
-                        if position and len(position) > 0:
+                        position = self._get_mt5_position(order_id)
+                        if position is not None:
                             logger.info(f"🔍 Found BUY pending order {order_id} as activated market position - will close it")
                             
                             # Update the pending order to active status in cycle.orders
-                            for order in cycle.orders:
-                                if order.get('order_id') == order_id:
-                                    order['status'] = 'active'
-                                    order['activated_at'] = datetime.datetime.now().isoformat()
-                                    logger.info(f"🔄 Updated BUY order {order_id} status from 'pending' to 'active' (activated)")
-                                    break
+                            order = self._order_store(cycle).get(order_id)
+                            if order is not None:
+                                self._set_order_status(cycle, order, 'active')
+                                order['activated_at'] = datetime.datetime.now().isoformat()
+                                logger.info(f"🔄 Updated BUY order {order_id} status from 'pending' to 'active' (activated)")
                             
                             self._cleanup_cycle_order_references(
                                 cycle,
@@ -4422,12 +4675,11 @@ class MoveGuard(Strategy):
                                 cancelled_count += 1
                                 
                                 # Update status in main orders list
-                                for order in cycle.orders:
-                                    if order.get('order_id') == order_id:
-                                        order['status'] = 'cancelled'
-                                        order['cancelled_at'] = datetime.datetime.now().isoformat()
-                                        order['cancelled_reason'] = 'below_lower_when_price_above_upper'
-                                        break
+                                order = self._order_store(cycle).get(order_id)
+                                if order is not None:
+                                    self._set_order_status(cycle, order, 'cancelled')
+                                    order['cancelled_at'] = datetime.datetime.now().isoformat()
+                                    order['cancelled_reason'] = 'below_lower_when_price_above_upper'
                                 
                                 # Remove from pending orders tracking
                                 cycle.pending_orders.remove(pending_order)
@@ -4466,12 +4718,11 @@ class MoveGuard(Strategy):
                                 cancelled_count += 1
                                 
                                 # Update status in main orders list
-                                for order in cycle.orders:
-                                    if order.get('order_id') == order_id:
-                                        order['status'] = 'cancelled'
-                                        order['cancelled_at'] = datetime.datetime.now().isoformat()
-                                        order['cancelled_reason'] = 'above_upper_when_price_below_lower'
-                                        break
+                                order = self._order_store(cycle).get(order_id)
+                                if order is not None:
+                                    self._set_order_status(cycle, order, 'cancelled')
+                                    order['cancelled_at'] = datetime.datetime.now().isoformat()
+                                    order['cancelled_reason'] = 'above_upper_when_price_below_lower'
                                 
                                 # Remove from pending orders tracking
                                 cycle.pending_orders.remove(pending_order)
@@ -4521,12 +4772,11 @@ class MoveGuard(Strategy):
                         cancelled_count += 1
                         
                         # Update status in main orders list from 'pending' to 'cancelled'
-                        for order in cycle.orders:
-                            if order.get('order_id') == order_id:
-                                order['status'] = 'cancelled'
-                                order['cancelled_at'] = datetime.datetime.now().isoformat()
-                                logger.info(f"🔄 Updated order {order_id} status from 'pending' to 'cancelled' in cycle orders")
-                                break
+                        order = self._order_store(cycle).get(order_id)
+                        if order is not None:
+                            self._set_order_status(cycle, order, 'cancelled')
+                            order['cancelled_at'] = datetime.datetime.now().isoformat()
+                            logger.info(f"🔄 Updated order {order_id} status from 'pending' to 'cancelled' in cycle orders")
                         
                         # Remove from pending orders list
                         cycle.pending_orders.remove(pending_order)
@@ -4550,17 +4800,16 @@ class MoveGuard(Strategy):
                         logger.warning(f"⚠️ Failed to cancel pending order {order_id} - checking if it was activated as market order")
                         
                         # Search for the order as a market position
-                        position = self.meta_trader.get_position_by_ticket(int(order_id))
-                        if position and len(position) > 0:
+                        position = self._get_mt5_position(order_id)
+                        if position is not None:
                             logger.info(f"🔍 Found pending order {order_id} as activated market position - will close it")
                             
                             # Update the pending order to active status in cycle.orders
-                            for order in cycle.orders:
-                                if order.get('order_id') == order_id:
-                                    order['status'] = 'active'
-                                    order['activated_at'] = datetime.datetime.now().isoformat()
-                                    logger.info(f"🔄 Updated order {order_id} status from 'pending' to 'active' (activated)")
-                                    break
+                            order = self._order_store(cycle).get(order_id)
+                            if order is not None:
+                                self._set_order_status(cycle, order, 'active')
+                                order['activated_at'] = datetime.datetime.now().isoformat()
+                                logger.info(f"🔄 Updated order {order_id} status from 'pending' to 'active' (activated)")
                             
                             # Remove from pending orders list since it's now active
                             cycle.pending_orders.remove(pending_order)
@@ -4582,13 +4831,12 @@ class MoveGuard(Strategy):
                         else:
                             logger.warning(f"⚠️ Failed to cancel pending order {order_id} and order not found as market position - likely already cancelled or executed")
                             # Mark as cancelled in cycle data even if we can't cancel it in MT5
-                            for order in cycle.orders:
-                                if order.get('order_id') == order_id:
-                                    order['status'] = 'cancelled'
-                                    order['cancelled_at'] = datetime.datetime.now().isoformat()
-                                    order['cancelled_reason'] = 'not_found_in_mt5'
-                                    logger.info(f"🔄 Updated order {order_id} status to 'cancelled' in cycle data")
-                                    break
+                            order = self._order_store(cycle).get(order_id)
+                            if order is not None:
+                                self._set_order_status(cycle, order, 'cancelled')
+                                order['cancelled_at'] = datetime.datetime.now().isoformat()
+                                order['cancelled_reason'] = 'not_found_in_mt5'
+                                logger.info(f"🔄 Updated order {order_id} status to 'cancelled' in cycle data")
                             
                             # Remove from pending orders list
                             cycle.pending_orders.remove(pending_order)
@@ -4709,11 +4957,11 @@ class MoveGuard(Strategy):
 
                 position = None
                 try:
-                    position = self.meta_trader.get_position_by_ticket(int(str(order_id)))
+                    position = self._get_mt5_position(str(order_id))
                 except (TypeError, ValueError):
                     position = None
 
-                if position and len(position) > 0:
+                if position is not None:
                     cleanup_summary = self._cleanup_cycle_order_references(
                         cycle,
                         order_id,
@@ -4785,7 +5033,7 @@ class MoveGuard(Strategy):
                         summary['removed_from_pending'] = True
 
                         if new_status:
-                            pending_order['status'] = new_status
+                            self._set_order_status(cycle, pending_order, new_status)
                             summary['status_updated'] = True
                             if new_status == 'cancelled':
                                 pending_order['cancelled_at'] = timestamp
@@ -4805,7 +5053,7 @@ class MoveGuard(Strategy):
                     order_ref = order.get('order_id') or order.get('ticket')
                     if str(order_ref) == str_order_id:
                         if new_status:
-                            order['status'] = new_status
+                            self._set_order_status(cycle, order, new_status)
                             summary['status_updated'] = True
                             if new_status == 'cancelled':
                                 order['cancelled_at'] = timestamp
@@ -4895,18 +5143,17 @@ class MoveGuard(Strategy):
             
             # Update status in main orders list from 'pending' to 'active'
             order_found_in_main = False
-            for order in cycle.orders:
-                if order.get('order_id') == order_id:
-                    order['status'] = 'active'
-                    order['triggered_at'] = datetime.datetime.now().isoformat()
-                    order_found_in_main = True
-                    logger.info(f"🔄 Updated order {order_id} status from 'pending' to 'active' in cycle orders")
-                    break
+            order = self._order_store(cycle).get(order_id)
+            if order is not None:
+                self._set_order_status(cycle, order, 'active')
+                order['triggered_at'] = datetime.datetime.now().isoformat()
+                order_found_in_main = True
+                logger.info(f"🔄 Updated order {order_id} status from 'pending' to 'active' in cycle orders")
             
             # If order not found in main orders list, add it (shouldn't happen with new implementation)
             if not order_found_in_main:
                 logger.warning(f"⚠️ Order {order_id} not found in main orders list - adding it now")
-                pending_order['status'] = 'active'
+                self._set_order_status(cycle, pending_order, 'active')
                 pending_order['triggered_at'] = datetime.datetime.now().isoformat()
                 cycle.orders.append(pending_order)
             
@@ -5039,16 +5286,16 @@ class MoveGuard(Strategy):
         """Check the actual status of a pending order in MT5"""
         try:
             # First check if it's still a pending order
-            is_pending = self.meta_trader.check_order_is_pending(order_id)
+            is_pending = self._pending_order_exists_in_mt5(order_id)
             
             if is_pending:
                 # Order is still pending
                 return 'pending'
             else:
                 # Order is no longer pending - check if it became a position
-                position_info = self.meta_trader.get_position_by_ticket(order_id)
+                position_info = self._get_mt5_position(order_id)
                 
-                if position_info:
+                if position_info is not None:
                     # Order has been filled and became a position
                     return 'filled'
                 else:
@@ -5110,7 +5357,7 @@ class MoveGuard(Strategy):
                         pending_levels = set(pending_levels_data or [])
                     
                     # Update local cycle with PocketBase data
-                    cycle.pending_orders = pending_orders
+                    cycle.pending_orders = orders_from_dicts(pending_orders)
                     cycle.pending_order_levels = pending_levels
                     
                     logger.debug(f"✅ Synced {len(pending_orders)} pending orders from PocketBase for cycle {cycle.cycle_id}")
@@ -5131,7 +5378,7 @@ class MoveGuard(Strategy):
                 return True
             
             # Get all active orders (status = 'active')
-            active_orders = [order for order in cycle.orders if order.get('status') == 'active']
+            active_orders = self._order_store(cycle).active()
             
             if not active_orders:
                 return True
@@ -5140,56 +5387,25 @@ class MoveGuard(Strategy):
             
             # Check each active order to see if it still exists in MT5
             for order in active_orders:
-                order_id = order.get('order_id') or order.get('ticket')
+                order_id = getattr(order, 'ticket', None)
                 if not order_id:
                     continue
                 
                 try:
-                    # Check if the order still exists as a position in MT5
-                    # Use comprehensive checking to ensure we catch all closed positions
-                    position = None
+                    # Check if the order still exists as a position in MT5 (O(1) via the tick's ticket index)
                     position_exists = False
-                    
                     try:
-                        position = self.meta_trader.get_position_by_ticket(int(order_id))
-                        # Check if position exists - MT5 returns tuple or None
-                        if position is not None:
-                            # If it's a tuple, check if it has elements
-                            if isinstance(position, tuple):
-                                position_exists = len(position) > 0
-                            elif isinstance(position, list):
-                                position_exists = len(position) > 0
-                            else:
-                                # Single position object
-                                position_exists = True
+                        position_exists = self._get_mt5_position(order_id) is not None
                     except Exception as pos_check_error:
                         logger.debug(f"Error checking position {order_id}: {pos_check_error}")
                         position_exists = False
                     
-                    # Also verify by checking all positions to ensure ticket doesn't exist
-                    if not position_exists:
-                        try:
-                            # Double-check by getting all positions and checking if ticket exists
-                            all_positions = self.meta_trader.get_all_positions()
-                            if all_positions:
-                                for pos in all_positions:
-                                    if hasattr(pos, 'ticket') and pos.ticket == int(order_id):
-                                        position_exists = True
-                                        logger.debug(f"✅ Found position {order_id} in all_positions check")
-                                        break
-                                    elif isinstance(pos, (dict, tuple)) and (pos.get('ticket') if isinstance(pos, dict) else (pos[0] if len(pos) > 0 else None)) == int(order_id):
-                                        position_exists = True
-                                        logger.debug(f"✅ Found position {order_id} in all_positions check (dict/tuple)")
-                                        break
-                        except Exception as all_pos_error:
-                            logger.debug(f"Error checking all positions for {order_id}: {all_pos_error}")
-                    
                     if not position_exists:
                         # Order no longer exists in MT5 - it was closed
                         logger.info(f"🔍 Position {order_id} NOT FOUND in MT5 - marking as closed")
                         # CRITICAL: Preserve profit before marking as closed
                         self._preserve_order_profit_before_closure(order)
-                        order['status'] = 'closed'
+                        self._set_order_status(cycle, order, 'closed')
                         order['closed_at'] = datetime.datetime.now().isoformat()
                         order['closed_reason'] = 'mt5_position_closed'
                         closed_orders_count += 1
@@ -5204,7 +5420,7 @@ class MoveGuard(Strategy):
                         # Add to completed_orders if it exists
                         if hasattr(cycle, 'completed_orders') and isinstance(cycle.completed_orders, list):
                             # Make a copy to avoid reference issues
-                            order_copy = order.copy() if isinstance(order, dict) else dict(order)
+                            order_copy = order.copy()
                             cycle.completed_orders.append(order_copy)
                             logger.debug(f"➕ Added closed order {order_id} to cycle.completed_orders")
                         
@@ -5264,7 +5480,7 @@ class MoveGuard(Strategy):
                 
                 # CRITICAL: Update cycle.active_orders to reflect only active orders
                 # This ensures active_orders list is synchronized with order statuses
-                active_orders_list = [o for o in cycle.orders if o.get('status') == 'active']
+                active_orders_list = self._order_store(cycle).active()
                 if hasattr(cycle, 'active_orders'):
                     cycle.active_orders = active_orders_list
                     logger.info(f"🔄 Updated cycle.active_orders: {len(active_orders_list)} active orders remaining")
@@ -5273,7 +5489,7 @@ class MoveGuard(Strategy):
                     logger.info(f"➕ Created cycle.active_orders: {len(active_orders_list)} active orders")
                 
                 # CRITICAL: Update completed_orders list
-                completed_orders_list = [o for o in cycle.orders if o.get('status') == 'closed']
+                completed_orders_list = self._order_store(cycle).closed()
                 if hasattr(cycle, 'completed_orders'):
                     cycle.completed_orders = completed_orders_list
                     logger.debug(f"🔄 Updated cycle.completed_orders: {len(completed_orders_list)} completed orders")
@@ -5291,7 +5507,7 @@ class MoveGuard(Strategy):
                 
                 # CRITICAL: Check if grid orders closed and reset grid ordering if needed
                 # After grid orders close, check if no active grid orders remain
-                remaining_active_orders = [o for o in cycle.orders if o.get('status') == 'active']
+                remaining_active_orders = self._order_store(cycle).active()
                 active_grid_orders = [o for o in remaining_active_orders if o.get('grid_level', 0) >= 1]
                 
                 if len(active_grid_orders) == 0:
@@ -5327,12 +5543,11 @@ class MoveGuard(Strategy):
                                                 if hasattr(cycle, 'pending_order_levels'):
                                                     cycle.pending_order_levels.discard(grid_level)
                                                 # Update status in main orders list
-                                                for order in cycle.orders:
-                                                    if order.get('order_id') == order_id:
-                                                        order['status'] = 'cancelled'
-                                                        order['cancelled_at'] = datetime.datetime.now().isoformat()
-                                                        order['cancelled_reason'] = 'grid_reset_after_close'
-                                                        break
+                                                order = self._order_store(cycle).get(order_id)
+                                                if order is not None:
+                                                    self._set_order_status(cycle, order, 'cancelled')
+                                                    order['cancelled_at'] = datetime.datetime.now().isoformat()
+                                                    order['cancelled_reason'] = 'grid_reset_after_close'
                                         except Exception as cancel_error:
                                             logger.error(f"❌ Error cancelling pending grid order {order_id}: {cancel_error}")
                                     
@@ -5361,12 +5576,11 @@ class MoveGuard(Strategy):
                                                     if hasattr(cycle, 'pending_order_levels'):
                                                         cycle.pending_order_levels.discard(grid_level)
                                                     # Update status in main orders list
-                                                    for order in cycle.orders:
-                                                        if order.get('order_id') == order_id:
-                                                            order['status'] = 'cancelled'
-                                                            order['cancelled_at'] = datetime.datetime.now().isoformat()
-                                                            order['cancelled_reason'] = 'grid_not_sequential'
-                                                            break
+                                                    order = self._order_store(cycle).get(order_id)
+                                                    if order is not None:
+                                                        self._set_order_status(cycle, order, 'cancelled')
+                                                        order['cancelled_at'] = datetime.datetime.now().isoformat()
+                                                        order['cancelled_reason'] = 'grid_not_sequential'
                                             except Exception as cancel_error:
                                                 logger.error(f"❌ Error cancelling pending grid order {order_id}: {cancel_error}")
                                     
@@ -5479,8 +5693,8 @@ class MoveGuard(Strategy):
                         cycle.pending_orders = []
                         cycle.pending_order_levels = set()
                     
-                    # Sync pending orders from PocketBase
-                    if self._sync_pending_orders_from_pocketbase(cycle):
+                    # Sync pending orders from PocketBase (snapshot-restored cycles already have them)
+                    if cycle.cycle_id in self.warm_started_cycle_ids or self._sync_pending_orders_from_pocketbase(cycle):
                         restored_count += 1
                         logger.info(f"✅ Restored {len(cycle.pending_orders)} pending orders for cycle {cycle.cycle_id}")
                         
@@ -5582,7 +5796,7 @@ class MoveGuard(Strategy):
                 logger.info(f"🔄 Orders were closed in cycle {cycle.cycle_id} - checking if pending orders should be cleaned up")
                 
                 # Check if all orders are now closed
-                active_orders = [o for o in cycle.orders if o.get('status') == 'active']
+                active_orders = self._order_store(cycle).active()
                 if not active_orders:
                     logger.info(f"🔄 All orders closed in cycle {cycle.cycle_id} - cleaning up pending orders but keeping cycle open")
                     
@@ -5995,7 +6209,7 @@ class MoveGuard(Strategy):
                 logger.info(f"🔄 Confirmed cycle {cycle.cycle_id} direction as {order_direction} for recovery order")
                 
                 # Add recovery order to cycle
-                recovery_order = {
+                recovery_order = OrderRecord({
                     'order_id': order_result['order'].get('ticket'),
                     'direction': order_direction,
                     'price': current_price,
@@ -6004,7 +6218,7 @@ class MoveGuard(Strategy):
                     'status': 'active',
                     'placed_at': datetime.datetime.now().isoformat(),
                     'grid_level': -2  # -2 indicates recovery order (not a grid order)
-                }
+                })
                 
                 # Add order to cycle
                 if hasattr(cycle, 'orders'):
@@ -6149,8 +6363,9 @@ class MoveGuard(Strategy):
             cycle.closing_method = "take_profit"
             cycle.close_time = datetime.datetime.now().isoformat()  # Use close_time for database
             cycle.close_reason = "Take profit target reached"
-            cycle.total_profit_pips = self._calculate_cycle_total_profit_pips(cycle, self._get_current_price())
-            cycle.total_profit_dollars = self._calculate_cycle_total_profit_dollars(cycle, self._get_current_price())
+            current_price = self._get_current_price()
+            cycle.total_profit_pips = self._calculate_cycle_total_profit_pips(cycle, current_price)
+            cycle.total_profit_dollars = self._calculate_cycle_total_profit_dollars(cycle, current_price)
             
             # Update database - force immediate update when closing
             self._update_cycle_in_database(cycle, force_update=True)
@@ -6183,18 +6398,17 @@ class MoveGuard(Strategy):
                 return True
 
             # Try to close active position first
-            positions = None
+            pos = None
             try:
-                positions = self.meta_trader.get_position_by_ticket(int(order_id))
+                pos = self._get_mt5_position(order_id)
             except Exception:
-                positions = None
+                pos = None
                 
-            if positions and len(positions) > 0:
+            if pos is not None:
                 # Preserve profit before closing the position
                 self._preserve_order_profit_before_closure(order)
                 
                 # Close active position
-                pos = positions[0]
                 result = self.meta_trader.close_position(pos)
                 if result is not None:
                     # Use preserved profit data
@@ -6270,9 +6484,9 @@ class MoveGuard(Strategy):
             pip_value = self._get_pip_value()
             
             for order in cycle.orders:
-                if order.get('status') == 'active':
-                    order_price = order.get('price', 0.0)
-                    order_direction = order.get('direction', 'BUY')
+                if getattr(order, 'status', None) == 'active':
+                    order_price = getattr(order, 'price', 0.0)
+                    order_direction = getattr(order, 'direction', 'BUY')
                     
                     if order_direction == 'BUY':
                         # For BUY orders, profit when price goes up
@@ -6282,7 +6496,7 @@ class MoveGuard(Strategy):
                         profit_pips = (order_price - current_price) / pip_value
                     
                     # Weight by lot size
-                    weighted_profit = profit_pips * order.get('lot_size', 0.0)
+                    weighted_profit = profit_pips * getattr(order, 'lot_size', 0.0)
                     total_profit_pips += weighted_profit
             
             return total_profit_pips
@@ -6294,20 +6508,29 @@ class MoveGuard(Strategy):
     def _calculate_cycle_total_profit_dollars(self, cycle, current_price: float) -> float:
         """Get cycle total profit in dollars directly from MetaTrader for MoveGuard"""
         try:
-            total_profit_dollars = 0.0
+            store = self._order_store(cycle)
+            pnl_book = self._get_pnl_book()
             
-            for order in cycle.orders:
-                if order.get('status') == 'active':
-                    # Get profit directly from MetaTrader for this active order
+            # Open profit of the cycle's positions, summed in the book's vectorized pass
+            total_profit_dollars = pnl_book.cycle(cycle.cycle_id)[0] if pnl_book is not None else 0.0
+            cycle_id = str(cycle.cycle_id)
+            
+            for order in store.active():
+                order_id = getattr(order, 'ticket', None)
+                if pnl_book is not None and order_id and pnl_book.cycle_of(order_id) == cycle_id and pnl_book.has(order_id):
+                    order_profit = pnl_book.order(order_id)
+                else:
+                    # Order not grouped under this cycle in the book - resolve it on its own
                     order_profit = self._calculate_order_profit(order)
                     total_profit_dollars += order_profit['profit']
-                    
-                    # Update the order with the latest profit data from MetaTrader
-                    order['profit'] = order_profit['profit']
-                    order['profit_pips'] = order_profit['profit_pips']
-                elif order.get('status') == 'closed':
-                    # Add realized profit from closed orders
-                    total_profit_dollars += order.get('profit', 0.0)
+                
+                # Update the order with the latest profit data from MetaTrader
+                order['profit'] = order_profit['profit']
+                order['profit_pips'] = order_profit['profit_pips']
+            
+            # Add realized profit from closed orders
+            for order in store.closed():
+                total_profit_dollars += order.get('profit', 0.0)
             
             return total_profit_dollars
             
@@ -6456,19 +6679,18 @@ class MoveGuard(Strategy):
             # Find the order in all cycles
             order_found = False
             for cycle in self.multi_cycle_manager.get_all_active_cycles():
-                for order in cycle.orders:
-                    if order.get('order_id') == order_id:
-                        # Close the specific order
-                        success = self._close_order(order)
-                        if success:
-                            # Update database
-                            try:
-                                self._update_cycle_in_database(cycle)
-                            except Exception as e:
-                                logger.error(f"❌ Error updating cycle {cycle.cycle_id} in database: {str(e)}")
-                            logger.info(f"✅ MoveGuard order {order_id} closed successfully")
-                            order_found = True
-                        break
+                order = self._order_store(cycle).get(order_id)
+                if order is not None:
+                    # Close the specific order
+                    success = self._close_order(order)
+                    if success:
+                        # Update database
+                        try:
+                            self._update_cycle_in_database(cycle)
+                        except Exception as e:
+                            logger.error(f"❌ Error updating cycle {cycle.cycle_id} in database: {str(e)}")
+                        logger.info(f"✅ MoveGuard order {order_id} closed successfully")
+                        order_found = True
                 if order_found:
                     break
             
@@ -6582,6 +6804,9 @@ class MoveGuard(Strategy):
             if not active_cycles:
                 return
             
+            # Rebuild the ticket index so this pass sees orders placed or closed earlier in the tick
+            self._refresh_ticket_index()
+            
             total_cycles_checked = 0
             total_orders_checked = 0
             total_orders_closed = 0
@@ -6600,7 +6825,7 @@ class MoveGuard(Strategy):
                     result = self._monitor_active_orders_status(cycle)
                     if result:
                         # Count closed orders for this cycle
-                        closed_in_cycle = [o for o in cycle.orders if o.get('status') == 'closed' and o.get('closed_reason') == 'mt5_position_closed']
+                        closed_in_cycle = [o for o in self._order_store(cycle).closed() if o.get('closed_reason') == 'mt5_position_closed']
                         cycle_orders_closed = len(closed_in_cycle)
                         if cycle_orders_closed > 0:
                             orders_updated = True
@@ -6630,12 +6855,10 @@ class MoveGuard(Strategy):
                                 # If it was cancelled, remove from pending orders
                                 
                                 # Check if this order exists in cycle.orders as active
-                                found_as_active = False
-                                for order in cycle.orders:
-                                    if order.get('order_id') == order_id and order.get('status') == 'active':
-                                        found_as_active = True
-                                        logger.info(f"✅ Pending order {order_id} was filled and is now active")
-                                        break
+                                cycle_order = self._order_store(cycle).get(order_id)
+                                found_as_active = cycle_order is not None and cycle_order.get('status') == 'active'
+                                if found_as_active:
+                                    logger.info(f"✅ Pending order {order_id} was filled and is now active")
                                 
                                 if not found_as_active:
                                     # Order was cancelled or closed - remove from pending orders and cycle.orders
@@ -6651,21 +6874,19 @@ class MoveGuard(Strategy):
                                     
                                     # Remove from cycle.orders completely if it exists and is still pending
                                     order_to_remove = None
-                                    for order in cycle.orders:
-                                        if order.get('order_id') == order_id:
-                                            # Only remove if it's still in pending status (didn't activate)
-                                            if order.get('status') == 'pending':
-                                                order_to_remove = order
-                                                logger.info(f"🗑️ Removing pending order {order_id} from cycle.orders (was cancelled in MT5, never activated)")
-                                                break
-                                            else:
-                                                # If it's not pending, just update status to cancelled
-                                                order['status'] = 'cancelled'
-                                                order['cancelled_at'] = datetime.datetime.now().isoformat()
-                                                order['cancelled_reason'] = 'mt5_pending_order_cancelled'
-                                                logger.info(f"📝 Updated order {order_id} status to cancelled (was not pending)")
-                                                orders_updated = True
-                                                break
+                                    order = self._order_store(cycle).get(order_id)
+                                    if order is not None:
+                                        # Only remove if it's still in pending status (didn't activate)
+                                        if order.get('status') == 'pending':
+                                            order_to_remove = order
+                                            logger.info(f"🗑️ Removing pending order {order_id} from cycle.orders (was cancelled in MT5, never activated)")
+                                        else:
+                                            # If it's not pending, just update status to cancelled
+                                            self._set_order_status(cycle, order, 'cancelled')
+                                            order['cancelled_at'] = datetime.datetime.now().isoformat()
+                                            order['cancelled_reason'] = 'mt5_pending_order_cancelled'
+                                            logger.info(f"📝 Updated order {order_id} status to cancelled (was not pending)")
+                                            orders_updated = True
                                     
                                     # Remove the order from cycle.orders if found and was pending
                                     if order_to_remove:
@@ -6678,7 +6899,7 @@ class MoveGuard(Strategy):
                 
                 # Also check all pending orders in cycle.orders that might not be in pending_orders list
                 # This ensures we catch any pending orders that were added to cycle.orders but not tracked in pending_orders
-                pending_orders_in_cycle = [o for o in cycle.orders if o.get('status') == 'pending']
+                pending_orders_in_cycle = self._order_store(cycle).pending()
                 for pending_order_in_cycle in pending_orders_in_cycle[:]:  # Copy list to avoid modification during iteration
                     order_id = pending_order_in_cycle.get('order_id') or pending_order_in_cycle.get('ticket')
                     if not order_id:
@@ -6714,14 +6935,14 @@ class MoveGuard(Strategy):
                         continue
                 
                 # Count all active orders checked
-                active_orders = [o for o in cycle.orders if o.get('status') == 'active']
+                active_orders = self._order_store(cycle).active()
                 total_orders_checked += len(active_orders)
                 
                 # If orders were updated, update active_orders and sync to database
                 if orders_updated:
                     try:
                         # CRITICAL: Update cycle.active_orders to reflect only active orders
-                        active_orders_list = [o for o in cycle.orders if o.get('status') == 'active']
+                        active_orders_list = self._order_store(cycle).active()
                         if hasattr(cycle, 'active_orders'):
                             cycle.active_orders = active_orders_list
                             logger.info(f"🔄 Updated cycle.active_orders: {len(active_orders_list)} active orders for cycle {cycle.cycle_id}")
@@ -6730,7 +6951,7 @@ class MoveGuard(Strategy):
                             logger.info(f"➕ Created cycle.active_orders: {len(active_orders_list)} active orders for cycle {cycle.cycle_id}")
                         
                         # Update completed_orders list
-                        completed_orders_list = [o for o in cycle.orders if o.get('status') == 'closed']
+                        completed_orders_list = self._order_store(cycle).closed()
                         if hasattr(cycle, 'completed_orders'):
                             cycle.completed_orders = completed_orders_list
                         else:
@@ -6757,62 +6978,22 @@ class MoveGuard(Strategy):
     def _order_exists_in_mt5(self, order_id: int) -> bool:
         """Check if order/position still exists in MT5 (both pending orders and active positions)
         
-        Uses comprehensive checking to ensure we catch all cases:
-        1. Check position by ticket
-        2. Verify by checking all positions
-        3. Check pending orders by ticket
+        Answers from the tick's ticket index (positions and pending orders),
+        falling back to direct MT5 queries only when there is no index or the
+        ticket is in neither of its tables.
         """
         try:
-            # Check for active positions by ticket
-            position_exists = False
-            try:
-                positions = self.meta_trader.get_position_by_ticket(int(order_id))
-                if positions is not None:
-                    if isinstance(positions, (tuple, list)):
-                        position_exists = len(positions) > 0
-                    else:
-                        position_exists = True
-            except Exception as pos_error:
-                logger.debug(f"Error checking position {order_id} by ticket: {pos_error}")
-                position_exists = False
+            if order_id is None:
+                return False
             
-            # If not found by ticket, double-check by getting all positions
-            if not position_exists:
-                try:
-                    all_positions = self.meta_trader.get_all_positions()
-                    if all_positions:
-                        for pos in all_positions:
-                            pos_ticket = None
-                            if hasattr(pos, 'ticket'):
-                                pos_ticket = pos.ticket
-                            elif isinstance(pos, dict):
-                                pos_ticket = pos.get('ticket')
-                            elif isinstance(pos, (tuple, list)) and len(pos) > 0:
-                                pos_ticket = pos[0] if isinstance(pos[0], (int, float)) else (pos.get('ticket') if isinstance(pos[0], dict) else None)
-                            
-                            if pos_ticket and int(pos_ticket) == int(order_id):
-                                position_exists = True
-                                logger.debug(f"✅ Found position {order_id} in all_positions")
-                                break
-                except Exception as all_pos_error:
-                    logger.debug(f"Error checking all positions for {order_id}: {all_pos_error}")
-            
-            if position_exists:
+            ticket_index = self._get_ticket_index()
+            if ticket_index is not None and ticket_index.exists(order_id):
                 return True
             
-            # Check for pending orders
-            try:
-                pending_order = self.meta_trader.get_order_by_ticket(order_id)
-                if pending_order is not None:
-                    if isinstance(pending_order, (tuple, list)):
-                        if len(pending_order) > 0:
-                            return True
-                    else:
-                        return True
-            except Exception as pending_error:
-                logger.debug(f"Could not check pending order {order_id}: {pending_error}")
-            
-            return False
+            # Not indexed (or no index): the ticket may have been opened or filled after the index was built
+            if self.meta_trader.get_position_by_ticket(int(order_id)):
+                return True
+            return bool(self.meta_trader.get_order_by_ticket(int(order_id)))
             
         except Exception as e:
             logger.error(f"❌ Error checking order existence in MT5: {str(e)}")
@@ -6829,8 +7010,8 @@ class MoveGuard(Strategy):
             cycle.total_profit_pips = self._calculate_cycle_total_profit_pips(cycle, current_price)
             
             # Update active/completed order counts
-            active_orders = [o for o in cycle.orders if o.get('status') == 'active']
-            completed_orders = [o for o in cycle.orders if o.get('status') == 'closed']
+            active_orders = self._order_store(cycle).active()
+            completed_orders = self._order_store(cycle).closed()
             
             if hasattr(cycle, 'active_orders'):
                 cycle.active_orders = active_orders
@@ -6838,7 +7019,7 @@ class MoveGuard(Strategy):
                 cycle.completed_orders = completed_orders
                 
             # Update total volume
-            cycle.total_volume = sum(o.get('lot_size', 0) for o in cycle.orders if o.get('status') == 'active')
+            cycle.total_volume = sum(getattr(o, 'lot_size', 0) for o in active_orders)
             
             logger.debug(f"✅ Updated statistics for cycle {cycle.cycle_id}")
             
@@ -6857,10 +7038,10 @@ class MoveGuard(Strategy):
             realized_profit_pips = 0.0
             
             for order in cycle.orders:
-                if order.get('status') == 'closed':
+                if getattr(order, 'status', None) == 'closed':
                     # Use stored profit for closed orders, don't recalculate
-                    realized_profit += order.get('profit', 0.0)
-                    realized_profit_pips += order.get('profit_pips', 0.0)
+                    realized_profit += getattr(order, 'profit', 0.0)
+                    realized_profit_pips += getattr(order, 'profit_pips', 0.0)
             
             # Calculate unrealized profit from active orders
             unrealized_profit_pips = self._calculate_cycle_total_profit_pips(cycle, current_price)
@@ -6870,8 +7051,8 @@ class MoveGuard(Strategy):
             cycle.total_profit_pips = realized_profit_pips + unrealized_profit_pips
             
             # Update active/completed order counts
-            active_orders = [o for o in cycle.orders if o.get('status') == 'active']
-            completed_orders = [o for o in cycle.orders if o.get('status') == 'closed']
+            active_orders = self._order_store(cycle).active()
+            completed_orders = self._order_store(cycle).closed()
             
             if hasattr(cycle, 'active_orders'):
                 cycle.active_orders = active_orders
@@ -6879,7 +7060,7 @@ class MoveGuard(Strategy):
                 cycle.completed_orders = completed_orders
                 
             # Update total volume (all orders - both active and completed)
-            cycle.total_volume = sum(o.get('lot_size', 0) for o in cycle.orders)
+            cycle.total_volume = sum(getattr(o, 'lot_size', 0) for o in cycle.orders)
             
             # Calculate order statistics for database fields
             cycle.total_orders = len(cycle.orders)
@@ -6889,7 +7070,7 @@ class MoveGuard(Strategy):
             loss_orders = 0
             
             for order in completed_orders:
-                profit = order.get('profit', 0.0)
+                profit = getattr(order, 'profit', 0.0)
                 if profit > 0:
                     profitable_orders += 1
                 elif profit < 0:
@@ -6911,7 +7092,7 @@ class MoveGuard(Strategy):
                 cycle.duration_minutes = 0.0
             
             # Calculate total profit in dollars
-            total_profit_dollars = self._calculate_cycle_total_profit_dollars(cycle, self._get_current_price())
+            total_profit_dollars = self._calculate_cycle_total_profit_dollars(cycle, current_price)
             cycle.total_profit_dollars = total_profit_dollars
             logger.info(f"✅ Updated cycle {cycle.cycle_id} statistics: realized_profit=${realized_profit:.2f}, total_profit=${total_profit_dollars:.2f} ({cycle.total_profit_pips:.2f} pips), total_volume={cycle.total_volume}, total_orders={cycle.total_orders}, profitable_orders={profitable_orders}, loss_orders={loss_orders}")
             
@@ -6927,10 +7108,9 @@ class MoveGuard(Strategy):
                 return False
             
             # Get current profit from MetaTrader if order is still active
-            positions = self.meta_trader.get_position_by_ticket(int(order_id))
+            position = self._get_mt5_position(order_id)
             
-            if positions and len(positions) > 0:
-                position = positions[0]
+            if position is not None:
                 current_profit = getattr(position, 'profit', 0.0)
                 current_swap = getattr(position, 'swap', 0.0)
                 current_commission = getattr(position, 'commission', 0.0)
@@ -6979,25 +7159,30 @@ class MoveGuard(Strategy):
         try:
             order_id = order.get('order_id') or order.get('ticket')
             if not order_id:
-                logger.warning(f"⚠️ No order ID/ticket found for order in profit calculation")
+                logger.warning("⚠️ No order ID/ticket found for order in profit calculation")
                 return {'profit': 0.0, 'profit_pips': 0.0}
             
             # Check if order already has preserved profit (for closed orders)
             if order.get('status') == 'closed' and 'profit' in order:
                 preserved_profit = order.get('profit', 0.0)
                 preserved_profit_pips = order.get('profit_pips', 0.0)
-                logger.info(f"💰 Using preserved profit for closed order {order_id}: ${preserved_profit:.2f} ({preserved_profit_pips:.2f} pips)")
+                logger.info("💰 Using preserved profit for closed order %s: $%.2f (%.2f pips)", order_id, preserved_profit, preserved_profit_pips)
                 return {
                     'profit': preserved_profit,
                     'profit_pips': preserved_profit_pips,
                     'close_price': order.get('close_price', 0.0)
                 }
             
-            # Get position data directly from MetaTrader
-            positions = self.meta_trader.get_position_by_ticket(int(order_id))
+            # Read the position from this tick's P&L book (no MetaTrader call)
+            pnl_book = self._get_pnl_book()
+            order_pnl = pnl_book.order(order_id) if pnl_book is not None else None
+            if order_pnl is not None:
+                return order_pnl
             
-            if positions and len(positions) > 0:
-                position = positions[0]
+            # Not in the book (e.g. opened after it was built) - look the position up directly
+            position = self._get_mt5_position(order_id)
+            
+            if position is not None:
                 # Get actual profit from MetaTrader position
                 # MT5 position has 'profit' field which includes swaps and commission
                 profit = getattr(position, 'profit', 0.0)
@@ -7006,7 +7191,7 @@ class MoveGuard(Strategy):
                 
                 # If profit is 0 but we have swap/commission, log it for debugging
                 if profit == 0.0 and (swap != 0.0 or commission != 0.0):
-                    logger.debug(f"⚠️ Order {order_id} profit is 0 but has swap={swap:.2f}, commission={commission:.2f}")
+                    logger.debug("⚠️ Order %s profit is 0 but has swap=%.2f, commission=%.2f", order_id, swap, commission)
                 
                 # Calculate profit in pips for reference
                 order_price = order.get('price', 0.0)
@@ -7022,14 +7207,14 @@ class MoveGuard(Strategy):
                 else:
                     profit_pips = 0.0
                     if not order_price:
-                        logger.warning(f"⚠️ Order {order_id} has no price field for profit calculation")
+                        logger.warning("⚠️ Order %s has no price field for profit calculation", order_id)
                     if not current_price:
-                        logger.warning(f"⚠️ Could not get current price for profit calculation")
+                        logger.warning("⚠️ Could not get current price for profit calculation")
                     if not pip_value:
-                        logger.warning(f"⚠️ Invalid pip_value for profit calculation")
+                        logger.warning("⚠️ Invalid pip_value for profit calculation")
                 
                 # Log detailed profit information for debugging (always log, not just debug level)
-                logger.info(f"💰 Order {order_id} profit from MT5: ${profit:.2f} (swap={swap:.2f}, commission={commission:.2f}), calculated pips: {profit_pips:.2f}, price={order_price:.5f}, current={current_price:.5f}")
+                logger.info("💰 Order %s profit from MT5: $%.2f (swap=%.2f, commission=%.2f), calculated pips: %.2f, price=%.5f, current=%.5f", order_id, profit, swap, commission, profit_pips, order_price, current_price)
                 
                 return {
                     'profit': profit,
@@ -7040,21 +7225,21 @@ class MoveGuard(Strategy):
                 }
             else:
                 # Position not found - try to get profit from order history or preserve last known value
-                logger.debug(f"⚠️ Order {order_id} not found in MetaTrader positions - trying to preserve last profit")
+                logger.debug("⚠️ Order %s not found in MetaTrader positions - trying to preserve last profit", order_id)
                 
                 # Try to get profit from order history or use last known value
                 last_profit = order.get('profit', 0.0)
                 last_profit_pips = order.get('profit_pips', 0.0)
                 
                 if last_profit != 0.0:
-                    logger.info(f"💰 Using last known profit for order {order_id}: ${last_profit:.2f} ({last_profit_pips:.2f} pips)")
+                    logger.info("💰 Using last known profit for order %s: $%.2f (%.2f pips)", order_id, last_profit, last_profit_pips)
                     return {
                         'profit': last_profit,
                         'profit_pips': last_profit_pips,
                         'close_price': order.get('close_price', 0.0)
                     }
                 else:
-                    logger.warning(f"⚠️ No profit data available for order {order_id} - returning 0.0")
+                    logger.warning("⚠️ No profit data available for order %s - returning 0.0", order_id)
                     return {'profit': 0.0, 'profit_pips': 0.0}
             
         except Exception as e:
@@ -7085,13 +7270,13 @@ class MoveGuard(Strategy):
             total_active_orders = 0
             profit_changed = False
             
-            for order in cycle.orders:
+            for order in self._order_store(cycle).active():
                 if order.get('status') == 'active':
                     total_active_orders += 1
                     order_id = order.get('order_id') or order.get('ticket')
                     
                     # First verify order status with MetaTrader
-                    self._verify_order_status_with_mt5(order)
+                    self._verify_order_status_with_mt5(order, cycle)
                     
                     # Only update profit if order is still active after verification
                     if order.get('status') == 'active':
@@ -7113,7 +7298,7 @@ class MoveGuard(Strategy):
                             order['last_profit_update'] = datetime.datetime.now().isoformat()
                             
                             # Log all profit updates (not just significant changes) for debugging
-                            logger.info(f"💰 Order {order_id} profit updated: ${old_profit:.2f} → ${new_profit:.2f} ({old_profit_pips:.2f} → {new_profit_pips:.2f} pips)")
+                            logger.info("💰 Order %s profit updated: $%.2f → $%.2f (%.2f → %.2f pips)", order_id, old_profit, new_profit, old_profit_pips, new_profit_pips)
                         else:
                             # Still update timestamp even if profit didn't change
                             order['last_profit_update'] = datetime.datetime.now().isoformat()
@@ -7121,16 +7306,17 @@ class MoveGuard(Strategy):
                         updated_count += 1
             
             if updated_count > 0:
-                logger.info(f"✅ Updated profit data for {updated_count}/{total_active_orders} active orders in cycle {cycle.cycle_id}")
+                logger.info("✅ Updated profit data for %s/%s active orders in cycle %s", updated_count, total_active_orders, cycle.cycle_id)
                 
                 # CRITICAL: Immediately sync to PocketBase if profits changed
                 if profit_changed and sync_to_pocketbase:
                     try:
                         # Update cycle statistics first
                         self._update_cycle_statistics_with_profit(cycle)
-                        # Then sync to PocketBase immediately
-                        self._update_cycle_in_database(cycle, force_update=True)
-                        logger.info(f"🔄 Immediately synced updated profits to PocketBase for cycle {cycle.cycle_id}")
+                        # Then hand it to the write-behind buffer; per-tick profit churn
+                        # is coalesced into one PocketBase write per flush window
+                        self._queue_cycle_update(cycle)
+                        logger.info("🔄 Queued updated profits for PocketBase sync for cycle %s", cycle.cycle_id)
                     except Exception as sync_error:
                         logger.error(f"❌ Error syncing profits to PocketBase for cycle {cycle.cycle_id}: {str(sync_error)}")
             
@@ -7183,7 +7369,7 @@ class MoveGuard(Strategy):
                     continue
             
             if updated_cycles > 0:
-                logger.debug(f"✅ Updated profit data for {updated_cycles}/{len(active_cycles)} active cycles")
+                logger.debug("✅ Updated profit data for %s/%s active cycles", updated_cycles, len(active_cycles))
             
         except Exception as e:
             logger.error(f"❌ Error updating all cycles profit from MetaTrader: {str(e)}")
@@ -7207,7 +7393,7 @@ class MoveGuard(Strategy):
                     continue
             
             if updated_cycles > 0:
-                logger.info(f"✅ Updated profit data for {updated_cycles}/{len(cycles)} filtered cycles")
+                logger.info("✅ Updated profit data for %s/%s filtered cycles", updated_cycles, len(cycles))
                     
         except Exception as e:
             logger.error(f"❌ Error updating cycles profit: {str(e)}")
@@ -7218,9 +7404,10 @@ class MoveGuard(Strategy):
         try:
             total_profit = 0.0
             active_cycles = self.multi_cycle_manager.get_all_active_cycles()
+            current_price = self._get_current_price()
             
             for cycle in active_cycles:
-                cycle_profit = self._calculate_cycle_total_profit_dollars(cycle, self._get_current_price())
+                cycle_profit = self._calculate_cycle_total_profit_dollars(cycle, current_price)
                 total_profit += cycle_profit
             
             return total_profit
@@ -7229,21 +7416,22 @@ class MoveGuard(Strategy):
             logger.error(f"❌ Error getting total active profit from MetaTrader: {str(e)}")
             return 0.0
 
-    def _verify_order_status_with_mt5(self, order):
+    def _verify_order_status_with_mt5(self, order, cycle=None):
         """Verify order status against MetaTrader and fix inconsistencies"""
         try:
             order_id = order.get('order_id') or order.get('ticket')
             if not order_id:
                 return False
             
-            # Check if order exists in MetaTrader
-            positions = self.meta_trader.get_position_by_ticket(int(order_id))
+            # Check if order exists in MetaTrader (the tick's ticket index is authoritative here,
+            # so closed orders never cost an extra round trip)
+            position = self._get_mt5_position(order_id, fallback=False)
             
-            if positions and len(positions) > 0:
+            if position is not None:
                 # Order exists in MetaTrader but marked as closed locally
                 if order.get('status') == 'closed':
                     logger.warning(f"⚠️ Order {order_id} exists in MetaTrader but marked as closed locally - fixing status")
-                    order['status'] = 'active'
+                    self._set_order_status(cycle, order, 'active')
                     if 'closed_at' in order:
                         del order['closed_at']
                 
@@ -7268,10 +7456,10 @@ class MoveGuard(Strategy):
         """Check and fix any orders that are incorrectly marked as closed but still exist in MetaTrader"""
         try:
             fixed_count = 0
-            for order in cycle.orders:
+            for order in self._order_store(cycle).closed():
                 if order.get('status') == 'closed':
                     # Check if this order actually exists in MetaTrader
-                    if self._verify_order_status_with_mt5(order):
+                    if self._verify_order_status_with_mt5(order, cycle):
                         fixed_count += 1
                         logger.info(f"✅ Fixed incorrectly closed order {order.get('order_id')} in cycle {cycle.cycle_id}")
             
@@ -7292,10 +7480,9 @@ class MoveGuard(Strategy):
                 return False
             
             # Get position data from MetaTrader to check comment
-            positions = self.meta_trader.get_position_by_ticket(int(order_id))
+            position = self._get_mt5_position(order_id)
             
-            if positions and len(positions) > 0:
-                position = positions[0]
+            if position is not None:
                 comment = getattr(position, 'comment', '')
                 
                 logger.debug(f"📊 Checking MT5 comment for order {order_id}: '{comment}'")
@@ -7986,7 +8173,7 @@ class MoveGuard(Strategy):
                     continue
                 
                 if not self._order_exists_in_mt5(order_id_int):
-                    order['status'] = 'closed'
+                    self._set_order_status(cycle, order, 'closed')
                     order['closed_reason'] = 'cleanup_missing_mt5'
                     order['closed_at'] = now_iso
                     if hasattr(cycle, 'active_orders') and isinstance(cycle.active_orders, list):
@@ -8050,24 +8237,6 @@ class MoveGuard(Strategy):
             logger.error(f"❌ Error getting lowest pending grid level: {str(e)}")
             return None
 
-    def _order_exists_in_mt5(self, ticket: int) -> bool:
-        """Check whether an order or position still exists in MT5"""
-        try:
-            if ticket is None:
-                return False
-            
-            positions = self.meta_trader.get_position_by_ticket(ticket)
-            if positions and len(positions) > 0:
-                return True
-            
-            orders = self.meta_trader.get_order_by_ticket(ticket)
-            if orders and len(orders) > 0:
-                return True
-            
-            return False
-        except Exception:
-            return False
-
     def _normalize_grid_level(self, level_value) -> Optional[int]:
         """Normalize grid level value to integer"""
         try:
@@ -8155,9 +8324,9 @@ class MoveGuard(Strategy):
                         active_cycles = active_cycles_after_cleanup
                     else:
                         logger.info(f"🎯 Max active cycles ({max_active_cycles}) reached, skipping interval cycle creation. Current active cycles: {len(active_cycles)}")
-                if direction == "BUY" and current_level > self.meta_trader.get_ask(self.symbol):
+                if direction == "BUY" and current_level > self._get_ask():
                     return
-                if direction == "SELL" and current_level < self.meta_trader.get_bid(self.symbol):
+                if direction == "SELL" and current_level < self._get_bid():
                     return
                 # Update last cycle price
                 self.last_cycle_price = current_level
@@ -8167,9 +8336,9 @@ class MoveGuard(Strategy):
             if not self.auto_place_cycles:
                 logger.debug("Auto place cycles is disabled, skipping interval cycle creation")
                 # Check if we should create a cycle at this level
-                if direction == "BUY" and current_level > self.meta_trader.get_ask(self.symbol):
+                if direction == "BUY" and current_level > self._get_ask():
                     return 
-                if direction == "SELL" and current_level < self.meta_trader.get_bid(self.symbol):
+                if direction == "SELL" and current_level < self._get_bid():
                     return 
                 # Update last cycle price
                 self.last_cycle_price = current_price
@@ -8235,10 +8404,10 @@ class MoveGuard(Strategy):
         """Create a new cycle with initial order based on price movement"""
         try:
             # Check if we should create a cycle at this level
-            if direction == "BUY" and price > self.meta_trader.get_ask(self.symbol):
+            if direction == "BUY" and price > self._get_ask():
                 logger.debug(f"🔄 Skipping BUY cycle creation at {price} - price too high")
                 return False  # Don't create BUY cycles below current price
-            if direction == "SELL" and price < self.meta_trader.get_bid(self.symbol):
+            if direction == "SELL" and price < self._get_bid():
                 logger.debug(f"🔄 Skipping SELL cycle creation at {price} - price too low")
                 return False  # Don't create SELL cycles above current price
             
@@ -8292,10 +8461,10 @@ class MoveGuard(Strategy):
             logger.info(f"🔄 Placing {direction} order for interval cycle at price {price}")
             
             if direction == "BUY":
-                current_ask = self.meta_trader.get_ask(self.symbol)
+                current_ask = self._get_ask()
                 success = await self._place_buy_order(order_params, current_ask, "cycle_entry")
             else:  # SELL
-                current_bid = self.meta_trader.get_bid(self.symbol)
+                current_bid = self._get_bid()
                 success = await self._place_sell_order(order_params, current_bid, "cycle_entry")
                 
             if success:
@@ -8375,6 +8544,14 @@ class MoveGuard(Strategy):
             old_symbol = self.symbol
             self.symbol = new_symbol
             
+            # Reload the contract spec in case the broker changed it since it was cached
+            self.meta_trader.invalidate_symbol_spec(new_symbol)
+            
+            # Move the tick stream subscription to the new symbol
+            if self.tick_subscription is not None:
+                self.tick_subscription.remove_symbol(old_symbol)
+                self.tick_subscription.add_symbol(new_symbol)
+            
             # Re-initialize symbol-dependent components
             self._reinitialize_symbol_dependent_components()
             
@@ -8529,6 +8706,7 @@ class MoveGuard(Strategy):
             # Reset market data tracking
             self.current_market_price = None
             self.last_candle_time = None
+            self.market_snapshot = None
             
             # Reset zone state
             self.initial_threshold_breached = False
@@ -1,21 +1,32 @@
 """
 Strategy components package
+
+Components are imported on first access, so a strategy only loads the ones it uses.
 """
 
-from .direction_controller import DirectionController
-from .zone_detection_engine import ZoneDetectionEngine
-from .enhanced_zone_detection import EnhancedZoneDetection
-from .advanced_order_manager import AdvancedOrderManager
-from .enhanced_order_manager import EnhancedOrderManager
-from .multi_cycle_manager import MultiCycleManager
-from .reversal_detector import ReversalDetector
-
-__all__ = [
-    'DirectionController',
-    'ZoneDetectionEngine',
-    'EnhancedZoneDetection',
-    'AdvancedOrderManager',
-    'EnhancedOrderManager',
-    'MultiCycleManager',
-    'ReversalDetector'
-] 
\ No newline at end of file
+import importlib
+
+_COMPONENTS = {
+    'DirectionController': '.direction_controller',
+    'ZoneDetectionEngine': '.zone_detection_engine',
+    'EnhancedZoneDetection': '.enhanced_zone_detection',
+    'AdvancedOrderManager': '.advanced_order_manager',
+    'EnhancedOrderManager': '.enhanced_order_manager',
+    'MultiCycleManager': '.multi_cycle_manager',
+    'ReversalDetector': '.reversal_detector',
+}
+
+__all__ = list(_COMPONENTS)
+
+
+def __getattr__(name):
+    module_name = _COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -10,7 +10,10 @@ import asyncio
 from typing import Dict, List, Optional, Tuple, Any
 from queue import Queue, Empty
 from Views.globals.app_logger import app_logger as logger
-import MetaTrader5 as Mt5
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module
+
+Mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
 
 
 class OrderDiagnostics:
@@ -8,7 +8,7 @@ import datetime
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from Views.globals.app_logger import app_logger as logger
-import MetaTrader5 as Mt5
+from MetaTrader.SymbolManager import symbol_spec_cache
 
 
 class ZoneState(Enum):
@@ -538,17 +538,11 @@ class EnhancedZoneDetection:
     def _get_pip_value(self) -> float:
         """Get pip value for the current symbol"""
         try:
-            # Select the symbol to ensure it's available
-            Mt5.symbol_select(self.symbol, True)
-            
-            # Get symbol info from MetaTrader
-            symbol_info = Mt5.symbol_info(self.symbol)
-            if symbol_info is None:
+            # Shared spec cache, loaded from MetaTrader once per symbol
+            pip_value = symbol_spec_cache.pip(self.symbol)
+            if pip_value is None:
                 logger.error(f"Cannot get symbol info for {self.symbol}")
                 return self._get_fallback_pip_value()
-            
-            point = symbol_info.point
-            pip_value = point*10
             return pip_value
             
         except Exception as e:
@@ -0,0 +1,43 @@
+"""
+Strategy registry - strategy names mapped to lazily imported classes
+
+The strategy modules are large (MoveGuard and the Advanced Cycles Trader pull
+in most of Strategy.components), so a bot only imports the class of the
+strategy it runs, the first time it is needed.
+"""
+
+import importlib
+import threading
+
+# Strategy name as stored in PocketBase -> "module:class"
+STRATEGIES = {
+    "Tony AH Recovery": "Strategy.AdaptiveHedging:AdaptiveHedging",
+    "Cycles Trader": "Strategy.CycleTrader:CycleTrader",
+    "Advanced Cycles Trader": "Strategy.AdvancedCyclesTrader_Organized:AdvancedCyclesTrader",
+    "MoveGuard": "Strategy.MoveGuard:MoveGuard",
+    "Stock Trader": "Strategy.StockTrader:StockTrader",
+}
+
+_classes = {}
+_lock = threading.Lock()
+
+
+def strategy_names():
+    """Names of the registered strategies"""
+    return list(STRATEGIES)
+
+
+def get_strategy_class(name):
+    """Import and return the class of a strategy
+
+    Raises:
+        KeyError: If no strategy is registered under the name
+    """
+    strategy_class = _classes.get(name)
+    if strategy_class is not None:
+        return strategy_class
+    module_name, _, class_name = STRATEGIES[name].partition(":")
+    with _lock:
+        if name not in _classes:
+            _classes[name] = getattr(importlib.import_module(module_name), class_name)
+        return _classes[name]
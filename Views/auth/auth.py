@@ -12,9 +12,11 @@ from cycles.cycles_manager import cycles_manager
 from helpers.store import store
 
 import multiprocessing
+import os
 from multiprocessing import Queue
 import logging
 from helpers.sync import MT5_LOCK, sync_manager
+from helpers import startup_profile
 from Api.Events.flutter_event_system import create_flutter_communicator
 
 # Create a Manager object
@@ -105,6 +107,7 @@ def launch_metatrader(data, authorized):
 
             app_logger.info(
                 f"Successfully connected to MetaTrader 5 account: {acc['login']}")
+            startup_profile.mark("mt5 connected")
             # sync_logger.info(
             #     f"MT5 Connection established for account: {acc['login']}")
         except Exception as acc_error:
@@ -115,6 +118,7 @@ def launch_metatrader(data, authorized):
 
         # Connect to remote API
         app_configs = AppConfigs()
+        start_metrics(app_configs, acc['login'])
         auth = API(app_configs.pb_url)
         auth_result = auth.login(server_username, server_password)
 
@@ -127,6 +131,7 @@ def launch_metatrader(data, authorized):
         user_account = Account(auth, expert)
         # Use asyncio.run to handle the awaitable
         asyncio.run(user_account.on_init())
+        startup_profile.mark("account initialized")
 
         # Initialize order and cycle managers with synchronized access
         OrdersManager = orders_manager(expert)
@@ -195,6 +200,19 @@ def launch_metatrader(data, authorized):
         return False
 
 
+def start_metrics(app_configs, login):
+    """Expose this account process's stage timings and call counters locally"""
+    from helpers.metrics import registry
+
+    registry.enabled = app_configs.metrics_enabled
+    if not app_configs.metrics_enabled:
+        return
+    registry.start_http_server(app_configs.metrics_host, app_configs.metrics_port)
+    if app_configs.metrics_dump_path:
+        root, ext = os.path.splitext(app_configs.metrics_dump_path)
+        registry.start_periodic_dump(f"{root}_{login}{ext or '.prom'}", app_configs.metrics_dump_interval)
+
+
 def launch_metatrader_in_process(data):
     # ns=multiprocessing.Manager().Namespace()
     authorized = Queue()
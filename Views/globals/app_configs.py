@@ -8,3 +8,9 @@ class AppConfigs(BaseSettings):
     # Pocketbase configs
     pb_url: str = "https://pdapp.fppatrading.com"  # the pocketbase url
     auth_collection: str = "users"  # the collection to authenticate with, ex: 'users'
+    # Metrics configs
+    metrics_enabled: bool = True  # record stage timings and call counters
+    metrics_host: str = "127.0.0.1"  # the local metrics endpoint only listens on loopback by default
+    metrics_port: int = 9108  # first port tried; each MT5 account process takes the next free one
+    metrics_dump_path: str = ""  # write the metrics to this file periodically, ex: 'metrics.prom' or 'metrics.json'
+    metrics_dump_interval: float = 60.0  # seconds between metrics dumps
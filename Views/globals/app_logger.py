@@ -1,6 +1,10 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 
 # Set the root logger to ERROR level to override all other configurations
 logging.basicConfig(level=logging.ERROR, force=True)
@@ -56,6 +60,87 @@ class UnicodeFilter(logging.Filter):
                 record.msg = record.msg.replace('✅', '[SUCCESS]').replace('❌', '[FAILED]').replace('⚠️', '[WARNING]')
         return True
 
+# Rate limit each call site and fold repeated messages into one line
+class RateLimitFilter(logging.Filter):
+    """Let at most ``max_records`` records per call site through every ``interval`` seconds
+
+    A record identical to the last one emitted from the same call site is
+    suppressed until the interval expires. The next record that gets through
+    reports what was dropped, e.g. "[previous message repeated 240 times]".
+    Records at ``exempt_level`` or above are never limited, so consecutive
+    error lines (e.g. a message followed by its traceback) all get through.
+    """
+
+    class _CallSite:
+        __slots__ = ('window_start', 'emitted', 'suppressed', 'duplicates_only', 'last')
+
+        def __init__(self, now):
+            self.window_start = now
+            self.emitted = 0
+            self.suppressed = 0
+            self.duplicates_only = True
+            self.last = None
+
+    def __init__(self, max_records=5, interval=10.0, exempt_level=logging.ERROR):
+        super().__init__()
+        self.max_records = max_records
+        self.interval = interval
+        self.exempt_level = exempt_level
+        self._sites = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= self.exempt_level or self.max_records <= 0:
+            return True
+        now = record.created
+        message = (record.msg, record.args)
+        with self._lock:
+            site = self._sites.get((record.pathname, record.lineno))
+            if site is None:
+                site = self._sites[(record.pathname, record.lineno)] = self._CallSite(now)
+            if now - site.window_start >= self.interval:
+                site.window_start = now
+                site.emitted = 0
+            try:
+                duplicate = site.last == message
+            except Exception:
+                duplicate = False
+            if (duplicate and site.emitted) or site.emitted >= self.max_records:
+                site.suppressed += 1
+                site.duplicates_only = site.duplicates_only and duplicate
+                return False
+            suppressed, duplicates_only = site.suppressed, site.duplicates_only
+            site.emitted += 1
+            site.suppressed = 0
+            site.duplicates_only = True
+            site.last = message
+        if suppressed:
+            note = (f"[previous message repeated {suppressed} times]" if duplicates_only
+                    else f"[{suppressed} similar messages suppressed]")
+            record.msg = f"{record.getMessage()} {note}"
+            record.args = None
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # The listener runs in this process, so the record is queued as is and the
+        # msg/args merge and exc_info formatting happen on the listener thread
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
 # Add filters to both handlers
 sync_filter = SyncCTCyclesFilter()
 unicode_filter = UnicodeFilter()
@@ -65,9 +150,73 @@ unicode_filter = UnicodeFilter()
 console_handler.addFilter(sync_filter)
 console_handler.addFilter(unicode_filter)
 
+
+def _env_level(name, default):
+    """Logging level named by an environment variable (e.g. "ERROR"), or the default"""
+    level = logging.getLevelName(os.environ.get(name, "").strip().upper())
+    return level if isinstance(level, int) else default
+
+
+# Records are handed to a background listener so formatting, writing (and the filters
+# above) never run on the trading threads; only rate limiting runs on the caller
+log_queue = queue.Queue(maxsize=int(os.environ.get("APP_LOG_QUEUE_SIZE", "10000")))
+queue_handler = DroppingQueueHandler(log_queue)
+queue_handler.addFilter(RateLimitFilter(
+    max_records=int(os.environ.get("APP_LOG_RATE_LIMIT", "5")),
+    interval=float(os.environ.get("APP_LOG_RATE_INTERVAL", "10")),
+    exempt_level=_env_level("APP_LOG_RATE_EXEMPT_LEVEL", logging.ERROR)))
+log_listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+log_listener.start()
+
 # Add handlers to the logger
 # app_logger.addHandler(file_handler)  # File handler disabled
-app_logger.addHandler(console_handler)
+app_logger.addHandler(queue_handler)
+# Do not also write every record synchronously through the root handler
+app_logger.propagate = False
+
+
+def _restart_listener_after_fork():
+    """The listener thread does not survive fork; start a fresh one in the child"""
+    log_listener._thread = None
+    log_listener.start()
+
+
+def shutdown_logging():
+    """Write out every queued record and stop the listener"""
+    if log_listener._thread is not None:
+        log_listener.stop()
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
+# Per-subsystem levels, e.g. APP_LOG_LEVELS="moveguard=INFO,act=WARNING"
+def _subsystem_levels():
+    levels = {}
+    for item in os.environ.get("APP_LOG_LEVELS", "").split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+SUBSYSTEM_LEVELS = _subsystem_levels()
+
+
+def get_logger(subsystem):
+    """Logger for one subsystem (e.g. "moveguard"), routed through the app logger's pipeline
+
+    Its level comes from APP_LOG_LEVELS and defaults to the app logger's level.
+    """
+    subsystem_logger = app_logger.getChild(subsystem)
+    level = SUBSYSTEM_LEVELS.get(subsystem)
+    if level:
+        subsystem_logger.setLevel(level)
+        # The console handler has to pass what the subsystem lets through
+        console_handler.setLevel(min(console_handler.level, subsystem_logger.level))
+    return subsystem_logger
 
 # Example usage
 if __name__ == "__main__":
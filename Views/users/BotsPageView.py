@@ -4,8 +4,7 @@ from helpers.actions_creators import GetUser, GetAccount, isMt5Authorized
 from Views.globals.app_router import AppRoutes
 from Views.globals.app_logger import app_logger
 from fletx import Xview
-from Strategy.AdvancedCyclesTrader_Organized import AdvancedCyclesTrader
-from Strategy.MoveGuard import MoveGuard
+from Strategy.registry import get_strategy_class
 from Api.Events.flutter_event_system import get_strategy_manager
 
 
@@ -42,6 +41,7 @@ class BotsPageView(Xview):
                     
                     # Initialize strategy based on bot type
                     if hasattr(bot, 'strategy') and bot.strategy == 'AdvancedCyclesTrader':
+                        AdvancedCyclesTrader = get_strategy_class("Advanced Cycles Trader")
                         strategy = AdvancedCyclesTrader(
                             meta_trader=meta_trader,
                             config=bot.config,
@@ -50,6 +50,7 @@ class BotsPageView(Xview):
                             bot=bot
                         )
                     elif hasattr(bot, 'strategy') and bot.strategy == 'MoveGuard':
+                        MoveGuard = get_strategy_class("MoveGuard")
                         strategy = MoveGuard(
                             meta_trader=meta_trader,
                             config=bot.config,
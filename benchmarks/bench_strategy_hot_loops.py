@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+"""
+Per-tick latency benchmark for the strategy hot loops
+
+Replays synthetic ticks through a SimulatedMetaTrader and a fake PocketBase
+client, and for every scenario (number of cycles x orders per cycle) reports:
+- p50 / p99 wall time per tick
+- peak memory allocated per tick (tracemalloc, measured on a separate pass)
+- MetaTrader and HTTP calls per tick, to catch call amplification
+
+Measured entry points:
+- MoveGuard tick: snapshot + ticket index + P&L book refresh, then _process_strategy_logic
+- MoveGuard._track_and_update_order_status
+- MoveGuard._maintain_pending_grid_orders (every cycle, one level)
+- AdvancedCyclesTrader tick: _get_market_data, then _process_strategy_logic
+
+Usage:
+    python benchmarks/bench_strategy_hot_loops.py
+    python benchmarks/bench_strategy_hot_loops.py --cycles 1 10 --orders 0 10 --ticks 100
+    python benchmarks/bench_strategy_hot_loops.py --json results.json --max-mt5-calls 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import MetaTrader.SimulatedMT5
+from MetaTrader.SimulatedMT5 import SimulatedMetaTrader, Tick
+
+# Run on the simulator even where the terminal package is installed: module-level
+# MetaTrader5 calls made by the strategies (e.g. symbol spec loads) must hit the fake
+sys.modules['MetaTrader5'] = MetaTrader.SimulatedMT5
+
+from benchmarks.fakes import CountingProxy, FakePocketBase, make_bot
+
+SYMBOL = "EURUSD"
+PIP = 0.0001
+CYCLE_COUNTS = (1, 10, 50, 200)
+ORDER_COUNTS = (0, 10, 50)
+
+MOVEGUARD_CONFIG = {
+    "lot_size": 0.01,
+    "initial_entry_interval_pips": 10.0,
+    "subsequent_entry_interval_pips": 10.0,
+    "cycle_take_profit_pips": 1e9,  # Keep cycles open for the whole run
+    "initial_order_sl_pips": 1e6,
+    "max_concurrent_cycles": 1000,
+    "max_trades_per_cycle": 1000,
+    "auto_place_cycles": False,
+    "market_hours_enabled": False,
+    "optimization_enabled": False,  # Process every cycle on every tick
+    "tick_stream_enabled": False,
+}
+
+ACT_CONFIG = {
+    "lot_size": 0.01,
+    "order_interval_pips": 10.0,
+    "take_profit_pips": 1e9,
+    "stop_loss_pips": 1e6,
+    "initial_order_stop_loss_pips": 1e6,
+    "max_concurrent_cycles": 1000,
+    "auto_place_cycles": False,
+}
+
+
+def synthetic_ticks(count, start_price=1.10000, seed=7):
+    """Random-walk ticks one second apart"""
+    rng = random.Random(seed)
+    price = start_price
+    start_ms = 1_700_000_000_000
+    for i in range(count):
+        price = round(price + rng.choice((-1, 1)) * rng.randint(1, 5) * 0.00001, 5)
+        yield Tick(SYMBOL, (start_ms + i * 1000) // 1000, start_ms + i * 1000, price, round(price + 0.00010, 5), 0.0, 0.0)
+
+
+def build_market(ticks):
+    """Simulator wrapped in a call counter, primed with its first tick"""
+    sim = SimulatedMetaTrader(synthetic_ticks(ticks + 1))
+    sim.step()
+    return sim, CountingProxy(sim)
+
+
+def seed_moveguard_cycles(sim, cycles, orders):
+    """Open real simulated positions/pending orders and return MoveGuard cycle records"""
+    price = sim.get_bid(SYMBOL)
+    records = []
+    for c in range(cycles):
+        cycle_orders = []
+        for level in range(orders):
+            if level % 2 == 0:
+                ticket = sim.buy(SYMBOL, 0.01, 777001, 0, 0, "PRICE", 10)[0].ticket
+                status = "active"
+            else:
+                ticket = sim.buy_stop(SYMBOL, price + (level + 20) * 10 * PIP, 0.01, 777001, 0, 0, "PRICE", 10)[0].ticket
+                status = "pending"
+            cycle_orders.append({
+                "order_id": ticket, "ticket": ticket, "status": status, "grid_level": level,
+                "direction": "BUY", "order_type": "grid" if level else "initial", "price": price,
+                "lot_size": 0.01, "profit": 0.0, "profit_pips": 0.0, "symbol": SYMBOL,
+            })
+        records.append({
+            "id": f"mg{c}", "symbol": SYMBOL, "direction": "BUY", "status": "active", "is_closed": False,
+            "entry_price": price, "lower_bound": price - 50 * PIP, "upper_bound": price + 50 * PIP,
+            "zone_data": {"upper_boundary": price + 50 * PIP, "lower_boundary": price - 50 * PIP},
+            "lot_size": 0.01, "orders": cycle_orders,
+            "active_orders": [o for o in cycle_orders if o["status"] == "active"],
+            "pending_orders": [o for o in cycle_orders if o["status"] == "pending"],
+        })
+    return records
+
+
+def seed_act_cycles(sim, cycles, orders):
+    """Open real simulated positions and return ACT cycle records"""
+    price = sim.get_bid(SYMBOL)
+    records = []
+    for c in range(cycles):
+        active_orders = []
+        for i in range(orders):
+            position = sim.buy(SYMBOL, 0.01, 777001, 0, 0, "PRICE", 10)[0]
+            active_orders.append({
+                "ticket": position.ticket, "price": position.price_open, "type": 0, "volume": 0.01,
+                "profit": 0.0, "swap": 0.0, "commission": 0.0, "kind": "initial" if i == 0 else "grid",
+                "status": "active", "symbol": SYMBOL,
+            })
+        records.append({
+            "id": f"act{c}", "symbol": SYMBOL, "direction": "BUY", "current_direction": "BUY",
+            "status": "ACTIVE", "is_closed": False, "entry_price": price, "zone_base_price": price,
+            "lot_size": 0.01, "active_orders": active_orders, "completed_orders": [],
+        })
+    return records
+
+
+def build_moveguard(mt5, client, records):
+    from Strategy.MoveGuard import MoveGuard
+    from cycles.MoveGuard_cycle import MoveGuardCycle
+
+    strategy = MoveGuard(mt5, dict(MOVEGUARD_CONFIG), client, SYMBOL, make_bot(client))
+    for record in records:
+        cycle = MoveGuardCycle(record, mt5, strategy.bot)
+        cycle.status = "active"
+        strategy.multi_cycle_manager.active_cycles[cycle.cycle_id] = cycle
+    return strategy
+
+
+def build_act(mt5, client, records):
+    from Strategy.AdvancedCyclesTrader_Organized import AdvancedCyclesTrader
+    from cycles.ACT_cycle_Organized import AdvancedCycle
+
+    strategy = AdvancedCyclesTrader(mt5, dict(ACT_CONFIG), client, SYMBOL, make_bot(client))
+    for record in records:
+        cycle = AdvancedCycle(record, mt5, strategy.bot)
+        strategy.active_cycles.append(cycle)
+        strategy.multi_cycle_manager.active_cycles[cycle.cycle_id] = cycle
+    return strategy
+
+
+MOVEGUARD_TARGETS = ("MoveGuard._process_strategy_logic", "MoveGuard._track_and_update_order_status",
+                     "MoveGuard._maintain_pending_grid_orders")
+ACT_TARGETS = ("AdvancedCyclesTrader._process_strategy_logic",)
+
+
+def moveguard_targets(strategy, loop):
+    async def tick():
+        market_data = strategy._get_market_data()
+        strategy._refresh_ticket_index()
+        strategy._refresh_pnl_book()
+        await strategy._process_strategy_logic(market_data)
+
+    def maintain_grid():
+        price = strategy._get_current_price()
+        for cycle in strategy.multi_cycle_manager.get_all_active_cycles():
+            strategy._maintain_pending_grid_orders(cycle, price, 1)
+
+    return {
+        "MoveGuard._process_strategy_logic": lambda: loop.run_until_complete(tick()),
+        "MoveGuard._track_and_update_order_status": strategy._track_and_update_order_status,
+        "MoveGuard._maintain_pending_grid_orders": maintain_grid,
+    }
+
+
+def act_targets(strategy, loop):
+    async def tick():
+        market_data = strategy._get_market_data()
+        await strategy._process_strategy_logic(market_data)
+
+    return {"AdvancedCyclesTrader._process_strategy_logic": lambda: loop.run_until_complete(tick())}
+
+
+def measure(target, sim, mt5, client, ticks, alloc_ticks):
+    """Run a target once per tick and collect latency, allocation and call counts"""
+    latencies, mt5_calls, http_calls, peaks = [], [], [], []
+    for i in range(ticks + alloc_ticks):
+        if sim.step() is None:
+            break
+        trace = i >= ticks
+        mt5.reset_calls()
+        client.reset_calls()
+        if trace:
+            tracemalloc.start()
+        started = time.perf_counter()
+        target()
+        elapsed = time.perf_counter() - started
+        if trace:
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        else:
+            latencies.append(elapsed)
+            mt5_calls.append(mt5.total_calls())
+            http_calls.append(client.total_calls())
+
+    latencies_ms = np.array(latencies) * 1000.0 if latencies else np.zeros(1)
+    return {
+        "ticks": len(latencies),
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "peak_alloc_kib": float(np.median(peaks) / 1024.0) if peaks else 0.0,
+        "mt5_calls_per_tick": float(np.mean(mt5_calls)) if mt5_calls else 0.0,
+        "http_calls_per_tick": float(np.mean(http_calls)) if http_calls else 0.0,
+        "top_mt5_calls": dict(mt5.calls.most_common(3)),
+    }
+
+
+def run_scenario(strategy_name, cycles, orders, ticks, alloc_ticks):
+    """Benchmark every entry point of one strategy for one cycles x orders scenario"""
+    results = []
+    loop = asyncio.new_event_loop()
+    try:
+        seed, build, targets, names = {
+            "MoveGuard": (seed_moveguard_cycles, build_moveguard, moveguard_targets, MOVEGUARD_TARGETS),
+            "AdvancedCyclesTrader": (seed_act_cycles, build_act, act_targets, ACT_TARGETS),
+        }[strategy_name]
+        for name in names:
+            # Fresh market and strategy per entry point so state changes do not leak between them
+            sim, mt5 = build_market(ticks + alloc_ticks)
+            client = FakePocketBase()
+            strategy = build(mt5, client, seed(sim, cycles, orders))
+            result = measure(targets(strategy, loop)[name], sim, mt5, client, ticks, alloc_ticks)
+            result.update({"target": name, "cycles": cycles, "orders_per_cycle": orders})
+            results.append(result)
+    finally:
+        loop.close()
+    return results
+
+
+def print_results(results):
+    header = f"{'target':<46} {'cycles':>6} {'orders':>6} {'p50 ms':>9} {'p99 ms':>9} {'alloc KiB':>10} {'MT5/tick':>9} {'HTTP/tick':>9}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['target']:<46} {r['cycles']:>6} {r['orders_per_cycle']:>6} {r['p50_ms']:>9.3f} {r['p99_ms']:>9.3f} "
+              f"{r['peak_alloc_kib']:>10.1f} {r['mt5_calls_per_tick']:>9.1f} {r['http_calls_per_tick']:>9.1f}")
+
+
+def main(argv=None):
+    """Run the benchmark matrix and check the optional call budgets"""
+    parser = argparse.ArgumentParser(description="Per-tick latency benchmark for the strategy hot loops")
+    parser.add_argument("--strategies", nargs="+", default=["MoveGuard", "AdvancedCyclesTrader"],
+                        choices=["MoveGuard", "AdvancedCyclesTrader"])
+    parser.add_argument("--cycles", nargs="+", type=int, default=list(CYCLE_COUNTS))
+    parser.add_argument("--orders", nargs="+", type=int, default=list(ORDER_COUNTS))
+    parser.add_argument("--ticks", type=int, default=200, help="Timed ticks per entry point")
+    parser.add_argument("--alloc-ticks", type=int, default=10, help="Extra ticks traced with tracemalloc")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--max-mt5-calls", type=float, help="Fail if any entry point averages more MT5 calls per tick")
+    parser.add_argument("--max-http-calls", type=float, help="Fail if any entry point averages more HTTP calls per tick")
+    args = parser.parse_args(argv)
+
+    # Strategy logging is per order and would dominate the timings
+    logging.disable(logging.CRITICAL)
+
+    results = []
+    for strategy_name in args.strategies:
+        for cycles in args.cycles:
+            for orders in args.orders:
+                results.extend(run_scenario(strategy_name, cycles, orders, args.ticks, args.alloc_ticks))
+
+    logging.disable(logging.NOTSET)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    failures = [r for r in results
+                if (args.max_mt5_calls is not None and r["mt5_calls_per_tick"] > args.max_mt5_calls)
+                or (args.max_http_calls is not None and r["http_calls_per_tick"] > args.max_http_calls)]
+    for r in failures:
+        print(f"❌ {r['target']} ({r['cycles']} cycles x {r['orders_per_cycle']} orders): "
+              f"{r['mt5_calls_per_tick']:.1f} MT5 / {r['http_calls_per_tick']:.1f} HTTP calls per tick")
+    return not failures
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
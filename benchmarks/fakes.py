@@ -0,0 +1,89 @@
+"""
+Stand-ins for MetaTrader and PocketBase used by the benchmarks
+
+CountingProxy wraps any object (e.g. SimulatedMetaTrader) and counts calls per
+method name. FakePocketBase accepts any API method the strategies call, counts
+it as one HTTP request and returns a plausible empty result without a network
+round trip.
+"""
+
+import itertools
+from collections import Counter
+from types import SimpleNamespace
+
+
+class CountingProxy:
+    """Forward attribute access to a target object, counting method calls"""
+
+    def __init__(self, target):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, 'calls', Counter())
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            return value
+        calls = self.calls
+
+        def counted(*args, **kwargs):
+            calls[name] += 1
+            return value(*args, **kwargs)
+
+        return counted
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    def reset_calls(self):
+        """Clear the call counters"""
+        self.calls.clear()
+
+    def total_calls(self):
+        """Number of method calls since the last reset"""
+        return sum(self.calls.values())
+
+
+class FakePocketBase:
+    """API client stand-in: every method call counts as one HTTP request"""
+
+    READ_PREFIXES = ('get_', 'list_', 'fetch_', 'search_')
+
+    def __init__(self):
+        self.calls = Counter()
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        calls = self.calls
+
+        def request(*args, **kwargs):
+            calls[name] += 1
+            if name.startswith(self.READ_PREFIXES):
+                return []
+            return SimpleNamespace(id=f"fake{next(self._ids)}")
+
+        return request
+
+    def flush_pending_updates(self):
+        """Nothing is buffered - writes are counted as they are made"""
+        return 0
+
+    def reset_calls(self):
+        """Clear the call counters"""
+        self.calls.clear()
+
+    def total_calls(self):
+        """Number of requests since the last reset"""
+        return sum(self.calls.values())
+
+
+def make_bot(client, magic_number=777001):
+    """Minimal bot object with the attributes the strategies read"""
+    return SimpleNamespace(
+        id="bench-bot",
+        magic_number=magic_number,
+        api_client=client,
+        account=SimpleNamespace(id="bench-account"),
+        symbol_name=None,
+    )
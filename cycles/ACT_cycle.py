@@ -1,6 +1,7 @@
 import datetime
 from Orders.order import order
-import MetaTrader5 as Mt5
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module
 from DB.db_engine import engine
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 from types import SimpleNamespace
@@ -13,6 +14,8 @@ import asyncio
 import uuid
 from typing import Dict
 
+Mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
+
 
 def serialize_datetime_objects(obj):
     """Recursively serialize datetime objects and other complex types in data structures"""
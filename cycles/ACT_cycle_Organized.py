@@ -13,12 +13,17 @@ import uuid
 import json
 import asyncio
 from typing import Dict, List, Optional, Any
+from collections.abc import Mapping
 from Orders.order import order
-import MetaTrader5 as Mt5
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module
 from DB.db_engine import engine
 from cycles.CT_cycle import cycle
 from Views.globals.app_logger import app_logger as logger
 from helpers.sync import verify_order_status, sync_delay, MT5_LOCK
+from cycles.order_record import OrderRecord, orders_from_dicts, json_default
+
+Mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
 
 
 class AdvancedCycle(cycle):
@@ -98,10 +103,10 @@ class AdvancedCycle(cycle):
             # JSON fields
             self.opened_by = self._parse_json_field(cycle_data.get('opened_by'), {})
             self.closing_method = self._parse_json_field(cycle_data.get('closing_method'), {})
-            self.orders = self._parse_json_field(cycle_data.get('orders'), [])
+            self.orders = orders_from_dicts(self._parse_json_field(cycle_data.get('orders'), []))
             self.orders_config = self._parse_json_field(cycle_data.get('orders_config'), {})
-            self.active_orders = self._parse_json_field(cycle_data.get('active_orders'), [])
-            self.completed_orders = self._parse_json_field(cycle_data.get('completed_orders'), [])
+            self.active_orders = orders_from_dicts(self._parse_json_field(cycle_data.get('active_orders'), []))
+            self.completed_orders = orders_from_dicts(self._parse_json_field(cycle_data.get('completed_orders'), []))
             self.done_price_levels = self._parse_json_field(cycle_data.get('done_price_levels'), [])
             
             # Direction and zone settings
@@ -332,8 +337,8 @@ class AdvancedCycle(cycle):
         self.cycle_interval = cycle_data.get("cycle_interval", 100.0)
         
         # Order management
-        self.active_orders = cycle_data.get("active_orders", [])
-        self.completed_orders = cycle_data.get("completed_orders", [])
+        self.active_orders = orders_from_dicts(cycle_data.get("active_orders", []))
+        self.completed_orders = orders_from_dicts(cycle_data.get("completed_orders", []))
         
         # Batch management
         self.current_batch_id = cycle_data.get("current_batch_id", None)
@@ -431,15 +436,17 @@ class AdvancedCycle(cycle):
             logger.error(f"Error adding order to cycle: {e}")
             return False
 
-    def _process_order_input(self, order_input) -> Optional[dict]:
+    def _process_order_input(self, order_input) -> Optional[OrderRecord]:
         """Process order input and convert to standardized format"""
         try:
-            if isinstance(order_input, dict):
+            if isinstance(order_input, OrderRecord):
                 return order_input
+            elif isinstance(order_input, dict):
+                return OrderRecord(order_input)
             elif hasattr(order_input, '__dict__'):
-                return self._convert_object_to_order_data(order_input)
+                return OrderRecord(self._convert_object_to_order_data(order_input))
             elif isinstance(order_input, (int, str)):
-                return self._create_order_data_from_ticket(order_input)
+                return OrderRecord(self._create_order_data_from_ticket(order_input))
             else:
                 logger.error(f"Unsupported order input type: {type(order_input)}")
                 return None
@@ -576,19 +583,19 @@ class AdvancedCycle(cycle):
                 if isinstance(order, int):
                     logger.warning(f"Found integer ticket {order} in active_orders, skipping profit calculation")
                     continue
-                elif not isinstance(order, dict):
-                    logger.warning(f"Found non-dict order {type(order)} in active_orders, skipping profit calculation")
+                elif not isinstance(order, OrderRecord):
+                    logger.warning(f"Found non-record order {type(order)} in active_orders, skipping profit calculation")
                     continue
                 
-                profit = float(order.get('profit', 0.0))
-                swap = float(order.get('swap', 0.0))
-                commission = float(order.get('commission', 0.0))
+                profit = float(getattr(order, 'profit', 0.0))
+                swap = float(getattr(order, 'swap', 0.0))
+                commission = float(getattr(order, 'commission', 0.0))
                 
                 active_profit += profit
                 total_swap += swap
                 total_commission += commission
                 
-                logger.debug(f"Active order {order.get('ticket')}: Profit={profit}, Swap={swap}, Commission={commission}")
+                logger.debug(f"Active order {getattr(order, 'ticket', None)}: Profit={profit}, Swap={swap}, Commission={commission}")
             
             # Calculate profit from completed orders
             for order in self.completed_orders:
@@ -596,19 +603,19 @@ class AdvancedCycle(cycle):
                 if isinstance(order, int):
                     logger.warning(f"Found integer ticket {order} in completed_orders, skipping profit calculation")
                     continue
-                elif not isinstance(order, dict):
-                    logger.warning(f"Found non-dict order {type(order)} in completed_orders, skipping profit calculation")
+                elif not isinstance(order, OrderRecord):
+                    logger.warning(f"Found non-record order {type(order)} in completed_orders, skipping profit calculation")
                     continue
                 
-                profit = float(order.get('profit', 0.0))
-                swap = float(order.get('swap', 0.0))
-                commission = float(order.get('commission', 0.0))
+                profit = float(getattr(order, 'profit', 0.0))
+                swap = float(getattr(order, 'swap', 0.0))
+                commission = float(getattr(order, 'commission', 0.0))
                 
                 completed_profit += profit
                 total_swap += swap
                 total_commission += commission
                 
-                logger.debug(f"Completed order {order.get('ticket')}: Profit={profit}, Swap={swap}, Commission={commission}")
+                logger.debug(f"Completed order {getattr(order, 'ticket', None)}: Profit={profit}, Swap={swap}, Commission={commission}")
             
             # Calculate total profit
             self.total_profit = active_profit + completed_profit + total_swap + total_commission
@@ -704,23 +711,23 @@ class AdvancedCycle(cycle):
                 if isinstance(order, int):
                     logger.warning(f"Found integer ticket {order} in active_orders, skipping update")
                     continue
-                elif not isinstance(order, dict):
-                    logger.warning(f"Found non-dict order {type(order)} in active_orders, skipping update")
+                elif not isinstance(order, OrderRecord):
+                    logger.warning(f"Found non-record order {type(order)} in active_orders, skipping update")
                     continue
                 
                 # Convert ticket to integer for dictionary lookup
-                ticket = int(order.get('ticket', '0'))
+                ticket = int(getattr(order, 'ticket', '0'))
                 if ticket in positions_dict:
                     position = positions_dict[ticket]
                     
                     # Update order with live data
-                    order['profit'] = getattr(position, 'profit', 0.0)
-                    order['swap'] = getattr(position, 'swap', 0.0)
-                    order['commission'] = getattr(position, 'commission', 0.0)
-                    order['volume'] = getattr(position, 'volume', order.get('volume', 0.0))
+                    order.profit = getattr(position, 'profit', 0.0)
+                    order.swap = getattr(position, 'swap', 0.0)
+                    order.commission = getattr(position, 'commission', 0.0)
+                    order.volume = getattr(position, 'volume', getattr(order, 'volume', 0.0))
                     
                     updated_count += 1
-                    logger.info(f"Updated order {ticket} with profit: {order['profit']}, swap: {order['swap']}, commission: {order['commission']}")
+                    logger.info(f"Updated order {ticket} with profit: {order.profit}, swap: {order.swap}, commission: {order.commission}")
                 else:
                     logger.debug(f"Order {ticket} not found in positions dictionary. Available tickets: {list(positions_dict.keys())}")
                     
@@ -875,8 +882,8 @@ class AdvancedCycle(cycle):
             if isinstance(order, int):
                 logger.warning(f"Found integer ticket {order} in order check, treating as closed")
                 return True
-            elif not isinstance(order, dict):
-                logger.warning(f"Found non-dict order {type(order)} in order check, treating as closed")
+            elif not isinstance(order, OrderRecord):
+                logger.warning(f"Found non-record order {type(order)} in order check, treating as closed")
                 return True
             
             ticket = order.get('ticket')
@@ -1350,7 +1357,7 @@ class AdvancedCycle(cycle):
                 return None
             if isinstance(data, (list, tuple)):
                 return [self._serialize_data(item) for item in data]
-            if isinstance(data, dict):
+            if isinstance(data, Mapping):
                 return {k: self._serialize_data(v) for k, v in data.items()}
             if isinstance(data, (datetime.datetime, datetime.date)):
                 return self._safe_datetime_string(data)
@@ -1523,9 +1530,9 @@ class AdvancedCycle(cycle):
                 "initial_threshold_breached": bool(getattr(self, 'initial_threshold_breached', False)),
                 "direction_switched": bool(getattr(self, 'direction_switched', False)),
                 "next_order_index": int(getattr(self, 'next_order_index', 1)),
-                "active_orders": json.dumps(getattr(self, 'active_orders', [])),
-                "completed_orders": json.dumps(getattr(self, 'completed_orders', [])),
-                "orders": json.dumps(getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', [])),
+                "active_orders": json.dumps(getattr(self, 'active_orders', []), default=json_default),
+                "completed_orders": json.dumps(getattr(self, 'completed_orders', []), default=json_default),
+                "orders": json.dumps(getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', []), default=json_default),
                 "done_price_levels": json.dumps(getattr(self, 'done_price_levels', [])),
                 "total_orders": len(getattr(self, 'active_orders', [])) + len(getattr(self, 'completed_orders', [])),
                 "total_volume": self._safe_float_conversion(sum(float(order.get('volume', 0.0)) for order in getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', []))),
@@ -1653,9 +1660,8 @@ class AdvancedCycle(cycle):
         try:
             symbol = getattr(self, 'symbol', '')
             try:
-                # Get symbol point from MT5 and multiply by 100 for pip value
-                symbol_info = self.meta_trader.get_symbol_info(symbol)
-                return symbol_info.point * 10
+                # Cached symbol spec: point * 10
+                return self.meta_trader.get_pips(symbol)
             except Exception as inner_e:
                 logger.warning(f"Could not get symbol point from MT5: {inner_e}, using fallback")
                 return 0.0001
@@ -1761,13 +1767,13 @@ class AdvancedCycle(cycle):
             issues = []
             
             # Check for duplicate tickets in active orders
-            active_tickets = [order.get('ticket') for order in self.active_orders]
+            active_tickets = [getattr(order, 'ticket', None) for order in self.active_orders]
             duplicate_active = [ticket for ticket in set(active_tickets) if active_tickets.count(ticket) > 1]
             if duplicate_active:
                 issues.append(f"Duplicate tickets in active orders: {duplicate_active}")
             
             # Check for duplicate tickets in completed orders
-            completed_tickets = [order.get('ticket') for order in self.completed_orders]
+            completed_tickets = [getattr(order, 'ticket', None) for order in self.completed_orders]
             duplicate_completed = [ticket for ticket in set(completed_tickets) if completed_tickets.count(ticket) > 1]
             if duplicate_completed:
                 issues.append(f"Duplicate tickets in completed orders: {duplicate_completed}")
@@ -1781,11 +1787,11 @@ class AdvancedCycle(cycle):
             
             # Check for orders with invalid status
             for order in self.active_orders:
-                if order.get('status') != 'active':
+                if getattr(order, 'status', None) != 'active':
                     issues.append(f"Active order {order.get('ticket')} has invalid status: {order.get('status')}")
             
             for order in self.completed_orders:
-                if order.get('status') != 'closed':
+                if getattr(order, 'status', None) != 'closed':
                     issues.append(f"Completed order {order.get('ticket')} has invalid status: {order.get('status')}")
             
             if issues:
@@ -1834,7 +1840,7 @@ class AdvancedCycle(cycle):
             return 0
 
     def cleanup_order_lists(self):
-        """Clean up order lists by converting integer tickets to proper order dictionaries"""
+        """Clean up order lists by converting integer tickets and plain dicts to order records"""
         try:
             logger.info(f"Cleaning up order lists for cycle {self.cycle_id}")
             
@@ -1844,10 +1850,12 @@ class AdvancedCycle(cycle):
                 if isinstance(item, int):
                     # Convert integer ticket to order dictionary
                     order_dict = self._create_order_data_from_ticket(str(item))
-                    cleaned_active.append(order_dict)
+                    cleaned_active.append(OrderRecord(order_dict))
                     logger.info(f"Converted integer ticket {item} to order dictionary")
-                elif isinstance(item, dict):
+                elif isinstance(item, OrderRecord):
                     cleaned_active.append(item)
+                elif isinstance(item, dict):
+                    cleaned_active.append(OrderRecord(item))
                 else:
                     logger.warning(f"Removing invalid order item of type {type(item)}: {item}")
             
@@ -1859,10 +1867,12 @@ class AdvancedCycle(cycle):
                     order_dict = self._create_order_data_from_ticket(str(item))
                     order_dict['status'] = 'closed'
                     order_dict['is_closed'] = True
-                    cleaned_completed.append(order_dict)
+                    cleaned_completed.append(OrderRecord(order_dict))
                     logger.info(f"Converted integer ticket {item} to completed order dictionary")
-                elif isinstance(item, dict):
+                elif isinstance(item, OrderRecord):
                     cleaned_completed.append(item)
+                elif isinstance(item, dict):
+                    cleaned_completed.append(OrderRecord(item))
                 else:
                     logger.warning(f"Removing invalid order item of type {type(item)}: {item}")
             
@@ -2020,7 +2030,7 @@ def serialize_datetime_objects(obj):
         return obj.isoformat() if obj else None
     elif isinstance(obj, list):
         return [serialize_datetime_objects(item) for item in obj]
-    elif isinstance(obj, dict):
+    elif isinstance(obj, Mapping):
         return {key: serialize_datetime_objects(value) for key, value in obj.items()}
     elif hasattr(obj, '__dict__'):
         return serialize_datetime_objects(obj.__dict__)
@@ -2036,7 +2046,7 @@ def ensure_json_serializable(data):
         return data.isoformat() if data else None
     elif isinstance(data, list):
         return [ensure_json_serializable(item) for item in data]
-    elif isinstance(data, dict):
+    elif isinstance(data, Mapping):
         return {key: ensure_json_serializable(value) for key, value in data.items()}
     elif hasattr(data, '__dict__'):
         return ensure_json_serializable(data.__dict__)
@@ -1,11 +1,14 @@
 import datetime
 from Orders.order import order
-import MetaTrader5 as Mt5
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module
 from DB.db_engine import engine
 from DB.ah_strategy.repositories.ah_repo import AHRepo
 from types import SimpleNamespace
 from helpers.sync import verify_order_status, sync_delay, MT5_LOCK
 
+Mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
+
 
 class cycle:
     def __init__(self, data, mt5, bot, source=None):
@@ -59,6 +62,10 @@ class cycle:
     def combine_orders(self):
         return self.initial + self.hedge + self.pending + self.recovery + self.max_recovery
 
+    def refresh_derived_state(self):
+        """Recompute the state derived from the order lists, for objects kept across ticks"""
+        self.orders = self.combine_orders()
+
     def get_orders_from_remote(self, orders):
         for order_data in orders:
             # convet orderdata to subscrible
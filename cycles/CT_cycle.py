@@ -1,12 +1,15 @@
 import datetime
 from Orders.order import order
-import MetaTrader5 as Mt5
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module
 from DB.db_engine import engine
 from DB.ct_strategy.repositories.ct_repo import CTRepo
 from types import SimpleNamespace
 import json
 from helpers.sync import verify_order_status, sync_delay, MT5_LOCK
 
+Mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
+
 
 class cycle:
     def __init__(self, data, mt5, bot, source=None):
@@ -110,6 +113,16 @@ class cycle:
     def combine_orders(self):
         return self.initial + self.hedge + self.pending + self.recovery + self.threshold
 
+    def refresh_derived_state(self):
+        """Recompute the state derived from the order lists, for objects kept across ticks"""
+        self.orders = self.combine_orders()
+
+        # Open price comes from the initial order, which a filled pending order may only now provide
+        if self.open_price == 0 and len(self.initial) > 0:
+            initial_order = self.local_api.get_order_by_ticket(self.initial[0])
+            if initial_order:
+                self.open_price = initial_order.open_price
+
     def get_orders_from_remote(self, orders):
         if orders is None:
             return []
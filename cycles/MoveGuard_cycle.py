@@ -16,11 +16,16 @@ import json
 import asyncio
 from typing import Dict, List, Optional, Any
 from Orders.order import order
-import MetaTrader5 as Mt5
+import MetaTrader5
+from MetaTrader.MT5Gateway import routed_module
 from DB.db_engine import engine
 from cycles.CT_cycle import cycle
 from Views.globals.app_logger import app_logger as logger
 from helpers.sync import verify_order_status, sync_delay, MT5_LOCK
+from cycles.order_store import OrderStore
+from cycles.order_record import OrderRecord, orders_from_dicts, to_record, json_default
+
+Mt5 = routed_module(MetaTrader5)  # Counted per bot and serialized on the MT5 gateway thread
 
 
 class MoveGuardCycle(cycle):
@@ -50,6 +55,15 @@ class MoveGuardCycle(cycle):
             
         logger.info(f"MoveGuardCycle initialized with ID: {getattr(self, 'cycle_id', 'NEW')}")
         
+    @property
+    def orders(self) -> OrderStore:
+        """All orders of the cycle, indexed by ticket, status and grid level"""
+        return self._orders
+
+    @orders.setter
+    def orders(self, value):
+        self._orders = value if isinstance(value, OrderStore) else OrderStore(value or [])
+
     def _validate_cycle_data(self, cycle_data):
         """Validate required fields in cycle data"""
         required_fields = ['symbol', 'direction']
@@ -91,14 +105,14 @@ class MoveGuardCycle(cycle):
             # JSON fields
             self.opened_by = self._parse_json_field(cycle_data.get('opened_by'), {})
             self.closing_method = self._parse_json_field(cycle_data.get('closing_method'), {})
-            self.orders = self._parse_json_field(cycle_data.get('orders'), [])
+            self.orders = orders_from_dicts(self._parse_json_field(cycle_data.get('orders'), []))
             self.orders_config = self._parse_json_field(cycle_data.get('orders_config'), {})
-            self.active_orders = self._parse_json_field(cycle_data.get('active_orders'), [])
-            self.completed_orders = self._parse_json_field(cycle_data.get('completed_orders'), [])
+            self.active_orders = orders_from_dicts(self._parse_json_field(cycle_data.get('active_orders'), []))
+            self.completed_orders = orders_from_dicts(self._parse_json_field(cycle_data.get('completed_orders'), []))
             self.done_price_levels = self._parse_json_field(cycle_data.get('done_price_levels'), [])
             
             # Load pending orders data for MoveGuard strategy
-            self.pending_orders = self._parse_json_field(cycle_data.get('pending_orders'), [])
+            self.pending_orders = orders_from_dicts(self._parse_json_field(cycle_data.get('pending_orders'), []))
             pending_levels_data = self._parse_json_field(cycle_data.get('pending_order_levels'), [])
             self.pending_order_levels = set(pending_levels_data) if isinstance(pending_levels_data, list) else set()
             
@@ -319,6 +333,8 @@ class MoveGuardCycle(cycle):
     def add_grid_order(self, order_data: dict, grid_level: int):
         """Add a grid order to the cycle"""
         try:
+            order_data = to_record(order_data)
+            
             # Add grid-specific information
             order_data['grid_level'] = grid_level
             order_data['order_type'] = 'grid'
@@ -538,6 +554,8 @@ class MoveGuardCycle(cycle):
     def add_recovery_order(self, order_data: dict):
         """Add a recovery order to the cycle"""
         try:
+            order_data = to_record(order_data)
+            
             # Add recovery-specific information
             order_data['order_type'] = 'recovery'
             order_data['placed_at'] = datetime.datetime.now().isoformat()
@@ -617,15 +635,17 @@ class MoveGuardCycle(cycle):
             logger.error(f"Error adding order to cycle: {e}")
             return False
 
-    def _process_order_input(self, order_input) -> Optional[dict]:
+    def _process_order_input(self, order_input) -> Optional[OrderRecord]:
         """Process order input and convert to standardized format"""
         try:
-            if isinstance(order_input, dict):
+            if isinstance(order_input, OrderRecord):
                 return order_input
+            elif isinstance(order_input, dict):
+                return OrderRecord(order_input)
             elif hasattr(order_input, '__dict__'):
-                return self._convert_object_to_order_data(order_input)
+                return OrderRecord(self._convert_object_to_order_data(order_input))
             elif isinstance(order_input, (int, str)):
-                return self._create_order_data_from_ticket(order_input)
+                return OrderRecord(self._create_order_data_from_ticket(order_input))
             else:
                 logger.error(f"Unsupported order input type: {type(order_input)}")
                 return None
@@ -796,12 +816,12 @@ class MoveGuardCycle(cycle):
                 "max_trades_per_cycle": int(getattr(self, 'max_trades_per_cycle', 10)),
                 "zone_movement_mode": getattr(self, 'zone_movement_mode', 'NO_MOVE'),
                 "recovery_enabled": bool(getattr(self, 'recovery_enabled', True)),
-                "active_orders": json.dumps(getattr(self, 'active_orders', [])),
-                "completed_orders": json.dumps(getattr(self, 'completed_orders', [])),
-                "orders": json.dumps(getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', [])),
-                "grid_data": json.dumps(getattr(self, 'grid_data', {})),
+                "active_orders": json.dumps(getattr(self, 'active_orders', []), default=json_default),
+                "completed_orders": json.dumps(getattr(self, 'completed_orders', []), default=json_default),
+                "orders": json.dumps(getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', []), default=json_default),
+                "grid_data": json.dumps(getattr(self, 'grid_data', {}), default=json_default),
                 "zone_data": json.dumps(getattr(self, 'zone_data', {})),
-                "recovery_data": json.dumps(getattr(self, 'recovery_data', {})),
+                "recovery_data": json.dumps(getattr(self, 'recovery_data', {}), default=json_default),
                 "total_orders": len(getattr(self, 'active_orders', [])) + len(getattr(self, 'completed_orders', [])),
                 "total_volume": self._safe_float_conversion(sum(float(order.get('volume', 0.0)) for order in getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', []))),
                 "total_profit": self._safe_float_conversion(getattr(self, 'total_profit', 0.0)),
@@ -879,14 +899,14 @@ class MoveGuardCycle(cycle):
                 'total_profit': self._safe_float_conversion(getattr(self, 'total_profit', 0.0)),
                 'is_active': bool(getattr(self, 'is_active', True)),
                 'is_closed': bool(getattr(self, 'is_closed', False)),
-                'orders': json.dumps(getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', [])),
-                'active_orders': json.dumps(getattr(self, 'active_orders', [])),
-                'completed_orders': json.dumps(getattr(self, 'completed_orders', [])),
-                'pending_orders': json.dumps(getattr(self, 'pending_orders', [])),
+                'orders': json.dumps(getattr(self, 'active_orders', []) + getattr(self, 'completed_orders', []), default=json_default),
+                'active_orders': json.dumps(getattr(self, 'active_orders', []), default=json_default),
+                'completed_orders': json.dumps(getattr(self, 'completed_orders', []), default=json_default),
+                'pending_orders': json.dumps(getattr(self, 'pending_orders', []), default=json_default),
                 'pending_order_levels': json.dumps(list(getattr(self, 'pending_order_levels', set()))),
-                'grid_data': json.dumps(getattr(self, 'grid_data', {})),
+                'grid_data': json.dumps(getattr(self, 'grid_data', {}), default=json_default),
                 'zone_data': json.dumps(getattr(self, 'zone_data', {})),
-                'recovery_data': json.dumps(getattr(self, 'recovery_data', {})),
+                'recovery_data': json.dumps(getattr(self, 'recovery_data', {}), default=json_default),
                 'cycle_type': 'MoveGuard',
                 'upper_bound': self._safe_float_conversion(getattr(self, 'zone_data', {}).get('upper_boundary', 0.0)),
                 'lower_bound': self._safe_float_conversion(getattr(self, 'zone_data', {}).get('lower_boundary', 0.0)),
@@ -910,9 +930,8 @@ class MoveGuardCycle(cycle):
         try:
             symbol = getattr(self, 'symbol', '')
             try:
-                # Get symbol point from MT5 and multiply by 10 for pip value
-                symbol_info = self.meta_trader.get_symbol_info(symbol)
-                return symbol_info.point * 10
+                # Cached symbol spec: point * 10
+                return self.meta_trader.get_pips(symbol)
             except Exception as inner_e:
                 logger.warning(f"Could not get symbol point from MT5: {inner_e}, using fallback")
                 return 0.0001
@@ -0,0 +1,62 @@
+"""
+Cycle Registry - long-lived cycle objects of one bot
+
+The AH and CT strategies used to rebuild every active cycle object from its
+DB row on every tick. The registry keeps one object per cycle id across ticks
+and rebuilds it only when the row no longer matches the object, i.e. when the
+row was changed by someone else (orders manager, cycles manager, another
+process). Rows the object wrote itself match its to_dict() and keep the object.
+"""
+
+
+class CycleRegistry:
+    """Cycle objects of one bot keyed by cycle id, refreshed from the active rows"""
+
+    def __init__(self, build):
+        """
+        Args:
+            build: Callable turning a DB cycle row into a cycle object
+        """
+        self.build = build
+        self._cycles = {}
+        self.builds = 0
+
+    def __len__(self):
+        return len(self._cycles)
+
+    def get(self, cycle_id):
+        """Cached cycle object of an id, or None"""
+        return self._cycles.get(cycle_id)
+
+    def refresh(self, rows) -> list:
+        """Sync the registry with the active cycle rows
+
+        New rows and rows changed outside their object are (re)built, cycles
+        missing from the rows (closed or deleted) are dropped.
+
+        Returns:
+            list: The cycle objects, in row order
+        """
+        current = {}
+        for row in rows or ():
+            if row is None:
+                continue
+            cycle_obj = self._cycles.get(row.id)
+            if cycle_obj is not None and self.matches(cycle_obj, row):
+                cycle_obj.refresh_derived_state()
+            else:
+                cycle_obj = self.build(row)
+                self.builds += 1
+            current[row.id] = cycle_obj
+        self._cycles = current
+        return list(current.values())
+
+    @staticmethod
+    def matches(cycle_obj, row) -> bool:
+        """Check if a row holds exactly the state the cycle object would write"""
+        missing = object()
+        return all(getattr(row, key, missing) == value for key, value in cycle_obj.to_dict().items())
+
+    def clear(self):
+        """Drop every cached cycle, the next refresh rebuilds them all"""
+        self._cycles = {}
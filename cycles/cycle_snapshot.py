@@ -0,0 +1,124 @@
+"""
+Cycle Snapshot - local warm-start copy of a bot's in-memory cycles
+
+A restart (e.g. after an auto-update) used to re-download every open cycle
+from PocketBase and re-parse it field by field before trading resumed.
+The strategy now writes its in-memory cycles to a small SQLite file every
+few seconds and on shutdown. On startup the snapshot is loaded and only the
+cycles PocketBase reports as updated since the snapshot are re-read.
+
+Each row holds one pickled cycle state (the cycle's attributes without the
+bot / MetaTrader references, which are re-attached on load). The file is
+written and read only by this app.
+"""
+
+import datetime
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+SNAPSHOT_VERSION = 1
+
+# Runtime references re-attached on load, derived state rebuilt on first use, and
+# DB write bookkeeping: fingerprints are recorded when a write is queued (and hash
+# strings per process), so a restored cycle sends one full write instead
+_TRANSIENT = frozenset(('bot', 'meta_trader', 'grid_ladder', '_persisted_fingerprints', '_last_db_update_time'))
+
+
+def default_snapshot_path(strategy: str, bot_id) -> str:
+    """Snapshot file of a bot, next to the local database"""
+    return os.path.join(os.getcwd(), 'snapshots', f'{strategy}_{bot_id}.db')
+
+
+def dump_cycle(cycle) -> bytes:
+    """Pickle a cycle's state without its bot and MetaTrader references"""
+    state = {key: value for key, value in vars(cycle).items() if key not in _TRANSIENT}
+    return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_cycle(cycle_class, data: bytes, meta_trader, bot):
+    """Rebuild a cycle from its pickled state
+
+    Defaults are applied first, so attributes added to the class since the
+    snapshot was written still exist on the restored cycle.
+    """
+    cycle = cycle_class.__new__(cycle_class)
+    cycle.bot = bot
+    cycle.meta_trader = meta_trader
+    if hasattr(cycle, '_initialize_defaults'):
+        cycle._initialize_defaults()
+    for key, value in pickle.loads(data).items():
+        setattr(cycle, key, value)
+    return cycle
+
+
+def pocketbase_time(timestamp: float) -> str:
+    """Format a UNIX timestamp the way PocketBase stores 'created'/'updated'"""
+    moment = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+    return moment.strftime('%Y-%m-%d %H:%M:%S.') + f'{moment.microsecond // 1000:03d}Z'
+
+
+class CycleSnapshotStore:
+    """SQLite file holding the latest snapshot of a bot's cycles"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cycles (cycle_id TEXT PRIMARY KEY, state BLOB NOT NULL)")
+        return conn
+
+    def save(self, states: dict, saved_at: float = None):
+        """Replace the snapshot with the given {cycle_id: dump_cycle(cycle)} states in one transaction"""
+        saved_at = time.time() if saved_at is None else saved_at
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM cycles")
+                    conn.executemany("INSERT INTO cycles (cycle_id, state) VALUES (?, ?)",
+                                     ((str(cycle_id), sqlite3.Binary(state)) for cycle_id, state in states.items()))
+                    conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                     (('version', str(SNAPSHOT_VERSION)), ('saved_at', repr(saved_at))))
+            finally:
+                conn.close()
+
+    def load(self, max_age: float = None):
+        """Load the snapshot
+
+        Returns:
+            tuple: (saved_at, {cycle_id: state}), or (None, {}) if there is no usable snapshot
+        """
+        if not os.path.exists(self.path):
+            return None, {}
+        with self._lock:
+            conn = self._connect()
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta"))
+                if meta.get('version') != str(SNAPSHOT_VERSION) or 'saved_at' not in meta:
+                    return None, {}
+                saved_at = float(meta['saved_at'])
+                if max_age is not None and time.time() - saved_at > max_age:
+                    return None, {}
+                return saved_at, {cycle_id: bytes(state) for cycle_id, state in conn.execute("SELECT cycle_id, state FROM cycles")}
+            finally:
+                conn.close()
+
+    def clear(self):
+        """Drop the snapshot so the next start does a full sync"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM cycles")
+                    conn.execute("DELETE FROM meta")
+            finally:
+                conn.close()
@@ -0,0 +1,82 @@
+"""
+Cycle Sync - dirty tracking for the local DB -> PocketBase cycle sync
+
+The cycles manager mirrors every active AH/CT cycle to PocketBase. Instead of
+rebuilding each cycle object and pushing its full remote dict every second,
+it fingerprints the cycle row together with the rows of the orders the remote
+dict embeds, and only pushes cycles whose fingerprint differs from the one
+last pushed successfully. Cycle objects are cached per row and rebuilt only
+when the row changes.
+"""
+
+import hashlib
+import json
+import time
+
+
+def row_fingerprint(row) -> str:
+    """Digest of a DB row's column values (SQLAlchemy state and other private attributes skipped)"""
+    values = {key: value for key, value in vars(row).items() if not key.startswith('_')}
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class CycleSyncTracker:
+    """Cached cycle objects and last pushed fingerprints of one cycle type"""
+
+    def __init__(self, build, full_push_interval=300):
+        """
+        Args:
+            build: Callable turning a DB cycle row into a cycle object
+            full_push_interval: Seconds after which every cycle is pushed again,
+                so edits made on the remote side do not outlive the local state
+        """
+        self.build = build
+        self.full_push_interval = full_push_interval
+        self._cycles = {}  # cycle id -> (row fingerprint, cycle object)
+        self._pushed = {}  # cycle id -> fingerprint of the last successful push
+        self._last_full_push = time.monotonic()
+
+    def cycle(self, row, fingerprint=None):
+        """Cycle object of a row, rebuilt only if the row changed since the last call"""
+        fingerprint = fingerprint or row_fingerprint(row)
+        cached = self._cycles.get(row.id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        cycle_obj = self.build(row)
+        self._cycles[row.id] = (fingerprint, cycle_obj)
+        return cycle_obj
+
+    @staticmethod
+    def tickets(cycle_obj) -> list:
+        """Tickets of the orders a cycle's remote dict embeds"""
+        return list(cycle_obj.orders) + list(cycle_obj.closed)
+
+    def fingerprint(self, row_digest, tickets, order_rows) -> str:
+        """Fingerprint of everything a cycle's remote dict is built from (the cycle row and its order rows)"""
+        parts = [row_digest]
+        for ticket in tickets:
+            order_row = order_rows.get(ticket)
+            parts.append(row_fingerprint(order_row) if order_row is not None else f"missing:{ticket}")
+        return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+    def start_pass(self):
+        """Forget the pushed fingerprints once per full_push_interval"""
+        if time.monotonic() - self._last_full_push >= self.full_push_interval:
+            self._pushed.clear()
+            self._last_full_push = time.monotonic()
+
+    def is_dirty(self, cycle_id, fingerprint) -> bool:
+        """Check if a cycle changed since it was last pushed"""
+        return self._pushed.get(cycle_id) != fingerprint
+
+    def mark_pushed(self, cycle_id, fingerprint):
+        """Record a successful push"""
+        self._pushed[cycle_id] = fingerprint
+
+    def retain(self, cycle_ids):
+        """Drop the cache entries of cycles that are no longer synced"""
+        cycle_ids = set(cycle_ids)
+        for cache in (self._cycles, self._pushed):
+            for cycle_id in set(cache) - cycle_ids:
+                del cache[cycle_id]
@@ -1,6 +1,7 @@
 from cycles.ACT_cycle_Organized import AdvancedCycle as ACT_cycle
 from cycles.AH_cycle import cycle as AH_cycle
 from cycles.CT_cycle import cycle as CT_cycle
+from cycles.cycle_sync import CycleSyncTracker, row_fingerprint
 from DB.db_engine import engine
 from DB.ah_strategy.repositories.ah_repo import AHRepo
 from DB.ct_strategy.repositories.ct_repo import CTRepo
@@ -9,6 +10,7 @@ import time
 import asyncio
 import logging
 from Views.globals.app_logger import app_logger as logger
+from helpers.metrics import timed
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,9 @@ class cycles_manager:
         self.all_ACT_cycles = []
         self.remote_ACT_cycles = []
         self.account = account
+        # Cached cycle objects and pushed fingerprints, so only changed cycles are sent to PocketBase
+        self.ah_sync = CycleSyncTracker(lambda row: AH_cycle(row, self.mt5, self, "db"))
+        self.ct_sync = CycleSyncTracker(lambda row: CT_cycle(row, self.mt5, self, "db"))
 
     def get_all_AH_active_cycles(self):
         try:
@@ -126,12 +131,13 @@ class cycles_manager:
     async def run_cycles_manager(self):
         while True:
             try:
-                await asyncio.gather(
-                    self.sync_AH_cycles(),
-                    self.sync_CT_cycles(),
-                    # self.sync_ACT_cycles(),
-                    self.fix_incorrectly_closed_cycles()
-                )
+                with timed("cycles_manager", "sync_cycles"):
+                    await asyncio.gather(
+                        self.sync_AH_cycles(),
+                        self.sync_CT_cycles(),
+                        # self.sync_ACT_cycles(),
+                        self.fix_incorrectly_closed_cycles()
+                    )
                 await asyncio.sleep(1)
             except Exception as e:
                 logger.error(f"Error in run_cycles_manager: {e}")
@@ -146,53 +152,8 @@ class cycles_manager:
                 logger.error("remote_AH_cycles is None")
                 return
 
-            for remote_cycle in self.remote_AH_cycles:
-                try:
-                    if remote_cycle is None:
-                        logger.error(
-                            "Found None remote_cycle in remote_AH_cycles")
-                        continue
-
-                    cycle_id = remote_cycle.id
-                    if cycle_id not in [cycle.cycle_id for cycle in self.all_AH_cycles]:
-                        cycle_data = self.ah_repo.get_cycle_by_remote_id(
-                            cycle_id)
-                        if cycle_data is not None:
-                            cycle_obj = AH_cycle(
-                                cycle_data, self.mt5, self, "db")
-                            self.remote_api.update_AH_cycle_by_id(
-                                cycle_obj.cycle_id, cycle_obj.to_remote_dict())
-                        if cycle_data is None:
-                            try:
-                                cycle_obj = AH_cycle(
-                                    remote_cycle, self.mt5, self, "remote")
-                                self.ah_repo.create_cycle(cycle_obj.to_dict())
-                            except Exception as creation_error:
-                                logger.error(
-                                    f"Error creating AH cycle from remote data: {creation_error}")
-                except Exception as cycle_error:
-                    logger.error(
-                        f"Error processing remote AH cycle: {cycle_error}")
-
-            for cycle_data in self.all_AH_cycles:
-                try:
-                    if cycle_data is None:
-                        logger.error("Found None cycle_data in all_AH_cycles")
-                        continue
-
-                    cycle_obj = AH_cycle(cycle_data, self.mt5, self, "db")
-                    cycle_id = cycle_obj.cycle_id
-
-                    if not cycle_id:
-                        logger.error(
-                            f"Empty cycle_id for local AH cycle {cycle_data.id}")
-                        continue
-
-                    self.remote_api.update_AH_cycle_by_id(
-                        cycle_id, cycle_obj.to_remote_dict())
-                except Exception as local_cycle_error:
-                    logger.error(
-                        f"Error processing local AH cycle: {local_cycle_error}")
+            self._sync_cycles("AH", self.ah_repo, AH_cycle, self.ah_sync, self.all_AH_cycles,
+                              self.remote_AH_cycles, self.remote_api.update_AH_cycle_by_id)
         except Exception as e:
             logger.error(f"Error in sync_AH_cycles: {e}")
 
@@ -206,57 +167,84 @@ class cycles_manager:
                 logger.error("remote_CT_cycles is None")
                 return
 
-            for remote_cycle in self.remote_CT_cycles:
+            self._sync_cycles("CT", self.ct_repo, CT_cycle, self.ct_sync, self.all_CT_cycles,
+                              self.remote_CT_cycles, self.remote_api.update_CT_cycle_by_id)
+        except Exception as e:
+            logger.error(f"Error in sync_CT_cycles: {e}")
+
+    def _sync_cycles(self, cycle_type, repo, cycle_class, tracker, local_cycles, remote_cycles, update_remote):
+        """
+        Mirror the local active cycles of one strategy to PocketBase.
+
+        Remote cycles unknown locally are created in the local DB, and local cycles
+        are pushed only when their row or one of their order rows changed since the
+        last successful push.
+
+        Args:
+            cycle_type: "AH" or "CT", used in log messages
+            repo: The repository for the cycle type
+            cycle_class: The cycle class to instantiate
+            tracker: The CycleSyncTracker of the cycle type
+            local_cycles: Active cycle rows from the local DB
+            remote_cycles: Active cycle records from PocketBase
+            update_remote: Remote API method updating a cycle by ID
+        """
+        rows = [row for row in local_cycles if row is not None]
+        if len(rows) != len(local_cycles):
+            logger.error(f"Found None cycle_data in all_{cycle_type}_cycles")
+        local_ids = {row.id for row in rows}
+
+        for remote_cycle in remote_cycles:
+            try:
                 if remote_cycle is None:
-                    logger.error("Found None remote_cycle in remote_CT_cycles")
+                    logger.error(f"Found None remote_cycle in remote_{cycle_type}_cycles")
+                    continue
+                if remote_cycle.id in local_ids:
                     continue
 
+                cycle_data = repo.get_cycle_by_remote_id(remote_cycle.id)
+                if cycle_data is not None:
+                    # Closed locally but still active remotely, push the local state
+                    rows.append(cycle_data)
+                    local_ids.add(cycle_data.id)
+                    continue
                 try:
-                    cycle_id = remote_cycle.id
-
-                    if cycle_id not in [cycle.cycle_id for cycle in self.all_CT_cycles]:
-                        cycle_data = self.ct_repo.get_cycle_by_remote_id(
-                            cycle_id)
-
-                        if cycle_data is not None:
-                            cycle_obj = CT_cycle(
-                                cycle_data, self.mt5, self, "db")
-                            self.remote_api.update_CT_cycle_by_id(
-                                cycle_obj.cycle_id, cycle_obj.to_remote_dict())
-                        if cycle_data is None:
-                            try:
-                                cycle_obj = CT_cycle(
-                                    remote_cycle, self.mt5, self, "remote")
-                                self.ct_repo.create_cycle(cycle_obj.to_dict())
-                            except Exception as creation_error:
-                                logger.error(
-                                    f"Error creating cycle from remote data: {creation_error}")
-                except Exception as cycle_error:
+                    cycle_obj = cycle_class(remote_cycle, self.mt5, self, "remote")
+                    repo.create_cycle(cycle_obj.to_dict())
+                except Exception as creation_error:
                     logger.error(
-                        f"Error processing remote cycle: {cycle_error}")
+                        f"Error creating {cycle_type} cycle from remote data: {creation_error}")
+            except Exception as cycle_error:
+                logger.error(f"Error processing remote {cycle_type} cycle: {cycle_error}")
 
-            for cycle_data in self.all_CT_cycles:
-                try:
-                    if cycle_data is None:
-                        logger.error("Found None cycle_data in all_CT_cycles")
-                        continue
+        tracker.start_pass()
+        cycles = []
+        for row in rows:
+            try:
+                row_digest = row_fingerprint(row)
+                cycle_obj = tracker.cycle(row, row_digest)
+                if not cycle_obj.cycle_id:
+                    logger.error(f"Empty cycle_id for local {cycle_type} cycle {row.id}")
+                    continue
+                cycles.append((row_digest, cycle_obj))
+            except Exception as local_cycle_error:
+                logger.error(f"Error processing local {cycle_type} cycle: {local_cycle_error}")
 
-                    cycle_obj = CT_cycle(cycle_data, self.mt5, self, "db")
-                    cycle_id = cycle_obj.cycle_id
+        # One query for the orders of every cycle instead of one per order
+        tickets = {ticket for _, cycle_obj in cycles for ticket in tracker.tickets(cycle_obj)}
+        order_rows = repo.get_orders_by_tickets(tickets) if tickets else {}
 
-                    if not cycle_id:
-                        logger.error(
-                            f"Empty cycle_id for local cycle {cycle_data.id}")
-                        continue
+        for row_digest, cycle_obj in cycles:
+            try:
+                fingerprint = tracker.fingerprint(row_digest, tracker.tickets(cycle_obj), order_rows)
+                if not tracker.is_dirty(cycle_obj.cycle_id, fingerprint):
+                    continue
+                if update_remote(cycle_obj.cycle_id, cycle_obj.to_remote_dict()) is not None:
+                    tracker.mark_pushed(cycle_obj.cycle_id, fingerprint)
+            except Exception as local_cycle_error:
+                logger.error(f"Error processing local {cycle_type} cycle: {local_cycle_error}")
 
-                    remote_dict = cycle_obj.to_remote_dict()
-                    self.remote_api.update_CT_cycle_by_id(
-                        cycle_id, remote_dict)
-                except Exception as local_cycle_error:
-                    logger.error(
-                        f"Error processing local cycle: {local_cycle_error}")
-        except Exception as e:
-            logger.error(f"Error in sync_CT_cycles: {e}")
+        tracker.retain(cycle_obj.cycle_id for _, cycle_obj in cycles)
 
     async def sync_ACT_cycles(self):
         """
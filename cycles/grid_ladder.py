@@ -0,0 +1,127 @@
+"""
+Grid Ladder - precomputed grid level prices of a cycle
+
+Grid level n (n >= 1) sits at start_price +/- (interval_pips * (n - 1) * pip_value),
+above the start for BUY grids and below it for SELL grids. The prices are
+kept in an array that is only rebuilt when the start price, interval or
+direction change, and "which level has price reached" is a bisect over it.
+
+Level occupancy (active orders / pending orders) is a bitmap refreshed from
+the cycle's OrderStore and pending level set only when those change, so the
+next level, "does this level exist" and gap checks are O(1) per tick.
+"""
+
+from array import array
+from bisect import bisect_right
+
+ACTIVE = 1
+PENDING = 2
+
+
+class GridLadder:
+    """Grid level prices and occupancy of one cycle"""
+
+    def __init__(self, levels=16):
+        self.direction = None
+        self.start_price = 0.0
+        self.interval_pips = 0.0
+        self.pip_value = 0.0
+        self._sign = 1
+        self._capacity = max(int(levels), 1)
+        # Prices multiplied by the direction sign, so the array ascends for BUY and SELL grids alike
+        self._keys = array('d')
+        self.rebuilds = 0
+
+        self._occupancy = bytearray()
+        self._occupancy_key = None
+        self.active_orders = 0
+        self.active_levels = 0
+        self.min_active_level = 0
+        self.max_active_level = 0
+
+    # ==================== PRICES ====================
+
+    def configure(self, direction, start_price, interval_pips, pip_value) -> bool:
+        """Set the ladder geometry, rebuilding the prices only if it changed
+
+        Returns:
+            bool: True if the prices were rebuilt
+        """
+        geometry = (direction, float(start_price), float(interval_pips), float(pip_value))
+        if geometry == (self.direction, self.start_price, self.interval_pips, self.pip_value) and self._keys:
+            return False
+        self.direction, self.start_price, self.interval_pips, self.pip_value = geometry
+        self._sign = -1 if direction == 'SELL' else 1
+        self._keys = array('d')
+        self._grow(self._capacity)
+        self.rebuilds += 1
+        return True
+
+    def _grow(self, levels):
+        start, interval, pip, sign = self.start_price, self.interval_pips, self.pip_value, self._sign
+        for n in range(len(self._keys) + 1, levels + 1):
+            # Same expression the order placement used, so prices match to the last bit
+            price = start + (interval * (n - 1) * pip) if sign > 0 else start - (interval * (n - 1) * pip)
+            self._keys.append(sign * price)
+        self._capacity = max(self._capacity, levels)
+
+    def price(self, level: int) -> float:
+        """Target price of a grid level (1-based)"""
+        if level > len(self._keys):
+            self._grow(max(level, 2 * len(self._keys)))
+        return self._sign * self._keys[level - 1]
+
+    def level_at(self, price: float) -> int:
+        """Highest grid level the price has reached in the grid direction, 0 if none"""
+        if not self._keys:
+            return 0
+        key = self._sign * price
+        step = self.interval_pips * self.pip_value
+        if key >= self._keys[-1] and step > 0:
+            self._grow(int((key - self._keys[0]) / step) + 2)
+        return bisect_right(self._keys, key)
+
+    # ==================== OCCUPANCY ====================
+
+    def sync(self, store, pending_levels=()) -> bool:
+        """Refresh the occupancy bitmap if the cycle's orders or pending levels changed
+
+        Returns:
+            bool: True if the bitmap was rebuilt
+        """
+        counts = store.active_level_counts()
+        pending = frozenset(int(level) for level in pending_levels
+                            if isinstance(level, (int, float)) and level >= 0 and level == int(level))
+        key = (id(store), store.version, pending)
+        if key == self._occupancy_key:
+            return False
+        self._occupancy_key = key
+
+        occupancy = bytearray(max(max(counts, default=0), max(pending, default=0)) + 1)
+        for level in counts:
+            occupancy[level] |= ACTIVE
+        for level in pending:
+            occupancy[level] |= PENDING
+        self._occupancy = occupancy
+
+        grid_levels = [level for level in counts if level > 0]
+        self.active_orders = sum(counts[level] for level in grid_levels)
+        self.active_levels = len(grid_levels)
+        self.min_active_level = min(grid_levels, default=0)
+        self.max_active_level = max(grid_levels, default=0)
+        return True
+
+    def is_occupied(self, level: int, states=ACTIVE | PENDING) -> bool:
+        """Check if a level has an active and/or pending order"""
+        return 0 <= level < len(self._occupancy) and bool(self._occupancy[level] & states)
+
+    def next_level(self) -> int:
+        """Grid level after the highest active one (1 when no grid level is active)"""
+        return self.max_active_level + 1
+
+    def has_gaps(self) -> bool:
+        """Check if active grid levels are not consecutive (or a level holds several orders)"""
+        if self.active_orders <= 1:
+            return False
+        return (self.active_orders != self.active_levels
+                or self.max_active_level - self.min_active_level + 1 != self.active_levels)
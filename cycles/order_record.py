@@ -0,0 +1,155 @@
+"""
+Order Record - compact in-memory order for MoveGuard and ACT cycles
+
+Orders are persisted to PocketBase as JSON dicts, but a long-running
+account keeps thousands of closed orders in memory. OrderRecord stores the
+known order fields in __slots__ instead of a per-order dict, keeps
+``order_id`` and ``ticket`` in a single slot, and interns the repeated
+string values (status, direction, symbol, ...). Unknown keys go to a small
+overflow dict so nothing read from the database is lost.
+
+Orders are wrapped where they enter a cycle (load and add-order paths, see
+to_record), so the cycle order lists hold records only. OrderRecord is a
+MutableMapping, so existing ``order.get('profit')`` / ``order['status'] = ...``
+code keeps working; hot loops read the attributes directly
+(``getattr(order, 'profit', 0.0)``, unset fields have no attribute).
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+ORDER_FIELDS = (
+    'ticket', 'status', 'grid_level', 'order_type', 'direction', 'type', 'kind', 'symbol',
+    'price', 'open_price', 'close_price', 'target_price', 'volume', 'lot_size',
+    'profit', 'profit_pips', 'swap', 'commission', 'sl', 'tp', 'stop_loss', 'take_profit',
+    'magic_number', 'comment', 'placed_at', 'open_time', 'close_time', 'closed_at',
+    'close_reason', 'is_initial', 'is_grid', 'is_closed', 'is_active',
+)
+
+# order_id and ticket always hold the same order number
+_ALIASES = {'order_id': 'ticket'}
+_FIELDS = frozenset(ORDER_FIELDS)
+_INTERNED = frozenset(('status', 'order_type', 'direction', 'type', 'kind', 'symbol', 'close_reason', 'comment'))
+
+
+class OrderRecord(MutableMapping):
+    """Slotted order with a dict-compatible interface"""
+
+    __slots__ = ORDER_FIELDS + ('_extra',)
+
+    def __init__(self, data=None, **kwargs):
+        self._extra = None
+        if data:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from an order dict loaded from the database"""
+        return cls(data)
+
+    def to_dict(self):
+        """Plain dict for JSON / PocketBase persistence (includes both order_id and ticket)"""
+        return {key: self[key] for key in self}
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        return self.__class__(self)
+
+    def __reduce__(self):
+        return (self.__class__, (self.to_dict(),))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    # ==================== MAPPING INTERFACE ====================
+
+    def __getitem__(self, key):
+        name = _ALIASES.get(key, key)
+        if name in _FIELDS:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        name = _ALIASES.get(key, key)
+        if name in _FIELDS:
+            return getattr(self, name, default)
+        return self._extra.get(key, default) if self._extra else default
+
+    def __setitem__(self, key, value):
+        name = _ALIASES.get(key, key)
+        if name in _FIELDS:
+            if name in _INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, name, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        name = _ALIASES.get(key, key)
+        if name in _FIELDS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        name = _ALIASES.get(key, key)
+        if name in _FIELDS:
+            return hasattr(self, name)
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self):
+        for name in ORDER_FIELDS:
+            if hasattr(self, name):
+                if name == 'ticket':
+                    yield 'order_id'
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def to_record(order):
+    """OrderRecord for an order dict (records and non-dict entries are returned as-is)"""
+    return OrderRecord(order) if isinstance(order, dict) else order
+
+
+def orders_from_dicts(orders):
+    """Convert a list of order dicts to OrderRecords (records and non-dict entries are kept as-is)"""
+    if not orders:
+        return []
+    return [to_record(o) for o in orders]
+
+
+def to_plain(value):
+    """Recursively replace OrderRecords with plain dicts"""
+    if isinstance(value, OrderRecord):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    return value
+
+
+def json_default(obj):
+    """json.dumps ``default`` hook for OrderRecords"""
+    if isinstance(obj, OrderRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
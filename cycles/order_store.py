@@ -0,0 +1,270 @@
+"""
+Order Store - indexed list of a cycle's orders
+
+Keeps the cycle's orders in a regular list (so JSON serialization and
+existing iteration keep working) while maintaining indexes by ticket,
+by status and by grid level. Lookups and status views cost O(1) or
+O(open orders) instead of a scan over the cycle's full order history.
+"""
+
+from collections import Counter, defaultdict
+from cycles.order_record import OrderRecord
+
+OPEN_STATUSES = ('active', 'pending')
+_ACTIVE_LEVELS = ('levels', 'active')  # _views key of the active level counts
+
+
+def order_ticket(order):
+    """Normalized ticket of an order record (order_id and ticket share a slot), or None"""
+    ticket = getattr(order, 'ticket', None)
+    return str(ticket) if ticket is not None else None
+
+
+class OrderStore(list):
+    """
+    List of OrderRecords indexed by ticket, status and grid level
+
+    The indexes follow list mutations (append, remove, slicing, ...).
+    Status changes should go through set_status(); direct writes to an
+    open order's 'status' or 'grid_level' key are picked up the next time a
+    view is read, since open orders are re-checked then. ``version`` grows
+    on every index change so derived state (e.g. a GridLadder) can tell
+    when to refresh.
+    """
+
+    def __init__(self, orders=()):
+        super().__init__(orders)
+        self.reindex()
+
+    def __reduce_ex__(self, protocol):
+        # copy/deepcopy/pickle rebuild through __init__ so the indexes exist
+        return (self.__class__, (list(self),))
+
+    # ==================== INDEX MAINTENANCE ====================
+
+    def reindex(self):
+        """Rebuild all indexes from the list contents"""
+        self._by_ticket = defaultdict(dict)
+        self._by_status = defaultdict(dict)
+        self._by_level = defaultdict(dict)
+        self._keys = {}
+        self._refs = {}
+        self._views = {}
+        self.version = getattr(self, 'version', 0) + 1
+        for order in self:
+            self._index(order)
+
+    def _index(self, order):
+        if not isinstance(order, OrderRecord):
+            return
+        key = id(order)
+        self._refs[key] = self._refs.get(key, 0) + 1
+        if self._refs[key] > 1:
+            return
+        ticket = order_ticket(order)
+        status = getattr(order, 'status', None)
+        level = getattr(order, 'grid_level', None)
+        if ticket is not None:
+            self._by_ticket[ticket][key] = order
+        self._by_status[status][key] = order
+        if level is not None:
+            self._by_level[level][key] = order
+        self._keys[key] = (ticket, status, level)
+        self._changed()
+
+    def _unindex(self, order):
+        key = id(order)
+        if key not in self._keys:
+            return
+        self._refs[key] -= 1
+        if self._refs[key] > 0:
+            return
+        del self._refs[key]
+        ticket, status, level = self._keys.pop(key)
+        if ticket is not None:
+            self._drop(self._by_ticket, ticket, key)
+        self._drop(self._by_status, status, key)
+        if level is not None:
+            self._drop(self._by_level, level, key)
+        self._changed()
+
+    def _changed(self):
+        self._views.clear()
+        self.version += 1
+
+    @staticmethod
+    def _drop(index, value, key):
+        bucket = index.get(value)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del index[value]
+
+    def _move_status(self, order, status):
+        key = id(order)
+        ticket, old_status, level = self._keys[key]
+        if old_status == status:
+            return
+        self._drop(self._by_status, old_status, key)
+        self._by_status[status][key] = order
+        self._keys[key] = (ticket, status, level)
+        self._changed()
+
+    def _move_level(self, order, level):
+        key = id(order)
+        ticket, status, old_level = self._keys[key]
+        if old_level == level:
+            return
+        if old_level is not None:
+            self._drop(self._by_level, old_level, key)
+        if level is not None:
+            self._by_level[level][key] = order
+        self._keys[key] = (ticket, status, level)
+        self._changed()
+
+    def _revalidate_open(self):
+        """Re-bucket open orders whose status or grid level was written directly"""
+        keys = self._keys
+        for status in OPEN_STATUSES:
+            bucket = self._by_status.get(status)
+            if not bucket:
+                continue
+            stale = [o for k, o in bucket.items()
+                     if getattr(o, 'status', None) != status or getattr(o, 'grid_level', None) != keys[k][2]]
+            for order in stale:
+                self._move_level(order, getattr(order, 'grid_level', None))
+                self._move_status(order, getattr(order, 'status', None))
+
+    # ==================== LIST MUTATIONS ====================
+
+    def append(self, order):
+        super().append(order)
+        self._index(order)
+
+    def extend(self, orders):
+        orders = list(orders)
+        super().extend(orders)
+        for order in orders:
+            self._index(order)
+
+    def __iadd__(self, orders):
+        self.extend(orders)
+        return self
+
+    def insert(self, index, order):
+        super().insert(index, order)
+        self._index(order)
+
+    def remove(self, order):
+        super().remove(order)
+        self._unindex(order)
+
+    def pop(self, index=-1):
+        order = super().pop(index)
+        self._unindex(order)
+        return order
+
+    def clear(self):
+        super().clear()
+        self.reindex()
+
+    def __setitem__(self, index, value):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__setitem__(index, value)
+        for order in removed:
+            self._unindex(order)
+        for order in (self[index] if isinstance(index, slice) else [value]):
+            self._index(order)
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for order in removed:
+            self._unindex(order)
+
+    # ==================== LOOKUPS ====================
+
+    def set_status(self, order, status):
+        """Set an order's status and keep the status index in sync"""
+        order['status'] = status
+        if id(order) in self._keys:
+            self._move_status(order, status)
+        return order
+
+    def set_grid_level(self, order, grid_level):
+        """Set an order's grid level and keep the level index in sync"""
+        order['grid_level'] = grid_level
+        if id(order) in self._keys:
+            self._move_level(order, grid_level)
+        return order
+
+    def get(self, ticket):
+        """Get the first order with the given ticket, or None"""
+        if ticket is None:
+            return None
+        bucket = self._by_ticket.get(str(ticket))
+        return next(iter(bucket.values())) if bucket else None
+
+    def has_ticket(self, ticket):
+        """Check if an order with the given ticket is in the store"""
+        return ticket is not None and str(ticket) in self._by_ticket
+
+    def with_status(self, status):
+        """Orders with the given status (cached until the store changes)"""
+        self._revalidate_open()
+        view = self._views.get(status)
+        if view is None:
+            view = list(self._by_status.get(status, {}).values())
+            self._views[status] = view
+        return list(view)
+
+    def active(self):
+        """Orders with status 'active'"""
+        return self.with_status('active')
+
+    def pending(self):
+        """Orders with status 'pending'"""
+        return self.with_status('pending')
+
+    def closed(self):
+        """Orders with status 'closed'"""
+        return self.with_status('closed')
+
+    def open_orders(self):
+        """Active and pending orders"""
+        return self.active() + self.pending()
+
+    def at_level(self, grid_level, statuses=None):
+        """Orders placed at a grid level, optionally limited to some statuses"""
+        if statuses is not None:
+            self._revalidate_open()
+        orders = list(self._by_level.get(grid_level, {}).values())
+        if statuses is None:
+            return orders
+        return [o for o in orders if getattr(o, 'status', None) in statuses]
+
+    def active_level_counts(self):
+        """Number of active orders per integer grid level (cached until the store changes)"""
+        self._revalidate_open()
+        counts = self._views.get(_ACTIVE_LEVELS)
+        if counts is None:
+            counts = Counter()
+            for key in self._by_status.get('active', {}):
+                level = self._keys[key][2]
+                if isinstance(level, (int, float)) and level >= 0 and level == int(level):
+                    counts[int(level)] += 1
+            self._views[_ACTIVE_LEVELS] = counts
+        return counts
+
+    def levels(self, statuses=None):
+        """Grid levels that have orders, optionally limited to some statuses"""
+        if statuses is None:
+            return set(self._by_level)
+        self._revalidate_open()
+        levels = set()
+        for status in statuses:
+            for order in self._by_status.get(status, {}).values():
+                level = getattr(order, 'grid_level', None)
+                if level is not None:
+                    levels.add(level)
+        return levels
@@ -0,0 +1,168 @@
+"""
+Startup profile - where the cold start time of the app goes.
+
+Opt-in with the STARTUP_PROFILE environment variable, which the MetaTrader
+account processes inherit. When enabled it records:
+
+- the import time of every module (self time, nested imports excluded)
+- named marks relative to process start ("db ready", "mt5 connected", ...)
+- the time to first tick of every bot, i.e. the first stage timing recorded
+  under the bot's metrics label
+
+and logs a report once the process has been up for STARTUP_PROFILE_REPORT_AFTER
+seconds (default 60). If STARTUP_PROFILE is a file path rather than "1", the
+report is also appended to that file.
+
+Usage (first lines of the entry point, before the heavy imports):
+    from helpers import startup_profile
+    startup_profile.install()
+"""
+
+import importlib.abc
+import os
+import sys
+import threading
+import time
+
+_started = time.perf_counter()
+_lock = threading.Lock()
+_import_times = {}  # module name -> self seconds
+_marks = []  # (label, seconds since start)
+_first_ticks = {}  # bot label -> seconds since start
+_stack = []  # [inclusive children seconds] per module being executed on the importing thread
+_finder = None
+
+
+def enabled() -> bool:
+    """Check if the startup profile is recording"""
+    return _finder is not None
+
+
+def _elapsed() -> float:
+    return time.perf_counter() - _started
+
+
+class _TimedLoader:
+    """Loader proxy timing exec_module, restored on the module once it is loaded"""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        _stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - started
+            children = _stack.pop()
+            if _stack:
+                _stack[-1] += total
+            with _lock:
+                _import_times[module.__name__] = _import_times.get(module.__name__, 0.0) + total - children
+            module.__loader__ = self._loader
+            if getattr(module, '__spec__', None) is not None:
+                module.__spec__.loader = self._loader
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps the loaders found by the other finders"""
+
+    def find_spec(self, name, path, target=None):
+        if threading.current_thread() is not threading.main_thread():
+            return None  # The stack of nested imports is only tracked on the main thread
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader)
+            return spec
+        return None
+
+
+def install(report_after=None):
+    """Start recording if STARTUP_PROFILE is set; safe to call more than once"""
+    global _finder
+    setting = os.environ.get("STARTUP_PROFILE", "")
+    if _finder is not None or setting.lower() in ("", "0", "false", "no"):
+        return False
+    _finder = _TimingFinder()
+    sys.meta_path.insert(0, _finder)
+
+    from helpers.metrics import set_stage_listener
+    set_stage_listener(_on_stage)
+
+    if report_after is None:
+        report_after = float(os.environ.get("STARTUP_PROFILE_REPORT_AFTER", "60"))
+    path = setting if setting.lower() not in ("1", "true", "yes") else None
+    timer = threading.Timer(report_after, write_report, args=(path,))
+    timer.daemon = True
+    timer.start()
+    return True
+
+
+def uninstall():
+    """Stop recording imports and first ticks"""
+    global _finder
+    if _finder is None:
+        return
+    if _finder in sys.meta_path:
+        sys.meta_path.remove(_finder)
+    _finder = None
+    from helpers.metrics import set_stage_listener
+    set_stage_listener(None)
+
+
+def mark(label):
+    """Record that a startup step finished"""
+    if _finder is None:
+        return
+    with _lock:
+        _marks.append((label, _elapsed()))
+
+
+def _on_stage(component, stage, bot):
+    """Metrics stage listener: the first stage a bot records is its first tick"""
+    if bot in _first_ticks or bot == "-" or bot.startswith("account-"):
+        return
+    with _lock:
+        _first_ticks.setdefault(bot, _elapsed())
+
+
+def report(top=25) -> str:
+    """Text report of the slowest imports, the startup marks and the time to first tick per bot"""
+    with _lock:
+        imports = sorted(_import_times.items(), key=lambda item: item[1], reverse=True)
+        marks = list(_marks)
+        first_ticks = sorted(_first_ticks.items(), key=lambda item: item[1])
+    lines = [f"Startup profile of process {os.getpid()} ({_elapsed():.2f}s since start)",
+             f"Imports: {len(imports)} modules, {sum(seconds for _, seconds in imports):.3f}s in total"]
+    lines += [f"  {seconds * 1000:9.1f} ms  {name}" for name, seconds in imports[:top]]
+    lines.append("Marks:")
+    lines += [f"  {seconds:9.3f} s   {label}" for label, seconds in marks]
+    lines.append("Time to first tick:")
+    lines += [f"  {seconds:9.3f} s   bot {bot}" for bot, seconds in first_ticks]
+    return "\n".join(lines)
+
+
+def write_report(path=None):
+    """Log the report, and append it to a file if a path is given"""
+    from Views.globals.app_logger import app_logger as logger
+
+    text = report()
+    logger.info(text)
+    if path:
+        try:
+            with open(path, "a", encoding="utf-8") as handle:
+                handle.write(text + "\n\n")
+        except OSError as e:
+            logger.error(f"Could not write the startup profile to {path}: {e}")
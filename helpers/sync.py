@@ -42,7 +42,8 @@ class DummyLock:
         pass
 
 
-# Global lock for MetaTrader 5 operations - replaced with dummy lock
+# Global lock for MetaTrader 5 operations - replaced with dummy lock.
+# Terminal calls are serialized by the MT5 gateway thread (MetaTrader/MT5Gateway.py) instead.
 MT5_LOCK = DummyLock()  # Previously: threading.Lock()
 
 
@@ -1,27 +1,31 @@
-import flet
-from fletx import Xapp, route
-from Views.login.metatrader_login_page import Mt5LoginPageView
-from Views.login.pocketbase_login_page import RemoteLoginPageView
-from Views.users.UserPageView import UserPageView
-from Views.home.add_account import AddAccountView
-from Views.users.AccountPageView import AccountPageView
-from Views.users.BotsPageView import BotsPageView
-from Views.home.homepage import HomePageView
-from Views.globals.app_router import AppRoutes
+from helpers import startup_profile
+startup_profile.install()  # Before the heavy imports, so they show up in the profile
+
 from Views.globals.app_logger import app_logger
 import threading
 import asyncio
 
-from DB.remote_login.repositories.remote_login_repo import RemoteLoginRepo
-
-from Views.auth.auth import login
 from DB.db_engine import engine, create_db_and_tables
 from helpers.store import store
 
 import multiprocessing
 
 
-def main(page: flet.Page):
+def main(page: "flet.Page"):
+    # The GUI modules are imported here rather than at module level: the account processes
+    # started with multiprocessing re-import this module and never show a view
+    from fletx import Xapp, route
+    from Views.login.metatrader_login_page import Mt5LoginPageView
+    from Views.login.pocketbase_login_page import RemoteLoginPageView
+    from Views.users.UserPageView import UserPageView
+    from Views.home.add_account import AddAccountView
+    from Views.users.AccountPageView import AccountPageView
+    from Views.users.BotsPageView import BotsPageView
+    from Views.home.homepage import HomePageView
+    from Views.globals.app_router import AppRoutes
+    from DB.remote_login.repositories.remote_login_repo import RemoteLoginRepo
+    from Views.auth.auth import login
+
     # 0. Register Globals
     # Register the page to the AppState to allow changing the page route from anywhere
     page.title = "Patrick Display"
@@ -40,6 +44,7 @@ def main(page: flet.Page):
         ],
     )
     page.on_close = terminate_all_processes
+    startup_profile.mark("views ready")
 
     async def fetch_data():
         try:
@@ -72,8 +77,10 @@ if __name__ == "__main__":
         app_logger.info("Initializing database...")
         create_db_and_tables()
         app_logger.info("Database initialization complete")
+        startup_profile.mark("db ready")
     except Exception as e:
         app_logger.error(f"Database initialization error: {e}")
         # Continue with app startup even if database initialization fails
 
+    import flet
     flet.app(main)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Test script for ACT cycle order handling
+Checks that orders loaded from PocketBase survive the live data update and are saved back intact
+"""
+
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import MetaTrader5  # noqa: F401
+except ImportError:
+    # The simulator carries the MetaTrader5 constants, enough to import the cycle modules off Windows
+    import MetaTrader.SimulatedMT5
+    sys.modules['MetaTrader5'] = MetaTrader.SimulatedMT5
+
+# The DB engine creates database.db in the working directory on import
+os.chdir(tempfile.mkdtemp())
+
+from cycles.ACT_cycle_Organized import AdvancedCycle
+from cycles.order_record import OrderRecord
+
+
+class FakeClient:
+    """PocketBase client stand-in recording the cycle updates"""
+
+    def __init__(self):
+        self.updates = []
+
+    def update_ACT_cycle_by_id(self, cycle_id, data):
+        self.updates.append((cycle_id, data))
+
+
+class FakeMetaTrader:
+    """MetaTrader stand-in returning fixed open positions"""
+
+    def __init__(self, positions):
+        self.positions = positions
+
+    def get_all_positions(self):
+        return self.positions
+
+
+def make_order(ticket, status='active', profit=0.0):
+    return {'ticket': str(ticket), 'order_id': str(ticket), 'type': 0, 'direction': 'BUY',
+            'price': 1.1, 'volume': 0.01, 'profit': profit, 'swap': 0.0, 'commission': 0.0,
+            'status': status, 'is_closed': status == 'closed'}
+
+
+def make_cycle(positions):
+    """ACT cycle built from a PocketBase record, JSON fields as strings"""
+    cycle_data = {
+        'id': 'act-cycle-1', 'account': 'account-1', 'bot': 'bot-1', 'symbol': 'EURUSD',
+        'direction': 'BUY', 'status': 'ACTIVE', 'is_closed': False,
+        'active_orders': json.dumps([make_order(101), make_order(102)]),
+        'completed_orders': json.dumps([make_order(90, status='closed', profit=3.5)]),
+        'orders': json.dumps([make_order(101), make_order(102), make_order(90, status='closed', profit=3.5)]),
+    }
+    bot = SimpleNamespace(client=FakeClient(), magic_number=7, configs={
+        'lot_size': 0.01, 'reversal_threshold_pips': 300.0, 'order_interval_pips': 50.0,
+        'initial_order_stop_loss_pips': 300.0, 'cycle_interval_pips': 100.0})
+    return AdvancedCycle(cycle_data, FakeMetaTrader(positions), bot), bot.client
+
+
+def test_loaded_orders_survive_live_update():
+    """Order records loaded from PocketBase stay in the cycle after a live data update"""
+    positions = [SimpleNamespace(ticket=101, profit=12.5, swap=-0.2, commission=0.0, volume=0.01),
+                 SimpleNamespace(ticket=102, profit=-4.0, swap=0.0, commission=0.0, volume=0.01)]
+    act_cycle, _ = make_cycle(positions)
+    assert all(isinstance(order, OrderRecord) for order in act_cycle.active_orders)
+
+    act_cycle.update_orders_with_live_data()
+
+    assert [order['ticket'] for order in act_cycle.active_orders] == ['101', '102']
+    assert [order['ticket'] for order in act_cycle.completed_orders] == ['90']
+    assert act_cycle.active_orders[0]['profit'] == 12.5 and act_cycle.active_orders[1]['profit'] == -4.0
+    print("✅ Loaded orders survive the live data update")
+    return True
+
+
+def test_updated_orders_saved_as_json():
+    """The cycle update sent to PocketBase carries the order records as plain JSON objects"""
+    positions = [SimpleNamespace(ticket=101, profit=12.5, swap=-0.2, commission=0.0, volume=0.01)]
+    act_cycle, client = make_cycle(positions)
+
+    act_cycle.update_orders_with_live_data()
+
+    assert len(client.updates) == 1
+    cycle_id, data = client.updates[0]
+    active_orders = data['active_orders']
+    assert json.loads(json.dumps(active_orders)) == active_orders
+    assert cycle_id == 'act-cycle-1'
+    assert [order['ticket'] for order in active_orders] == ['101', '102']
+    assert active_orders[0]['profit'] == 12.5
+    assert [order['ticket'] for order in data['completed_orders']] == ['90']
+    print("✅ Updated orders are saved as plain JSON objects")
+    return True
+
+
+def test_added_orders_become_records():
+    """Orders added at runtime as dicts, objects or tickets are kept as records"""
+    act_cycle, _ = make_cycle([])
+    assert act_cycle.add_order(make_order(103))
+    assert act_cycle.add_order(SimpleNamespace(ticket=104, type=0, price_open=1.1, volume=0.01, profit=0.0))
+    assert act_cycle.add_order(105)
+    assert all(isinstance(order, OrderRecord) for order in act_cycle.active_orders)
+    assert [str(order.ticket) for order in act_cycle.active_orders] == ['101', '102', '103', '104', '105']
+
+    # Plain dicts put straight into the lists are compacted on the next cleanup
+    act_cycle.completed_orders.append(make_order(91, status='closed'))
+    act_cycle.cleanup_order_lists()
+    assert all(isinstance(order, OrderRecord) for order in act_cycle.completed_orders)
+    print("✅ Added orders are stored as records")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_loaded_orders_survive_live_update,
+        test_updated_orders_saved_as_json,
+        test_added_orders_become_records,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+"""
+Test script for the async PocketBase client
+Runs AsyncAPI against a local stub HTTP server and checks paging, writes,
+bounded concurrency, connection reuse and request timeouts
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Api.AsyncAPIHandler import AsyncAPI
+
+
+class StubPocketBase(BaseHTTPRequestHandler):
+    """Minimal PocketBase records API backed by an in-memory dict"""
+    protocol_version = "HTTP/1.1"
+    records = {"events": [{"id": f"ev{i}", "account": "acc1", "bot": "bot1", "collectionId": "c1"} for i in range(5)]}
+    writes = []
+    client_ports = set()
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+    delay = 0.0
+    subscribed = threading.Event()
+    realtime_subscriptions = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _track(self):
+        cls = StubPocketBase
+        with cls.lock:
+            cls.client_ports.add(self.client_address[1])
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(cls.delay)
+        with cls.lock:
+            cls.in_flight -= 1
+
+    def do_GET(self):
+        if self.path.startswith("/api/realtime"):
+            return self._stream_realtime()
+        self._track()
+        url = urlparse(self.path)
+        collection = url.path.split("/")[3]
+        query = parse_qs(url.query)
+        page, per_page = int(query["page"][0]), int(query["perPage"][0])
+        items = self.records.get(collection, [])
+        self._reply(200, {"page": page, "perPage": per_page, "items": items[(page - 1) * per_page:page * per_page]})
+
+    def do_PATCH(self):
+        self._track()
+        length = int(self.headers["Content-Length"])
+        data = json.loads(self.rfile.read(length))
+        record_id = urlparse(self.path).path.split("/")[-1]
+        StubPocketBase.writes.append((record_id, data, self.headers.get("Authorization")))
+        self._reply(200, {"id": record_id, **data})
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        data = json.loads(self.rfile.read(length))
+        if self.path == "/api/realtime":
+            StubPocketBase.realtime_subscriptions = data["subscriptions"]
+            StubPocketBase.subscribed.set()
+        self._reply(204)
+
+    def _stream_realtime(self):
+        """Send PB_CONNECT, wait for the subscription, push one record event and close"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.close_connection = True
+        self.wfile.write(b'id:client1\nevent:PB_CONNECT\ndata:{"clientId":"client1"}\n\n')
+        self.wfile.flush()
+        StubPocketBase.subscribed.wait(5)
+        topic = StubPocketBase.realtime_subscriptions[0]
+        payload = json.dumps({"action": "create", "record": {"id": "ev9", "account": "acc1", "bot": "bot1"}})
+        self.wfile.write(f"event:{topic}\ndata:{payload}\n\n".encode())
+        self.wfile.flush()
+
+    def do_DELETE(self):
+        self._track()
+        self._reply(204)
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPocketBase)
+    server.handle_error = lambda request, client_address: None  # Client-side timeouts drop connections
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def reset_stub():
+    StubPocketBase.writes = []
+    StubPocketBase.client_ports = set()
+    StubPocketBase.max_in_flight = 0
+    StubPocketBase.delay = 0.0
+
+
+def test_paging_and_records():
+    """get_full_list pages until a short page and returns attribute records"""
+    server, url = start_stub_server()
+    reset_stub()
+
+    async def run():
+        async with AsyncAPI(url, token="tok") as api:
+            api_items = await api._get_full_list("events", batch=2)
+            events = await api.get_events_by_account_and_bot("acc1", "bot1")
+            return api_items, events
+
+    try:
+        api_items, events = asyncio.run(run())
+        assert [r.id for r in api_items] == [f"ev{i}" for i in range(5)]
+        assert len(events) == 5 and events[0].collection_id == "c1"
+        print("✅ Paging and record mapping work")
+        return True
+    finally:
+        server.shutdown()
+
+
+def test_updates_reuse_pooled_connections():
+    """Many concurrent updates share a few keep-alive connections and stay under the concurrency limit"""
+    server, url = start_stub_server()
+    reset_stub()
+    StubPocketBase.delay = 0.02
+
+    async def run():
+        async with AsyncAPI(url, token="tok", max_connections=4, max_concurrency=3) as api:
+            results = await asyncio.gather(*(api.update_MG_cycle_by_id(f"cyc{i}", {"total_profit": i}) for i in range(30)))
+            return results
+
+    try:
+        results = asyncio.run(run())
+        assert all(r is not None for r in results)
+        assert len(StubPocketBase.writes) == 30
+        assert all(auth == "tok" for _, _, auth in StubPocketBase.writes)
+        assert StubPocketBase.max_in_flight <= 3, StubPocketBase.max_in_flight
+        assert len(StubPocketBase.client_ports) <= 4, StubPocketBase.client_ports
+        print(f"✅ 30 updates over {len(StubPocketBase.client_ports)} connections, max {StubPocketBase.max_in_flight} in flight")
+        return True
+    finally:
+        server.shutdown()
+
+
+def test_timeout_returns_none():
+    """A request that exceeds its timeout is logged and returns None like the sync API"""
+    server, url = start_stub_server()
+    reset_stub()
+    StubPocketBase.delay = 0.5
+
+    async def run():
+        async with AsyncAPI(url, timeout=0.1) as api:
+            return await api.update_symbol("sym1", {"price": 1.1})
+
+    try:
+        assert asyncio.run(run()) is None
+        print("✅ Timed out request returns None")
+        return True
+    finally:
+        server.shutdown()
+
+
+def test_realtime_subscription():
+    """subscribe_realtime registers the filtered topic and yields connect + record events"""
+    server, url = start_stub_server()
+    reset_stub()
+    StubPocketBase.subscribed.clear()
+
+    async def run():
+        received = []
+        async with AsyncAPI(url, token="tok") as api:
+            async for action, record in api.subscribe_realtime("events", "account = 'acc1'"):
+                received.append((action, getattr(record, "id", None)))
+        return received
+
+    try:
+        received = asyncio.run(asyncio.wait_for(run(), 10))
+        assert received == [("connect", None), ("create", "ev9")], received
+        assert StubPocketBase.realtime_subscriptions[0].startswith("events?options=")
+        print("✅ Realtime subscription delivers filtered record events")
+        return True
+    finally:
+        server.shutdown()
+
+
+def main():
+    """Run all tests"""
+    tests = [test_paging_and_records, test_updates_reuse_pooled_connections, test_timeout_returns_none,
+             test_realtime_subscription]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
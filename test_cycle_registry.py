@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Test script for the per-bot cycle registry
+Checks that cycle objects keep their identity across ticks and are rebuilt only on outside changes
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cycles.cycle_registry import CycleRegistry
+
+
+class FakeCycle:
+    """Cycle stand-in with the AH/CT cycle to_dict/refresh pattern"""
+
+    def __init__(self, row):
+        self.cycle_id = row.id
+        self.status = row.status
+        self.initial = list(row.initial)
+        self.hedge = list(row.hedge)
+        self.orders = self.combine_orders()
+
+    def combine_orders(self):
+        return self.initial + self.hedge
+
+    def refresh_derived_state(self):
+        self.orders = self.combine_orders()
+
+    def to_dict(self):
+        return {"id": self.cycle_id, "status": self.status, "initial": self.initial, "hedge": self.hedge}
+
+
+def make_row(cycle_id, status="initial", initial=(1,), hedge=()):
+    return SimpleNamespace(id=cycle_id, status=status, initial=list(initial), hedge=list(hedge))
+
+
+def test_identity_across_ticks():
+    """Unchanged rows and rows the object wrote itself keep the same object"""
+    registry = CycleRegistry(FakeCycle)
+    first, second = registry.refresh([make_row(1), make_row(2)])
+    assert registry.refresh([make_row(1), make_row(2)]) == [first, second] and registry.builds == 2
+
+    # The cycle adds a hedge and writes its row, the next tick sees its own write
+    first.hedge.append(5)
+    cycles = registry.refresh([make_row(1, hedge=[5]), make_row(2)])
+    assert cycles[0] is first and first.orders == [1, 5] and registry.builds == 2
+    print("✅ Cycle objects keep their identity across ticks")
+    return True
+
+
+def test_outside_changes_and_closed_cycles():
+    """Rows changed elsewhere are rebuilt, missing rows are dropped, new rows are built"""
+    registry = CycleRegistry(FakeCycle)
+    first, second = registry.refresh([make_row(1), make_row(2)])
+    cycles = registry.refresh([make_row(1, status="recovery"), make_row(3)])
+    assert cycles[0] is not first and cycles[0].status == "recovery"
+    assert registry.get(2) is None and registry.get(3) is cycles[1] and len(registry) == 2
+    assert registry.builds == 4
+    assert registry.refresh(None) == [] and len(registry) == 0
+    print("✅ Outside changes rebuild and closed cycles are dropped")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_identity_across_ticks, test_outside_changes_and_closed_cycles]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Test script for the warm-start cycle snapshot
+Checks cycle state round trips, defaults for new attributes and snapshot expiry
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cycles.cycle_snapshot import CycleSnapshotStore, dump_cycle, load_cycle, pocketbase_time
+from cycles.order_record import orders_from_dicts
+from cycles.order_store import OrderStore
+
+
+class FakeCycle:
+    """Cycle stand-in with the MoveGuardCycle construction pattern"""
+
+    def __init__(self, cycle_id, bot=None, meta_trader=None):
+        self.bot = bot
+        self.meta_trader = meta_trader
+        self._initialize_defaults()
+        self.cycle_id = cycle_id
+
+    def _initialize_defaults(self):
+        self.cycle_id = None
+        self.orders = OrderStore()
+        self.pending_order_levels = set()
+        self.zone_data = {'upper_boundary': 0.0, 'lower_boundary': 0.0}
+        self.added_in_new_version = 'default'
+
+
+def test_cycle_round_trip():
+    """Cycles come back with their orders, sets and nested data, and with fresh references"""
+    cycle = FakeCycle('c1', bot='old bot', meta_trader='old mt5')
+    cycle.orders = OrderStore(orders_from_dicts([{'order_id': 7, 'status': 'active', 'grid_level': 1}]))
+    cycle.pending_order_levels = {2}
+    cycle.zone_data['upper_boundary'] = 1.1015
+    cycle._persisted_fingerprints = {'total_profit': 123}
+    cycle._last_db_update_time = time.time()
+    state = dump_cycle(cycle)
+
+    restored = load_cycle(FakeCycle, state, 'mt5', 'bot')
+    assert restored.bot == 'bot' and restored.meta_trader == 'mt5'
+    assert restored.orders.get(7)['grid_level'] == 1 and len(restored.orders.active()) == 1
+    assert restored.pending_order_levels == {2} and restored.zone_data['upper_boundary'] == 1.1015
+    # DB write bookkeeping is not restored, so the first write after a restart is a full one
+    assert not hasattr(restored, '_persisted_fingerprints') and not hasattr(restored, '_last_db_update_time')
+
+    # Attributes the snapshot does not have keep their class defaults
+    del cycle.added_in_new_version
+    assert load_cycle(FakeCycle, dump_cycle(cycle), None, None).added_in_new_version == 'default'
+    print("✅ Cycle state round trips through the snapshot")
+    return True
+
+
+def test_store_save_load_and_expiry():
+    """The store replaces the snapshot atomically and ignores stale snapshots"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CycleSnapshotStore(os.path.join(tmp, 'snapshots', 'moveguard_bot1.db'))
+        assert store.load() == (None, {})
+
+        store.save({'c1': dump_cycle(FakeCycle('c1')), 'c2': dump_cycle(FakeCycle('c2'))}, saved_at=time.time())
+        store.save({'c2': dump_cycle(FakeCycle('c2'))}, saved_at=time.time())
+        saved_at, states = store.load(max_age=60)
+        assert saved_at is not None and list(states) == ['c2']
+
+        store.save({'c3': dump_cycle(FakeCycle('c3'))}, saved_at=time.time() - 3600)
+        assert store.load(max_age=60) == (None, {})
+        assert list(store.load()[1]) == ['c3']
+
+        store.clear()
+        assert store.load() == (None, {})
+    assert pocketbase_time(0) == '1970-01-01 00:00:00.000Z'
+    print("✅ Snapshot store saves, loads and expires")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_cycle_round_trip, test_store_save_load_and_expiry]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Test script for the dirty-tracking cycle sync
+Checks that cycle objects are cached per row and only changed cycles are reported dirty
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cycles.cycle_sync import CycleSyncTracker, row_fingerprint
+
+
+class FakeCycle:
+    """Cycle stand-in exposing what the tracker reads"""
+
+    def __init__(self, row):
+        self.cycle_id = row.id
+        self.orders = row.initial + row.hedge
+        self.closed = row.closed
+
+
+def make_row(cycle_id, profit=0.0, closed=None):
+    return SimpleNamespace(id=cycle_id, total_profit=profit, initial=[1], hedge=[2], closed=closed or [],
+                           closing_method={}, _sa_instance_state=object())
+
+
+def push(tracker, row, order_rows):
+    """Return True if the tracker reports the cycle as dirty, and mark it pushed"""
+    row_digest = row_fingerprint(row)
+    cycle_obj = tracker.cycle(row, row_digest)
+    fingerprint = tracker.fingerprint(row_digest, tracker.tickets(cycle_obj), order_rows)
+    if not tracker.is_dirty(cycle_obj.cycle_id, fingerprint):
+        return False
+    tracker.mark_pushed(cycle_obj.cycle_id, fingerprint)
+    return True
+
+
+def test_cycle_cache():
+    """Cycle objects are rebuilt only when the row changes"""
+    built = []
+    tracker = CycleSyncTracker(lambda row: built.append(row.id) or FakeCycle(row))
+    first = tracker.cycle(make_row(1))
+    assert tracker.cycle(make_row(1)) is first and built == [1]
+    assert tracker.cycle(make_row(1, profit=5.0)) is not first and built == [1, 1]
+    print("✅ Cycle objects are cached per row")
+    return True
+
+
+def test_dirty_tracking():
+    """Only cycles whose row or order rows changed are pushed"""
+    tracker = CycleSyncTracker(FakeCycle)
+    orders = {1: SimpleNamespace(ticket=1, profit=1.0), 2: SimpleNamespace(ticket=2, profit=2.0)}
+    assert push(tracker, make_row(1), orders)
+    assert not push(tracker, make_row(1), orders)
+
+    orders[2] = SimpleNamespace(ticket=2, profit=2.5)
+    assert push(tracker, make_row(1), orders)
+    assert push(tracker, make_row(1, closed=[3]), orders)
+    assert not push(tracker, make_row(1, closed=[3]), orders)
+
+    tracker.retain([])
+    assert push(tracker, make_row(1, closed=[3]), orders)
+
+    tracker.full_push_interval = 0
+    tracker.start_pass()
+    assert push(tracker, make_row(1, closed=[3]), orders)
+    print("✅ Only changed cycles are reported dirty")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_cycle_cache, test_dirty_tracking]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Test script for the bulk DB helpers and repository upserts
+Checks insert-then-update by key, chunked IN lookups and rollback of a failed batch on in-memory SQLite
+"""
+
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from DB.bulk import LOOKUP_CHUNK, get_rows_by_key
+from DB.ah_strategy.repositories.ah_repo import AHRepo
+from DB.ah_strategy.models.ah_cycles_orders import AhCyclesOrders
+from DB.ct_strategy.repositories.ct_repo import CTRepo
+
+
+def make_engine():
+    """Fresh in-memory database with all tables"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def make_order(ticket, profit=0, **fields):
+    order = {
+        "ticket": ticket, "comment": "test", "commission": 0, "is_pending": False, "kind": "initial",
+        "magic_number": 777, "open_price": 1, "open_time": "2026-01-01 00:00:00", "profit": profit,
+        "tp": 0, "sl": 0, "swap": 0, "symbol": "EURUSD", "type": 0, "volume": 1, "is_closed": False,
+        "trailing_steps": 0, "account": "1001",
+    }
+    order.update(fields)
+    return order
+
+
+def make_cycle(cycle_id, status="initial"):
+    return {
+        "id": cycle_id, "lower_bound": 1, "upper_bound": 2, "is_pending": False, "is_closed": False,
+        "lot_idx": 0, "status": status, "total_volume": 0, "total_profit": 0, "zone_index": 0,
+        "bot": "bot-1", "account": "1001", "symbol": "EURUSD", "cycle_type": "AH",
+    }
+
+
+def all_orders(engine, model=AhCyclesOrders):
+    with Session(engine) as session:
+        return {row.ticket: row for row in session.exec(select(model)).all()}
+
+
+def test_insert_then_update_by_key():
+    """A second upsert updates the rows with known keys in place and inserts the rest"""
+    for repo in (AHRepo(make_engine()), CTRepo(make_engine())):
+        written = repo.upsert_orders([make_order(1), make_order(2), make_order(3)])
+        assert [row.ticket for row in written] == [1, 2, 3]
+        ids = {row.ticket: row.id for row in written}
+
+        written = repo.upsert_orders([make_order(2, profit=15), make_order(4), make_order(3, is_closed=True)])
+        assert [row.ticket for row in written] == [2, 4, 3]
+
+        rows = repo.get_orders_by_tickets([1, 2, 3, 4])
+        assert sorted(rows) == [1, 2, 3, 4]
+        assert rows[2].profit == 15 and rows[2].id == ids[2]
+        assert rows[3].is_closed and rows[3].id == ids[3]
+        assert rows[1].profit == 0
+
+    repo = AHRepo(make_engine())
+    repo.upsert_cycles([make_cycle(1), make_cycle(2)])
+    repo.upsert_cycles([make_cycle(2, status="recovery")])
+    assert repo.get_cycle_by_id(1).status == "initial" and repo.get_cycle_by_id(2).status == "recovery"
+    print("✅ Upserts insert new keys and update known keys in place")
+    return True
+
+
+def test_chunked_lookups():
+    """Lookups past LOOKUP_CHUNK values are split into several IN queries and return every row"""
+    engine = make_engine()
+    repo = AHRepo(engine)
+    count = 2 * LOOKUP_CHUNK + 7
+    assert len(repo.upsert_orders(make_order(ticket) for ticket in range(1, count + 1))) == count
+
+    selects = []
+
+    def count_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(len(parameters))
+
+    event.listen(engine, "before_cursor_execute", count_selects)
+    try:
+        # Duplicates are looked up once, missing tickets are left out
+        tickets = list(range(1, count + 1)) + [1, 2, count + 100]
+        with Session(engine) as session:
+            rows = get_rows_by_key(session, AhCyclesOrders, "ticket", tickets)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_selects)
+
+    assert len(rows) == count and count + 100 not in rows
+    assert len(selects) == 3 and max(selects) <= LOOKUP_CHUNK
+    print(f"✅ {count} tickets looked up in {len(selects)} chunked queries")
+    return True
+
+
+def test_failed_batch_rolls_back():
+    """A row that fails to write rolls the whole batch back, including updates and valid inserts"""
+    engine = make_engine()
+    repo = AHRepo(engine)
+    repo.upsert_orders([make_order(1), make_order(2)])
+
+    # symbol is NOT NULL, so the new order 4 fails on flush
+    result = repo.upsert_orders([make_order(1, profit=99), make_order(3), make_order(4, symbol=None)])
+    assert result is None
+
+    rows = all_orders(engine)
+    assert sorted(rows) == [1, 2] and rows[1].profit == 0
+    print("✅ A failed batch leaves the database unchanged")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_insert_then_update_by_key,
+        test_chunked_lookups,
+        test_failed_batch_rolls_back,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Test script for the precomputed MoveGuard grid ladder
+Checks level prices, bisect level lookups and occupancy/gap tracking from the order store
+"""
+
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cycles.grid_ladder import GridLadder, ACTIVE, PENDING
+from cycles.order_record import OrderRecord, orders_from_dicts
+from cycles.order_store import OrderStore
+
+
+def test_prices_and_level_lookup():
+    """Ladder prices match the placement formula and bisect finds the reached level"""
+    ladder = GridLadder(levels=4)
+    assert ladder.configure('BUY', 1.10150, 50, 0.0001)
+    assert not ladder.configure('BUY', 1.10150, 50, 0.0001)  # Same geometry, no rebuild
+    for level in range(1, 40):
+        assert ladder.price(level) == 1.10150 + (50 * (level - 1) * 0.0001)
+    assert ladder.level_at(1.10149) == 0
+    assert ladder.level_at(1.10150) == 1
+    assert ladder.level_at(1.10700) == 2
+    assert ladder.level_at(1.20000) == 20
+
+    ladder.configure('SELL', 1.09850, 50, 0.0001)
+    assert ladder.rebuilds == 2
+    assert ladder.price(3) == 1.09850 - (50 * 2 * 0.0001)
+    assert ladder.level_at(1.09900) == 0
+    assert ladder.level_at(1.09300) == 2
+    print("✅ Ladder prices and level lookups are correct")
+    return True
+
+
+def test_placed_prices_map_back_to_their_level():
+    """An order placed at a ladder price is classified at that level, not one below"""
+    ladder = GridLadder()
+    start, interval, pip = 1.09876, 50.0, 0.0001
+    ladder.configure('SELL', start, interval, pip)
+    for level in range(1, 150):
+        assert ladder.level_at(ladder.price(level)) == level
+    # Dividing the price distance by the interval truncates some of these to the level below
+    assert int(((start - ladder.price(2)) / pip) / interval) + 1 == 1
+    print("✅ Placed prices map back to their grid level")
+    return True
+
+
+def test_occupancy_and_gaps():
+    """Occupancy follows the order store, including direct status and level writes"""
+    orders = OrderStore(orders_from_dicts([
+        {'order_id': 1, 'status': 'active', 'grid_level': 0},
+        {'order_id': 2, 'status': 'active', 'grid_level': 1},
+        {'order_id': 3, 'status': 'active', 'grid_level': 2},
+    ]))
+    ladder = GridLadder()
+    assert ladder.sync(orders, {3})
+    assert not ladder.sync(orders, {3})  # Nothing changed
+    assert ladder.next_level() == 3 and not ladder.has_gaps()
+    assert ladder.is_occupied(0) and ladder.is_occupied(3, PENDING) and not ladder.is_occupied(3, ACTIVE)
+
+    orders[1]['status'] = 'closed'  # Direct write, picked up on the next sync
+    assert ladder.sync(orders, set())
+    assert ladder.has_gaps() is False and ladder.next_level() == 3
+
+    orders.append(OrderRecord({'order_id': 4, 'status': 'active', 'grid_level': 4}))
+    ladder.sync(orders, set())
+    assert ladder.has_gaps() and ladder.max_active_level == 4
+
+    orders[3]['grid_level'] = 3  # Direct level rewrite
+    ladder.sync(orders, set())
+    assert not ladder.has_gaps() and ladder.next_level() == 4
+    assert not ladder.is_occupied(4) and orders.at_level(3, ('active',)) == [orders[3]]
+
+    orders.append(OrderRecord({'order_id': 5, 'status': 'active', 'grid_level': 3}))  # Duplicate level
+    ladder.sync(orders, set())
+    assert ladder.has_gaps()
+    print("✅ Occupancy and gap detection follow the order store")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_prices_and_level_lookup, test_placed_prices_map_back_to_their_level, test_occupancy_and_gaps]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
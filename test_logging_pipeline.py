@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Test script for the non-blocking logging pipeline
+Checks per-call-site rate limiting, duplicate folding and the dropping queue handler
+"""
+
+import logging
+import os
+import queue
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Views.globals.app_logger import RateLimitFilter, DroppingQueueHandler, get_logger, app_logger
+
+
+def make_record(msg, args=(), lineno=10, created=0.0, level=logging.INFO):
+    record = logging.LogRecord("app_logger", level, "MoveGuard.py", lineno, msg, args, None)
+    record.created = created
+    return record
+
+
+def test_duplicates_are_folded():
+    """Repeats of the same message are dropped and reported on the next record"""
+    rate_filter = RateLimitFilter(max_records=5, interval=10.0)
+    assert rate_filter.filter(make_record("profit %.2f", (1.0,)))
+    passed = [rate_filter.filter(make_record("profit %.2f", (1.0,), created=1.0)) for _ in range(240)]
+    assert not any(passed)
+
+    record = make_record("profit %.2f", (1.0,), created=11.0)
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "profit 1.00 [previous message repeated 240 times]"
+    print("✅ Duplicate messages are folded")
+    return True
+
+
+def test_call_site_rate_limit():
+    """Each call site gets its own budget per interval"""
+    rate_filter = RateLimitFilter(max_records=3, interval=10.0)
+    passed = [rate_filter.filter(make_record("order %s", (i,), created=0.1 * i)) for i in range(10)]
+    assert passed.count(True) == 3
+    assert rate_filter.filter(make_record("order %s", (1,), lineno=20))  # A different call site
+    assert rate_filter.filter(make_record("fatal", level=logging.CRITICAL, created=1.0))  # Exempt level
+
+    record = make_record("order %s", (99,), created=12.0)
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "order 99 [7 similar messages suppressed]"
+    print("✅ Call sites are rate limited")
+    return True
+
+
+def test_errors_are_not_limited():
+    """Consecutive error lines from one call site all get through, lower levels are limited"""
+    rate_filter = RateLimitFilter(max_records=2, interval=10.0)
+    errors = [rate_filter.filter(make_record("Traceback: %s", ("line",), level=logging.ERROR)) for _ in range(20)]
+    assert all(errors)
+    warnings = [rate_filter.filter(make_record("retry %s", (i,), lineno=30, level=logging.WARNING)) for i in range(20)]
+    assert warnings.count(True) == 2
+    print("✅ Error records are never rate limited")
+    return True
+
+
+def test_formatting_happens_in_listener():
+    """The caller only queues the record, msg/args and exc_info are merged when the listener formats it"""
+    class CountingArg:
+        calls = 0
+
+        def __str__(self):
+            CountingArg.calls += 1
+            return "arg"
+
+    handler = DroppingQueueHandler(queue.Queue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("app_logger", logging.ERROR, "MoveGuard.py", 40, "failed %s", (CountingArg(),), sys.exc_info())
+    handler.handle(record)
+
+    queued = handler.queue.get_nowait()
+    assert queued.msg == "failed %s" and queued.exc_info is not None and queued.exc_text is None
+    assert CountingArg.calls == 0
+
+    text = logging.Formatter("%(message)s").format(queued)
+    assert text.startswith("failed arg") and "ValueError: boom" in text and CountingArg.calls == 1
+    print("✅ Records are formatted by the listener, not the caller")
+    return True
+
+
+def test_queue_never_blocks():
+    """A full queue drops records instead of blocking the caller"""
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    for i in range(5):
+        handler.handle(make_record("tick %s", (i,), lineno=i))
+    assert handler.queue.qsize() == 2 and handler.dropped == 3
+
+    subsystem = get_logger("moveguard")
+    assert subsystem.parent is app_logger and subsystem.name == "app_logger.moveguard"
+    print("✅ Queue handler drops instead of blocking")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_duplicates_are_folded, test_call_site_rate_limit, test_errors_are_not_limited,
+             test_formatting_happens_in_listener, test_queue_never_blocks]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Test script for the stage timing and call counting metrics
+Checks histogram accuracy, timers, MT5 call counting and the Prometheus endpoint
+"""
+
+import asyncio
+import os
+import sys
+import urllib.request
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from helpers.metrics import (Histogram, CountedModule, registry, timed, set_bot_label,
+                             count_http_request, STAGE_SECONDS, MT5_CALLS, HTTP_REQUESTS)
+
+
+def test_histogram_quantiles():
+    """Quantiles stay within the log-linear bucket error"""
+    histogram = Histogram()
+    for micros in range(1, 10001):
+        histogram.record(micros / 1_000_000)
+    assert histogram.count == 10000
+    assert abs(histogram.quantile(0.5) - 0.005) / 0.005 < 0.04
+    assert abs(histogram.quantile(0.99) - 0.0099) / 0.0099 < 0.04
+    assert histogram.quantile(1.0) <= histogram.max
+    assert Histogram().quantile(0.5) == 0.0
+    print("✅ Histogram quantiles are accurate")
+    return True
+
+
+def test_timers_and_counters():
+    """Stage timers and call counters are labelled with the current bot"""
+    registry.clear()
+    set_bot_label("bot1")
+
+    with timed("moveguard", "process_grid_logic"):
+        pass
+
+    @timed("orders_manager", "sync")
+    async def sync():
+        return 42
+
+    assert asyncio.run(sync()) == 42
+
+    fake_mt5 = CountedModule(SimpleNamespace(positions_get=lambda **kwargs: (), ORDER_TYPE_BUY=0))
+    fake_mt5.positions_get(symbol="EURUSD")
+    fake_mt5.positions_get(symbol="EURUSD")
+    assert fake_mt5.ORDER_TYPE_BUY == 0
+    count_http_request("async")
+
+    assert STAGE_SECONDS.histogram("moveguard", "process_grid_logic", "bot1").count == 1
+    assert STAGE_SECONDS.histogram("orders_manager", "sync", "bot1").count == 1
+    assert MT5_CALLS.value("bot1", "positions_get") == 2
+    assert HTTP_REQUESTS.value("bot1", "async") == 1
+    print("✅ Timers and counters record per bot")
+    return True
+
+
+def test_prometheus_endpoint():
+    """The local endpoint serves the Prometheus text format"""
+    registry.clear()
+    set_bot_label("bot2")
+    with timed("act", "check_zone_breaches"):
+        pass
+    port = registry.start_http_server("127.0.0.1", 19108)
+    try:
+        assert port is not None
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+        assert "# TYPE trading_stage_seconds summary" in body
+        assert 'trading_stage_seconds_count{component="act",stage="check_zone_breaches",bot="bot2"} 1' in body
+        assert 'quantile="0.99"' in body
+    finally:
+        registry.stop_http_server()
+    print("✅ Prometheus endpoint serves the stage timings")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_histogram_quantiles, test_timers_and_counters, test_prometheus_endpoint]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
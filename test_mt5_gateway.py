@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+Test script for the MT5 gateway thread
+Checks priority ordering, SL/TP modification priority, nested calls and the awaitable API
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from MetaTrader.MT5Gateway import MT5Gateway, PRIORITY_QUERY, PRIORITY_TRADE
+
+
+def make_terminal(log, gate=None):
+    """Fake MetaTrader5 module recording the order calls run in"""
+    def positions_get(**kwargs):
+        if gate is not None:
+            gate.wait(5)
+        log.append(("positions_get", threading.current_thread().name))
+        return ()
+
+    def order_send(request):
+        log.append(("order_send", request["action"]))
+        return SimpleNamespace(retcode=10009)
+
+    return SimpleNamespace(positions_get=positions_get, order_send=order_send, TRADE_ACTION_DEAL=1)
+
+
+def test_trades_jump_ahead_of_polling():
+    """Queued trades run before queued polling, SL/TP modifications in between"""
+    log, gate = [], threading.Event()
+    gateway = MT5Gateway()
+    terminal = make_terminal(log, gate)
+    try:
+        blocker = gateway.submit(PRIORITY_QUERY, terminal.positions_get)  # Occupies the worker
+        queued = [gateway.submit(PRIORITY_QUERY, terminal.positions_get) for _ in range(3)]
+        routed = gateway.wrap(terminal)
+        sends = [threading.Thread(target=routed.order_send, args=({"action": action},)) for action in (6, 1)]
+        for thread in sends:
+            thread.start()
+        while gateway.queue_depth() < 5:
+            pass
+        gate.set()
+        for future in [blocker] + queued:
+            future.result(5)
+        for thread in sends:
+            thread.join(5)
+    finally:
+        gateway.stop()
+
+    order = [entry[0] if entry[0] == "positions_get" else entry[1] for entry in log]
+    assert order == ["positions_get", 1, 6, "positions_get", "positions_get", "positions_get"], order
+    assert all(entry[1] == gateway.name for entry in log if entry[0] == "positions_get")
+    print("✅ Trades and SL/TP changes run ahead of queued polling")
+    return True
+
+
+def test_nested_and_async_calls():
+    """Calls from the gateway thread run inline and the async API awaits results"""
+    gateway = MT5Gateway()
+    terminal = gateway.wrap(make_terminal([]))
+    try:
+        nested = gateway.call(PRIORITY_TRADE, lambda: terminal.order_send({"action": 1}).retcode)
+        assert nested == 10009
+        assert asyncio.run(gateway.call_async(PRIORITY_QUERY, lambda: 42)) == 42
+        assert terminal.TRADE_ACTION_DEAL == 1
+
+        failing = gateway.submit(PRIORITY_QUERY, lambda: 1 / 0)
+        try:
+            failing.result(5)
+            assert False, "exception should propagate"
+        except ZeroDivisionError:
+            pass
+    finally:
+        gateway.stop()
+    print("✅ Nested, async and failing calls behave")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_trades_jump_ahead_of_polling, test_nested_and_async_calls]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Test script for the incremental order reconciliation
+Checks that only changed positions and new closing deals are reported between passes
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from MetaTrader.SimulatedMT5 import SimulatedMetaTrader, load_tick_csv
+from Orders.change_tracker import PositionTracker, DealCursor
+
+PRICES = [1.1000, 1.1005, 1.1010, 1.1020, 1.1030, 1.1015]
+
+
+def make_simulator():
+    path = os.path.join(tempfile.mkdtemp(), "ticks.csv")
+    with open(path, "w") as handle:
+        handle.write("time,bid,ask\n")
+        for i, bid in enumerate(PRICES):
+            handle.write(f"{1700000000 + i * 30},{bid:.5f},{bid + 0.0001:.5f}\n")
+    sim = SimulatedMetaTrader(load_tick_csv(path, "EURUSD"), balance=1000.0)
+    sim.step()
+    return sim
+
+
+def test_position_changes():
+    """Only new, modified and vanished positions are reported"""
+    sim = make_simulator()
+    first = sim.buy("EURUSD", 0.1, 1, 0, 0, "PIPS", 10)[0]
+    second = sim.buy("EURUSD", 0.1, 1, 0, 0, "PIPS", 10)[0]
+    tracker = PositionTracker()
+    tracker.reset(sim.get_all_positions())
+    assert tracker.diff(sim.get_all_positions()) == ([], set())
+
+    sim.modify_position_sl_tp(first.ticket, sl=1.0950)
+    changed, gone = tracker.diff(sim.get_all_positions())
+    assert [p.ticket for p in changed] == [first.ticket] and not gone
+
+    sim.close_position(sim.get_position_by_ticket(second.ticket)[0])
+    third = sim.buy("EURUSD", 0.1, 1, 0, 0, "PIPS", 10)[0]
+    changed, gone = tracker.diff(sim.get_all_positions())
+    assert [p.ticket for p in changed] == [third.ticket] and gone == {second.ticket}
+    print("✅ Position tracker reports only changed positions")
+    return True
+
+
+def test_deal_cursor():
+    """Each deal is returned once and closing deals name their position"""
+    sim = make_simulator()
+    now = sim.clock.time_msc // 1000
+    cursor = DealCursor()
+    first = sim.buy("EURUSD", 0.1, 1, 0, 0, "PIPS", 10)[0]
+    cursor.reset(sim.get_deals_between(*cursor.window(now)), now)
+    assert cursor.advance(sim.get_deals_between(*cursor.window(now))) == []
+
+    sim.step()
+    sim.close_position(sim.get_position_by_ticket(first.ticket)[0])
+    second = sim.buy("EURUSD", 0.1, 1, 0, 0, "PIPS", 10)[0]
+    new_deals = cursor.advance(sim.get_deals_between(*cursor.window(now)))
+    assert len(new_deals) == 2
+    assert DealCursor.closed_positions(new_deals) == {first.ticket}
+    assert second.ticket not in DealCursor.closed_positions(new_deals)
+    assert cursor.advance(sim.get_deals_between(*cursor.window(now))) == []
+    assert cursor.high_water == sim.clock.time_msc // 1000
+    print("✅ Deal cursor returns each new deal once")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_position_changes, test_deal_cursor]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
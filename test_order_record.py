@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Test script for the compact order record
+Checks dict compatibility, order_id/ticket sharing, persistence round trips
+and indexing of records in the cycle order store
+"""
+
+import copy
+import json
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cycles.order_record import OrderRecord, orders_from_dicts, to_record, json_default, to_plain
+from cycles.order_store import OrderStore
+
+SAMPLE_ORDER = {
+    "order_id": 1001, "ticket": 1001, "status": "closed", "grid_level": 3, "direction": "BUY",
+    "price": 1.1012, "profit": -2.5, "placed_at": "2025-01-01T00:00:00", "custom_flag": True,
+}
+
+
+def test_dict_compatibility():
+    """Records answer get/[]/in/pop like the order dicts they replace"""
+    record = OrderRecord.from_dict(SAMPLE_ORDER)
+    assert record.get("profit") == -2.5 and record.profit == -2.5
+    assert record["custom_flag"] is True and "custom_flag" in record
+    assert record.get("missing", "x") == "x" and "missing" not in record
+    record["order_id"] = 2002
+    assert record["ticket"] == 2002
+    assert record.pop("custom_flag") is True and "custom_flag" not in record
+    print("✅ Records behave like order dicts")
+    return True
+
+
+def test_persistence_round_trip():
+    """to_dict/json_default reproduce the stored order, copies stay records"""
+    record = OrderRecord.from_dict(SAMPLE_ORDER)
+    assert record.to_dict() == SAMPLE_ORDER
+    assert json.loads(json.dumps([record], default=json_default)) == [SAMPLE_ORDER]
+    assert to_plain({"orders": [record]}) == {"orders": [SAMPLE_ORDER]}
+    assert isinstance(copy.deepcopy(record), OrderRecord) and copy.deepcopy(record) == record
+    assert orders_from_dicts([SAMPLE_ORDER, 5])[1] == 5
+    assert to_record(record) is record and isinstance(to_record(dict(SAMPLE_ORDER)), OrderRecord)
+    print("✅ Records round-trip through JSON")
+    return True
+
+
+def test_order_store_indexes_records():
+    """OrderStore indexes records by ticket, status and level through their attributes"""
+    store = OrderStore(orders_from_dicts([SAMPLE_ORDER, {"ticket": 7, "status": "active", "grid_level": 1}]))
+    assert store.get(1001)["grid_level"] == 3
+    assert [o.ticket for o in store.active()] == [7]
+    store.set_status(store.get(7), "closed")
+    assert len(store.closed()) == 2
+    print("✅ Order store indexes records")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_dict_compatibility, test_persistence_round_trip, test_order_store_indexes_records]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
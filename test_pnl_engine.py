@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Test script for the vectorized P&L book
+Checks per-order, per-cycle and account totals computed from MT5 position records
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from MetaTrader.PnLEngine import PnLBook
+
+
+def position(ticket, type_, price_open, profit, swap=0.0, commission=0.0):
+    return SimpleNamespace(ticket=ticket, type=type_, volume=0.01, price_open=price_open,
+                           profit=profit, swap=swap, commission=commission)
+
+
+def test_order_and_cycle_totals():
+    """Orders are looked up by ticket and summed per cycle in one pass"""
+    positions = [position(1, 0, 1.1000, 5.0, swap=-0.2), position(2, 1, 1.1020, 3.0),
+                 position(3, 0, 1.1010, -1.5), position(4, 0, 1.0990, 2.0)]
+    book = PnLBook(positions, {1: "cycA", 2: "cycA", 3: "cycB"}, price=1.1010, pip=0.0001)
+
+    order = book.order(1)
+    assert order["profit"] == 5.0 and order["swap"] == -0.2
+    assert abs(order["profit_pips"] - 10.0) < 1e-6
+    assert abs(book.order(2)["profit_pips"] - 10.0) < 1e-6  # SELL gains when price falls
+    assert book.cycle("cycA")[0] == 8.0 and book.cycle("cycB")[0] == -1.5
+    assert book.cycle("missing") == (0.0, 0.0)
+    assert book.total_profit == 8.5  # Unassigned position 4 still counts toward the account total
+    assert book.order(99) is None and book.cycle_of(4) is None
+    print("✅ Per-order, per-cycle and account P&L match")
+    return True
+
+
+def test_empty_positions():
+    """An empty position list yields an empty book"""
+    book = PnLBook(None, {1: "cycA"}, price=1.1, pip=0.0001)
+    assert len(book) == 0 and book.total_profit == 0.0 and book.cycle("cycA") == (0.0, 0.0)
+    print("✅ Empty book is safe")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_order_and_cycle_totals, test_empty_positions]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
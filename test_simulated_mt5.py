@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Test script for the simulated MetaTrader backend
+Replays a small tick file and checks market orders, pending fills, SL/TP hits,
+candles and the account balance
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from MetaTrader.SimulatedMT5 import SimulatedMetaTrader, load_tick_csv, TRADE_RETCODE_DONE
+from MetaTrader.SymbolSpec import spec_from_symbol_info
+
+PRICES = [1.1000, 1.1005, 1.1010, 1.1020, 1.1030, 1.1015, 1.0990, 1.0980]
+
+
+def write_ticks(path):
+    with open(path, "w") as handle:
+        handle.write("time,bid,ask\n")
+        for i, bid in enumerate(PRICES):
+            handle.write(f"{1700000000 + i * 30},{bid:.5f},{bid + 0.0001:.5f}\n")
+
+
+def make_simulator():
+    path = os.path.join(tempfile.mkdtemp(), "ticks.csv")
+    write_ticks(path)
+    sim = SimulatedMetaTrader(load_tick_csv(path, "EURUSD"), balance=1000.0)
+    sim.step()
+    return sim
+
+
+def test_market_order_take_profit():
+    """A BUY with a TP in pips closes on the tick that reaches it and books the profit"""
+    sim = make_simulator()
+    position = sim.buy("EURUSD", 0.1, 1, 0, 10, "PIPS", 10)[0]
+    assert abs(position.tp - 1.1011) < 1e-9
+    sim.replay(max_ticks=3)
+    assert not sim.get_position_by_ticket(position.ticket)
+    assert sim.check_order_is_closed(position.ticket)
+    assert sim.get_account_info()["balance"] > 1000.0
+    print("✅ Take profit closes the position")
+    return True
+
+
+def test_pending_fill_and_stop_loss():
+    """A SELL_STOP fills when bid falls to it, keeps its ticket and is stopped out later"""
+    sim = make_simulator()
+    sim.replay(max_ticks=4)
+    order = sim.sell_stop("EURUSD", 1.1000, 0.1, 1, 1.1012, 0, "PRICE", 10)[0]
+    assert sim.check_order_is_pending(order.ticket)
+    sim.replay(max_ticks=2)
+    position = sim.get_position_by_ticket(order.ticket)[0]
+    assert position.sl == 1.1012 and position.price_open == 1.0990
+    sim.replay()
+    assert sim.get_position_by_ticket(order.ticket)  # Price never came back to the SL
+    assert sim.modify_position_sl_tp(order.ticket, sl=1.0985).retcode == TRADE_RETCODE_DONE
+    print("✅ Pending order fills under its own ticket")
+    return True
+
+
+def test_candles_and_replay_stats():
+    """Ticks build candles and replay reports per-tick callback cost"""
+    sim = make_simulator()
+    stats = sim.replay(on_tick=lambda s, tick: s.get_market_snapshot(tick.symbol))
+    assert stats["ticks"] == len(PRICES) - 1
+    candles = sim.get_candles("EURUSD", "M1", 3)
+    assert len(candles) == 3 and candles[-1]["close"] == PRICES[-1]
+    assert sim.check_candle_direction("EURUSD", "H1") is None  # Only one H1 candle so far
+    print(f"✅ Replayed {stats['ticks']} ticks, {stats['callback_cpu_us_per_tick']:.1f} us per tick")
+    return True
+
+
+def test_bulk_sl_modification():
+    """Bulk SL updates skip positions already at the target and report per ticket"""
+    sim = make_simulator()
+    first = sim.buy("EURUSD", 0.1, 1, 0, 0, "PRICE", 10)[0]
+    second = sim.buy("EURUSD", 0.1, 1, 1.0950, 0, "PRICE", 10)[0]
+    results = sim.modify_positions_sl_tp([(first.ticket, 1.095000001, 0.0), (second.ticket, 1.0950, 0.0), (999, 1.0950, 0.0)])
+    assert results[first.ticket]["status"] == "modified" and results[first.ticket]["sl"] == 1.095
+    assert results[second.ticket]["status"] == "unchanged"
+    assert results[999]["status"] == "not_found"
+    assert sim.get_position_by_ticket(first.ticket)[0].sl == 1.095
+    print("✅ Bulk SL modification skips no-ops")
+    return True
+
+
+def test_symbol_spec():
+    """The symbol spec matches the symbol info it summarises"""
+    sim = make_simulator()
+    spec = sim.get_symbol_spec("EURUSD")
+    assert spec == spec_from_symbol_info("EURUSD", sim.get_symbol_info("EURUSD"), spec.loaded_at)
+    assert spec.pip == sim.get_pips("EURUSD") and spec.digits == 5
+    assert sim.get_symbol_spec("USDJPY").pip == 0.01
+    print("✅ Symbol spec matches the symbol info")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_market_order_take_profit, test_pending_fill_and_stop_loss, test_candles_and_replay_stats,
+             test_bulk_sl_modification, test_symbol_spec]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Test script for the startup profile
+Checks import timing, startup marks and time to first tick per bot
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from helpers import startup_profile
+from helpers.metrics import timed, set_bot_label
+
+
+def test_disabled_by_default():
+    """Nothing is recorded unless STARTUP_PROFILE is set"""
+    os.environ.pop("STARTUP_PROFILE", None)
+    assert not startup_profile.install()
+    assert not startup_profile.enabled()
+    startup_profile.mark("ignored")
+    assert "ignored" not in startup_profile.report()
+    print("✅ Startup profile is off by default")
+    return True
+
+
+def test_imports_marks_and_first_ticks():
+    """Imported modules, marks and the first stage of each bot show up in the report"""
+    directory = tempfile.mkdtemp()
+    with open(os.path.join(directory, "profiled_parent.py"), "w") as handle:
+        handle.write("import time\nimport profiled_child\ntime.sleep(0.02)\n")
+    with open(os.path.join(directory, "profiled_child.py"), "w") as handle:
+        handle.write("import time\ntime.sleep(0.05)\n")
+    sys.path.insert(0, directory)
+
+    os.environ["STARTUP_PROFILE"] = "1"
+    try:
+        assert startup_profile.install(report_after=3600)
+        import profiled_parent
+        startup_profile.mark("db ready")
+        set_bot_label("bot42")
+        with timed("moveguard", "tick"):
+            pass
+        with timed("moveguard", "tick"):
+            pass
+        set_bot_label(None)
+        with timed("orders_manager", "sync"):
+            pass
+    finally:
+        startup_profile.uninstall()
+        os.environ.pop("STARTUP_PROFILE", None)
+        sys.path.remove(directory)
+
+    times = startup_profile._import_times
+    assert times["profiled_child"] >= 0.05 and 0.02 <= times["profiled_parent"] < 0.05
+    assert type(profiled_parent.__loader__).__name__ != "_TimedLoader"
+    text = startup_profile.report()
+    assert "profiled_child" in text and "db ready" in text
+    assert list(startup_profile._first_ticks) == ["bot42"]
+    print("✅ Imports, marks and first ticks are recorded")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [test_disabled_by_default, test_imports_marks_and_first_ticks]
+    passed = sum(1 for test in tests if test())
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
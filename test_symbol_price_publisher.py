@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Test script for the per-account symbol price publisher
+Checks the move threshold, the per-symbol rate limit and symbols with an unknown point size
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Bots.symbol_price_publisher import SymbolPricePublisher
+
+
+class FakeClient:
+    """Async API client stand-in recording symbol writes"""
+
+    def __init__(self):
+        self.updates = []
+        self.lookups = 0
+
+    async def get_symbol_by_name(self, symbol, account_id):
+        self.lookups += 1
+        return [SimpleNamespace(id=f"rec-{symbol}")]
+
+    async def update_symbol(self, record_id, data):
+        self.updates.append((record_id, data["price"]))
+        return True
+
+
+class FakeMetaTrader:
+    """MetaTrader stand-in with fixed symbol points, None for unknown symbols"""
+
+    def __init__(self, points):
+        self.points = points
+
+    def get_symbol_info(self, symbol):
+        point = self.points.get(symbol)
+        return SimpleNamespace(point=point) if point is not None else None
+
+
+def make_publisher(points, **kwargs):
+    client = FakeClient()
+    return SymbolPricePublisher(client, "account-1", FakeMetaTrader(points), **kwargs), client
+
+
+def test_move_threshold():
+    """Only moves of at least min_move_points points are due"""
+    publisher, _ = make_publisher({"EURUSD": 0.00001}, min_move_points=5, min_interval=1.0)
+    assert publisher.should_publish("EURUSD", 1.10000, now=0.0)  # Nothing published yet
+    publisher.last_published["EURUSD"] = 1.10000
+    publisher.last_publish_time["EURUSD"] = 0.0
+    assert not publisher.should_publish("EURUSD", 1.10003, now=5.0)
+    assert publisher.should_publish("EURUSD", 1.10005, now=5.0)
+    assert publisher.should_publish("EURUSD", 1.09990, now=5.0)
+    print("✅ Moves below the threshold are not published")
+    return True
+
+
+def test_rate_limit():
+    """A symbol is written at most once per min_interval, a held back move goes out later"""
+    publisher, client = make_publisher({"EURUSD": 0.00001, "GBPUSD": 0.00001}, min_interval=60.0)
+
+    async def run():
+        assert await publisher.publish_many({"EURUSD": 1.10000, "GBPUSD": 1.25000}) == 2
+        assert await publisher.publish_many({"EURUSD": 1.10050, "GBPUSD": 1.25050}) == 0
+        assert not publisher.should_publish("EURUSD", 1.10050, now=publisher.last_publish_time["EURUSD"] + 30.0)
+        assert publisher.should_publish("EURUSD", 1.10050, now=publisher.last_publish_time["EURUSD"] + 60.0)
+
+    asyncio.run(run())
+    assert client.updates == [("rec-EURUSD", 1.10000), ("rec-GBPUSD", 1.25000)]
+    assert client.lookups == 2
+    print("✅ Writes are rate limited per symbol")
+    return True
+
+
+def test_unknown_point_publishes_only_changes():
+    """Without a point size an unchanged bid is not republished, a changed one is"""
+    publisher, client = make_publisher({}, min_interval=0.0)
+
+    async def run():
+        assert await publisher.publish("XAUUSD", 2400.10)
+        for _ in range(5):
+            assert not await publisher.publish("XAUUSD", 2400.10)
+        assert await publisher.publish("XAUUSD", 2400.11)
+
+    asyncio.run(run())
+    assert client.updates == [("rec-XAUUSD", 2400.10), ("rec-XAUUSD", 2400.11)]
+    print("✅ Unknown point size publishes only actual changes")
+    return True
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_move_threshold,
+        test_rate_limit,
+        test_unknown_point_publishes_only_changes,
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {e}")
+    print(f"\n{passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)